@@ -1,7 +1,7 @@
 
 from org.pyut.history.HistoryUtils import COMMAND_CLASS_ID
 from org.pyut.history.HistoryUtils import COMMAND_MODULE_ID
-from org.pyut.history.HistoryUtils import makeValuatedToken
+from org.pyut.history.HistoryUtils import CommandRecord
 
 
 class Command:
@@ -20,35 +20,36 @@ class Command:
         """
         self._group = None  # group to which the command is added. Init when added to a group
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
         """
         Return the module name and class name in view to read them during
         the deserialization and get the right constructor.
 
-        Notes:  Use makeValuatedToken() from historyUtils for each value
-        you want to serialize, so that you can use the getTokenValue to get
-        back the string representation of this value for the deserialization.
+        Notes:  Only put JSON compatible values in the record (strings, numbers,
+        booleans, None, lists and dictionaries);  Tuples come back as lists.
 
-        Returns:   String representation of the command in view to store it
-        in a file. This method must be redefined in all subclasses in that
+        Returns:   The record of the command in view to store it in the
+        history. This method must be redefined in all subclasses in that
         way :
 
-            return Command.serialize + (MyCommand's serialized information)
+            record: CommandRecord = Command.serialize(self)
+            record['myValue'] = ...
+            return record
         """
 
-        return (makeValuatedToken(COMMAND_MODULE_ID, str(self.__module__)) +
-                makeValuatedToken(COMMAND_CLASS_ID, str(self.__class__.__name__)))
+        return {
+            COMMAND_MODULE_ID: str(self.__module__),
+            COMMAND_CLASS_ID:  str(self.__class__.__name__)
+        }
 
-    def deserialize(self, serializedInfo: str):
+    def deserialize(self, record: CommandRecord):
         """
         (Abstract) Here the developer should assign values to the information needed
-        by the command (see also getTokenValue in historyUtils).
+        by the command.
 
         Args:
-            serializedInfo:
-
-        Returns:    String from which we have to extract the information needed to
-        set up the command.
+            record: The record built by serialize(), from which we have to extract
+            the information needed to set up the command.
         """
         pass
 
@@ -80,6 +81,18 @@ class Command:
         """
         pass
 
+    def coalesce(self, command: 'Command') -> bool:
+        """
+        Override to merge a command that follows this one into it, e.g. the
+        successive moves of a drag, so that the history keeps a single command.
+
+        Args:
+            command:    The command that follows this one
+
+        Returns:  `True` if this command now includes `command`, else `False`
+        """
+        return False
+
     def getGroup(self):
         """
 
@@ -8,19 +8,12 @@ from importlib import import_module
 
 from org.pyut.commands.Command import Command
 
-from org.pyut.history.HistoryUtils import COMMAND_BEGIN_ID
 from org.pyut.history.HistoryUtils import COMMAND_CLASS_ID
-from org.pyut.history.HistoryUtils import COMMAND_END_ID
 from org.pyut.history.HistoryUtils import COMMAND_MODULE_ID
-from org.pyut.history.HistoryUtils import GROUP_BEGIN_ID
-from org.pyut.history.HistoryUtils import GROUP_COMMENT_ID
-from org.pyut.history.HistoryUtils import GROUP_END_ID
-from org.pyut.history.HistoryUtils import TOKEN_BEGIN
-from org.pyut.history.HistoryUtils import TOKEN_END
+from org.pyut.history.HistoryUtils import CommandRecord
 
-from org.pyut.history.HistoryUtils import getTokenValue
-from org.pyut.history.HistoryUtils import makeToken
-from org.pyut.history.HistoryUtils import makeValuatedToken
+from org.pyut.history.HistoryUtils import decodeGroup
+from org.pyut.history.HistoryUtils import encodeGroup
 
 
 class CommandGroup:
@@ -75,58 +68,31 @@ class CommandGroup:
 
         self._commands.remove(command)
 
-    def serialize(self):
+    def serialize(self) -> str:
         """
-        Transform all the commands belonging to the group into strings in
-        view to store them in a file.
-        @return a string representing the command.
+        Transform all the commands belonging to the group into a string in
+        view to store it in a file.
+        @return a single line string representing the group.
         """
-        # add the beginning information of the group
-        serializedGroup = (makeToken(GROUP_BEGIN_ID) + makeValuatedToken(GROUP_COMMENT_ID, self._comment))
-        # add the beginning information and setup information of
-        # each command. After that add the ending information of
-        # for each command.
-        for command in self._commands:
-            serializedGroup += (makeToken(COMMAND_BEGIN_ID) + command.serialize() + makeToken(COMMAND_END_ID))
-
-        # add the ending information of the group
-        serializedGroup += makeToken(GROUP_END_ID)
+        records: List[CommandRecord] = [command.serialize() for command in self._commands]
 
-        return serializedGroup
+        return encodeGroup(self._comment, records)
 
-    def deserialize(self, serializedCommands: str):
+    def deserialize(self, serializedGroup: str):
         """
-        deserialize the specified commands and add them to the group
+        deserialize the specified group;  Set its comment and add its commands to this group
 
         Args:
-            serializedCommands:   a string representation of the commands belonging to the group.
+            serializedGroup:   a string representation of the group, see serialize()
         """
-        # define the beginning and ending token of a serialized command
-        commandBegin = TOKEN_BEGIN + COMMAND_BEGIN_ID + TOKEN_END
-        commandEnd   = TOKEN_BEGIN + COMMAND_END_ID + TOKEN_END
-
-        # looking for the beginning of the first command
-        cStart = serializedCommands.find(commandBegin)
-        self.logger.info(f'cStart: {cStart}')
-        # while there is still a command beginning token we can proceed to the deserialization.
-        while cStart > -1:
-
-            # we don't need anymore of the beginning token
-            cStart += len(commandBegin)
-            self.logger.info(f'cStart - commandBegin: {cStart}')
-
-            # find the ending token for this command
-            cEnd = serializedCommands.find(commandEnd, cStart)
-
-            # we work only on the useful data
-            serialCommand = serializedCommands[cStart: cEnd]
+        comment, records = decodeGroup(serializedGroup)
+        self._comment = comment
 
-            commandModuleName = getTokenValue(COMMAND_MODULE_ID, serialCommand)
-            self.logger.info(f'commandModuleName: {commandModuleName}')
+        for record in records:
 
-            # get the name of the class of the command
-            commandClassName = getTokenValue(COMMAND_CLASS_ID, serialCommand)
-            self.logger.info(f'commandClassName: {commandClassName}')
+            commandModuleName: str = record[COMMAND_MODULE_ID]
+            commandClassName:  str = record[COMMAND_CLASS_ID]
+            self.logger.debug(f'command: {commandModuleName}.{commandClassName}')
 
             # import the module which contains the command class and get the class (cls)
             moduleName = import_module(commandModuleName)
@@ -138,18 +104,29 @@ class CommandGroup:
                 command.setGroup(self)
 
                 # deserialization and setup of the command
-                command.deserialize(serialCommand)
+                command.deserialize(record)
 
                 # add the command to the group
                 self.addCommand(command)
 
-                # looking for the next command beginning token
-                cStart = serializedCommands.find(commandBegin, cEnd)
-                self.logger.info(f'cStart - serializedCommands: {cStart}')
-
             except (ValueError, Exception) as e:
                 self.logger.error(f'Error during deserialization: {e}')
 
+    def coalesce(self, group: 'CommandGroup') -> bool:
+        """
+        Merge a group that follows this one into it;  Only groups of a single
+        command coalesce, and only when the command accepts it (see Command.coalesce())
+
+        Args:
+            group:  The group that follows this one
+
+        Returns:  `True` if this group now includes `group`
+        """
+        if len(self._commands) != 1 or len(group._commands) != 1:
+            return False
+
+        return self._commands[0].coalesce(group._commands[0])
+
     def redo(self):
         """
         Call the redo() method of all commands belonging to the group
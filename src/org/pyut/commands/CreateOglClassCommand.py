@@ -49,14 +49,13 @@ class CreateOglClassCommand(DelOglClassCommand):
 
         return DelOglClassCommand.serialize(self)
 
-    def deserialize(self, serializedData):
+    def deserialize(self, record):
         """
         deserialize the data needed by the command to undo/redo the created link
-        @param serializedData    :   string representation of the data needed
-                                            by the command to undo redo a link
+        @param record    :   the data needed by the command to undo redo a link
         """
 
-        DelOglClassCommand.deserialize(self, serializedData)
+        DelOglClassCommand.deserialize(self, record)
 
     def redo(self):
         """
@@ -15,8 +15,7 @@ from org.pyut.ogl.OglLinkFactory import getOglLinkFactory
 from org.pyut.enums.LinkType import LinkType
 from org.pyut.model.PyutLink import PyutLink
 
-from org.pyut.history.HistoryUtils import getTokenValue
-from org.pyut.history.HistoryUtils import makeValuatedToken
+from org.pyut.history.HistoryUtils import CommandRecord
 from org.pyut.ogl.sd.OglSDInstance import OglSDInstance
 from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 
@@ -48,12 +47,12 @@ class CreateOglLinkCommand(Command):
         else:
             self._link = self._createLink(src, dst, linkType, srcPos, dstPos)
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
         """
         serialize the data needed by the command to undo/redo the created link
         """
         # serialize the data common to all commands
-        serialShape = Command.serialize(self)
+        record: CommandRecord = Command.serialize(self)
         # get the pyutId of the source OglObject of the link
         srcId = self._link.getSourceShape().getPyutObject().getId()
         # get the pyutId of the destination OglObject of the link
@@ -67,35 +66,35 @@ class CreateOglLinkCommand(Command):
         # get the pyutId of the link
         linkId = self._link.getPyutObject().getId()
         # serialize required data needed to undo/redo the link
-        serialShape += makeValuatedToken("srcId", repr(srcId))
-        serialShape += makeValuatedToken("dstId", repr(dstId))
-        serialShape += makeValuatedToken("srcPos", repr(srcPos))
-        serialShape += makeValuatedToken("dstPos", repr(dstPos))
-        serialShape += makeValuatedToken("linkType", repr(linkType))
-        serialShape += makeValuatedToken("linkId", repr(linkId))
+        record['srcId']    = srcId
+        record['dstId']    = dstId
+        record['srcPos']   = list(srcPos)
+        record['dstPos']   = list(dstPos)
+        record['linkType'] = linkType.name
+        record['linkId']   = linkId
 
-        return serialShape
+        return record
 
-    def deserialize(self, serializedInfo: str):
+    def deserialize(self, record: CommandRecord):
         """
         deserialize the data needed by the command to undo/redo the created link
-        @param serializedInfo    :   string representation of the data needed by the command to undo redo a link
+        @param record    :   the data needed by the command to undo redo a link
         """
 
         # deserialize the data common to all commands
-        Command.deserialize(self, serializedInfo)
+        Command.deserialize(self, record)
         # get the pyutId of the source OglObject of the link
-        srcId = eval(getTokenValue("srcId", serializedInfo))
+        srcId = record['srcId']
         # get the pyutId of the destination OglObject of the link
-        dstId = eval(getTokenValue("dstId", serializedInfo))
+        dstId = record['dstId']
         # get the model (MVC pattern) start position of the link
-        srcPos = eval(getTokenValue("srcPos", serializedInfo))
+        srcPos = record['srcPos']
         # get the model (MVC pattern) end position of the link
-        dstPos = eval(getTokenValue("dstPos", serializedInfo))
+        dstPos = record['dstPos']
         # get the type of the link (see OglLinkFactory)
-        linkType = eval(getTokenValue("linkType", serializedInfo))
+        linkType = LinkType.toEnum(record['linkType'])
         # get the pyutId of the link
-        linkId = eval(getTokenValue("linkId", serializedInfo))
+        linkId = record['linkId']
         # get the frame to which belongs the link
         umlFrame = self.getGroup().getHistory().getFrame()
 
@@ -1,8 +1,7 @@
 
-from org.pyut.history.HistoryUtils import getTokenValue
+from org.pyut.history.HistoryUtils import CommandRecord
 
 from org.pyut.commands.DelOglLinkedObjectCommand import DelOglLinkedObjectCommand
-from org.pyut.history.HistoryUtils import makeValuatedToken
 
 from org.pyut.general.Globals import cmp
 from org.pyut.model.PyutClass import PyutClass
@@ -22,13 +21,13 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
         """
         super().__init__(shape)
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
         """
         Serialize the data needed by the destroyed OglLinkedObject.
-        @return a string representation of the data needed by the command.
+        @return the record of the data needed by the command.
         """
         # serialize the data common to all OglObjects
-        serialShape = DelOglLinkedObjectCommand.serialize(self)
+        record: CommandRecord = DelOglLinkedObjectCommand.serialize(self)
 
         pyutClass: PyutClass = self._shape.getPyutObject()
         classDescription = pyutClass.description
@@ -38,9 +37,9 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
         else:
             classStereotypeName = ""
 
-        classShowStereotype = repr(pyutClass.getShowStereotype())
-        classShowMethods = repr(pyutClass.showMethods)
-        classShowFields = repr(pyutClass.showFields)
+        classShowStereotype = pyutClass.getShowStereotype()
+        classShowMethods = pyutClass.showMethods
+        classShowFields = pyutClass.showFields
 
         fields = []
         for field in pyutClass.fields:
@@ -48,7 +47,7 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
             fieldType = field.getType().__str__()
             fieldDefaultValue = field.getDefaultValue()
             fieldVisibility = field.getVisibility().__str__()
-            fields.append((fieldName, fieldType, fieldDefaultValue, fieldVisibility))
+            fields.append([fieldName, fieldType, fieldDefaultValue, fieldVisibility])
 
         methods = []
         for method in pyutClass.methods:
@@ -61,35 +60,35 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
                 paramName = param.getName()
                 paramType = param.getType().__str__()
                 paramDefaultValue = param.getDefaultValue()
-                params.append((paramName, paramType, paramDefaultValue))
+                params.append([paramName, paramType, paramDefaultValue])
 
             modifiers = []
             for modifier in method.getModifiers():
                 modifierName = modifier.getName()
                 modifiers.append(modifierName)
 
-            methodProfile = (methodName, methodVisibility,
-                             methodReturns, repr(params),
-                             repr(modifiers))
+            methodProfile = [methodName, methodVisibility,
+                             methodReturns, params,
+                             modifiers]
 
             methods.append(methodProfile)
 
-        serialShape += makeValuatedToken("classDescription",    classDescription)
-        serialShape += makeValuatedToken("classStereotypeName", classStereotypeName)
-        serialShape += makeValuatedToken("classShowStereotype", classShowStereotype)
-        serialShape += makeValuatedToken("classShowMethods",    classShowMethods)
-        serialShape += makeValuatedToken("classShowFields",     classShowFields)
-        serialShape += makeValuatedToken("fields", repr(fields))
-        serialShape += makeValuatedToken("methods", repr(methods))
+        record['classDescription']    = classDescription
+        record['classStereotypeName'] = classStereotypeName
+        record['classShowStereotype'] = classShowStereotype
+        record['classShowMethods']    = classShowMethods
+        record['classShowFields']     = classShowFields
+        record['fields']  = fields
+        record['methods'] = methods
 
-        return serialShape
+        return record
 
-    def deserialize(self, serializedData):
+    def deserialize(self, record: CommandRecord):
         """
         deserialize the data needed by the destroyed OglLinkedObject.
 
         Args:
-            serializedData: serialized data needed by the command.
+            record: serialized data needed by the command.
         """
         from org.pyut.model.PyutMethod import PyutMethod
         from org.pyut.model.PyutParam import PyutParam
@@ -99,17 +98,17 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
         from org.pyut.model.PyutModifier import PyutModifier
 
         # deserialize the data common to all OglObjects
-        DelOglLinkedObjectCommand.deserialize(self, serializedData)
+        DelOglLinkedObjectCommand.deserialize(self, record)
 
         # deserialize properties of the OglClass (first level)
-        classDescription    = getTokenValue("classDescription", serializedData)
-        classStereotypeName = getTokenValue("classStereotypeName", serializedData)
-        classShowStereotype = eval(getTokenValue("classShowStereotype", serializedData))
-        classShowMethods    = eval(getTokenValue("classShowMethods", serializedData))
-        classShowFields     = eval(getTokenValue("classShowFields", serializedData))
+        classDescription    = record['classDescription']
+        classStereotypeName = record['classStereotypeName']
+        classShowStereotype = record['classShowStereotype']
+        classShowMethods    = record['classShowMethods']
+        classShowFields     = record['classShowFields']
 
-        methods = eval(getTokenValue("methods", serializedData))
-        fields   = eval(getTokenValue("fields", serializedData))
+        methods = record['methods']
+        fields  = record['fields']
 
         # set up the first level properties of the pyutClass
         pyutClass: PyutClass = self._shape.getPyutObject()
@@ -145,7 +144,7 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
             method = PyutMethod(methodName, methodVisibility, methodReturns)
 
             # deserialize method's params so we get a tuple (name, Type, defaultValue)
-            params = eval(methodProfile[3])
+            params = methodProfile[3]
             for param in params:
                 paramName = param[0]
 
@@ -159,7 +158,7 @@ class DelOglClassCommand(DelOglLinkedObjectCommand):
 
             # deserialize method's modifiers so we get a list of names
             # that we have to transform into a list of PyutModifiers.
-            modifiersNames = eval(methodProfile[4])
+            modifiersNames = methodProfile[4]
             modifiers = []
             for modifierName in modifiersNames:
                 modifiers.append(PyutModifier(modifierName))
@@ -9,8 +9,7 @@ from org.pyut.ogl.OglLinkFactory import getLinkType
 
 from org.pyut.enums.LinkType import LinkType
 
-from org.pyut.history.HistoryUtils import getTokenValue
-from org.pyut.history.HistoryUtils import makeValuatedToken
+from org.pyut.history.HistoryUtils import CommandRecord
 from org.pyut.ui.UmlClassDiagramsFrame import UmlClassDiagramsFrame
 
 
@@ -33,9 +32,9 @@ class DelOglLinkCommand(DelOglObjectCommand):
         self._linkDestId   = None
         self._linkId       = None
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
 
-        serialLink = Command.serialize(self)
+        record: CommandRecord = Command.serialize(self)
 
         self._srcPosition  = self._shape.GetSource().GetModel().GetPosition()
         self._destPosition = self._shape.GetDestination().GetModel().GetPosition()
@@ -44,28 +43,25 @@ class DelOglLinkCommand(DelOglObjectCommand):
         self._linkDestId   = self._shape.getDestinationShape().getPyutObject().getId()
         self._linkId       = self._shape.getPyutObject().getId()
 
-        serialLink += makeValuatedToken("srcPosition",  repr(self._srcPosition))
-        serialLink += makeValuatedToken("destPosition", repr(self._destPosition))
-        serialLink += makeValuatedToken("linkType",     repr(self._linkType))
-        serialLink += makeValuatedToken("linkSrcId",    repr(self._linkSrcId))
-        serialLink += makeValuatedToken("linkDestId",   repr(self._linkDestId))
-        serialLink += makeValuatedToken("linkId",       repr(self._linkId))
+        record['srcPosition']  = list(self._srcPosition)
+        record['destPosition'] = list(self._destPosition)
+        record['linkType']     = self._linkType.name
+        record['linkSrcId']    = self._linkSrcId
+        record['linkDestId']   = self._linkDestId
+        record['linkId']       = self._linkId
 
-        return serialLink
+        return record
 
-    def deserialize(self, serializedInfos):
+    def deserialize(self, record: CommandRecord):
 
         umlFrame = self.getGroup().getHistory().getFrame()
 
-        self._srcPosition  = eval(getTokenValue("srcPosition", serializedInfos))
-        self._destPosition = eval(getTokenValue("destPosition", serializedInfos))
-
-        linkTypeStr: str = getTokenValue("linkType", serializedInfos)
-        self._linkType   = LinkType.toEnum(linkTypeStr)
-
-        self._linkSrcId    = eval(getTokenValue("linkSrcId", serializedInfos))
-        self._linkDestId   = eval(getTokenValue("linkDestId", serializedInfos))
-        self._linkId       = eval(getTokenValue("linkId", serializedInfos))
+        self._srcPosition  = record['srcPosition']
+        self._destPosition = record['destPosition']
+        self._linkType     = LinkType.toEnum(record['linkType'])
+        self._linkSrcId    = record['linkSrcId']
+        self._linkDestId   = record['linkDestId']
+        self._linkId       = record['linkId']
 
         self._shape = umlFrame.getUmlObjectById(self._linkId)
 
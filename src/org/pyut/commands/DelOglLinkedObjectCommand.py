@@ -1,7 +1,7 @@
 
 from org.pyut.commands.DelOglObjectCommand import DelOglObjectCommand
 
-from org.pyut.history.HistoryUtils import getTokenValue
+from org.pyut.history.HistoryUtils import CommandRecord
 
 
 class DelOglLinkedObjectCommand(DelOglObjectCommand):
@@ -20,32 +20,27 @@ class DelOglLinkedObjectCommand(DelOglObjectCommand):
 
         super().__init__(shape)
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
         """
         Serialize the data needed by the destroyed OglLinkedObject.
         @return a string representation of the data needed by the command.
         """
 
         # serialize the data common to all OglObjects
-        serialShape = DelOglObjectCommand.serialize(self)
+        record: CommandRecord = DelOglObjectCommand.serialize(self)
 
-        fileName = self._shape.getPyutObject().getFilename()
-        serialShape += getTokenValue("fileName", fileName)
+        record['fileName'] = self._shape.getPyutObject().getFilename()
 
-        return serialShape
+        return record
 
-    def deserialize(self, serializedData: str):
+    def deserialize(self, record: CommandRecord):
         """
         deserialize the data needed by the destroyed OglLinkedObject.
 
         Args:
-            serializedData:
-
-        Returns:  deserialized data needed by the command.
-
+            record: The data needed by the command.
         """
         # deserialize the data common to all OglObjects
-        DelOglObjectCommand.deserialize(self, serializedData)
+        DelOglObjectCommand.deserialize(self, record)
 
-        fileName = getTokenValue("fileName", serializedData)
-        self._shape.getPyutObject().setFilename(fileName)
+        self._shape.getPyutObject().setFilename(record['fileName'])
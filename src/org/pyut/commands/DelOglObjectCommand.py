@@ -1,12 +1,11 @@
 
-from typing import Tuple
+from typing import List
 
 from importlib import import_module
 
 from org.pyut.commands.Command import Command
 
-from org.pyut.history.HistoryUtils import getTokenValue
-from org.pyut.history.HistoryUtils import makeValuatedToken
+from org.pyut.history.HistoryUtils import CommandRecord
 
 
 class DelOglObjectCommand(Command):
@@ -21,27 +20,21 @@ class DelOglObjectCommand(Command):
         super().__init__()
         self._shape = shape
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
 
-        serialShape = Command.serialize(self)
+        record: CommandRecord = Command.serialize(self)
 
         # serialize the class and module of the ogl and pyut shape to get the
         # constructors for the unserialization.
-        oglShapeModule = self._shape.__module__
-        oglShapeClass = self._shape.__class__.__name__
-        pyutShapeModule = self._shape.getPyutObject().__module__
-        pyutShapeClass = self._shape.getPyutObject().__class__.__name__
-        serialShape += makeValuatedToken("oglShapeModule", oglShapeModule)
-        serialShape += makeValuatedToken("oglShapeClass", oglShapeClass)
-        serialShape += makeValuatedToken("pyutShapeModule", pyutShapeModule)
-        serialShape += makeValuatedToken("pyutShapeClass", pyutShapeClass)
+        record['oglShapeModule']  = self._shape.__module__
+        record['oglShapeClass']   = self._shape.__class__.__name__
+        record['pyutShapeModule'] = self._shape.getPyutObject().__module__
+        record['pyutShapeClass']  = self._shape.getPyutObject().__class__.__name__
         # serialize the shape's model size and position and NOT the Ogl(view)'s
         # ones because a zoom could be performed in between.
         model = self._shape.GetModel()
-        pos = model.GetPosition()
-        size = model.GetSize()
-        serialShape += makeValuatedToken("position", repr(pos))
-        serialShape += makeValuatedToken("size", repr(size))
+        record['position'] = list(model.GetPosition())
+        record['size']     = list(model.GetSize())
         # serialize the graphical links (Ogl) attached to the shape
         # and put it in the common data of the group. We have to do
         # so because the link can be rebuilt only after the
@@ -55,35 +48,31 @@ class DelOglObjectCommand(Command):
 
         # serialize data to init the associated pyutObject
         pyutObj = self._shape.getPyutObject()
-        shapeId = pyutObj.getId()
-        shapeName = pyutObj.getName()
-        serialShape += makeValuatedToken("shapeId", repr(shapeId))
-        serialShape += makeValuatedToken("shapeName", shapeName)
+        record['shapeId']   = pyutObj.getId()
+        record['shapeName'] = pyutObj.getName()
 
-        return serialShape
+        return record
 
-    def deserialize(self, serializedData):
+    def deserialize(self, record: CommandRecord):
         """
         Deserialize the data needed to undo/redo a delete command and createa shape
         Args:
-            serializedData:
+            record:
         """
 
-        oglShapeClassName:   str = getTokenValue("oglShapeClass", serializedData)
-        oglShapeModuleName:  str = getTokenValue("oglShapeModule", serializedData)
-        pyutShapeClassName:  str = getTokenValue("pyutShapeClass", serializedData)
-        pyutShapeModuleName: str = getTokenValue("pyutShapeModule", serializedData)
+        oglShapeClassName:   str = record['oglShapeClass']
+        oglShapeModuleName:  str = record['oglShapeModule']
+        pyutShapeClassName:  str = record['pyutShapeClass']
+        pyutShapeModuleName: str = record['pyutShapeModule']
 
-        shapeName:     str = getTokenValue("shapeName", serializedData)     # name of the pyutObject
-        shapeId:       int = eval(getTokenValue("shapeId", serializedData))
+        shapeName:     str = record['shapeName']     # name of the pyutObject
+        shapeId:       int = record['shapeId']
 
-        shapePosition: Tuple[float, float] = eval(getTokenValue("position", serializedData))
-        shapeSize:     Tuple[float, float] = eval(getTokenValue("size", serializedData))
+        shapePosition: List[float] = record['position']
+        shapeSize:     List[float] = record['size']
         #
         # Construct the UML objects
         # import the module which contains the ogl and pyut shape classes and instantiate the classes
-        # oglShapeClass = getattr(__import__(oglShapeModule), oglShapeClassName)
-        # pyutShapeClass = getattr(__import__(pyutShapeModule), pyutShapeClassName)
         oglModule = import_module(oglShapeModuleName)
         oglShapeClass = getattr(oglModule, oglShapeClassName)
 
@@ -0,0 +1,101 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from importlib import import_module
+
+from org.pyut.commands.Command import Command
+from org.pyut.commands.DelOglClassCommand import DelOglClassCommand
+from org.pyut.commands.DelOglLinkCommand import DelOglLinkCommand
+from org.pyut.commands.DelOglObjectCommand import DelOglObjectCommand
+
+from org.pyut.history.HistoryUtils import COMMAND_CLASS_ID
+from org.pyut.history.HistoryUtils import COMMAND_MODULE_ID
+from org.pyut.history.HistoryUtils import CommandRecord
+
+from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglLink import OglLink
+
+CommandType = Tuple[str, str]     # module, class
+
+
+class DelOglObjectsCommand(Command):
+    """
+    This class is a part of the history system of PyUt.
+    It execute/undo/redo the deletion of a whole selection as one command.  The shapes
+    are snapshot by the usual per shape delete commands, but they are kept in one record
+    where each command type is stored once and the snapshots refer to it by index.
+    """
+    def __init__(self, shapes: List = None):
+        """
+
+        Args:
+            shapes:  The OglObjects and OglLinks to delete
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._commands: List[Command] = []
+        if shapes is not None:
+            for shape in shapes:
+                self._commands.append(DelOglObjectsCommand._createDeleteCommand(shape))
+
+    def serialize(self) -> CommandRecord:
+
+        record: CommandRecord = Command.serialize(self)
+
+        commandTypes: List[CommandType]      = []
+        typeIndices:  Dict[CommandType, int] = {}
+        snapshots:    List                   = []
+        for command in self._commands:
+            # the links that are not deleted with the selection are appended to the group
+            command.setGroup(self.getGroup())
+            snapshot: CommandRecord = command.serialize()
+
+            commandType: CommandType = (snapshot.pop(COMMAND_MODULE_ID), snapshot.pop(COMMAND_CLASS_ID))
+            if commandType not in typeIndices:
+                typeIndices[commandType] = len(commandTypes)
+                commandTypes.append(commandType)
+            snapshots.append([typeIndices[commandType], snapshot])
+
+        record['commandTypes'] = [list(commandType) for commandType in commandTypes]
+        record['snapshots']    = snapshots
+
+        return record
+
+    def deserialize(self, record: CommandRecord):
+
+        commandClasses: List = []
+        for moduleName, className in record['commandTypes']:
+            commandClasses.append(getattr(import_module(moduleName), className))
+
+        self._commands = []
+        for typeIndex, snapshot in record['snapshots']:
+            command: Command = commandClasses[typeIndex]()
+            command.setGroup(self.getGroup())
+            command.deserialize(snapshot)
+            self._commands.append(command)
+
+    def redo(self):
+        for command in self._commands:
+            command.setGroup(self.getGroup())
+            command.redo()
+
+    def undo(self):
+        for command in self._commands:
+            command.setGroup(self.getGroup())
+            command.undo()
+
+    @staticmethod
+    def _createDeleteCommand(shape) -> Command:
+
+        if isinstance(shape, OglClass):
+            return DelOglClassCommand(shape)
+        elif isinstance(shape, OglLink):
+            return DelOglLinkCommand(shape)
+        else:
+            return DelOglObjectCommand(shape)
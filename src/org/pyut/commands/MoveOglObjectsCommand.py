@@ -0,0 +1,101 @@
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from time import monotonic
+
+from org.pyut.commands.Command import Command
+
+from org.pyut.history.HistoryUtils import CommandRecord
+
+
+class MoveOglObjectsCommand(Command):
+    """
+    This class is a part of the history system of PyUt.
+    It undo/redo the move of a selection as a single delta applied to the IDs of the
+    moved shapes, whatever the number of shapes.  A move of the same shapes that follows
+    within `COALESCE_SECONDS` is merged into this one;  See `coalesce()`.
+    """
+    COALESCE_SECONDS: float = 1.0
+
+    def __init__(self, shapeIds: List[int] = None, deltaX: float = 0.0, deltaY: float = 0.0):
+        """
+
+        Args:
+            shapeIds:   The pyut IDs of the moved shapes
+            deltaX:     How far they were moved
+            deltaY:
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._shapeIds:  List[int] = [] if shapeIds is None else shapeIds
+        self._deltaX:    float     = deltaX
+        self._deltaY:    float     = deltaY
+        self._timeStamp: float     = monotonic()
+
+    @property
+    def shapeIds(self) -> List[int]:
+        return self._shapeIds
+
+    @property
+    def delta(self) -> Tuple[float, float]:
+        return self._deltaX, self._deltaY
+
+    def serialize(self) -> CommandRecord:
+
+        record: CommandRecord = Command.serialize(self)
+
+        record['shapeIds'] = self._shapeIds
+        record['delta']    = [self._deltaX, self._deltaY]
+
+        return record
+
+    def deserialize(self, record: CommandRecord):
+
+        self._shapeIds = record['shapeIds']
+        self._deltaX, self._deltaY = record['delta']
+
+    def coalesce(self, command: Command) -> bool:
+        """
+        Merge a move of the same shapes that comes soon after this one
+
+        Args:
+            command:    The command that follows
+
+        Returns:  `True` if this command now includes `command`
+        """
+        if not isinstance(command, MoveOglObjectsCommand):
+            return False
+        if command._timeStamp - self._timeStamp > MoveOglObjectsCommand.COALESCE_SECONDS:
+            return False
+        if sorted(command._shapeIds) != sorted(self._shapeIds):
+            return False
+
+        self._deltaX    += command._deltaX
+        self._deltaY    += command._deltaY
+        self._timeStamp  = command._timeStamp
+
+        return True
+
+    def redo(self):
+        self._moveBy(self._deltaX, self._deltaY)
+
+    def undo(self):
+        self._moveBy(-self._deltaX, -self._deltaY)
+
+    def _moveBy(self, deltaX: float, deltaY: float):
+
+        umlFrame = self.getGroup().getHistory().getFrame()
+        for shapeId in self._shapeIds:
+            shape = umlFrame.getUmlObjectById(shapeId)
+            if shape is None:
+                self.logger.warning(f'Cannot move missing shape: {shapeId}')
+                continue
+            x, y = shape.GetPosition()
+            shape.SetPosition(x + deltaX, y + deltaY)
+
+        umlFrame.Refresh()
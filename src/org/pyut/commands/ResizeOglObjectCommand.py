@@ -0,0 +1,102 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from time import monotonic
+
+from org.pyut.commands.Command import Command
+
+from org.pyut.history.HistoryUtils import CommandRecord
+
+ShapeGeometry = List[float]     # x, y, width, height
+
+
+class ResizeOglObjectCommand(Command):
+    """
+    This class is a part of the history system of PyUt.
+    It undo/redo the resize of a shape by restoring its position and size.  A resize of
+    the same shape that follows within `COALESCE_SECONDS` is merged into this one, so
+    that the command always goes from the first geometry to the last one.
+    """
+    COALESCE_SECONDS: float = 1.0
+
+    def __init__(self, shapeId: int = 0, oldGeometry: ShapeGeometry = None, newGeometry: ShapeGeometry = None):
+        """
+
+        Args:
+            shapeId:        The pyut ID of the resized shape
+            oldGeometry:    Its position and size before the resize
+            newGeometry:    Its position and size after the resize
+        """
+        super().__init__()
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._shapeId:     int           = shapeId
+        self._oldGeometry: ShapeGeometry = oldGeometry
+        self._newGeometry: ShapeGeometry = newGeometry
+        self._timeStamp:   float         = monotonic()
+
+    def serialize(self) -> CommandRecord:
+
+        record: CommandRecord = Command.serialize(self)
+
+        record['shapeId']     = self._shapeId
+        record['oldGeometry'] = self._oldGeometry
+        record['newGeometry'] = self._newGeometry
+
+        return record
+
+    def deserialize(self, record: CommandRecord):
+
+        self._shapeId     = record['shapeId']
+        self._oldGeometry = record['oldGeometry']
+        self._newGeometry = record['newGeometry']
+
+    def coalesce(self, command: Command) -> bool:
+        """
+        Merge a resize of the same shape that comes soon after this one
+
+        Args:
+            command:    The command that follows
+
+        Returns:  `True` if this command now includes `command`
+        """
+        if not isinstance(command, ResizeOglObjectCommand):
+            return False
+        if command._timeStamp - self._timeStamp > ResizeOglObjectCommand.COALESCE_SECONDS:
+            return False
+        if command._shapeId != self._shapeId:
+            return False
+
+        self._newGeometry = command._newGeometry
+        self._timeStamp   = command._timeStamp
+
+        return True
+
+    def redo(self):
+        self._applyGeometry(self._newGeometry)
+
+    def undo(self):
+        self._applyGeometry(self._oldGeometry)
+
+    def _applyGeometry(self, geometry: ShapeGeometry):
+
+        umlFrame = self.getGroup().getHistory().getFrame()
+        shape    = umlFrame.getUmlObjectById(self._shapeId)
+        if shape is None:
+            self.logger.warning(f'Cannot resize missing shape: {self._shapeId}')
+            return
+
+        x, y, width, height = geometry
+        # the sizers are laid out when they are shown;  Hide them while the size changes
+        selected: bool = shape.IsSelected()
+        if selected is True:
+            shape.ShowSizers(False)
+        shape.SetPosition(x, y)
+        shape.SetSize(width, height)
+        if selected is True:
+            shape.ShowSizers(True)
+
+        umlFrame.Refresh()
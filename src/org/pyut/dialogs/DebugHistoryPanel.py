@@ -0,0 +1,102 @@
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import ALL
+from wx import EVT_BUTTON
+from wx import HORIZONTAL
+from wx import ID_ANY
+from wx import LC_REPORT
+from wx import LEFT
+from wx import LIST_FORMAT_RIGHT
+from wx import RIGHT
+from wx import VERTICAL
+
+from wx import BoxSizer
+from wx import Button
+from wx import CommandEvent
+from wx import ListCtrl
+from wx import Panel
+from wx import StaticBox
+from wx import StaticBoxSizer
+from wx import Window
+
+from org.pyut.general.Mediator import Mediator
+
+from org.pyut.history.HistoryJournal import HistoryJournal
+from org.pyut.history.HistoryManager import HistoryManager
+
+HistoryCounter = Tuple[str, int]    # name, value
+
+
+class DebugHistoryPanel(Panel):
+    """
+    Shows how much the undo history of the current diagram holds in memory and on disk,
+    and how often it was compressed, evicted and compacted to stay within its budget
+    """
+    HORIZONTAL_GAP: int = 5
+
+    COUNTERS_SIZE: Tuple[int, int] = (650, 150)
+
+    COLUMN_NAMES: List[str] = ['Counter', 'Value']
+
+    def __init__(self, parent: Window):
+
+        super().__init__(parent, ID_ANY)
+        self.logger: Logger = getLogger(__name__)
+
+        box:       StaticBox      = StaticBox(self, ID_ANY, 'Undo History')
+        mainSizer: StaticBoxSizer = StaticBoxSizer(box, VERTICAL)
+
+        self._counters: ListCtrl = ListCtrl(self, ID_ANY, size=DebugHistoryPanel.COUNTERS_SIZE, style=LC_REPORT)
+        for idx, name in enumerate(DebugHistoryPanel.COLUMN_NAMES):
+            columnFormat: int = LIST_FORMAT_RIGHT if idx > 0 else 0
+            self._counters.InsertColumn(idx, name, format=columnFormat)
+
+        szrButtons: BoxSizer = BoxSizer(HORIZONTAL)
+        btnRefresh: Button   = Button(self, ID_ANY, 'Refresh')
+        szrButtons.Add(btnRefresh, 0, ALL, DebugHistoryPanel.HORIZONTAL_GAP)
+
+        mainSizer.Add(self._counters, 0, LEFT | RIGHT, DebugHistoryPanel.HORIZONTAL_GAP)
+        mainSizer.Add(szrButtons,     0)
+
+        self.SetSizer(mainSizer)
+        mainSizer.Fit(self)
+
+        self.Bind(EVT_BUTTON, self.__onRefresh, btnRefresh)
+
+        self.refreshCounters()
+
+    def refreshCounters(self):
+        """
+        Show the counters of the current diagram's history;  Nothing is shown if no diagram is open
+        """
+        self._counters.DeleteAllItems()
+
+        umlFrame = Mediator().getUmlFrame()
+        if umlFrame is None:
+            return
+
+        for idx, (name, value) in enumerate(self.__historyCounters(umlFrame.getHistory())):
+            self._counters.InsertItem(idx, name)
+            self._counters.SetItem(idx, 1, str(value))
+
+    def __historyCounters(self, history: HistoryManager) -> List[HistoryCounter]:
+
+        journal: HistoryJournal = history.journal
+
+        return [
+            ('Groups',              history.groupCount),
+            ('Memory bytes',        history.byteCount),
+            ('Groups compressed',   history.compressedCount),
+            ('Groups evicted',      history.evictedCount),
+            ('Journal bytes',       journal.size),
+            ('Journal live bytes',  journal.liveSize),
+            ('Journal compactions', journal.compactionCount),
+        ]
+
+    # noinspection PyUnusedLocal
+    def __onRefresh(self, event: CommandEvent):
+        self.refreshCounters()
@@ -0,0 +1,114 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import ALL
+from wx import EVT_BUTTON
+from wx import EVT_CHECKBOX
+from wx import HORIZONTAL
+from wx import ID_ANY
+from wx import LC_REPORT
+from wx import LEFT
+from wx import LIST_FORMAT_RIGHT
+from wx import RIGHT
+from wx import VERTICAL
+
+from wx import BoxSizer
+from wx import Button
+from wx import CheckBox
+from wx import CommandEvent
+from wx import ListCtrl
+from wx import Panel
+from wx import StaticBox
+from wx import StaticBoxSizer
+from wx import Window
+
+from org.pyut.general.Tracer import TraceStatistic
+from org.pyut.general.Tracer import TraceSubsystem
+from org.pyut.general.Tracer import Tracer
+
+
+class DebugTracingPanel(Panel):
+    """
+    Switches the hot path tracing on and off per subsystem and shows the counters
+    and timers collected so far
+    """
+    HORIZONTAL_GAP: int = 5
+
+    STATISTICS_SIZE: Tuple[int, int] = (650, 150)
+
+    COLUMN_NAMES: List[str] = ['Trace Point', 'Calls', 'Total ms', 'Mean ms']
+
+    def __init__(self, parent: Window):
+
+        super().__init__(parent, ID_ANY)
+        self.logger: Logger = getLogger(__name__)
+
+        self._tracer: Tracer = Tracer()
+
+        self._subsystemCheckBoxes: Dict[int, TraceSubsystem] = {}
+
+        box:       StaticBox      = StaticBox(self, ID_ANY, 'Hot Path Tracing')
+        mainSizer: StaticBoxSizer = StaticBoxSizer(box, VERTICAL)
+
+        szrSubsystems: BoxSizer = BoxSizer(HORIZONTAL)
+        for subsystem in TraceSubsystem:
+            cb: CheckBox = CheckBox(self, ID_ANY, subsystem.value)
+            cb.SetValue(self._tracer.isEnabled(subsystem))
+            self._subsystemCheckBoxes[cb.GetId()] = subsystem
+            szrSubsystems.Add(cb, 0, LEFT | RIGHT, DebugTracingPanel.HORIZONTAL_GAP)
+            self.Bind(EVT_CHECKBOX, self.__onSubsystemToggled, cb)
+
+        self._statistics: ListCtrl = ListCtrl(self, ID_ANY, size=DebugTracingPanel.STATISTICS_SIZE, style=LC_REPORT)
+        for idx, name in enumerate(DebugTracingPanel.COLUMN_NAMES):
+            columnFormat: int = LIST_FORMAT_RIGHT if idx > 0 else 0
+            self._statistics.InsertColumn(idx, name, format=columnFormat)
+
+        szrButtons:    BoxSizer = BoxSizer(HORIZONTAL)
+        btnRefresh:    Button   = Button(self, ID_ANY, 'Refresh')
+        btnReset:      Button   = Button(self, ID_ANY, 'Reset')
+        szrButtons.Add(btnRefresh, 0, ALL, DebugTracingPanel.HORIZONTAL_GAP)
+        szrButtons.Add(btnReset,   0, ALL, DebugTracingPanel.HORIZONTAL_GAP)
+
+        mainSizer.Add(szrSubsystems,    0, ALL, DebugTracingPanel.HORIZONTAL_GAP)
+        mainSizer.Add(self._statistics, 0, LEFT | RIGHT, DebugTracingPanel.HORIZONTAL_GAP)
+        mainSizer.Add(szrButtons,       0)
+
+        self.SetSizer(mainSizer)
+        mainSizer.Fit(self)
+
+        self.Bind(EVT_BUTTON, self.__onRefresh, btnRefresh)
+        self.Bind(EVT_BUTTON, self.__onReset,   btnReset)
+
+        self.refreshStatistics()
+
+    def refreshStatistics(self):
+        """
+        Show the tracer's current counters and timers
+        """
+        self._statistics.DeleteAllItems()
+
+        statistics: List[TraceStatistic] = self._tracer.statistics()
+        for idx, (name, count, seconds) in enumerate(statistics):
+            totalMilliseconds: float = seconds * 1000.0
+            self._statistics.InsertItem(idx, name)
+            self._statistics.SetItem(idx, 1, str(count))
+            self._statistics.SetItem(idx, 2, f'{totalMilliseconds:.2f}')
+            self._statistics.SetItem(idx, 3, f'{totalMilliseconds / count:.3f}')
+
+    def __onSubsystemToggled(self, event: CommandEvent):
+
+        subsystem: TraceSubsystem = self._subsystemCheckBoxes[event.GetId()]
+        self._tracer.setEnabled(subsystem, event.IsChecked())
+
+    # noinspection PyUnusedLocal
+    def __onRefresh(self, event: CommandEvent):
+        self.refreshStatistics()
+
+    # noinspection PyUnusedLocal
+    def __onReset(self, event: CommandEvent):
+        self._tracer.reset()
+        self.refreshStatistics()
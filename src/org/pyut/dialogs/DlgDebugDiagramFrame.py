@@ -100,6 +100,7 @@ class DlgDebugDiagramFrame(Dialog):
 
         self.__x.SetLabel(str(wx))
         self.__y.SetLabel(str(wy))
+        self.__culled.SetLabel(str(self._diagramFrame.culledShapeCount))
 
     def __initializeTheControls(self, mainSizer: StaticBoxSizer):
         """
@@ -107,14 +108,16 @@ class DlgDebugDiagramFrame(Dialog):
         """
         # IDs
         [
-            self.__xId, self.__yId
-        ] = PyutUtils.assignID(2)
+            self.__xId, self.__yId, self.__culledId
+        ] = PyutUtils.assignID(3)
 
-        xBox, self.__x = self.__createPositionContainer('Frame X Position: ', self.__xId)
-        yBox, self.__y = self.__createPositionContainer('Frame Y Position: ', self.__yId)
+        xBox, self.__x           = self.__createPositionContainer('Frame X Position: ', self.__xId)
+        yBox, self.__y           = self.__createPositionContainer('Frame Y Position: ', self.__yId)
+        culledBox, self.__culled = self.__createPositionContainer('Culled Shapes: ',    self.__culledId)
 
-        mainSizer.Add(xBox, 0, ALL, DlgDebugDiagramFrame.VERTICAL_GAP)
-        mainSizer.Add(yBox, 0, ALL, DlgDebugDiagramFrame.VERTICAL_GAP)
+        mainSizer.Add(xBox,      0, ALL, DlgDebugDiagramFrame.VERTICAL_GAP)
+        mainSizer.Add(yBox,      0, ALL, DlgDebugDiagramFrame.VERTICAL_GAP)
+        mainSizer.Add(culledBox, 0, ALL, DlgDebugDiagramFrame.VERTICAL_GAP)
 
     def __createPositionContainer(self, labelText: str, posId: int) -> Tuple[BoxSizer, StaticText]:
 
@@ -400,9 +400,10 @@ class DlgEditClass(DlgEditClassCommon):
 
         prefs: PyutPreferences = PyutPreferences()
         try:
-            if prefs.autoResizeShapesOnEdit is True:
-                oglClass = self._mediator.getOglClass(self._pyutModel)
-                if oglClass is not None:
+            oglClass = self._mediator.getOglClass(self._pyutModel)
+            if oglClass is not None:
+                oglClass.invalidateRenderCache()
+                if prefs.autoResizeShapesOnEdit is True:
                     oglClass.autoResize()
         except (ValueError, Exception) as e:
             self.logger.warning(f'{e}')
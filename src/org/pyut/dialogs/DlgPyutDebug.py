@@ -31,7 +31,9 @@ from org.pyut.PyutUtils import PyutUtils
 
 from org.pyut.dialogs.BaseDlgEdit import BaseDlgEdit
 
+from org.pyut.dialogs.DebugHistoryPanel import DebugHistoryPanel
 from org.pyut.dialogs.DebugListControl import DebugListControl
+from org.pyut.dialogs.DebugTracingPanel import DebugTracingPanel
 
 
 class DlgPyutDebug(BaseDlgEdit):
@@ -64,10 +66,14 @@ class DlgPyutDebug(BaseDlgEdit):
         hs:        Sizer    = self._createDialogButtonsContainer()
         mainSizer: BoxSizer = BoxSizer(orient=VERTICAL)
 
-        self._list: DebugListControl = self.__initializeTheControls()
+        self._list:    DebugListControl  = self.__initializeTheControls()
+        self._tracing: DebugTracingPanel = DebugTracingPanel(self)
+        self._history: DebugHistoryPanel = DebugHistoryPanel(self)
 
-        mainSizer.Add(self._list, 0, LEFT | RIGHT | ALIGN_LEFT, border=5)
-        mainSizer.Add(hs,         0, CENTER)
+        mainSizer.Add(self._list,    0, LEFT | RIGHT | ALIGN_LEFT, border=5)
+        mainSizer.Add(self._tracing, 0, LEFT | RIGHT | ALIGN_LEFT, border=5)
+        mainSizer.Add(self._history, 0, LEFT | RIGHT | ALIGN_LEFT, border=5)
+        mainSizer.Add(hs,            0, CENTER)
 
         self.SetSizer(mainSizer)
 
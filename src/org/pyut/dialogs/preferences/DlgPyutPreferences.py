@@ -40,6 +40,7 @@ from org.pyut.dialogs.preferences.GeneralPreferences import GeneralPreferencesPa
 from org.pyut.dialogs.preferences.MiscellaneousPreferences import MiscellaneousPreferences
 from org.pyut.dialogs.preferences.PositioningPreferences import PositioningPreferences
 from org.pyut.dialogs.preferences.BackgroundPreferences import BackgroundPreferences
+from org.pyut.dialogs.preferences.PerformancePreferences import PerformancePreferences
 
 from org.pyut.general.Globals import _
 
@@ -102,11 +103,13 @@ class DlgPyutPreferences(Dialog):
         positioningPreferences: PositioningPreferences   = PositioningPreferences(parent=self)
         miscPanel:              MiscellaneousPreferences = MiscellaneousPreferences(parent=self)
         backgroundPreferences:  BackgroundPreferences    = BackgroundPreferences(parent=self)
+        performancePreferences: PerformancePreferences   = PerformancePreferences(parent=self)
 
         book.AddPage(generalPreferences,     text=_('General'),       select=False)
         book.AddPage(positioningPreferences, text=_('Positioning'),   select=False)
         book.AddPage(miscPanel,              text=_('Miscellaneous'), select=False)
         book.AddPage(backgroundPreferences,  text=_('Diagram'),       select=True)
+        book.AddPage(performancePreferences, text=_('Performance'),   select=False)
 
         self._positioningPreferences: PositioningPreferences = positioningPreferences
         return book
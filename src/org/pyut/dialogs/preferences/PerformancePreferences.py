@@ -0,0 +1,203 @@
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import ALIGN_LEFT
+from wx import EVT_CHECKBOX
+from wx import EVT_SPINCTRL
+from wx import EVT_SPINCTRLDOUBLE
+from wx import HORIZONTAL
+from wx import ID_ANY
+from wx import LEFT
+from wx import RIGHT
+from wx import TOP
+from wx import VERTICAL
+
+from wx import BoxSizer
+from wx import CheckBox
+from wx import CommandEvent
+from wx import SpinCtrl
+from wx import SpinCtrlDouble
+from wx import SpinDoubleEvent
+from wx import SpinEvent
+from wx import StaticBox
+from wx import StaticBoxSizer
+from wx import Window
+
+from org.pyut.dialogs.preferences.PreferencesPanel import PreferencesPanel
+
+from org.pyut.PyutUtils import PyutUtils
+
+from org.pyut.general.Globals import _
+
+
+class PerformancePreferences(PreferencesPanel):
+
+    VERTICAL_GAP:   int = 5
+    HORIZONTAL_GAP: int = 5
+
+    MINIMUM_ZOOM:   float = 0.0
+    MAXIMUM_ZOOM:   float = 1.0
+    ZOOM_INCREMENT: float = 0.05
+
+    MAXIMUM_FRAME_RATE: int = 240
+
+    MAXIMUM_HISTORY_GROUPS:    int = 100000
+    MAXIMUM_HISTORY_KILOBYTES: int = 1024 * 1024
+
+    clsLogger: Logger = getLogger(__name__)
+
+    def __init__(self, parent: Window):
+
+        super().__init__(parent=parent)
+
+        [self.classRenderCacheID, self.titleZoomID, self.outlineZoomID, self.dragFrameRateID, self.graphicsContextID,
+         self.historyWriteBehindID, self.historyMaximumGroupsID, self.historyMaximumKilobytesID] = PyutUtils.assignID(8)
+
+        self._createControls()
+        self.__setControlValues()
+
+    def _createControls(self):
+        """
+        Creates the main control and stashes them as private instance variables
+        """
+        mainSizer: BoxSizer = BoxSizer(VERTICAL)
+
+        cbClassRenderCache: CheckBox = CheckBox(self, self.classRenderCacheID, _('Cache Rendered Classes (uses more memory)'))
+        cbGraphicsContext:  CheckBox = CheckBox(self, self.graphicsContextID,  _('Anti-aliased Drawing'))
+        cbHistoryWriteBehind: CheckBox = CheckBox(self, self.historyWriteBehindID, _('Write Undo History in Batches'))
+
+        szrTitleZoom,   scTitleZoom   = self.__createZoomThreshold(self.titleZoomID,   _('Only Show Class Names Below Zoom'))
+        szrOutlineZoom, scOutlineZoom = self.__createZoomThreshold(self.outlineZoomID, _('Only Show Class Outlines Below Zoom'))
+
+        szrHistoryGroups, scHistoryGroups = self.__createHistoryLimit(self.historyMaximumGroupsID, _('Maximum Undo Steps (0 is no limit)'),
+                                                                      PerformancePreferences.MAXIMUM_HISTORY_GROUPS)
+        szrHistoryKilobytes, scHistoryKilobytes = self.__createHistoryLimit(self.historyMaximumKilobytesID, _('Maximum Undo Memory in KB (0 is no limit)'),
+                                                                            PerformancePreferences.MAXIMUM_HISTORY_KILOBYTES)
+
+        mainSizer.Add(cbClassRenderCache, 0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(cbGraphicsContext,  0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(cbHistoryWriteBehind, 0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.AddSpacer(PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(szrTitleZoom,       0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(szrOutlineZoom,     0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(self.__createDragFrameRate(), 0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(szrHistoryGroups,    0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+        mainSizer.Add(szrHistoryKilobytes, 0, LEFT | RIGHT | TOP, PerformancePreferences.VERTICAL_GAP)
+
+        self._cbClassRenderCache: CheckBox       = cbClassRenderCache
+        self._cbGraphicsContext:  CheckBox       = cbGraphicsContext
+        self._cbHistoryWriteBehind: CheckBox     = cbHistoryWriteBehind
+        self._scTitleZoom:        SpinCtrlDouble = scTitleZoom
+        self._scOutlineZoom:      SpinCtrlDouble = scOutlineZoom
+        self._scHistoryGroups:    SpinCtrl       = scHistoryGroups
+        self._scHistoryKilobytes: SpinCtrl       = scHistoryKilobytes
+
+        self.SetAutoLayout(True)
+        self.SetSizer(mainSizer)
+
+        self.Bind(EVT_CHECKBOX,       self.onClassRenderCacheChanged, self.classRenderCacheID)
+        self.Bind(EVT_CHECKBOX,       self.onGraphicsContextChanged,  self.graphicsContextID)
+        self.Bind(EVT_CHECKBOX,       self.onHistoryWriteBehindChanged, self.historyWriteBehindID)
+        self.Bind(EVT_SPINCTRLDOUBLE, self.onTitleZoomChanged,        self.titleZoomID)
+        self.Bind(EVT_SPINCTRLDOUBLE, self.onOutlineZoomChanged,      self.outlineZoomID)
+        self.Bind(EVT_SPINCTRL,       self.onDragFrameRateChanged,    self.dragFrameRateID)
+        self.Bind(EVT_SPINCTRL,       self.onHistoryMaximumGroupsChanged,    self.historyMaximumGroupsID)
+        self.Bind(EVT_SPINCTRL,       self.onHistoryMaximumKilobytesChanged, self.historyMaximumKilobytesID)
+
+    def __createZoomThreshold(self, spinnerId: int, label: str) -> Tuple[StaticBoxSizer, SpinCtrlDouble]:
+
+        box:          StaticBox      = StaticBox(self, ID_ANY, label)
+        szrThreshold: StaticBoxSizer = StaticBoxSizer(box, HORIZONTAL | ALIGN_LEFT)
+
+        scZoom: SpinCtrlDouble = SpinCtrlDouble(self, spinnerId, min=PerformancePreferences.MINIMUM_ZOOM, max=PerformancePreferences.MAXIMUM_ZOOM,
+                                                inc=PerformancePreferences.ZOOM_INCREMENT)
+        scZoom.SetDigits(2)
+
+        szrThreshold.Add(scZoom, 0, LEFT | RIGHT, PerformancePreferences.HORIZONTAL_GAP)
+
+        return szrThreshold, scZoom
+
+    def __createDragFrameRate(self) -> StaticBoxSizer:
+
+        box:          StaticBox      = StaticBox(self, ID_ANY, _('Drag Redraws per Second (0 is every mouse move)'))
+        szrFrameRate: StaticBoxSizer = StaticBoxSizer(box, HORIZONTAL | ALIGN_LEFT)
+
+        scFrameRate: SpinCtrl = SpinCtrl(self, self.dragFrameRateID, "", min=0, max=PerformancePreferences.MAXIMUM_FRAME_RATE)
+
+        szrFrameRate.Add(scFrameRate, 0, LEFT | RIGHT, PerformancePreferences.HORIZONTAL_GAP)
+
+        self._scDragFrameRate: SpinCtrl = scFrameRate
+
+        return szrFrameRate
+
+    def __createHistoryLimit(self, spinnerId: int, label: str, maximum: int) -> Tuple[StaticBoxSizer, SpinCtrl]:
+
+        box:      StaticBox      = StaticBox(self, ID_ANY, label)
+        szrLimit: StaticBoxSizer = StaticBoxSizer(box, HORIZONTAL | ALIGN_LEFT)
+
+        scLimit: SpinCtrl = SpinCtrl(self, spinnerId, "", min=0, max=maximum)
+
+        szrLimit.Add(scLimit, 0, LEFT | RIGHT, PerformancePreferences.HORIZONTAL_GAP)
+
+        return szrLimit, scLimit
+
+    def __setControlValues(self):
+        """
+        Set the default values on the controls.
+        """
+        self._cbClassRenderCache.SetValue(self._prefs.classRenderCache)
+        self._cbGraphicsContext.SetValue(self._prefs.graphicsContextRendering)
+        self._cbHistoryWriteBehind.SetValue(self._prefs.historyWriteBehind)
+        self._scTitleZoom.SetValue(self._prefs.levelOfDetailTitleZoom)
+        self._scOutlineZoom.SetValue(self._prefs.levelOfDetailOutlineZoom)
+        self._scDragFrameRate.SetValue(self._prefs.dragFrameRate)
+        self._scHistoryGroups.SetValue(self._prefs.historyMaximumGroups)
+        self._scHistoryKilobytes.SetValue(self._prefs.historyMaximumKilobytes)
+
+    def onClassRenderCacheChanged(self, event: CommandEvent):
+
+        enabledValue: bool = event.IsChecked()
+        PerformancePreferences.clsLogger.info(f'onClassRenderCacheChanged - {enabledValue}')
+        self._prefs.classRenderCache = enabledValue
+        event.Skip(True)
+
+    def onGraphicsContextChanged(self, event: CommandEvent):
+
+        enabledValue: bool = event.IsChecked()
+        PerformancePreferences.clsLogger.info(f'onGraphicsContextChanged - {enabledValue}')
+        self._prefs.graphicsContextRendering = enabledValue
+        event.Skip(True)
+
+    def onHistoryWriteBehindChanged(self, event: CommandEvent):
+
+        enabledValue: bool = event.IsChecked()
+        PerformancePreferences.clsLogger.info(f'onHistoryWriteBehindChanged - {enabledValue}')
+        self._prefs.historyWriteBehind = enabledValue
+        event.Skip(True)
+
+    def onTitleZoomChanged(self, event: SpinDoubleEvent):
+
+        self._prefs.levelOfDetailTitleZoom = event.GetValue()
+        event.Skip(True)
+
+    def onOutlineZoomChanged(self, event: SpinDoubleEvent):
+
+        self._prefs.levelOfDetailOutlineZoom = event.GetValue()
+        event.Skip(True)
+
+    def onDragFrameRateChanged(self, event: SpinEvent):
+
+        self._prefs.dragFrameRate = event.GetInt()
+        event.Skip(True)
+
+    def onHistoryMaximumGroupsChanged(self, event: SpinEvent):
+
+        self._prefs.historyMaximumGroups = event.GetInt()
+        event.Skip(True)
+
+    def onHistoryMaximumKilobytesChanged(self, event: SpinEvent):
+
+        self._prefs.historyMaximumKilobytes = event.GetInt()
+        event.Skip(True)
@@ -0,0 +1,134 @@
+from typing import Dict
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.general.Singleton import Singleton
+
+
+class IDRegistry(Singleton):
+    """
+    Hands out the model object IDs.  Replaces the old scheme where every new `PyutObject`
+    scanned all the UML objects on the current frame to find an unused ID.
+
+    IDs are tracked per scope;  Each project owns a scope so that IDs read from one
+    project file do not collide with IDs in another open project.  Allocation is O(1)
+    amortized;  The next ID pointer only moves forward and skips reserved IDs.
+
+    Usage:
+
+        registry: IDRegistry = IDRegistry()
+        newId:    int        = registry.allocate()      # a brand new model object
+        registry.reserve(42)                           # an ID read from a file
+        registry.release(newId)                        # the object got a different ID
+
+    `releaseCount` goes up every time an ID is given up;  An index of model objects by ID
+    that recorded it is still current as long as it has not changed
+    """
+    DEFAULT_SCOPE: int = 0
+
+    def init(self):
+        """
+        The singleton initialization method
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._usedIds:   Dict[int, Set[int]] = {IDRegistry.DEFAULT_SCOPE: set()}
+        self._nextIds:   Dict[int, int]      = {IDRegistry.DEFAULT_SCOPE: 0}
+        self._scope:     int                 = IDRegistry.DEFAULT_SCOPE
+        self._nextScope: int                 = IDRegistry.DEFAULT_SCOPE + 1
+
+        self._releaseCount: int = 0
+
+    @property
+    def scope(self) -> int:
+        """
+        Returns:  The scope that `allocate`, `reserve` and `release` work against
+        """
+        return self._scope
+
+    @scope.setter
+    def scope(self, newScope: int):
+        if newScope not in self._usedIds:
+            self._usedIds[newScope] = set()
+            self._nextIds[newScope] = 0
+        self._scope = newScope
+
+    @property
+    def releaseCount(self) -> int:
+        """
+        Returns:  How many times an ID was released, in any scope
+        """
+        return self._releaseCount
+
+    def newScope(self) -> int:
+        """
+        Creates an empty scope;  The current scope is unchanged
+
+        Returns:  The new scope identifier
+        """
+        scope: int = self._nextScope
+        self._nextScope += 1
+
+        self._usedIds[scope] = set()
+        self._nextIds[scope] = 0
+
+        return scope
+
+    def removeScope(self, scope: int):
+        """
+        Forget all the IDs in a scope.  If it is the current scope we revert to the default scope
+
+        Args:
+            scope:  The scope to discard
+        """
+        if scope == IDRegistry.DEFAULT_SCOPE:
+            self._usedIds[scope].clear()
+            self._nextIds[scope] = 0
+            return
+        self._usedIds.pop(scope, None)
+        self._nextIds.pop(scope, None)
+        if self._scope == scope:
+            self._scope = IDRegistry.DEFAULT_SCOPE
+
+    def allocate(self) -> int:
+        """
+        Returns:  An ID not in use in the current scope;  It is now in use
+        """
+        usedIds: Set[int] = self._usedIds[self._scope]
+        nextId:  int      = self._nextIds[self._scope]
+        while nextId in usedIds:
+            nextId += 1
+
+        usedIds.add(nextId)
+        self._nextIds[self._scope] = nextId + 1
+
+        return nextId
+
+    def reserve(self, theId: int):
+        """
+        Mark an externally supplied ID (e.g. from a project file) as in use in the current scope
+
+        Args:
+            theId:  The ID to reserve
+        """
+        self._usedIds[self._scope].add(theId)
+
+    def release(self, theId: int):
+        """
+        Args:
+            theId:  The ID no longer in use in the current scope
+        """
+        self._usedIds[self._scope].discard(theId)
+        self._releaseCount += 1
+
+    def isUsed(self, theId: int) -> bool:
+        """
+        Args:
+            theId: The ID to check
+
+        Returns:
+            `True` if `theId` is in use in the current scope, else `False`
+        """
+        return theId in self._usedIds[self._scope]
@@ -3,6 +3,9 @@ from typing import List
 from typing import Tuple
 
 from wx import DC
+from wx import Font
+
+from org.pyut.miniogl.TextMetricsCache import TextMetricsCache
 
 
 class LineSplitter:
@@ -28,8 +31,10 @@ class LineSplitter:
         Returns:
             A list of strings that are no wider than the input pixel `width`
         """
-        splitLines: List[str] = text.splitlines()
-        newLines:   List[str] = []
+        splitLines: List[str]        = text.splitlines()
+        newLines:   List[str]        = []
+        metrics:    TextMetricsCache = TextMetricsCache()
+        font:       Font             = dc.GetFont()
 
         for line in splitLines:
             words:     List[str] = line.split()
@@ -38,7 +43,7 @@ class LineSplitter:
             for word in words:
                 word: str = f'{word} '
 
-                extentSize: Tuple[int, int] = dc.GetTextExtent(word)        # width, height
+                extentSize: Tuple[int, int] = metrics.getTextExtent(word, font=font, dc=dc)        # width, height
                 wordWidth:  int             = extentSize[0]
                 if lineWidth + wordWidth <= textWidth:
                     newLine = f'{newLine}{word}'
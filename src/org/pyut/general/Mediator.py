@@ -1,6 +1,7 @@
 
 from typing import Callable
 from typing import Dict
+from typing import List
 from typing import NewType
 from typing import Union
 
@@ -382,6 +383,7 @@ class Mediator(Singleton):
         BeginBusyCursor()
         obj.callDoAction()
         EndBusyCursor()
+        self._invalidateClassRenderCaches()
         self.getUmlFrame().Refresh()
 
     def standardClassEditor(self, thePyutClass: PyutClass):
@@ -634,6 +636,7 @@ class Mediator(Singleton):
         if isinstance(diagramShape, OglClass):
             pyutObject = diagramShape.getPyutObject()
             self.classEditor(pyutObject)
+            diagramShape.invalidateRenderCache()
             self.autoResize(diagramShape)
         elif isinstance(diagramShape, OglInterface2):
 
@@ -675,7 +678,8 @@ class Mediator(Singleton):
             if rep == -1:  # destroy link
                 diagramShape.Detach()
 
-        umlFrame.Refresh()
+        diagramShape.MarkDirty()        # a no-op if it was detached;  Detaching already damaged its area
+        umlFrame.RefreshDirtyRegions()
 
     def getUmlObjects(self):
         """
@@ -774,6 +778,22 @@ class Mediator(Singleton):
             PyutMethod.setStringMode(PyutGloballyDisplayParameters.WITH_PARAMETERS)
         else:
             PyutMethod.setStringMode(PyutGloballyDisplayParameters.WITHOUT_PARAMETERS)
+        self._invalidateClassRenderCaches()
+
+    def _invalidateClassRenderCaches(self):
+        """
+        Forget the cached drawing of every class in every open diagram;  For the changes that
+        alter what the classes show without going through the class editor
+        """
+        from org.pyut.ogl.OglClass import OglClass
+
+        if self._fileHandling is None:
+            return
+        for project in self._fileHandling.getProjects():
+            for umlFrame in project.getFrames():
+                for umlObject in umlFrame.getUmlObjects():
+                    if isinstance(umlObject, OglClass):
+                        umlObject.invalidateRenderCache()
 
     def getCurrentDir(self):
         """
@@ -819,10 +839,7 @@ class Mediator(Singleton):
             event.Skip()
 
     def deleteSelectedShape(self):
-        from org.pyut.commands.DelOglObjectCommand import DelOglObjectCommand
-        from org.pyut.commands.DelOglClassCommand import DelOglClassCommand
-        from org.pyut.commands.DelOglLinkCommand import DelOglLinkCommand
-        from org.pyut.ogl.OglClass import OglClass
+        from org.pyut.commands.DelOglObjectsCommand import DelOglObjectsCommand
         from org.pyut.ogl.OglObject import OglObject
         from org.pyut.ogl.OglLink import OglLink
         from org.pyut.commands.CommandGroup import CommandGroup
@@ -830,16 +847,12 @@ class Mediator(Singleton):
         umlFrame = self._fileHandling.getCurrentFrame()
         if umlFrame is None:
             return
-        selected     = umlFrame.GetSelectedShapes()
-        cmdGroup     = CommandGroup("Delete UML object(s)")
-        cmdGroupInit = False  # added by hasii to avoid Pycharm warning about cmdGroupInit not set
+        selected = umlFrame.GetSelectedShapes()
+        shapesToDelete: List = []
 
         for shape in selected:
-            cmd = None
-            if isinstance(shape, OglClass):
-                cmd = DelOglClassCommand(shape)
-            elif isinstance(shape, OglObject):
-                cmd = DelOglObjectCommand(shape)
+            if isinstance(shape, OglObject):
+                shapesToDelete.append(shape)
             elif isinstance(shape, OglLink):
                 dlg: DlgRemoveLink = DlgRemoveLink()
                 rep = dlg.ShowModal()
@@ -847,17 +860,16 @@ class Mediator(Singleton):
                 if rep == ID_NO:
                     return
                 else:
-                    cmd = DelOglLinkCommand(shape)
-
-            # if the shape is not an Ogl instance no command has been created.
-            if cmd is not None:
-                cmdGroup.addCommand(cmd)
-                cmdGroupInit = True
+                    shapesToDelete.append(shape)
             else:
+                # if the shape is not an Ogl instance no command is created.
                 shape.Detach()
                 umlFrame.Refresh()
 
-        if cmdGroupInit:
+        # one command for the whole selection
+        if len(shapesToDelete) > 0:
+            cmdGroup: CommandGroup = CommandGroup("Delete UML object(s)")
+            cmdGroup.addCommand(DelOglObjectsCommand(shapesToDelete))
             umlFrame.getHistory().addCommandGroup(cmdGroup)
             umlFrame.getHistory().execute()
 
@@ -0,0 +1,103 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from enum import Enum
+
+from time import perf_counter
+
+from org.pyut.general.Singleton import Singleton
+
+
+class TraceSubsystem(Enum):
+    """
+    The parts of Pyut whose hot paths can be traced;  The value is the name of the
+    matching `Tracer` class flag
+    """
+    MINIOGL     = 'miniogl'
+    OGL         = 'ogl'
+    PERSISTENCE = 'persistence'
+
+    def __str__(self):
+        return str(self.name)
+
+
+TraceStatistic = Tuple[str, int, float]     # name, number of calls, total seconds
+
+
+class Tracer(Singleton):
+    """
+    Counters and timers for the drawing, hit test, layout and persistence hot paths.
+    Everything is off by default;  The subsystems are switched on at runtime from the
+    debug dialog.
+
+    The per subsystem switches are plain class attributes so that a disabled trace
+    point costs a single attribute lookup and nothing is formatted or timed:
+
+        if Tracer.miniogl is True:
+            startTime: float = perf_counter()
+        ...
+        if Tracer.miniogl is True:
+            Tracer().record('miniogl.draw', startTime)
+
+    Use `count` for a trace point that is not timed.
+    """
+    miniogl:     bool = False
+    ogl:         bool = False
+    persistence: bool = False
+
+    def init(self):
+        """
+        The singleton initialization method
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._counts: Dict[str, int]   = {}
+        self._times:  Dict[str, float] = {}
+
+    def isEnabled(self, subsystem: TraceSubsystem) -> bool:
+        return getattr(Tracer, subsystem.value)
+
+    def setEnabled(self, subsystem: TraceSubsystem, enabled: bool):
+        """
+        Args:
+            subsystem:  The subsystem to switch
+            enabled:    `True` to collect its counters and timers
+        """
+        setattr(Tracer, subsystem.value, enabled)
+        self.logger.info(f'Tracing {subsystem} {enabled=}')
+
+    def count(self, name: str):
+        """
+        Args:
+            name:   The trace point that was reached
+        """
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def record(self, name: str, startTime: float):
+        """
+        Count a timed trace point and add the time spent since `startTime`
+
+        Args:
+            name:       The trace point
+            startTime:  The `time.perf_counter()` value when the traced code started
+        """
+        self._counts[name] = self._counts.get(name, 0) + 1
+        self._times[name]  = self._times.get(name, 0.0) + perf_counter() - startTime
+
+    def statistics(self) -> List[TraceStatistic]:
+        """
+        Returns:  (name, count, total seconds) for every trace point reached, sorted by name;
+        Untimed trace points report 0 seconds
+        """
+        return [(name, self._counts[name], self._times.get(name, 0.0)) for name in sorted(self._counts)]
+
+    def reset(self):
+        """
+        Zero all the counters and timers;  The switches are unchanged
+        """
+        self._counts.clear()
+        self._times.clear()
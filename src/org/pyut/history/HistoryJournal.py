@@ -0,0 +1,402 @@
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from dataclasses import dataclass
+
+from logging import Logger
+from logging import getLogger
+
+from io import BufferedRandom
+
+from os import SEEK_END
+from os import remove as osRemove
+from os import replace as osReplace
+
+
+@dataclass
+class JournalRecovery:
+    """
+    What a journal recorded since it was last saved
+    """
+    savePoint:    str           # as given to `HistoryJournal.markSaved()`
+    groupsToUndo: List[str]     # the saved groups that were undone since, most recent first
+    groupsToRedo: List[str]     # the groups applied since, oldest first
+
+
+class HistoryJournal:
+    """
+    The on disk copy of a history.  It is only ever appended to:  one record per line, a
+    serialized command group when a group is added or coalesced with the last one and a
+    marker when a group is undone or redone, so that each user action costs one short
+    write however long the session has been going.  An offset index of the groups
+    currently in the history lets `readGroup` seek straight to a group instead of
+    reading the file.
+
+    With write-behind the records are buffered and written `WRITE_BEHIND_RECORDS` at a time,
+    and whenever the journal is read, flushed or closed.  Once the history was saved every
+    record is written as it comes, so that a crash loses none of the edits made since.
+
+    Groups that can no longer be redone or that were evicted from the history stay in the
+    file as dead records.  Once the file is more than `COMPACT_RATIO` times the size of the
+    live groups, plus `COMPACT_MINIMUM_BYTES`, it is rewritten with the live groups only
+    (See `compact()`), so that its size follows the history budget.
+
+    A save point record marks the groups that are in the saved project, so that the edits
+    made since can be recovered from the journal of a session that did not close properly;
+    See `recover()`.  The saved groups are kept through compaction even once they are undone
+    and replaced, so that recovery can still undo them.
+    """
+    GROUP_RECORD:   bytes = b'G'
+    REPLACE_RECORD: bytes = b'C'
+    UNDO_RECORD:    bytes = b'U'
+    REDO_RECORD:    bytes = b'R'
+    SAVE_RECORD:    bytes = b'S'
+
+    RECORD_END:     bytes = b'\n'
+    ENCODING:       str   = 'utf-8'
+
+    WRITE_BEHIND_RECORDS: int = 32
+
+    COMPACT_RATIO:         int = 2
+    COMPACT_MINIMUM_BYTES: int = 64 * 1024
+    COMPACT_SUFFIX:        str = '.compact'
+
+    def __init__(self, fileName: str, writeBehind: bool = True):
+        """
+
+        Args:
+            fileName:       The journal file;  It is created empty
+            writeBehind:    If `True` buffer the records instead of writing each one as it comes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName:    str  = fileName
+        self._writeBehind: bool = writeBehind
+
+        self._file:    BufferedRandom = open(fileName, 'wb+')
+        self._offsets: List[int]      = []
+        """
+        file offset of each group in the history, oldest first
+        """
+        self._lengths: List[int]      = []
+        """
+        record length of each group in the history
+        """
+        self._liveSize: int = 0
+        """
+        sum of the group record lengths;  The smallest the journal can be compacted to
+        """
+        self._position: int = 0
+        """
+        number of groups that are not undone
+        """
+        self._compactionCount: int = 0
+
+        self._savePoint:    str       = ''
+        self._savedOffsets: List[int] = cast(List[int], None)
+        """
+        file offset of each group in the saved project, oldest first;  The ones the history
+        still holds are a prefix of `_offsets`.  None if it was never saved or if the recovery
+        would need a group evicted from the history.  In that case compacting drops the save point.
+        """
+        self._savedLengths: List[int] = cast(List[int], None)
+        self._pending: List[bytes]    = []
+        self._size:    int            = 0
+        """
+        journal size including the pending records;  The offset of the next record
+        """
+
+    @property
+    def fileName(self) -> str:
+        return self._fileName
+
+    @property
+    def groupCount(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns:  The journal size in bytes, including records not written yet
+        """
+        return self._size
+
+    @property
+    def liveSize(self) -> int:
+        """
+        Returns:  The size in bytes of the group records still in the history
+        """
+        return self._liveSize
+
+    @property
+    def compactionCount(self) -> int:
+        return self._compactionCount
+
+    def appendGroup(self, position: int, serializedGroup: str):
+        """
+        Record a group added to the history.  Groups at and after `position`, i.e. the ones
+        that could have been redone, are dropped from the index;  Their records stay in the
+        file
+
+        Args:
+            position:           Where the group goes in the history
+            serializedGroup:    The group serialized on a single line
+        """
+        self._liveSize -= sum(self._lengths[position:])
+        del self._offsets[position:]
+        del self._lengths[position:]
+
+        self._position = position + 1
+        self._appendGroupRecord(HistoryJournal.GROUP_RECORD, serializedGroup)
+
+    def replaceLastGroup(self, serializedGroup: str):
+        """
+        Record that the last group was coalesced with a new one
+
+        Args:
+            serializedGroup:    The merged group serialized on a single line
+        """
+        self._liveSize -= self._lengths.pop()
+        self._offsets.pop()
+        self._appendGroupRecord(HistoryJournal.REPLACE_RECORD, serializedGroup)
+
+    def appendUndo(self):
+        self._position -= 1
+        self._append(HistoryJournal.UNDO_RECORD)
+
+    def appendRedo(self):
+        self._position += 1
+        self._append(HistoryJournal.REDO_RECORD)
+
+    def markSaved(self, savePoint: str):
+        """
+        Record that the groups currently applied are in a saved project;  The journal is flushed
+        so that the save point is on disk, and so is every record from now on
+
+        Args:
+            savePoint:  Where the project was saved, on a single line
+        """
+        self._savePoint    = savePoint
+        self._savedOffsets = self._offsets[:self._position]
+        self._savedLengths = self._lengths[:self._position]
+        self._append(HistoryJournal.SAVE_RECORD + savePoint.encode(HistoryJournal.ENCODING))
+        self.flush()
+
+    def evictGroups(self, count: int):
+        """
+        Drop the oldest groups from the index;  Their records are dropped from the file the
+        next time it is compacted
+
+        Args:
+            count:  How many groups were evicted from the history
+        """
+        if self._savedOffsets is not None:
+            if self._savedCommonCount() < count:
+                self._dropSavePoint()
+            else:
+                del self._savedOffsets[:count]
+                del self._savedLengths[:count]
+
+        self._liveSize -= sum(self._lengths[:count])
+        del self._offsets[:count]
+        del self._lengths[:count]
+
+        self._position -= count
+        self._compactIfWasteful()
+
+    def compact(self):
+        """
+        Rewrite the journal with the groups still in the history, followed by an undo record for
+        each of them that is undone.  If it was saved the groups in the saved project come first,
+        then the save point and an undo record for each saved group that is no longer in the
+        history, so that `recover()` reads the same changes back.  The new journal is written
+        aside and then moved over the old one, so that a crash while compacting leaves a
+        complete journal.
+        """
+        self.flush()
+
+        common:       int         = self._savedCommonCount()
+        records:      List[bytes] = [self._readRecord(offset) for offset in self._offsets]
+        savedRecords: List[bytes] = []
+        if self._savedOffsets is not None:
+            savedRecords = [self._readRecord(offset) for offset in self._savedOffsets[common:]]
+
+        compactFileName: str = f'{self._fileName}{HistoryJournal.COMPACT_SUFFIX}'
+        offsets:         List[int] = []
+        savedOffsets:    List[int] = []
+        size:            int       = 0
+        with open(compactFileName, 'wb') as compactFile:
+            for record in records[:common]:
+                offsets.append(size)
+                savedOffsets.append(size)
+                size += compactFile.write(HistoryJournal.GROUP_RECORD + record)
+            if self._savedOffsets is not None:
+                for record in savedRecords:
+                    savedOffsets.append(size)
+                    size += compactFile.write(HistoryJournal.GROUP_RECORD + record)
+                size += compactFile.write(self._saveRecord())
+                for _ in savedRecords:
+                    size += compactFile.write(HistoryJournal.UNDO_RECORD + HistoryJournal.RECORD_END)
+            for record in records[common:]:
+                offsets.append(size)
+                size += compactFile.write(HistoryJournal.GROUP_RECORD + record)
+            for _ in range(len(records) - self._position):
+                size += compactFile.write(HistoryJournal.UNDO_RECORD + HistoryJournal.RECORD_END)
+
+        self._file.close()
+        osReplace(compactFileName, self._fileName)
+        self._file = open(self._fileName, 'rb+')
+        self._file.seek(0, SEEK_END)
+
+        self.logger.debug(f'Compacted {self._fileName} from {self._size} to {size} bytes')
+        self._offsets = offsets
+        if self._savedOffsets is not None:
+            self._savedOffsets = savedOffsets
+        self._size    = size
+        self._compactionCount += 1
+
+    def readGroup(self, position: int) -> str:
+        """
+        Args:
+            position:   The group position in the history
+
+        Returns:  The serialized group
+        """
+        self.flush()
+        self._file.seek(self._offsets[position])
+        record: bytes = self._file.readline()
+        self._file.seek(0, SEEK_END)
+
+        # group and replace records have the same length prefix
+        return record[len(HistoryJournal.GROUP_RECORD):-len(HistoryJournal.RECORD_END)].decode(HistoryJournal.ENCODING)
+
+    def flush(self):
+        """
+        Write the pending records
+        """
+        if len(self._pending) > 0:
+            self._file.write(b''.join(self._pending))
+            self._pending = []
+        self._file.flush()
+
+    def close(self, remove: bool = True):
+        """
+        Args:
+            remove: If `True` delete the journal file
+        """
+        if self._file.closed is True:
+            return
+        self.flush()
+        self._file.close()
+        if remove is True:
+            osRemove(self._fileName)
+
+    @staticmethod
+    def recover(fileName: str) -> JournalRecovery:
+        """
+        Read the journal of a history that was not closed
+
+        Args:
+            fileName:   The journal file
+
+        Returns:  What changed since the last save point;  None if the journal has none
+        """
+        groups:       List[Tuple[int, str]] = []      # record number, serialized group;  The number tells apart equal groups
+        position:     int                   = 0
+        savePoint:    str                   = cast(str, None)
+        savedGroups:  List[Tuple[int, str]] = []
+        with open(fileName, 'rb') as journalFile:
+            for recordNumber, record in enumerate(journalFile):
+                if record.endswith(HistoryJournal.RECORD_END) is False:
+                    break       # torn by the crash
+                recordType: bytes = record[:len(HistoryJournal.GROUP_RECORD)]
+                payload:    str   = record[len(HistoryJournal.GROUP_RECORD):-len(HistoryJournal.RECORD_END)].decode(HistoryJournal.ENCODING)
+                if recordType == HistoryJournal.GROUP_RECORD:
+                    del groups[position:]
+                    groups.append((recordNumber, payload))
+                    position += 1
+                elif recordType == HistoryJournal.REPLACE_RECORD:
+                    groups[position - 1] = (recordNumber, payload)
+                elif recordType == HistoryJournal.UNDO_RECORD:
+                    position -= 1
+                elif recordType == HistoryJournal.REDO_RECORD:
+                    position += 1
+                elif recordType == HistoryJournal.SAVE_RECORD:
+                    savePoint   = payload
+                    savedGroups = groups[:position]
+
+        if savePoint is None:
+            return cast(JournalRecovery, None)
+
+        appliedGroups: List[Tuple[int, str]] = groups[:position]
+        common: int = 0
+        while common < min(len(savedGroups), len(appliedGroups)) and savedGroups[common] == appliedGroups[common]:
+            common += 1
+
+        return JournalRecovery(savePoint=savePoint,
+                               groupsToUndo=[serializedGroup for _, serializedGroup in reversed(savedGroups[common:])],
+                               groupsToRedo=[serializedGroup for _, serializedGroup in appliedGroups[common:]])
+
+    def _appendGroupRecord(self, recordType: bytes, serializedGroup: str):
+
+        record: bytes = recordType + serializedGroup.encode(HistoryJournal.ENCODING)
+        length: int   = len(record) + len(HistoryJournal.RECORD_END)
+
+        self._offsets.append(self._size)
+        self._lengths.append(length)
+        self._liveSize += length
+        self._append(record)
+
+    def _append(self, record: bytes):
+
+        record = record + HistoryJournal.RECORD_END
+        self._size += len(record)
+        self._pending.append(record)
+
+        if self._writeBehind is False or self._savedOffsets is not None or len(self._pending) >= HistoryJournal.WRITE_BEHIND_RECORDS:
+            self.flush()
+        self._compactIfWasteful()
+
+    def _readRecord(self, offset: int) -> bytes:
+        """
+        Args:
+            offset:  Where a group or replace record starts
+
+        Returns:  The record without its type, with its end
+        """
+        self._file.seek(offset)
+        return self._file.readline()[len(HistoryJournal.GROUP_RECORD):]
+
+    def _savedCommonCount(self) -> int:
+        """
+        Returns:  How many of the oldest groups in the history are in the saved project;  0 if
+        it was not saved
+        """
+        if self._savedOffsets is None:
+            return 0
+        common: int = 0
+        while common < min(len(self._savedOffsets), len(self._offsets)) and self._savedOffsets[common] == self._offsets[common]:
+            common += 1
+        return common
+
+    def _saveRecord(self) -> bytes:
+        return HistoryJournal.SAVE_RECORD + self._savePoint.encode(HistoryJournal.ENCODING) + HistoryJournal.RECORD_END
+
+    def _dropSavePoint(self):
+
+        if self._savedOffsets is not None:
+            self.logger.debug(f'{self._fileName}: a group to recover was evicted from the history;  Compacting drops the save point')
+        self._savedOffsets = cast(List[int], None)
+        self._savedLengths = cast(List[int], None)
+
+    def _compactIfWasteful(self):
+
+        if self._size <= HistoryJournal.COMPACT_RATIO * self._liveSize + HistoryJournal.COMPACT_MINIMUM_BYTES:
+            return
+        # the saved groups no longer in the history survive compaction
+        liveSize: int = self._liveSize
+        if self._savedOffsets is not None:
+            liveSize += sum(self._savedLengths[self._savedCommonCount():])
+        if self._size > HistoryJournal.COMPACT_RATIO * liveSize + HistoryJournal.COMPACT_MINIMUM_BYTES:
+            self.compact()
@@ -1,34 +1,52 @@
 
+from typing import List
+from typing import Union
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from os import getpid
 from os import sep as osSep
 
 from tempfile import gettempdir
 
+from zlib import compress
+from zlib import decompress
+
 from org.pyut.preferences.PyutPreferences import PyutPreferences
 
 from org.pyut.commands.CommandGroup import CommandGroup
 
-from org.pyut.history.HistoryUtils import GROUP_COMMENT_ID
+from org.pyut.history.HistoryJournal import HistoryJournal
+
+from org.pyut.history.HistoryUtils import HISTORY_FILE_ID_SEPARATOR
 from org.pyut.history.HistoryUtils import HISTORY_FILE_NAME
-from org.pyut.history.HistoryUtils import getTokenValue
+from org.pyut.history.HistoryUtils import encodeSavePoint
 
 from org.pyut.PyutUtils import PyutUtils
 
+HistoryEntry = Union[str, bytes]    # A serialized group;  zlib compressed once it is no longer recent
+
 
 class HistoryManager:
     """
     @author P. Dabrowski <przemek.dabrowski@destroy-display.com> (15.11.2005)
 
     This class is the structure that manages the history of a given frame.
-    It creates a file where serialized 'CommandGroups' are stored.  They
-    are compound of commands. Each command is able to do the undo/redo
+    It keeps the serialized 'CommandGroups' in memory and appends them to a
+    journal file (See HistoryJournal).  They are compound of commands. Each command is able to do the undo/redo
     operations and is also able to serialize/deserialize itself
     (See commandGroup and command).
 
+    The history is kept within the budget set in the preferences, a number of groups
+    and a size:  All but the `UNCOMPRESSED_GROUPS` most recent groups are compressed and
+    once the budget is exceeded the oldest groups are evicted and can no longer be undone.
+
+    The journal also records when the project is saved (See `markSaved()`);  If Pyut does not
+    close properly the journal is left behind and the changes made since can be replayed
+    onto the saved project (See `HistoryRecovery` and `replay()`).
+
     To see how it works, please see test.TestHistory
     """
     historyId = 0
@@ -37,6 +55,9 @@ class HistoryManager:
     in order to have a unique file associated to each instance of
     the history.
     """
+    UNCOMPRESSED_GROUPS: int = 8
+    ENCODING:            str = 'utf-8'
+
     def __init__(self, theFrame=None):
         """
 
@@ -47,27 +68,29 @@ class HistoryManager:
 
         self.logger.debug(f'Base directory: {PyutUtils.getBasePath()}')
 
-        if PyutPreferences().useDebugTempFileLocation is True:
-            self._fileName: str = f'{PyutUtils.getBasePath()}{osSep}{HISTORY_FILE_NAME}{str(self.__class__.historyId)}'
-        else:
-            tempDir: str = gettempdir()
-            self._fileName: str = f'{tempDir}{osSep}{HISTORY_FILE_NAME}{str(self.__class__.historyId)}'
+        prefs: PyutPreferences = PyutPreferences()
+        # the process ID keeps the journals left behind by another session from being overwritten
+        fileName: str = f'{HistoryManager.journalDirectory()}{osSep}{HISTORY_FILE_NAME}{getpid()}{HISTORY_FILE_ID_SEPARATOR}{self.__class__.historyId}'
 
         self._frame    = theFrame
-        """
-        name of file for hard storage which is unique for each history
-        """
         self.__class__.historyId += 1
         """
         for the next instance of the history...
         """
-        saveFile = open(self._fileName, 'w')  # create the file to store the groups
-        saveFile.close()
-
-        self._groupCount = 0
+        self._journal: HistoryJournal = HistoryJournal(fileName, writeBehind=prefs.historyWriteBehind)
+        """
+        append only copy of the history on disk, unique for each history
+        """
+        self._groups: List[HistoryEntry] = []
+        """
+        the serialized groups, oldest first
+        """
+        self._byteCount:       int = 0
         """
-        number of groups added to the history
+        memory used by the serialized groups
         """
+        self._compressedCount: int = 0
+        self._evictedCount:    int = 0
         self._groupUndoIndex = -1
         """
         index of the command group that will be undone
@@ -76,9 +99,13 @@ class HistoryManager:
         """
         reference to the last added group, for execute() method
         """
+        self._lastGroup: CommandGroup = cast(CommandGroup, None)
+        """
+        the last added group while it is on top of the history, for coalescing
+        """
 
     def getGroupCount(self) -> int:
-        return self._groupCount
+        return len(self._groups)
 
     def setGroupCount(self, newValue: int):
         raise NotImplementedError('Group count is read-only')
@@ -99,6 +126,42 @@ class HistoryManager:
     groupUndoIndex = property(getGroupUndoIndex, setGroupUndoIndex)
     groupToExecute = property(getGroupToExecute, setGroupToExecute)
 
+    @property
+    def journal(self) -> HistoryJournal:
+        return self._journal
+
+    @staticmethod
+    def journalDirectory() -> str:
+        """
+        Returns:  Where the history journals are written
+        """
+        prefs: PyutPreferences = PyutPreferences()
+        if prefs.useDebugTempFileLocation is True:
+            return PyutUtils.getBasePath()
+        else:
+            return gettempdir()
+
+    @property
+    def byteCount(self) -> int:
+        """
+        Returns:  The memory used by the serialized groups, in bytes
+        """
+        return self._byteCount
+
+    @property
+    def compressedCount(self) -> int:
+        """
+        Returns:  The number of groups compressed since the history was created
+        """
+        return self._compressedCount
+
+    @property
+    def evictedCount(self) -> int:
+        """
+        Returns:  The number of groups evicted since the history was created
+        """
+        return self._evictedCount
+
     def undo(self):
         """
         undo the current group command and make the previous one as current.
@@ -107,42 +170,34 @@ class HistoryManager:
         # check if there is a group to undo
         if self.isUndoPossible():
 
-            # open the file to get its current content in a list
-            saveFile = open(self._fileName, 'r')
-            fileContent = saveFile.readlines()
-            saveFile.close()
-
             # deserialize the group to undo
-            group = self._deserialize(fileContent[self._groupUndoIndex])
-            group.setHistory(self)
+            group = self._deserialize(self._groupAt(self._groupUndoIndex))
 
             # undo all the commands that are in the group
             group.undo()
 
             # set the previous command as the command to be undone
             self._groupUndoIndex -= 1
+            self._lastGroup = None
+            self._journal.appendUndo()
 
     def redo(self):
         """
-        take from the file the last undone command group and redo it.
+        take the last undone command group and redo it.
         """
         # check if there is a group to redo
         if self.isRedoPossible():
 
-            # open the file to get its current content in a list
-            saveFile = open(self._fileName, 'r')
-            fileContent = saveFile.readlines()
-            saveFile.close()
-
             # the group to redo means that it will be the group to undo
             self._groupUndoIndex += 1
 
             # deserialize the group
-            group = self._deserialize(fileContent[self._groupUndoIndex])
-            group.setHistory(self)
+            group = self._deserialize(self._groupAt(self._groupUndoIndex))
 
             # redo all the commands in the group
             group.redo()
+            self._lastGroup = None
+            self._journal.appendRedo()
 
     def execute(self):
         """
@@ -154,7 +209,10 @@ class HistoryManager:
 
     def addCommandGroup(self, group: CommandGroup):
         """
-        add a command group to the file.
+        add a command group to the history.  If the last added group has not been
+        undone and accepts to coalesce the new one (see CommandGroup.coalesce()),
+        it is replaced by the merged group instead.
+
         @param group   :   group to add to the history.
         """
 
@@ -162,34 +220,59 @@ class HistoryManager:
 
         self._groupToExecute = group
 
-        # open the file to get its current content in a list
-        saveFile = open(self._fileName, 'r')
-        fileContent = saveFile.readlines()
-        saveFile.close()
+        lastGroup: CommandGroup = self._lastGroup
+        if lastGroup is not None and not self.isRedoPossible() and lastGroup.coalesce(group):
+            serialGroup: str = lastGroup.serialize()
+            self._byteCount += len(serialGroup) - len(self._groups[self._groupUndoIndex])
+            self._groups[self._groupUndoIndex] = serialGroup
+            self._journal.replaceLastGroup(serialGroup)
+            self._evictOverBudget()
+            return
 
-        # add the serialized group to the file's content
-        serialGroup = self._serialize(group)
-        self._groupUndoIndex += 1
-        fileContent.insert(self._groupUndoIndex, serialGroup)
+        self._appendGroup(group.serialize())
+        self._lastGroup = group
+
+    def markSaved(self, projectFileName: str, documentIndex: int):
+        """
+        Record that the frame was saved to or loaded from a project file;  The groups added
+        since can be recovered from the journal if Pyut does not close properly.  The saved
+        group is no longer coalesced with the next one, so that it stays as saved.
 
-        # remove all the groups that comes after new group
-        del fileContent[self._groupUndoIndex + 1: len(fileContent) + 1]
+        Args:
+            projectFileName:    The project file
+            documentIndex:      The position of the frame's document in the project
+        """
+        self._lastGroup = None
+        self._journal.markSaved(encodeSavePoint(projectFileName, documentIndex))
 
-        # update the number of groups present in the history
-        self._groupCount = len(fileContent)
+    def replay(self, groupsToUndo: List[str], groupsToRedo: List[str]):
+        """
+        Bring the frame from its saved state to the state recovered from a journal (See
+        HistoryJournal.recover()).  The frame is refreshed once at the end instead of after
+        every command, and the redone groups are added to this history so that they can
+        be undone.
 
-        # save the new content on file, writing over the old content.
-        saveFile = open(self._fileName, 'w')
-        saveFile.writelines(fileContent)
-        saveFile.close()
+        Args:
+            groupsToUndo:   The saved groups that were undone, most recent first
+            groupsToRedo:   The groups that were applied since the save, oldest first
+        """
+        self._frame.SuspendRefresh()
+        try:
+            for serialGroup in groupsToUndo:
+                self._deserialize(serialGroup).undo()
+            for serialGroup in groupsToRedo:
+                self._deserialize(serialGroup).redo()
+                self._appendGroup(serialGroup)
+        finally:
+            self._frame.ResumeRefresh()
+        self._lastGroup = None
 
     def destroy(self):
         """
-        Destroy the file associated to the history. Should be called when
+        Destroy the journal associated to the history. Should be called when
         the associated frame is closing.
         """
-        import os
-        os.remove(self._fileName)
+        self._journal.close(remove=True)
 
     def isUndoPossible(self):
         """
@@ -209,46 +292,28 @@ class HistoryManager:
         # groupToUndo is on the last group added. If it's the case, the
         # it means that the last group hadn't been undone and so there is
         # no group to redo.
-        return self._groupUndoIndex < self._groupCount - 1
+        return self._groupUndoIndex < len(self._groups) - 1
 
     def getCommandGroupToRedo(self):
         """
         @return the the group (CommandGroup) that will be redone if we call
-        the undo method. If all the groups have been undone None is returned.
+        the redo method. If all the groups have been redone None is returned.
         """
         # check if there a group to redo
         if self.isRedoPossible():
-
-            # open the file to get its current content in a list
-            saveFile = open(self._fileName, 'r')
-            fileContent = saveFile.readlines()
-            saveFile.close()
-
-            # get the group that is next to be redone
-            group = self._deserialize(fileContent[self._groupUndoIndex + 1])
-            group.setHistory(self)
-            return group
+            return self._deserialize(self._groupAt(self._groupUndoIndex + 1))
         else:
             return None
 
     def getCommandGroupToUndo(self):
         """
-        @return the the group (CommandGroup) that will be redone if we call
+        @return the the group (CommandGroup) that will be undone if we call
         the undo method. If all the groups have been undone None is returned.
         """
 
         # check if there is a group to undo
         if self.isUndoPossible():
-
-            # open the file to get its current content in a list
-            saveFile = open(self._fileName, 'r')
-            fileContent = saveFile.readlines()
-            saveFile.close()
-
-            # get the group that is next to be redone
-            group = self._deserialize(fileContent[self._groupUndoIndex])
-            group.setHistory(self)
-            return group
+            return self._deserialize(self._groupAt(self._groupUndoIndex))
         else:
             return None
 
@@ -259,30 +324,97 @@ class HistoryManager:
 
         return self._frame
 
-    def _deserialize(self, serializedGroup) -> CommandGroup:
+    def _deserialize(self, serializedGroup: str) -> CommandGroup:
         """
         deserialize the specified string to return a command group
 
         Args:
-            serializedGroup: (string)  :   string from which will be constructed the group
+            serializedGroup: string from which will be constructed the group
 
         Returns:    an initialized group (CommandGroup)
         """
-        # get from the string the comment/description for the group
-        grpComment = getTokenValue(GROUP_COMMENT_ID, serializedGroup)
-
-        # create an initialized group with only its comment
-        group = CommandGroup(grpComment)
+        group = CommandGroup()
         group.setHistory(self)
 
-        # deserialize the commands belonging to the group
+        # the group comment and the commands belonging to the group
         group.deserialize(serializedGroup)
 
         return group
 
-    def _serialize(self, group):
+    def _appendGroup(self, serialGroup: str):
+        """
+        Make a serialized group the last one of the history, in place of the groups that could be redone
+
+        Args:
+            serialGroup:    The group to add
         """
-        serialize a group to store it in a file. Each serialized group is on
-        one line.
+        self._groupUndoIndex += 1
+
+        # remove all the groups that come after the new group;  They can no longer be redone
+        for entry in self._groups[self._groupUndoIndex:]:
+            self._byteCount -= len(entry)
+        del self._groups[self._groupUndoIndex:]
+        self._groups.append(serialGroup)
+        self._byteCount += len(serialGroup)
+
+        self._journal.appendGroup(self._groupUndoIndex, serialGroup)
+
+        self._compressOlderGroup()
+        self._evictOverBudget()
+
+    def _groupAt(self, index: int) -> str:
         """
-        return group.serialize() + "\n"
+        Args:
+            index:  The group position in the history
+
+        Returns:  The serialized group, decompressed if need be
+        """
+        entry: HistoryEntry = self._groups[index]
+        if isinstance(entry, bytes):
+            return decompress(entry).decode(HistoryManager.ENCODING)
+        return entry
+
+    def _compressOlderGroup(self):
+        """
+        Compress the group that just left the `UNCOMPRESSED_GROUPS` most recent ones;  The groups
+        before it were compressed in turn as the history grew
+        """
+        index: int = len(self._groups) - 1 - HistoryManager.UNCOMPRESSED_GROUPS
+        if index < 0 or isinstance(self._groups[index], bytes):
+            return
+
+        serialGroup: str   = self._groups[index]
+        compressed:  bytes = compress(serialGroup.encode(HistoryManager.ENCODING))
+        # small groups can come out bigger
+        if len(compressed) < len(serialGroup):
+            self._groups[index] = compressed
+            self._byteCount += len(compressed) - len(serialGroup)
+            self._compressedCount += 1
+
+    def _evictOverBudget(self):
+        """
+        Evict the oldest groups until the history is within the budget set in the preferences.
+        The last added group is always kept.
+        """
+        prefs:         PyutPreferences = PyutPreferences()
+        maximumGroups: int = prefs.historyMaximumGroups
+        maximumBytes:  int = prefs.historyMaximumKilobytes * 1024
+
+        groupCount: int = len(self._groups)
+        byteCount:  int = self._byteCount
+        evictCount: int = 0
+        while groupCount - evictCount > 1:
+            overGroups: bool = 0 < maximumGroups < groupCount - evictCount
+            overBytes:  bool = 0 < maximumBytes  < byteCount
+            if not overGroups and not overBytes:
+                break
+            byteCount  -= len(self._groups[evictCount])
+            evictCount += 1
+
+        if evictCount > 0:
+            del self._groups[:evictCount]
+            self._groupUndoIndex -= evictCount
+            self._byteCount       = byteCount
+            self._evictedCount   += evictCount
+            self._journal.evictGroups(evictCount)
+            self.logger.debug(f'Evicted {evictCount} groups, {len(self._groups)} left in {byteCount} bytes')
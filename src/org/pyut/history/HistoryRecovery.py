@@ -0,0 +1,158 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from os import getpid
+from os import kill as osKill
+from os import listdir
+from os import path as osPath
+from os import remove as osRemove
+
+from sys import platform as sysPlatform
+
+from org.pyut.history.HistoryJournal import HistoryJournal
+from org.pyut.history.HistoryJournal import JournalRecovery
+from org.pyut.history.HistoryManager import HistoryManager
+
+from org.pyut.history.HistoryUtils import HISTORY_FILE_ID_SEPARATOR
+from org.pyut.history.HistoryUtils import HISTORY_FILE_NAME
+from org.pyut.history.HistoryUtils import decodeSavePoint
+
+
+@dataclass
+class OrphanedJournal:
+    """
+    The journal of a history that a Pyut session left behind
+    """
+    fileName:        str
+    projectFileName: str
+    documentIndex:   int
+    recovery:        JournalRecovery
+
+
+class HistoryRecovery:
+    """
+    Finds the history journals left behind by the Pyut sessions that did not close properly.
+    A journal belongs to the process whose ID is in its name;  It is orphaned once that process
+    is gone.  The journals that were never saved to a project, or have nothing to replay, are
+    removed as they are found.
+
+    Sample use:
+
+        recovery: HistoryRecovery = HistoryRecovery()
+        for journal in recovery.findOrphanedJournals():
+            ... open journal.projectFileName and replay journal.recovery onto the document
+            recovery.discard(journal)
+    """
+    PROCESS_QUERY_LIMITED_INFORMATION: int = 0x1000
+    ERROR_ACCESS_DENIED:               int = 5
+    STILL_ACTIVE:                      int = 259
+
+    def __init__(self, journalDirectory: str = None):
+        """
+
+        Args:
+            journalDirectory:   Where to look for the journals;  Defaults to where the histories write them
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._journalDirectory: str = HistoryManager.journalDirectory() if journalDirectory is None else journalDirectory
+
+    def findOrphanedJournals(self) -> List[OrphanedJournal]:
+        """
+        Returns:  The orphaned journals that have changes to replay
+        """
+        orphans: List[OrphanedJournal] = []
+        for name in sorted(listdir(self._journalDirectory)):
+            processId: int = HistoryRecovery._owningProcessId(name)
+            if processId is None or processId == getpid() or HistoryRecovery._isRunning(processId) is True:
+                continue
+
+            fileName: str = osPath.join(self._journalDirectory, name)
+            if name.endswith(HistoryJournal.COMPACT_SUFFIX):
+                # a compaction was interrupted;  The journal itself is complete
+                self._remove(fileName)
+                continue
+            try:
+                recovery: JournalRecovery = HistoryJournal.recover(fileName)
+                if recovery is None or (len(recovery.groupsToUndo) == 0 and len(recovery.groupsToRedo) == 0):
+                    self._remove(fileName)
+                    continue
+                projectFileName, documentIndex = decodeSavePoint(recovery.savePoint)
+            except (ValueError, KeyError, OSError) as e:
+                self.logger.error(f'Unreadable history journal {fileName}: {e}')
+                continue
+
+            self.logger.info(f'Orphaned journal {fileName}: {projectFileName=} {documentIndex=}')
+            orphans.append(OrphanedJournal(fileName=fileName, projectFileName=projectFileName, documentIndex=documentIndex, recovery=recovery))
+
+        return orphans
+
+    def discard(self, journal: OrphanedJournal):
+        """
+        Remove a journal once it was replayed or the user declined to
+
+        Args:
+            journal:    One of the journals found by `findOrphanedJournals()`
+        """
+        self._remove(journal.fileName)
+
+    @staticmethod
+    def _owningProcessId(name: str) -> int:
+        """
+        Args:
+            name:   A file name in the journal directory
+
+        Returns:  The ID of the process that wrote it;  None if it is not a journal
+        """
+        if name.startswith(HISTORY_FILE_NAME) is False:
+            return None
+
+        processId, separator, _ = name[len(HISTORY_FILE_NAME):].partition(HISTORY_FILE_ID_SEPARATOR)
+        if separator == '' or processId.isdigit() is False:
+            return None
+
+        return int(processId)
+
+    def _remove(self, fileName: str):
+        try:
+            osRemove(fileName)
+        except OSError as e:
+            self.logger.warning(f'Cannot remove {fileName}: {e}')
+
+    @staticmethod
+    def _isRunning(processId: int) -> bool:
+
+        # on Windows os.kill() terminates the process
+        if sysPlatform == 'win32':
+            return HistoryRecovery._isRunningOnWindows(processId)
+        try:
+            osKill(processId, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def _isRunningOnWindows(processId: int) -> bool:
+
+        from ctypes import byref
+        from ctypes import windll
+        from ctypes.wintypes import DWORD
+
+        kernel32 = windll.kernel32
+        handle = kernel32.OpenProcess(HistoryRecovery.PROCESS_QUERY_LIMITED_INFORMATION, False, processId)
+        if not handle:
+            # a process we may not query is still a process
+            return kernel32.GetLastError() == HistoryRecovery.ERROR_ACCESS_DENIED
+        try:
+            exitCode: DWORD = DWORD()
+            if kernel32.GetExitCodeProcess(handle, byref(exitCode)) == 0:
+                return True
+            return exitCode.value == HistoryRecovery.STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
@@ -1,6 +1,7 @@
 
 from logging import Logger
 from logging import getLogger
+from logging import DEBUG
 
 from org.pyut.miniogl.LinePoint import LinePoint
 from org.pyut.miniogl.Shape import Shape
@@ -86,7 +87,9 @@ class AnchorPoint(LinePoint):
                 width, height      = self._parent.GetSize()
                 width  = abs(width) - 1
                 height = abs(height) - 1
-                self.logger.debug(f'topLeftX,topLeftY ({topLeftX},{topLeftY}) width,height ({width},{height})')
+                debug: bool = self.logger.isEnabledFor(DEBUG)
+                if debug is True:
+                    self.logger.debug(f'topLeftX,topLeftY ({topLeftX},{topLeftY}) width,height ({width},{height})')
                 if self._stayInside or self._stayOnBorder:
                     x = self.stayInside(topLeftX, width, x)
                     y = self.stayInside(topLeftY, height, y)
@@ -94,7 +97,9 @@ class AnchorPoint(LinePoint):
                         x, y = self.stickToBorder(topLeftX, topLeftY, width, height, x, y)
                 self._x, self._y = self.ConvertCoordToRelative(x, y)
 
-                self.logger.debug(f'Final Position: ({self._x}, {self._y})')
+                if debug is True:
+                    self.logger.debug(f'Final Position: ({self._x}, {self._y})')
+            self._IndexChanged()
 
             if self.HasDiagramFrame():
                 self.UpdateModel()
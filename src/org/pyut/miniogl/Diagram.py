@@ -1,10 +1,26 @@
 
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
 from logging import Logger
 from logging import getLogger
 
+from collections import OrderedDict
+
 from org.pyut.miniogl import Shape
 from org.pyut.miniogl import SizerShape
 
+from org.pyut.miniogl.LineShape import LineShape
+from org.pyut.miniogl.ShapeGrid import BoundingBox
+from org.pyut.miniogl.ShapeGrid import ShapeGrid
+
+DamageListener = Callable[[Optional[List[BoundingBox]]], None]
+
 
 class Diagram:
 
@@ -13,7 +29,22 @@ class Diagram:
     A diagram contains shapes and is responsible to manage them.
     It can be saved to a file, and loaded back. It knows every shapes that
     can be clicked (selected, moved...).
+
+    Shapes are also filed in a spatial index so that hit tests only look at the shapes
+    near the mouse.  Shapes report their moves and resizes via `InvalidateShape`;  The
+    index is brought up to date lazily, just before the next query.
+
+    Re-filing a shape also records its old and new bounds as damaged so that the
+    frame can repaint just those regions;  See `TakeDamagedRegions`
+
+    The display list is keyed by shape identity, so membership, removal and moving a
+    shape to the front or the back are O(1).  The diagram also tracks the shapes that
+    are selected or moving so that deselecting does not have to visit every shape
     """
+    HIT_MARGIN:           int = 10      # larger than any Inside() tolerance;  See PointShape.SELECTION_ZONE
+    LABEL_MARGIN:         int = 128     # Labels and arrow heads may be drawn outside of a line's bounds
+    MAX_DAMAGED_REGIONS:  int = 64      # past this a full repaint is cheaper
+
     def __init__(self, panel):
         """
         Constructor.
@@ -21,8 +52,24 @@ class Diagram:
         @param  panel : the panel on which to draw
         """
         self._panel = panel
-        self._shapes = []        # all selectable shapes
-        self._parentShapes = []  # all first level shapes
+        self._shapes:       OrderedDict      = OrderedDict()    # id(shape) -> shape;  all selectable shapes in display order
+        self._parentShapes: Dict[int, Shape] = {}               # all first level shapes
+        self._activeShapes: Dict[int, Shape] = {}               # the shapes that are selected or moving
+        self._shapesView:   Tuple[Shape]     = cast(Tuple[Shape], None)    # GetShapes() result;  None when it must be rebuilt
+
+        self._shapeIndex:   ShapeGrid        = ShapeGrid()
+        self._indexed:      Dict[int, Shape] = {}   # id(shape) -> shape;  Everything the grid knows about
+        self._unbounded:    Dict[int, Shape] = {}   # shapes that cannot report a bounding box;  Always candidates
+        self._dirtyShapes:  Dict[int, Shape] = {}   # shapes to re-file before the next query
+        self._zOrder:       Dict[int, int]   = {}   # id(shape) -> depth;  Larger is drawn later
+        self._topZ:         int              = 0
+        self._bottomZ:      int              = 0
+
+        self._indexedBoxes:    Dict[int, BoundingBox] = {}      # id(shape) -> the bounds it is filed under
+        self._damagedRegions:  List[BoundingBox]      = []
+        self._fullyDamaged:    bool                   = False
+
+        self._damageListeners: List[DamageListener]   = []
 
     def AddShape(self, shape, withModelUpdate: bool = True):
         """
@@ -33,10 +80,16 @@ class Diagram:
             shape:  the shape to add
             withModelUpdate:
         """
-        if shape not in self._shapes:
-            self._shapes.append(shape)
-        if shape not in self._parentShapes and shape.GetParent() is None:
-            self._parentShapes.append(shape)
+        shapeId: int = id(shape)
+        if shapeId not in self._shapes:
+            self._shapes[shapeId] = shape
+            self._shapesView = cast(Tuple[Shape], None)
+            self._topZ += 1
+            self._zOrder[shapeId] = self._topZ
+        if shape.GetParent() is None:
+            self._parentShapes.setdefault(shapeId, shape)
+        if shape.IsSelected() or shape.IsMoving():
+            self._activeShapes[shapeId] = shape
 
         self.clsLogger.debug(f'.AddShape before shape.Attach()=> {shape} withModelUpdate {withModelUpdate}')
         shape.Attach(self)
@@ -51,9 +104,13 @@ class Diagram:
         Delete all shapes in the diagram.
         """
         while self._shapes:
-            self._shapes[0].Detach()
-        self._shapes = []
-        self._parentShapes = []
+            next(iter(self._shapes.values())).Detach()
+        self._shapes.clear()
+        self._parentShapes.clear()
+        self._activeShapes.clear()
+        self._shapesView = cast(Tuple[Shape], None)
+        self._clearIndex()
+        self._fullyDamaged = True
 
     def RemoveShape(self, shape: SizerShape):
         """
@@ -62,20 +119,70 @@ class Diagram:
 
         @param  shape
         """
-        if shape in self._shapes:
-            self._shapes.remove(shape)
-        if shape in self._parentShapes:
-            self._parentShapes.remove(shape)
+        shapeId: int = id(shape)
+        if self._shapes.pop(shapeId, None) is not None:
+            self._shapesView = cast(Tuple[Shape], None)
+        self._parentShapes.pop(shapeId, None)
+        self._activeShapes.pop(shapeId, None)
 
-    def GetShapes(self):
+        if shapeId in self._indexedBoxes:
+            self._damage(shape, self._indexedBoxes.pop(shapeId))
+        elif shapeId in self._unbounded:
+            self._damage(shape, None)
+        self._zOrder.pop(shapeId, None)
+        self._dirtyShapes.pop(shapeId, None)
+        self._unbounded.pop(shapeId, None)
+        self._indexed.pop(shapeId, None)
+        self._shapeIndex.remove(shapeId)
+
+    def GetShapes(self) -> Tuple[Shape]:
         """
-        Return a list of the shapes in the diagram.
-        It is a copy of the original. You cannot detach or add shapes to the
-        diagram this way.
+        Return the shapes in the diagram in display order.
+        It is a read-only tuple that is shared between calls, not a copy. You cannot
+        detach or add shapes to the diagram this way.  Adding or removing shapes builds
+        a new tuple, so it is safe to detach shapes while looping over it.
 
-        @return Shape []
+        @return Shape ()
+        """
+        if self._shapesView is None:
+            self._shapesView = tuple(self._shapes.values())
+        return self._shapesView
+
+    def HasShape(self, shape: Shape) -> bool:
+        """
+        Args:
+            shape:  The shape to look for
+
+        Returns:  `True` if this very shape is in the diagram
+        """
+        return id(shape) in self._shapes
+
+    def GetActiveShapes(self) -> List[Shape]:
+        """
+        Returns:  A copy of the list of the shapes that are selected or moving
+        """
+        return list(self._activeShapes.values())
+
+    def ShapeStateChanged(self, shape: Shape):
         """
-        return self._shapes[:]
+        A shape was selected, deselected, or started or stopped moving
+
+        Args:
+            shape:  The shape whose state changed
+        """
+        shapeId: int = id(shape)
+        if shapeId not in self._shapes:
+            return
+        if shape.IsSelected() or shape.IsMoving():
+            self._activeShapes[shapeId] = shape
+        else:
+            self._activeShapes.pop(shapeId, None)
+
+    def GetShapeCount(self) -> int:
+        """
+        Returns:  The number of shapes in the diagram, without copying the list
+        """
+        return len(self._shapes)
 
     def GetParentShapes(self):
         """
@@ -85,7 +192,7 @@ class Diagram:
 
         @return Shape []
         """
-        return self._parentShapes[:]
+        return list(self._parentShapes.values())
 
     def GetPanel(self):
         """
@@ -104,8 +211,11 @@ class Diagram:
         """
         shapes = [shape] + shape.GetAllChildren()
         for s in shapes:
-            self._shapes.remove(s)
-        self._shapes = self._shapes + shapes
+            self._shapes.move_to_end(id(s))
+        self._shapesView = cast(Tuple[Shape], None)
+        for s in shapes:
+            self._topZ += 1
+            self._zOrder[id(s)] = self._topZ
 
     def MoveToBack(self, shape: Shape):
         """
@@ -115,6 +225,172 @@ class Diagram:
             shape: The shape to move
         """
         shapes = [shape] + shape.GetAllChildren()
-        for s in shapes:
-            self._shapes.remove(s)
-        self._shapes = shapes + self._shapes
+        for s in reversed(shapes):
+            self._shapes.move_to_end(id(s), last=False)
+        self._shapesView = cast(Tuple[Shape], None)
+        for s in reversed(shapes):
+            self._bottomZ -= 1
+            self._zOrder[id(s)] = self._bottomZ
+
+    def InvalidateShape(self, shape: Shape):
+        """
+        A shape moved or changed size.  It and everything that moves with it (anchors,
+        children, sizers, attached lines) are re-filed in the spatial index before the
+        next query and told to forget any cached geometry.  Cheap enough to call on every
+        mouse move.
+
+        Args:
+            shape: The shape that changed
+        """
+        pending: List[Shape] = [shape]
+        visited: Set[int]    = set()
+        while pending:
+            current: Shape = pending.pop()
+            currentId: int = id(current)
+            if currentId in visited:
+                continue
+            visited.add(currentId)
+            current._InvalidateGeometry()      # even if already dirty;  It may have cached since
+            self._dirtyShapes[currentId] = current
+            pending.extend(current._GetIndexDependents())
+
+    def InvalidateIndex(self):
+        """
+        Re-file every shape before the next query;  Use after changes that move shapes
+        without telling them
+        """
+        for shape in self._shapes.values():
+            shape._InvalidateGeometry()
+        self._dirtyShapes.update(self._shapes)
+        self._fullyDamaged = True
+
+    def TakeDamagedRegions(self) -> Optional[List[BoundingBox]]:
+        """
+        The regions that changed since the last call;  Old and new bounds of every shape
+        that moved, resized, was added, removed or asked to be repainted
+
+        Returns:  (left, top, right, bottom) rectangles in diagram coordinates or `None`
+        if the whole diagram must be repainted
+        """
+        self._updateIndex()
+
+        regions: Optional[List[BoundingBox]] = self._damagedRegions
+        if self._fullyDamaged is True:
+            regions = None
+
+        self._damagedRegions = []
+        self._fullyDamaged   = False
+
+        for listener in self._damageListeners:
+            listener(regions)
+
+        return regions
+
+    def AddDamageListener(self, listener: DamageListener):
+        """
+        Be told about every damaged region taken by the frame, e.g. to keep a thumbnail of the
+        diagram up to date without re-rendering it
+
+        Args:
+            listener:   Called with the result of each `TakeDamagedRegions`
+        """
+        self._damageListeners.append(listener)
+
+    def RemoveDamageListener(self, listener: DamageListener):
+        """
+        Args:
+            listener:   A listener added by `AddDamageListener`;  Unknown listeners are ignored
+        """
+        if listener in self._damageListeners:
+            self._damageListeners.remove(listener)
+
+    def FindShapesAt(self, x: float, y: float) -> List[Shape]:
+        """
+        The shapes that might contain the point;  The caller does the exact `Inside` test
+
+        Args:
+            x: abscissa in diagram coordinates
+            y: ordinate in diagram coordinates
+
+        Returns:  The candidate shapes, topmost first
+        """
+        self._updateIndex()
+        return self._toShapes(self._shapeIndex.queryPoint(x, y))
+
+    def FindShapesInRectangle(self, left: float, top: float, right: float, bottom: float) -> List[Shape]:
+        """
+        The shapes that might lie inside the rectangle;  The caller does the exact test
+
+        Args:
+            left:   in diagram coordinates
+            top:    in diagram coordinates
+            right:  in diagram coordinates
+            bottom: in diagram coordinates
+
+        Returns:  The candidate shapes, topmost first
+        """
+        self._updateIndex()
+        return self._toShapes(self._shapeIndex.queryRectangle((left, top, right, bottom)))
+
+    def _toShapes(self, shapeIds) -> List[Shape]:
+
+        candidates: Dict[int, Shape] = {shapeId: self._indexed[shapeId] for shapeId in shapeIds}
+        candidates.update(self._unbounded)
+
+        zOrder: Dict[int, int] = self._zOrder
+        return [candidates[shapeId] for shapeId in sorted(candidates, key=lambda k: zOrder[k], reverse=True)]
+
+    def _updateIndex(self):
+        """
+        Re-file the shapes that changed since the last query
+        """
+        margin: int = Diagram.HIT_MARGIN
+        for shapeId, shape in self._dirtyShapes.items():
+            if shapeId not in self._zOrder:
+                continue        # Not on this diagram (anymore)
+            self._indexed[shapeId] = shape
+            boundingBox: Optional[BoundingBox] = shape.GetBoundingBox()
+            if shapeId in self._indexedBoxes:
+                self._damage(shape, self._indexedBoxes[shapeId])
+            self._damage(shape, boundingBox)
+            if boundingBox is None:
+                self._shapeIndex.remove(shapeId)
+                self._indexedBoxes.pop(shapeId, None)
+                self._unbounded[shapeId] = shape
+            else:
+                left, top, right, bottom = boundingBox
+                self._unbounded.pop(shapeId, None)
+                self._shapeIndex.insert(shapeId, (left - margin, top - margin, right + margin, bottom + margin))
+                self._indexedBoxes[shapeId] = boundingBox
+        self._dirtyShapes.clear()
+
+    def _damage(self, shape: Shape, boundingBox: Optional[BoundingBox]):
+        """
+        Record that the area under a shape has to be repainted
+
+        Args:
+            shape:          The shape that changed
+            boundingBox:    Its bounds or `None` if they are unknown
+        """
+        if self._fullyDamaged is True:
+            return
+        if boundingBox is None or len(self._damagedRegions) >= Diagram.MAX_DAMAGED_REGIONS:
+            self._fullyDamaged   = True
+            self._damagedRegions = []
+            return
+
+        if isinstance(shape, LineShape):
+            margin: int = Diagram.LABEL_MARGIN
+        else:
+            margin = Diagram.HIT_MARGIN
+        left, top, right, bottom = boundingBox
+        self._damagedRegions.append((left - margin, top - margin, right + margin, bottom + margin))
+
+    def _clearIndex(self):
+
+        self._shapeIndex.clear()
+        self._indexed.clear()
+        self._unbounded.clear()
+        self._dirtyShapes.clear()
+        self._zOrder.clear()
+        self._indexedBoxes.clear()
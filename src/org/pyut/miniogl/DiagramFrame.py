@@ -1,9 +1,17 @@
 
 from typing import cast
+from typing import Dict
 from typing import List
+from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
+from logging import DEBUG
+
+from math import ceil
+from math import floor
+
+from time import perf_counter
 
 from wx import Colour
 from wx import WHITE
@@ -19,6 +27,7 @@ from wx import EVT_PAINT
 from wx import EVT_RIGHT_DCLICK
 from wx import EVT_RIGHT_DOWN
 from wx import EVT_RIGHT_UP
+from wx import EVT_TIMER
 
 from wx import FONTFAMILY_DEFAULT
 from wx import FONTSTYLE_NORMAL
@@ -26,6 +35,7 @@ from wx import FONTWEIGHT_NORMAL
 from wx import ID_ANY
 from wx import SUNKEN_BORDER
 from wx import TRANSPARENT_BRUSH
+from wx import TRANSPARENT_PEN
 
 from wx import Bitmap
 from wx import EmptyBitmap
@@ -33,10 +43,13 @@ from wx import Brush
 from wx import ClientDC
 from wx import DC
 from wx import Dialog
+from wx import GCDC
 from wx import PaintDC
 from wx import PaintEvent
 from wx import ScrolledWindow
 from wx import Size
+from wx import Timer
+from wx import TimerEvent
 from wx import MemoryDC
 from wx import MouseEvent
 from wx import NullBitmap
@@ -55,10 +68,17 @@ from org.pyut.miniogl.PyutPenStyle import PyutPenStyle
 from org.pyut.miniogl.ShapeEventHandler import ShapeEventHandler
 from org.pyut.miniogl.SizerShape import SizerShape
 from org.pyut.miniogl.ControlPoint import ControlPoint
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+from org.pyut.miniogl.LineBatch import LineBatch
+from org.pyut.miniogl.LineShape import LineShape
+from org.pyut.miniogl.MiniOglUtils import mergeRectangles
+from org.pyut.miniogl.MiniOglUtils import segmentIntersectsRectangle
 from org.pyut.miniogl.RectangleShape import RectangleShape
 
 from org.pyut.preferences.PyutPreferences import PyutPreferences
 
+from org.pyut.general.Tracer import Tracer
+
 from org.pyut.dialogs.DlgDebugDiagramFrame import DlgDebugDiagramFrame
 
 
@@ -66,6 +86,9 @@ class DiagramFrame(ScrolledWindow):
 
     clsLogger: Logger = getLogger(__name__)
 
+    CULL_MARGIN:    int = Diagram.LABEL_MARGIN
+    GRID_TILE_SIZE: int = 256      # the grid tile is the smallest multiple of the grid interval at least this big
+
     """
     A frame to draw simulation diagrams.
     This frame also manage all mouse events.
@@ -82,15 +105,24 @@ class DiagramFrame(ScrolledWindow):
         self._diagram = Diagram(self)
 
         self.__keepMoving       = False
-        self._selectedShapes    = []        # list of the shapes that are selected
+        self._selectedShapes: Dict[int, Shape] = {}     # id(shape) -> shape;  the shapes selected through the frame
         self._lastMousePosition = None
+        self._eventPosition: Tuple[float, float] = (0.0, 0.0)   # diagram position of the mouse event being handled;  Not rounded like the event
         self._selector          = None      # rectangle selector shape
         self._clickedShape      = None      # last clicked shape
         self._moving: bool      = False     # a drag has been initiated
 
-        self._xOffset = 0.0     # abscissa offset between the view and the model
-        self._yOffset = 0.0     # ordinate offset between the view and the model
-        self._zoomStack = []    # store all zoom factors applied
+        self._dragTimer:    Timer       = Timer(self)    # applies the coalesced mouse moves once per frame
+        self._dragPosition: Tuple       = cast(Tuple, None)     # latest mouse position not yet applied to the dragged shapes
+        self._dragShapes:   List[Shape] = []    # the shapes the drag moves;  Children of a selected shape follow it
+
+        self._culledShapeCount: int           = 0                     # shapes skipped by the last culled Redraw
+        self._levelOfDetail:    LevelOfDetail = LevelOfDetail.FULL    # how much the shapes draw at the current zoom
+
+        self._refreshSuspended: int  = 0        # nesting depth of SuspendRefresh
+        self._refreshPending:   bool = False    # a Refresh was asked for while suspended
+
+        self._zoomStack = []    # store all zoom factors applied;  Their product is the dc user scale
 
         self._zoomLevel = 0             # number of zoom factors applied
         self._maxZoomFactor = 6         # can zoom in beyond 600%
@@ -111,6 +143,9 @@ class DiagramFrame(ScrolledWindow):
         self.__workingBitmap    = Bitmap(w, h)   # double buffering
         self.__backgroundBitmap = Bitmap(w, h)
 
+        self._gridTile:          Bitmap = cast(Bitmap, None)    # pre-rendered piece of the background grid
+        self._gridTileSignature: Tuple  = cast(Tuple, None)     # the grid settings the tile was rendered with
+
         DEFAULT_FONT_SIZE = 12
         self._defaultFont = Font(DEFAULT_FONT_SIZE, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
         self.SetBackgroundColour(WHITE)
@@ -127,6 +162,7 @@ class DiagramFrame(ScrolledWindow):
         self.Bind(EVT_RIGHT_UP,      self.OnRightUp)
         self.Bind(EVT_RIGHT_DCLICK,  self.OnRightDClick)
         self.Bind(EVT_PAINT,         self.OnPaint)
+        self.Bind(EVT_TIMER,         self._OnDragTimer, self._dragTimer)
 
         if self._prefs.debugDiagramFrame is True:
 
@@ -146,6 +182,34 @@ class DiagramFrame(ScrolledWindow):
         x, y = self._ConvertEventCoordinates(event)  # Updated by CD, 20041005
         return x, y
 
+    def CalcDiagramPosition(self, x: int, y: int) -> Tuple[float, float]:
+        """
+        Convert a window position, e.g. from a mouse event, to diagram coordinates;
+        Undoes the scrolling and the zoom
+
+        Args:
+            x:  abscissa relative to the client area
+            y:  ordinate relative to the client area
+
+        Returns:  The position in diagram coordinates
+        """
+        zoom: float = self.GetCurrentZoom()
+        unscrolledX, unscrolledY = self.CalcUnscrolledPosition(x, y)
+
+        return unscrolledX / zoom, unscrolledY / zoom
+
+    def PrepareDC(self, dc: DC):
+        """
+        Override;  Besides the scroll position, set the zoom as the dc user scale so
+        that the shapes draw in diagram coordinates
+
+        Args:
+            dc: The dc to prepare
+        """
+        super().PrepareDC(dc)
+        zoom: float = self.GetCurrentZoom()
+        dc.SetUserScale(zoom, zoom)
+
     def GenericHandler(self, event: MouseEvent, methodName: str):
         """
         This handler finds the shape at event coordinates and dispatch the event.
@@ -157,10 +221,12 @@ class DiagramFrame(ScrolledWindow):
         @return Shape : the clicked shape
         """
         x, y = self.getEventPosition(event)
+        self._eventPosition = (x, y)
         shape = self.FindShape(x, y)
-        event.m_x, event.m_y = x, y
+        event.m_x, event.m_y = round(x), round(y)      # the event coordinates are integers
 
-        self.clsLogger.debug(f'GenericHandler - `{shape=}` `{methodName=}` x,y: {x},{y}')
+        if self.clsLogger.isEnabledFor(DEBUG):
+            self.clsLogger.debug(f'GenericHandler - `{shape=}` `{methodName=}` x,y: {x},{y}')
         # if the shape found is a ShapeEventHandler
         if shape is not None and isinstance(shape, ShapeEventHandler):
             getattr(shape, methodName)(event)
@@ -185,31 +251,30 @@ class DiagramFrame(ScrolledWindow):
             self._BeginSelect(event)
             return
 
-        # manage click and drag
-        x, y = event.GetX(), event.GetY()
-        self._lastMousePosition = (x, y)
+        # manage click and drag;  From the unrounded position so that zoomed drags do not snap
+        self._lastMousePosition = self._eventPosition
 
         realShape: Shape = cast(Shape, shape)
         if not event.ControlDown() and not realShape.IsSelected():
-            shapes = self._diagram.GetShapes()
-            shapes.remove(shape)
+            keptIds = {id(shape)}
             if isinstance(shape, SizerShape):
                 # don't deselect the parent of a sizer
                 # or its sizer's would be detached
-                shapes.remove(shape.GetParent())
+                keptIds.add(id(shape.GetParent()))
             elif isinstance(shape, ControlPoint):
                 # don't deselect the line of a control point
                 self.clsLogger.debug(f'{shape=}')
                 for line in shape.GetLines():
-                    shapes.remove(line)
+                    keptIds.add(id(line))
             # don't call DeselectAllShapes, because we must ensure that
             # the sizer won't be deselected (because they are detached when they are deselected)
-            # deselect all other shapes
-            for s in shapes:
-                s.SetSelected(False)
-                s.SetMoving(False)
+            # deselect all other shapes;  Only the selected or moving ones need it
+            for s in self._diagram.GetActiveShapes():
+                if id(s) not in keptIds:
+                    s.SetSelected(False)
+                    s.SetMoving(False)
 
-            self._selectedShapes = [shape]
+            self._selectedShapes = {id(shape): shape}
             shape.SetSelected(True)
             shape.SetMoving(True)
             self._clickedShape = None
@@ -224,19 +289,21 @@ class DiagramFrame(ScrolledWindow):
         Args:
             event:
         """
+        self._EndDrag()
         if self._selector is not None:
             self.Bind(EVT_MOTION, self._NullCallback)
             self.clsLogger.debug(f'{self._selector=}')
             rect = self._selector
 
-            for shape in self._diagram.GetShapes():
+            left, top, right, bottom = rect.GetBoundingBox()
+            for shape in reversed(self._diagram.FindShapesInRectangle(left, top, right, bottom)):
                 x0, y0 = shape.GetTopLeft()
                 w0, h0 = shape.GetSize()
 
                 if shape.GetParent() is None and self._isShapeInRectangle(rect, x0=x0, y0=y0, w0=w0, h0=h0):
                     shape.SetSelected(True)
                     shape.SetMoving(True)
-                    self._selectedShapes.append(shape)
+                    self._selectedShapes[id(shape)] = shape
             rect.Detach()
             self._selector = None
         if not self._moving and self._clickedShape:
@@ -244,17 +311,17 @@ class DiagramFrame(ScrolledWindow):
             clicked = self._clickedShape
             if not event.ControlDown():
                 self.DeselectAllShapes()
-                self._selectedShapes = [clicked]
+                self._selectedShapes = {id(clicked): clicked}
                 clicked.SetSelected(True)
                 clicked.SetMoving(True)
             else:
                 sel = not clicked.IsSelected()
                 clicked.SetSelected(sel)
                 clicked.SetMoving(sel)
-                if sel and clicked not in self._selectedShapes:
-                    self._selectedShapes.append(clicked)
-                elif not sel and clicked in self._selectedShapes:
-                    self._selectedShapes.remove(clicked)
+                if sel:
+                    self._selectedShapes[id(clicked)] = clicked
+                else:
+                    self._selectedShapes.pop(id(clicked), None)
             self._clickedShape = None
             self.Refresh()
 
@@ -268,33 +335,24 @@ class DiagramFrame(ScrolledWindow):
 
     def OnDrag(self, event: MouseEvent):
         """
-        Callback to drag the selected shapes.
+        Callback to drag the selected shapes.  Mouse moves are coalesced;  Only the latest
+        position is kept and the shapes are moved and repainted on the next frame tick.
+        With a drag frame rate of 0 every mouse move is applied immediately.
 
         Args:
             event:
         """
-        x, y = event.GetX(), event.GetY()
         if not self._moving:
-            self.PrepareBackground()
-        self._moving = True
-        clicked = self._clickedShape
-        if clicked and not clicked.IsSelected():
-            self._selectedShapes.append(clicked)
-            clicked.SetSelected(True)
-            clicked.SetMoving(True)
-        self._clickedShape = None
-        for shape in self._selectedShapes:
-            parent = shape.GetParent()
-            if parent is not None and parent.IsSelected() and not isinstance(shape, SizerShape):
-                continue
-            ox, oy = self._lastMousePosition
-            dx, dy = x - ox, y - oy
-            sx, sy = shape.GetPosition()
+            self._BeginDrag()
 
-            shape.SetPosition(sx + dx, sy + dy)
+        self._dragPosition = self._eventPosition
 
-        self.Refresh(False)
-        self._lastMousePosition = (x, y)
+        frameRate: int = self._prefs.dragFrameRate
+        if frameRate <= 0:
+            self._ApplyDrag()
+        elif not self._dragTimer.IsRunning():
+            self._ApplyDrag()       # respond at once to the first move;  The timer paces the following ones
+            self._dragTimer.Start(max(1, 1000 // frameRate))
 
     def OnMove(self, event: MouseEvent):
         """
@@ -302,7 +360,9 @@ class DiagramFrame(ScrolledWindow):
 
         @param  event
         """
-        event.m_x, event.m_y = self.getEventPosition(event)
+        x, y = self.getEventPosition(event)
+        self._eventPosition = (x, y)
+        event.m_x, event.m_y = round(x), round(y)
         self.OnDrag(event)
 
     def OnLeftDClick(self, event: MouseEvent):
@@ -391,26 +451,31 @@ class DiagramFrame(ScrolledWindow):
 
         Returns:  The shape that was found under the coordinates or None
         """
-        self.clsLogger.debug(f'FindShape: @{x},{y}')
+        if Tracer.miniogl is True:
+            startTime: float = perf_counter()
+        debug: bool = self.clsLogger.isEnabledFor(DEBUG)
         found = None
-        shapes = self._diagram.GetShapes()
-        self.clsLogger.debug(f'{shapes=}')
-        shapes.reverse()    # to select the one at the top
+        shapes = self._diagram.FindShapesAt(x, y)   # topmost first;  Only the shapes near (x, y)
+        if debug is True:
+            self.clsLogger.debug(f'FindShape: @{x},{y} {shapes=}')
         for shape in shapes:
             if shape.Inside(x, y):
-                self.clsLogger.debug(f"Inside: {shape}")
+                if debug is True:
+                    self.clsLogger.debug(f"Inside: {shape}")
                 found = shape
                 break   # only select the first one
+        if Tracer.miniogl is True:
+            Tracer().record('miniogl.hitTest', startTime)
         return found
 
     def DeselectAllShapes(self):
         """
-        Deselect all shapes in the frame.
+        Deselect all shapes in the frame.  Only the selected or moving shapes are visited
         """
-        for shape in self._diagram.GetShapes():
+        for shape in self._diagram.GetActiveShapes():
             shape.SetSelected(False)
             shape.SetMoving(False)
-        self._selectedShapes = []
+        self._selectedShapes = {}
 
     def GetSelectedShapes(self):
         """
@@ -418,9 +483,9 @@ class DiagramFrame(ScrolledWindow):
         Beware, this is the list of the frame, but other shapes could be
         selected and not declared to the frame.
 
-        @return Shape []
+        @return Shape []  A copy in selection order
         """
-        return self._selectedShapes
+        return list(self._selectedShapes.values())
 
     def SetSelectedShapes(self, shapes: List[Shape]):
         """
@@ -428,7 +493,7 @@ class DiagramFrame(ScrolledWindow):
 
         @param shapes
         """
-        self._selectedShapes = shapes
+        self._selectedShapes = {id(shape): shape for shape in shapes}
 
     def Refresh(self, eraseBackground=True, rect=None):
         """
@@ -438,11 +503,30 @@ class DiagramFrame(ScrolledWindow):
         @param Rect rect : not used
         """
         # self.clsLogger.warning(f'Refresh - {eraseBackground=}')
+        if self._refreshSuspended > 0:
+            self._refreshPending = True
+            return
         if eraseBackground:
             self.Redraw()
         else:
             self.RedrawWithBackground()
 
+    def SuspendRefresh(self):
+        """
+        Defer the refreshes, e.g. while many commands are applied in a row, until the
+        matching `ResumeRefresh`;  Calls can be nested
+        """
+        self._refreshSuspended += 1
+
+    def ResumeRefresh(self):
+        """
+        Do a single refresh if any was asked for since the outermost `SuspendRefresh`
+        """
+        self._refreshSuspended -= 1
+        if self._refreshSuspended == 0 and self._refreshPending is True:
+            self._refreshPending = False
+            self.Refresh()
+
     def SaveBackground(self, dc: DC):
         """
 
@@ -457,7 +541,10 @@ class DiagramFrame(ScrolledWindow):
         mem.SelectObject(bb)
 
         x, y = self.CalcUnscrolledPosition(0, 0)
+        scaleX, scaleY = dc.GetUserScale()
+        dc.SetUserScale(1.0, 1.0)       # blit pixels, not diagram coordinates
         mem.Blit(0, 0, w, h, dc, x, y)
+        dc.SetUserScale(scaleX, scaleY)
 
         mem.SelectObject(NullBitmap)
 
@@ -512,6 +599,9 @@ class DiagramFrame(ScrolledWindow):
             dc.SetBackground(Brush(self.GetBackgroundColour()))
             dc.Clear()
         self.PrepareDC(dc)
+        if not loadBackground and self._prefs.backgroundGridEnabled is True:
+            x, y = self.CalcUnscrolledPosition(0, 0)
+            self._drawGrid(memDC=dc, left=x, top=y, width=w, height=h)
 
         return dc
 
@@ -527,7 +617,21 @@ class DiagramFrame(ScrolledWindow):
         """
         self.Redraw(cast(DC, None), True, False, True)
 
-    def Redraw(self, dc: DC = None, full: bool = True, saveBackground: bool = False, useBackground: bool = False):
+    @property
+    def levelOfDetail(self) -> LevelOfDetail:
+        """
+        Returns:  How much detail the shapes should draw;  Always full detail while printing or exporting
+        """
+        return self._levelOfDetail
+
+    @property
+    def culledShapeCount(self) -> int:
+        """
+        Returns:  The number of shapes the last culled redraw did not draw
+        """
+        return self._culledShapeCount
+
+    def Redraw(self, dc: DC = None, full: bool = True, saveBackground: bool = False, useBackground: bool = False, cull: bool = False):
         """
         Refresh the diagram.
         If a DC is given, use it. Otherwise, use a double buffered DC.
@@ -537,57 +641,219 @@ class DiagramFrame(ScrolledWindow):
             full:   If False, only draw the shape borders.
             saveBackground: If True, save the background
             useBackground:  If True, use the background
+            cull:   If True, only draw the shapes in the visible part of the frame;
+                    Always done when we create the dc
         """
+        if Tracer.miniogl is True:
+            startTime: float = perf_counter()
         needBlit = False
         w, h = self.GetSize()
 
         if dc is None:
             dc = self.CreateDC(useBackground, w, h)
             needBlit = True
+            cull     = True
 
         dc.SetFont(self._defaultFont)
+        memoryDC: DC = dc
+        dc = self._createShapeDC(memoryDC)
 
-        shapes = self._diagram.GetShapes()
+        if cull:
+            shapes = self._getVisibleShapes()
+            self._diagram.TakeDamagedRegions()     # we are repainting everything that is visible
+        else:
+            shapes = self._diagram.GetShapes()
+            screenLevelOfDetail: LevelOfDetail = self._levelOfDetail
+            self._levelOfDetail = LevelOfDetail.FULL    # the dc is a printer or an image
         if full:
             # first time, need to create the background
             if saveBackground:
                 # first, draw every non moving shapes
-                for shape in shapes:
-                    if not shape.IsMoving():
-                        shape.Draw(dc)
+                self._drawShapes(dc, [shape for shape in shapes if not shape.IsMoving()])
                 # save the background
-                self.SaveBackground(dc)
+                self._flushShapeDC(dc)
+                self.SaveBackground(memoryDC)
                 # draw every moving shape
                 for shape in shapes:
                     if shape.IsMoving():
                         shape.Draw(dc)
 
-            # x, y = self.CalcUnScrolledPosition(0, 0)
             if useBackground:
                 # draw every moving shapes
                 for shape in shapes:
                     if shape.IsMoving():
                         shape.Draw(dc)
-                # TODO: This code belongs in OnPaint
-                # if self._prefs.backgroundGridEnabled is True:
-                #     self._drawGrid(memDC=dc, width=w, height=h, startX=x, startY=y)
             else:  # don't use background
                 # draw all shapes
-                for shape in shapes:
-                    shape.Draw(dc)
-                # TODO: This code belongs in OnPaint
-                # if self._prefs.backgroundGridEnabled is True:
-                #     self._drawGrid(memDC=dc, width=w, height=h, startX=x, startY=y)
+                self._drawShapes(dc, shapes)
         else:  # not full
             for shape in shapes:
                 shape.DrawBorder(dc)
                 shape.DrawAnchors(dc)
 
+        if not cull:
+            self._levelOfDetail = screenLevelOfDetail
+        self._flushShapeDC(dc)
+
         if needBlit:
             client = ClientDC(self)
 
             x, y = self.CalcUnscrolledPosition(0, 0)
-            client.Blit(0, 0, w, h, dc, x, y)
+            memoryDC.SetUserScale(1.0, 1.0)       # blit pixels, not diagram coordinates
+            client.Blit(0, 0, w, h, memoryDC, x, y)
+
+        if Tracer.miniogl is True:
+            Tracer().record('miniogl.draw', startTime)
+
+    def DrawShapesInRectangle(self, dc: DC, left: float, top: float, right: float, bottom: float, levelOfDetail: LevelOfDetail = LevelOfDetail.FULL):
+        """
+        Draw every shape that touches a rectangle of the diagram.  Used to render the diagram
+        off screen one tile at a time;  The caller prepares `dc` with the scale and origin of
+        the tile and clears it
+
+        Args:
+            dc:     The dc to draw on
+            left:   The rectangle, in diagram coordinates
+            top:
+            right:
+            bottom:
+            levelOfDetail:  How much the shapes draw;  Independent of the frame's zoom
+        """
+        screenLevelOfDetail: LevelOfDetail = self._levelOfDetail
+        self._levelOfDetail = levelOfDetail
+
+        dc.SetFont(self._defaultFont)
+        self._drawShapes(dc, list(reversed(self._diagram.FindShapesInRectangle(left, top, right, bottom))))
+
+        self._levelOfDetail = screenLevelOfDetail
+
+    def _drawShapes(self, dc: DC, shapes: List[Shape]):
+        """
+        Draw shapes in display list order.  Consecutive lines that can be batched are
+        collected and drawn with one dc call per pen and brush when the run ends, so that
+        the z-order is kept
+
+        Args:
+            dc:     The prepared dc
+            shapes: The shapes to draw
+        """
+        batch: LineBatch = LineBatch()
+        for shape in shapes:
+            if isinstance(shape, LineShape) and shape.IsBatchable() is True:
+                shape.AddToBatch(batch)
+            else:
+                if batch.isEmpty is False:
+                    batch.draw(dc)
+                    batch.clear()
+                shape.Draw(dc)
+        batch.draw(dc)
+
+    def _createShapeDC(self, dc: DC) -> DC:
+        """
+        The dc the shapes draw on.  With the graphics context backend a `GCDC` with the same
+        scale and origin is put over the memory dc, so that the shapes are anti-aliased and
+        can draw their cached `GraphicsPath`s;  Otherwise `dc` itself.  Printer dcs are
+        never wrapped
+
+        Args:
+            dc:     The prepared dc the frame paints into
+
+        Returns:  The dc to hand to `Shape.Draw`;  Flush it with `_flushShapeDC` before `dc` is blitted
+        """
+        if self._prefs.graphicsContextRendering is False or not isinstance(dc, MemoryDC):
+            return dc
+
+        shapeDC: GCDC = GCDC(dc)
+        origin = dc.GetDeviceOrigin()
+        shapeDC.SetDeviceOrigin(origin.x, origin.y)
+        shapeDC.SetUserScale(*dc.GetUserScale())
+        shapeDC.SetFont(dc.GetFont())
+
+        return shapeDC
+
+    def _flushShapeDC(self, shapeDC: DC):
+        """
+        Make sure everything drawn on a dc from `_createShapeDC` is in the underlying bitmap
+
+        Args:
+            shapeDC:    The dc the shapes drew on
+        """
+        if isinstance(shapeDC, GCDC):
+            shapeDC.GetGraphicsContext().Flush()
+
+    def RefreshDirtyRegions(self):
+        """
+        Repaint only the regions the diagram reports as damaged and blit just those
+        to the screen.  While dragging, the regions are restored from the saved background
+        and only the moving shapes are drawn on top;  Otherwise every shape in a region
+        is redrawn.  Falls back to a full `Refresh` when the whole diagram is damaged.
+        """
+        if Tracer.miniogl is True:
+            startTime: float = perf_counter()
+        regions = self._diagram.TakeDamagedRegions()
+        w, h = self.GetSize()
+        workingBitmap: Bitmap = self.__workingBitmap
+        if regions is None or (workingBitmap.GetWidth(), workingBitmap.GetHeight()) != (w, h):
+            self.Refresh(not self._moving)
+            return
+
+        # the regions are in diagram coordinates;  Paint and blit in unscaled, scrolled pixels
+        zoom: float = self.GetCurrentZoom()
+        originX, originY = self.CalcUnscrolledPosition(0, 0)
+        clientWidth, clientHeight = self.GetClientSize()
+        clipped = []
+        for left, top, right, bottom in regions:
+            left,  top    = max(floor(left * zoom),  originX), max(floor(top * zoom), originY)
+            right, bottom = min(ceil(right * zoom),  originX + clientWidth), min(ceil(bottom * zoom), originY + clientHeight)
+            if left < right and top < bottom:
+                clipped.append((left, top, right, bottom))
+        if len(clipped) == 0:
+            return
+
+        mem = MemoryDC()
+        mem.SelectObject(workingBitmap)
+        self.PrepareDC(mem)
+        mem.SetUserScale(1.0, 1.0)
+        mem.SetFont(self._defaultFont)
+
+        background = None
+        if self._moving:
+            background = MemoryDC()
+            background.SelectObject(self.__backgroundBitmap)
+        gridEnabled: bool = self._prefs.backgroundGridEnabled
+
+        client = ClientDC(self)
+        for left, top, right, bottom in mergeRectangles(clipped):
+            width, height = right - left, bottom - top
+            clientX, clientY = left - originX, top - originY
+            mem.SetClippingRegion(left, top, width, height)
+            if background is not None:
+                mem.Blit(left, top, width, height, background, clientX, clientY)
+            elif gridEnabled is True:
+                self._drawGrid(memDC=mem, left=left, top=top, width=width, height=height)
+            else:
+                mem.SetPen(TRANSPARENT_PEN)
+                mem.SetBrush(Brush(self.GetBackgroundColour()))
+                mem.DrawRectangle(left, top, width, height)
+            mem.SetUserScale(zoom, zoom)
+            shapeDC: DC = self._createShapeDC(mem)
+            if shapeDC is not mem:
+                shapeDC.SetClippingRegion(floor(left / zoom), floor(top / zoom), ceil(width / zoom) + 1, ceil(height / zoom) + 1)
+            regionShapes: List[Shape] = list(reversed(self._diagram.FindShapesInRectangle(left / zoom, top / zoom, right / zoom, bottom / zoom)))
+            if background is not None:
+                regionShapes = [shape for shape in regionShapes if shape.IsMoving()]
+            self._drawShapes(shapeDC, regionShapes)
+            self._flushShapeDC(shapeDC)
+            mem.SetUserScale(1.0, 1.0)
+            mem.DestroyClippingRegion()
+            client.Blit(clientX, clientY, width, height, mem, left, top)
+
+        if background is not None:
+            background.SelectObject(NullBitmap)
+        mem.SelectObject(NullBitmap)
+
+        if Tracer.miniogl is True:
+            Tracer().record('miniogl.refreshRegions', startTime)
 
     # noinspection PyUnusedLocal
     def OnPaint(self, event: PaintEvent):
@@ -599,19 +865,16 @@ class DiagramFrame(ScrolledWindow):
         """
         dc = PaintDC(self)
         w, h = self.GetSize()
+        #
+        # The grid, if enabled, is laid down by CreateDC so that Redraw(), which creates its own DC
+        # when Pyut is built for deployment, draws it too
+        #
         mem = self.CreateDC(False, w, h)
-        mem.SetBackground(Brush(self.GetBackgroundColour()))
-        mem.Clear()
 
         x, y = self.CalcUnscrolledPosition(0, 0)
-        #
-        # self.clsLogger.warning(f'OnPaint - {w=}, {h=} {x=} {y=}')
-        # Paint events don't seem to be generated when Pyut is built for deployment;  So code duplicated in .Redraw()
-        #
-        if self._prefs.backgroundGridEnabled is True:
-            self._drawGrid(memDC=mem, width=w, height=h, startX=x, startY=y)
-        self.Redraw(mem)
+        self.Redraw(mem, cull=True)
 
+        mem.SetUserScale(1.0, 1.0)          # blit pixels, not diagram coordinates
         dc.Blit(0, 0, w, h, mem, x, y)
 
     def GetCurrentZoom(self):
@@ -624,34 +887,6 @@ class DiagramFrame(ScrolledWindow):
             zoom *= z
         return zoom
 
-    def GetXOffset(self):
-        """
-        added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
-        @return the x offset between the model an the view of the shapes (MVC)
-        """
-        return self._xOffset
-
-    def GetYOffset(self):
-        """
-        added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
-        @return the y offset between the model an the view of the shapes (MVC)
-        """
-        return self._yOffset
-
-    def SetXOffset(self, offset):
-        """
-        added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
-        Set the x offset between the model an the view of the shapes (MVC)
-        """
-        self._xOffset = offset
-
-    def SetYOffset(self, offset):
-        """
-        added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
-        Set the y offset between the model an the view of the shapes (MVC)
-        """
-        self._yOffset = offset
-
     def SetDefaultZoomFactor(self, factor):
         """
         added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (11.11.2005)
@@ -704,59 +939,29 @@ class DiagramFrame(ScrolledWindow):
 
             self.GetMaxLevelZoom() * self.GetDefaultZoomFactor()
 
-        If the maximal zoom level is reached, then the shapes are just centered
+        If the maximal zoom level is reached, then the view is just centered
         on the selected area or on the clicked point.
 
+        The zoom is only a dc user scale;  The shapes are not touched, so this is
+        O(1) in the number of shapes.
+
         @param ax        :  abscissa of the upper left corner of the selected
-                            area or abscissa of the central point of the zoom
+                            area or abscissa of the central point of the zoom,
+                            in diagram coordinates
 
         @param ay        :  ordinate of the upper left corner of the selected
-                            area or ordinate of the central point of the zoom
+                            area or ordinate of the central point of the zoom,
+                            in diagram coordinates
 
         @param width    :   width of the selected area for the zoom
 
         @param height   :   height of the selected area for the zoom
         """
-
-        # number of pixels per unit of scrolling
-        xUnit, yUnit = self.GetScrollPixelsPerUnit()
-
-        # position of the upper left corner of the client area
-        # (work area that is visible) in scroll units.
-        viewStartX, viewStartY = self.GetViewStart()
-
-        # Get the client and virtual size of the work area, where
-        # the client size is the size of the work area that is
-        # visible and the virtual is the whole work area's size.
         clientWidth, clientHeight = self.GetClientSize()
-        virtualWidth, virtualHeight = self.GetVirtualSize()
 
         # maximal zoom factor that can be applied
-        # maxZoomFactor = self.GetMaxLevelZoom() * self.GetDefaultZoomFactor()
         maxZoomFactor = self.GetMaxZoomFactor()
 
-        # transform event coordinates to get them relative to the upper left corner of
-        # the virtual screen (avoid the case where that corner is on a shape and
-        # get its coordinates relative to the client view).
-        if ax >= viewStartX * xUnit and ay >= viewStartY * yUnit:
-            x = ax
-            y = ay
-        else:
-            x = ax + viewStartX * xUnit
-            y = ay + viewStartY * yUnit
-
-        # to get the upper left corner of the zoom selected area in the
-        # case where we select first the bottom right corner.
-        if width < 0:
-            x = x - width
-        if height < 0:
-            y = y - height
-
-        # init the zoom's offsets and factor
-        # zoomFactor = 1
-        # dx = 0
-        # dy = 0
-
         # if there is no selected area but a clicked point, a default
         # zoom is performed with the clicked point as center.
         if width == 0 or height == 0:
@@ -771,41 +976,33 @@ class DiagramFrame(ScrolledWindow):
             # if the view is reduced, we just eliminate the
             # last zoom out performed
             if self._zoomLevel < 0:
-                self._zoomStack.pop()
+                zoomFactor = 1 / self._zoomStack.pop()
                 self._zoomLevel += 1
             else:
                 if zoomFactor > 1.0:
                     self._zoomStack.append(zoomFactor)
                     self._zoomLevel += 1
+                else:
+                    zoomFactor = 1.0
 
-            # calculation of the upper-left corner of a zoom area whose
-            # size is the half of the diagram frame and which is centred
-            # on the clicked point. This calculation is done in the way to
-            # get the zoom area centred in the middle of the virtual screen.
-            dx = virtualWidth/2 - x
-            dy = virtualHeight/2 - y
+            centerX, centerY = ax, ay
 
         else:
-            # to be sure to get all the shapes in the selected zoom area
-            if width > height:
-                zoomFactor = clientWidth / abs(width)
+            # to be sure to get all the shapes in the selected zoom area;  The selected
+            # area is in diagram coordinates, the client size in pixels
+            currentZoom = self.GetCurrentZoom()
+            if abs(width) > abs(height):
+                zoomFactor = clientWidth / (abs(width) * currentZoom)
             else:
-                zoomFactor = clientHeight / abs(height)
+                zoomFactor = clientHeight / (abs(height) * currentZoom)
 
             # check if the zoom factor that we are to apply combined with the
             # previous ones won't be beyond the maximal zoom. If it's the case,
             # we proceed to the calculation of the zoom factor that allows to
             # exactly reach the maximal zoom.
-            maxZoomReached = maxZoomFactor <= self.GetCurrentZoom() * zoomFactor
+            maxZoomReached = maxZoomFactor <= currentZoom * zoomFactor
             if maxZoomReached:
-                zoomFactor = maxZoomFactor/self.GetCurrentZoom()
-
-            # calculation of the upper-left corner of a zoom area whose
-            # size is the half of the diagram frame and which is centred
-            # on the clicked point. This calculation is done in the way to
-            # get the zoom area centred in the middle of the virtual screen.
-            dx = virtualWidth/2 - x - (clientWidth / zoomFactor / 2.0)
-            dy = virtualHeight/2 - y - (clientHeight / zoomFactor / 2.0)
+                zoomFactor = maxZoomFactor/currentZoom
 
             # we have to check if the "zoom in" on a reduced view produce
             # an other less reduced view or an enlarged view. For this, we
@@ -813,7 +1010,7 @@ class DiagramFrame(ScrolledWindow):
             # obtain only one zoom factor.
             if self._zoomLevel < 0:
 
-                globalFactor = zoomFactor * self.GetCurrentZoom()
+                globalFactor = zoomFactor * currentZoom
                 self._zoomStack = []
                 self._zoomStack.append(globalFactor)
 
@@ -827,27 +1024,14 @@ class DiagramFrame(ScrolledWindow):
                 if zoomFactor > 1.0:
                     self._zoomStack.append(zoomFactor)
                     self._zoomLevel += 1
+                else:
+                    zoomFactor = 1.0
 
-        # set the offsets between the model and the view
-        self.SetXOffset((self.GetXOffset() + dx) * zoomFactor)
-        self.SetYOffset((self.GetYOffset() + dy) * zoomFactor)
+            # the selection may have been dragged from any corner
+            centerX = ax + width / 2.0
+            centerY = ay + height / 2.0
 
-        # updates the shapes (view) position and dimensions from
-        # their models in the light of the new zoom factor and offsets.
-        for shape in self.GetDiagram().GetShapes():
-            shape.UpdateFromModel()
-
-        # resize the virtual screen in order to match with the zoom
-        virtualWidth  = virtualWidth * zoomFactor
-        virtualHeight = virtualHeight * zoomFactor
-        virtualSize = Size(virtualWidth, virtualHeight)
-        self.SetVirtualSize(virtualSize)
-
-        # perform the scrolling in the way to have the zoom area visible
-        # and centred on the virtual screen.
-        scrollX = (virtualWidth - clientWidth) // 2 // xUnit
-        scrollY = (virtualHeight - clientHeight) // 2 // yUnit
-        self.Scroll(scrollX, scrollY)
+        self._applyZoom(zoomFactor=zoomFactor, centerX=centerX, centerY=centerY)
 
     def DoZoomOut(self, ax: int, ay: int):
         """
@@ -857,42 +1041,10 @@ class DiagramFrame(ScrolledWindow):
         last one from the zoom stack. Else, we add the default inverted zoom factor
         to the stack.
 
-        @param ax  abscissa of the clicked point
-        @param ay  ordinate of the clicked point
+        @param ax  abscissa of the clicked point in diagram coordinates
+        @param ay  ordinate of the clicked point in diagram coordinates
         """
-
-        # number of pixels per unit of scrolling
-        xUnit, yUnit = self.GetScrollPixelsPerUnit()
-
-        # position of the upper left corner of the client area
-        # (work area that is visible) in scroll units.
-        viewStartX, viewStartY = self.GetViewStart()
-
-        # Get the client and virtual size of the work area, where
-        # the client size is the size of the work area that is
-        # visible and the virtual is the whole work area's size.
-        clientWidth, clientHeight = self.GetClientSize()
-        virtualWidth, virtualHeight = self.GetVirtualSize()
-
-        # transform event coordinates to get them relative to the upper left corner of
-        # the virtual screen (avoid the case where that corner is on a shape and
-        # get its coordinates relative to the shape).
-        if ax >= viewStartX * xUnit and ay >= viewStartY * yUnit:
-            x = ax
-            y = ay
-        else:
-            x = ax + viewStartX * xUnit
-            y = ay + viewStartY * yUnit
-
-        # calculation of the upper-left corner of a zoom area whose
-        # size is the half of the diagram frame and which is centred
-        # on the clicked point. This calculation is done in the way to
-        # get the zoom area centred in the middle of the virtual screen.
-        dx = virtualWidth/2 - x
-        dy = virtualHeight/2 - y
-
         minZoomFactor = self.GetMinZoomFactor()
-        # minZoomReached = False        not used
 
         # if the view is enlarged, then we just remove the last
         # zoom in factor that has been applied. Else, we apply
@@ -913,27 +1065,7 @@ class DiagramFrame(ScrolledWindow):
                     self._zoomStack.append(zoomFactor)
                     self._zoomLevel -= 1
 
-        # set the offsets between the view and the model of the
-        # each shape on this diagram frame.
-        self.SetXOffset((self.GetXOffset() + dx) * zoomFactor)
-        self.SetYOffset((self.GetYOffset() + dy) * zoomFactor)
-
-        # updates the shapes (view) position and dimensions from
-        # their model in the light of the new zoom factor and offsets.
-        for shape in self.GetDiagram().GetShapes():
-            shape.UpdateFromModel()
-
-        # resize the virtual screen in order to match with the zoom
-        virtualWidth  = virtualWidth * zoomFactor
-        virtualHeight = virtualHeight * zoomFactor
-        virtualSize = Size(virtualWidth, virtualHeight)
-        self.SetVirtualSize(virtualSize)
-
-        # perform the scrolling in the way to have the zoom area visible
-        # and centred on the virtual screen.
-        scrollX = (virtualWidth - clientWidth) // 2 // xUnit
-        scrollY = (virtualHeight - clientHeight) // 2 // yUnit
-        self.Scroll(scrollX, scrollY)
+        self._applyZoom(zoomFactor=zoomFactor, centerX=ax, centerY=ay)
 
     def SetInfinite(self, infinite: bool = False):
         """
@@ -963,6 +1095,68 @@ class DiagramFrame(ScrolledWindow):
             else:
                 self.Scroll(0, 0)
 
+    def _BeginDrag(self):
+        """
+        Save the background without the moving shapes and decide which shapes the drag moves
+        """
+        self.PrepareBackground()
+        self._moving = True
+        clicked = self._clickedShape
+        if clicked and not clicked.IsSelected():
+            self._selectedShapes[id(clicked)] = clicked
+            clicked.SetSelected(True)
+            clicked.SetMoving(True)
+        self._clickedShape = None
+
+        self._dragShapes = []
+        for shape in self._selectedShapes.values():
+            parent = shape.GetParent()
+            if parent is not None and parent.IsSelected() and not isinstance(shape, SizerShape):
+                continue
+            self._dragShapes.append(shape)
+
+    def _ApplyDrag(self):
+        """
+        Move the dragged shapes by everything the mouse moved since the last frame and
+        repaint once
+        """
+        if self._dragPosition is None:
+            return
+        x, y   = self._dragPosition
+        ox, oy = self._lastMousePosition
+        dx, dy = x - ox, y - oy
+        self._dragPosition      = None
+        self._lastMousePosition = (x, y)
+        if dx == 0 and dy == 0:
+            return
+
+        for shape in self._dragShapes:
+            sx, sy = shape.GetPosition()
+            shape.SetPosition(sx + dx, sy + dy)
+
+        self.RefreshDirtyRegions()
+
+    # noinspection PyUnusedLocal
+    def _OnDragTimer(self, event: TimerEvent):
+        """
+        A frame tick;  Apply the pending mouse move, or stop ticking once the mouse is still
+
+        Args:
+            event:
+        """
+        if self._dragPosition is None:
+            self._dragTimer.Stop()
+        else:
+            self._ApplyDrag()
+
+    def _EndDrag(self):
+        """
+        Apply the last pending mouse move so that the shapes end up under the pointer
+        """
+        self._dragTimer.Stop()
+        self._ApplyDrag()
+        self._dragShapes = []
+
     def _BeginSelect(self, event: MouseEvent):
         """
         Create a selector box and manage it.
@@ -971,7 +1165,7 @@ class DiagramFrame(ScrolledWindow):
         """
         if not event.ControlDown():
             self.DeselectAllShapes()
-        x, y = event.GetX(), event.GetY()   # event position has been modified
+        x, y = self._eventPosition
         self._selector = rect = RectangleShape(x, y, 0, 0)
         rect.SetDrawFrame(True)
         rect.SetBrush(TRANSPARENT_BRUSH)
@@ -996,41 +1190,70 @@ class DiagramFrame(ScrolledWindow):
         pass
 
     def _ConvertEventCoordinates(self, event):
-        xView, yView = self.GetViewStart()
-        xDelta, yDelta = self.GetScrollPixelsPerUnit()
-        return event.GetX() + (xView * xDelta), event.GetY() + (yView * yDelta)
+        return self.CalcDiagramPosition(event.GetX(), event.GetY())
 
-    def _drawGrid(self, memDC: DC, width: int, height: int, startX: int, startY: int):
+    def _drawGrid(self, memDC: DC, left: int, top: int, width: int, height: int):
+        """
+        Cover a rectangle with copies of the grid tile.  The tiles are aligned on the top left
+        corner of the visible area so that the grid does not depend on which region is painted.
+        The grid is drawn in pixels;  It does not scale with the zoom
 
-        # self.clsLogger.info(f'{width=} {height=} {startX=} {startY=}')
-        savePen = memDC.GetPen()
+        Args:
+            memDC:  The dc to draw on
+            left:   Left of the area to cover in unscaled, scrolled coordinates
+            top:    Top of the area to cover
+            width:  Width of the area
+            height: Height of the area
+        """
+        tile: Bitmap = self._getGridTile()
+        tileWidth, tileHeight = tile.GetWidth(), tile.GetHeight()
 
-        newPen: Pen = self._getGridPen()
-        memDC.SetPen(newPen)
+        originX, originY = self.CalcUnscrolledPosition(0, 0)
+        firstX: int = originX + floor((left - originX) / tileWidth)  * tileWidth
+        firstY: int = originY + floor((top - originY)  / tileHeight) * tileHeight
 
-        self._drawHorizontalLines(memDC=memDC, width=width, height=height, startX=startX, startY=startY)
-        self._drawVerticalLines(memDC=memDC,   width=width, height=height, startX=startX, startY=startY)
-        memDC.SetPen(savePen)
+        scaleX, scaleY = memDC.GetUserScale()
+        memDC.SetUserScale(1.0, 1.0)
 
-    def _drawHorizontalLines(self, memDC: DC, width: int, height: int, startX: int, startY: int):
+        tileDC: MemoryDC = MemoryDC()
+        tileDC.SelectObject(tile)
+        for tileY in range(firstY, top + height, tileHeight):
+            for tileX in range(firstX, left + width, tileWidth):
+                memDC.Blit(tileX, tileY, tileWidth, tileHeight, tileDC, 0, 0)
+        tileDC.SelectObject(NullBitmap)
 
-        x1:   int = 0
-        x2:   int = startX + width
-        stop: int = height + startY
-        step: int = self._prefs.backgroundGridInterval
-        for movingY in range(startY, stop, step):
-            # self.clsLogger.info(f'{x1=} {movingY=} - {x2=} {movingY=}')
-            memDC.DrawLine(x1, movingY, x2, movingY)
+        memDC.SetUserScale(scaleX, scaleY)
 
-    def _drawVerticalLines(self, memDC: DC, width: int, height: int, startX: int, startY: int):
+    def _getGridTile(self) -> Bitmap:
+        """
+        Returns:  The grid tile;  Only rendered again when the grid preferences or the background colour change
+        """
+        signature: Tuple = (self._prefs.backgroundGridInterval, self._prefs.gridLineColor, self._prefs.gridLineStyle, self.GetBackgroundColour().GetRGB())
+        if self._gridTile is None or signature != self._gridTileSignature:
+            self._gridTile          = self._createGridTile(interval=signature[0])
+            self._gridTileSignature = signature
+
+        return self._gridTile
+
+    def _createGridTile(self, interval: int) -> Bitmap:
 
-        y1:   int = 0
-        y2:   int = startY + height
-        stop: int = width + startX
-        step: int = self._prefs.backgroundGridInterval
+        interval = max(1, interval)
+        lineCount: int = max(1, ceil(DiagramFrame.GRID_TILE_SIZE / interval))
+        tileSize:  int = lineCount * interval
 
-        for movingX in range(startX, stop, step):
-            memDC.DrawLine(movingX, y1, movingX, y2)
+        tile:   Bitmap   = Bitmap(tileSize, tileSize)
+        tileDC: MemoryDC = MemoryDC()
+        tileDC.SelectObject(tile)
+        tileDC.SetBackground(Brush(self.GetBackgroundColour()))
+        tileDC.Clear()
+
+        tileDC.SetPen(self._getGridPen())
+        for position in range(0, tileSize, interval):
+            tileDC.DrawLine(position, 0, position, tileSize)
+            tileDC.DrawLine(0, position, tileSize, position)
+        tileDC.SelectObject(NullBitmap)
+
+        return tile
 
     def _getGridPen(self) -> Pen:
 
@@ -1041,6 +1264,91 @@ class DiagramFrame(ScrolledWindow):
 
         return pen
 
+    def CenterOn(self, centerX: float, centerY: float):
+        """
+        Scroll so that a diagram point is in the middle of the client area, as far as
+        the virtual size allows
+
+        Args:
+            centerX:    abscissa in diagram coordinates
+            centerY:    ordinate in diagram coordinates
+        """
+        xUnit, yUnit = self.GetScrollPixelsPerUnit()
+        clientWidth, clientHeight = self.GetClientSize()
+
+        zoom: float = self.GetCurrentZoom()
+        scrollX = max(0, round(centerX * zoom - clientWidth / 2.0)) // max(1, xUnit)
+        scrollY = max(0, round(centerY * zoom - clientHeight / 2.0)) // max(1, yUnit)
+        self.Scroll(scrollX, scrollY)
+
+    def GetVisibleRectangle(self) -> Tuple[int, int, int, int]:
+        """
+        The part of the diagram that is on screen;  The scrolled client area divided by the zoom
+
+        Returns:  (left, top, right, bottom) in diagram coordinates
+        """
+        width, height = self.GetClientSize()
+        left,  top    = self.CalcDiagramPosition(0, 0)
+        right, bottom = self.CalcDiagramPosition(width, height)
+
+        return left, top, right, bottom
+
+    def _applyZoom(self, zoomFactor: float, centerX: float, centerY: float):
+        """
+        The zoom stack changed;  Resize the virtual screen and scroll so that the
+        given diagram point is in the middle of the client area
+
+        Args:
+            zoomFactor: The factor the view was just scaled by
+            centerX:    abscissa to center on, in diagram coordinates
+            centerY:    ordinate to center on, in diagram coordinates
+        """
+        virtualWidth, virtualHeight = self.GetVirtualSize()
+
+        # resize the virtual screen in order to match with the zoom
+        self.SetVirtualSize(Size(round(virtualWidth * zoomFactor), round(virtualHeight * zoomFactor)))
+
+        self.CenterOn(centerX, centerY)
+
+        self._updateLevelOfDetail()
+        self.Refresh()
+
+    def _updateLevelOfDetail(self):
+
+        self._levelOfDetail = LevelOfDetail.forZoom(zoom=self.GetCurrentZoom(),
+                                                    titleZoom=self._prefs.levelOfDetailTitleZoom,
+                                                    outlineZoom=self._prefs.levelOfDetailOutlineZoom)
+
+    def _getVisibleShapes(self) -> List[Shape]:
+        """
+        The shapes that intersect the visible rectangle, in display list order.  The
+        spatial index gives the candidates;  Lines are kept only if one of their
+        segments crosses the visible rectangle.
+
+        Returns:  The shapes to draw
+        """
+        margin: int = DiagramFrame.CULL_MARGIN
+        left, top, right, bottom = self.GetVisibleRectangle()
+        left, top, right, bottom = left - margin, top - margin, right + margin, bottom + margin
+
+        visibleShapes: List[Shape] = []
+        for shape in reversed(self._diagram.FindShapesInRectangle(left, top, right, bottom)):
+            if isinstance(shape, LineShape) and not self._isLineInRectangle(shape, left, top, right, bottom):
+                continue
+            visibleShapes.append(shape)
+
+        self._culledShapeCount = self._diagram.GetShapeCount() - len(visibleShapes)
+
+        return visibleShapes
+
+    def _isLineInRectangle(self, line: LineShape, left: float, top: float, right: float, bottom: float) -> bool:
+
+        segments = line.GetSegments()
+        for (x1, y1), (x2, y2) in zip(segments, segments[1:]):
+            if segmentIntersectsRectangle(x1, y1, x2, y2, left, top, right, bottom):
+                return True
+        return False
+
     def _isShapeInRectangle(self, rect: RectangleShape, x0: float, y0: float, w0: float, h0: float) -> bool:
 
         ans: bool = False
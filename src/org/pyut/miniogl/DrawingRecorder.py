@@ -0,0 +1,60 @@
+from typing import List
+from typing import Tuple
+
+from wx import Colour
+from wx import DC
+from wx import Font
+
+from org.pyut.miniogl.GraphicsPathCache import LineSegment
+
+RecordedText = Tuple[str, Font, Colour, float, float]      # text, font, colour, x, y
+
+
+class DrawingRecorder:
+    """
+    Stands in for a dc while a shape lays out its content.  The text and the lines the shape
+    draws are recorded relative to an origin instead of drawn, so that the layout can be
+    replayed on a graphics context on later frames without measuring anything again.  Every
+    other call, e.g. `GetTextExtent`, goes to the real dc.
+
+    Usage:
+
+        recorder: DrawingRecorder = DrawingRecorder(dc, x, y)
+        self._drawCompartments(recorder, x, y, w)
+        textLayout: List[RecordedText] = recorder.texts
+    """
+    def __init__(self, dc: DC, originX: float, originY: float):
+        """
+
+        Args:
+            dc:         The dc used for measuring
+            originX:    Subtracted from the recorded abscissas
+            originY:    Subtracted from the recorded ordinates
+        """
+        self._dc:      DC     = dc
+        self._originX: float  = originX
+        self._originY: float  = originY
+        self._font:    Font   = dc.GetFont()
+        self._colour:  Colour = dc.GetTextForeground()
+
+        self.texts: List[RecordedText] = []
+        self.lines: List[LineSegment]  = []
+
+    def SetFont(self, font: Font):
+        self._font = font
+        self._dc.SetFont(font)      # so that measuring uses it
+
+    def GetFont(self) -> Font:
+        return self._font
+
+    def SetTextForeground(self, colour: Colour):
+        self._colour = colour
+
+    def DrawText(self, text: str, x: float, y: float):
+        self.texts.append((text, self._font, self._colour, x - self._originX, y - self._originY))
+
+    def DrawLine(self, x1: float, y1: float, x2: float, y2: float):
+        self.lines.append((x1 - self._originX, y1 - self._originY, x2 - self._originX, y2 - self._originY))
+
+    def __getattr__(self, name: str):
+        return getattr(self._dc, name)
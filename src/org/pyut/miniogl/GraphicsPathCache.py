@@ -0,0 +1,176 @@
+from typing import Callable
+from typing import Hashable
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from math import cos
+from math import pi
+from math import sin
+
+from wx import GCDC
+
+from wx import GraphicsContext
+from wx import GraphicsPath
+from wx import GraphicsRenderer
+
+from org.pyut.general.Singleton import Singleton
+
+PathBuilder = Callable[[GraphicsPath], None]
+
+LineSegment = Tuple[float, float, float, float]     # x1, y1, x2, y2
+
+
+class GraphicsPathCache(Singleton):
+    """
+    Static geometry built once as `GraphicsPath`s and reused on every frame by shapes that
+    draw on a graphics context;  See the `graphicsContextRendering` preference.  The paths are
+    in shape local coordinates and `drawPath` moves and rotates them into place, so one
+    arrowhead serves every link.  The least recently used paths are evicted past
+    `MAXIMUM_ENTRIES`.
+
+    Usage:
+
+        cache: GraphicsPathCache = GraphicsPathCache()
+        cache.drawPath(dc, cache.getArrowHead(size), tipX, tipY, angle)
+    """
+    MAXIMUM_ENTRIES: int = 1024
+
+    def init(self):
+        """
+        The singleton initialization method
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._paths:  OrderedDict = OrderedDict()
+        self._hits:   int         = 0
+        self._misses: int         = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def getRectangle(self, width: float, height: float) -> GraphicsPath:
+        """
+        Returns:  A rectangle with its top left corner at the origin
+        """
+        def build(path: GraphicsPath):
+            path.AddRectangle(0, 0, width, height)
+
+        return self._getPath(('rectangle', width, height), build)
+
+    def getArrowHead(self, size: float) -> GraphicsPath:
+        """
+        Returns:  A closed arrowhead with its tip at the origin, opening along the positive x axis
+        """
+        def build(path: GraphicsPath):
+            path.MoveToPoint(size * cos(pi / 6), size * sin(pi / 6))
+            path.AddLineToPoint(0, 0)
+            path.AddLineToPoint(size * cos(pi / 6), -size * sin(pi / 6))
+            path.CloseSubpath()
+
+        return self._getPath(('arrowHead', size), build)
+
+    def getDiamond(self, size: float) -> GraphicsPath:
+        """
+        Returns:  A diamond with a tip at the origin, lying along the positive x axis
+        """
+        def build(path: GraphicsPath):
+            path.MoveToPoint(size * cos(pi / 6), size * sin(pi / 6))
+            path.AddLineToPoint(0, 0)
+            path.AddLineToPoint(size * cos(pi / 6), -size * sin(pi / 6))
+            path.AddLineToPoint(2 * size, 0)
+            path.CloseSubpath()
+
+        return self._getPath(('diamond', size), build)
+
+    def getCircle(self, radius: float) -> GraphicsPath:
+        """
+        Returns:  A circle centered on the origin
+        """
+        def build(path: GraphicsPath):
+            path.AddCircle(0, 0, radius)
+
+        return self._getPath(('circle', radius), build)
+
+    @staticmethod
+    def createLinesPath(lines: List[LineSegment]) -> GraphicsPath:
+        """
+        A path that is not shared;  For geometry a single shape caches itself, e.g. the
+        compartment separators of a class
+
+        Args:
+            lines:  The segments in shape local coordinates
+
+        Returns:  A path of the unconnected segments
+        """
+        path: GraphicsPath = GraphicsPathCache._createPath()
+        for x1, y1, x2, y2 in lines:
+            path.MoveToPoint(x1, y1)
+            path.AddLineToPoint(x2, y2)
+
+        return path
+
+    @staticmethod
+    def drawPath(dc: GCDC, path: GraphicsPath, x: float, y: float, angle: float = 0.0, fill: bool = True):
+        """
+        Draw a cached path with the pen and brush currently selected in `dc`
+
+        Args:
+            dc:     A dc over a graphics context
+            path:   The path in local coordinates
+            x:      Where the local origin goes, in diagram coordinates
+            y:
+            angle:  Rotation of the local x axis in radians
+            fill:   If `False` only stroke the path
+        """
+        gc: GraphicsContext = dc.GetGraphicsContext()
+        gc.SetPen(dc.GetPen())
+        gc.SetBrush(dc.GetBrush())
+
+        gc.PushState()
+        gc.Translate(x, y)
+        if angle != 0.0:
+            gc.Rotate(angle)
+        if fill is True:
+            gc.DrawPath(path)
+        else:
+            gc.StrokePath(path)
+        gc.PopState()
+
+    def invalidate(self):
+        """
+        Forget every path;  They are rebuilt on demand
+        """
+        self._paths.clear()
+
+    def _getPath(self, key: Hashable, builder: PathBuilder) -> GraphicsPath:
+
+        path: GraphicsPath = self._paths.get(key)
+        if path is not None:
+            self._hits += 1
+            self._paths.move_to_end(key)
+            return path
+
+        self._misses += 1
+        path = GraphicsPathCache._createPath()
+        builder(path)
+
+        self._paths[key] = path
+        if len(self._paths) > GraphicsPathCache.MAXIMUM_ENTRIES:
+            self._paths.popitem(last=False)
+
+        return path
+
+    @staticmethod
+    def _createPath() -> GraphicsPath:
+        # GCDC draws with the default renderer;  Paths only work with the renderer that created them
+        return GraphicsRenderer.GetDefaultRenderer().CreatePath()
@@ -0,0 +1,29 @@
+
+from enum import Enum
+
+
+class LevelOfDetail(Enum):
+    """
+    How much of a shape is worth drawing at the current zoom.  Far enough out, text is
+    unreadable and arrow heads are a few pixels, so drawing them only costs time
+    """
+
+    FULL    = 'Full'        # everything
+    TITLE   = 'Title'       # classes show only their name;  links are bare polylines
+    OUTLINE = 'Outline'     # classes are empty rectangles;  links are bare polylines
+
+    @staticmethod
+    def forZoom(zoom: float, titleZoom: float, outlineZoom: float) -> 'LevelOfDetail':
+        """
+        Args:
+            zoom:           The current zoom factor
+            titleZoom:      Below this zoom shapes are drawn at `TITLE` detail
+            outlineZoom:    Below this zoom shapes are drawn at `OUTLINE` detail
+
+        Returns:  The level of detail to draw with
+        """
+        if zoom < outlineZoom:
+            return LevelOfDetail.OUTLINE
+        if zoom < titleZoom:
+            return LevelOfDetail.TITLE
+        return LevelOfDetail.FULL
@@ -0,0 +1,106 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+
+from wx import Brush
+from wx import Pen
+
+PenKey   = Tuple[int, int, int]             # colour, width, style
+BrushKey = Tuple[PenKey, int, int]          # pen, colour, style
+
+BatchSegment = Tuple[int, int, int, int]    # x1, y1, x2, y2
+BatchPolygon = List[Tuple[int, int]]
+
+
+class LineBatch:
+    """
+    Collects the polylines and arrowheads of many lines so that the frame draws them with one
+    `DrawLineList` per pen and one `DrawPolygonList` per pen and brush instead of several dc
+    calls per line.  Lines are only batched while they draw nothing but a polyline and an
+    arrowhead;  See `LineShape.IsBatchable`.  Only a run of lines that are consecutive in the
+    display list may share a batch, so that the other shapes keep their z-order.
+
+    Usage:
+
+        batch: LineBatch = LineBatch()
+        for line in lines:
+            line.AddToBatch(batch)
+        batch.draw(dc)
+        batch.clear()
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._segments: Dict[PenKey,   Tuple[Pen, List[BatchSegment]]]        = {}
+        self._polygons: Dict[BrushKey, Tuple[Pen, Brush, List[BatchPolygon]]] = {}
+
+    @property
+    def segmentCount(self) -> int:
+        return sum(len(segments) for pen, segments in self._segments.values())
+
+    @property
+    def polygonCount(self) -> int:
+        return sum(len(polygons) for pen, brush, polygons in self._polygons.values())
+
+    @property
+    def isEmpty(self) -> bool:
+        return len(self._segments) == 0 and len(self._polygons) == 0
+
+    def addPolyline(self, pen: Pen, points: List[Tuple[float, float]]):
+        """
+        Args:
+            pen:    The pen to draw the line with
+            points: The polyline, in diagram coordinates
+        """
+        key: PenKey = LineBatch._penKey(pen)
+        if key not in self._segments:
+            self._segments[key] = (pen, [])
+        segments: List[BatchSegment] = self._segments[key][1]
+
+        previousX, previousY = round(points[0][0]), round(points[0][1])
+        for x, y in points[1:]:
+            x, y = round(x), round(y)
+            segments.append((previousX, previousY, x, y))
+            previousX, previousY = x, y
+
+    def addPolygon(self, pen: Pen, brush: Brush, points: List[Tuple[float, float]]):
+        """
+        Args:
+            pen:    The outline pen
+            brush:  The fill
+            points: The polygon, in diagram coordinates
+        """
+        key: BrushKey = (LineBatch._penKey(pen), brush.GetColour().GetRGB(), int(brush.GetStyle()))
+        if key not in self._polygons:
+            self._polygons[key] = (pen, brush, [])
+
+        self._polygons[key][2].append([(round(x), round(y)) for x, y in points])
+
+    def draw(self, dc: DC):
+        """
+        Draw everything collected;  The lines first, then the arrowheads over them
+
+        Args:
+            dc: The prepared dc
+        """
+        for pen, segments in self._segments.values():
+            dc.DrawLineList(segments, pen)
+        for pen, brush, polygons in self._polygons.values():
+            dc.DrawPolygonList(polygons, pen, brush)
+
+    def clear(self):
+        """
+        Forget everything collected;  The batch can collect the next run of lines
+        """
+        self._segments = {}
+        self._polygons = {}
+
+    @staticmethod
+    def _penKey(pen: Pen) -> PenKey:
+        return pen.GetColour().GetRGB(), pen.GetWidth(), int(pen.GetStyle())
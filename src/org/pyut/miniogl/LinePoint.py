@@ -57,6 +57,12 @@ class LinePoint(PointShape):
         if line in self._lines:
             self._lines.remove(line)
 
+    def _GetIndexDependents(self):
+        """
+        Override Shape._GetIndexDependents;  The lines passing through this point move with it
+        """
+        return PointShape._GetIndexDependents(self) + self._lines
+
     def SetMoving(self, state: bool):
         """
         A non-moving shape will be redrawn faster when others are moved.
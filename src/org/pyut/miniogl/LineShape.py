@@ -1,18 +1,34 @@
 
+from typing import List
 from typing import Tuple
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from math import atan
+from math import cos
+from math import pi
+from math import sin
+
 from wx import BLACK_PEN
 from wx import DC
+from wx import GCDC
 from wx import RED_PEN
 
+from org.pyut.miniogl.GraphicsPathCache import GraphicsPathCache
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+from org.pyut.miniogl.LineBatch import LineBatch
 from org.pyut.miniogl.LinePoint import LinePoint
+from org.pyut.miniogl.MiniOglUtils import SegmentGeometry
+from org.pyut.miniogl.MiniOglUtils import computeSegmentGeometry
+from org.pyut.miniogl.MiniOglUtils import segmentsContainPoint
 from org.pyut.miniogl.Shape import Shape
 from org.pyut.miniogl.AnchorPoint import AnchorPoint
 from org.pyut.miniogl.ControlPoint import ControlPoint
 
+ArrowGeometry = Tuple[float, List[Tuple[float, float]]]     # angle, polygon
+
 
 class LineShape(Shape):
     """
@@ -22,6 +38,8 @@ class LineShape(Shape):
     """
     clsLogger: Logger = getLogger(__name__)
 
+    HIT_TOLERANCE: float = 4.0
+
     def __init__(self, srcAnchor: AnchorPoint, dstAnchor: AnchorPoint):
         """
 
@@ -37,6 +55,13 @@ class LineShape(Shape):
         self._drawArrow = True
         self._arrowSize = 8
         self._spline = False
+
+        self._segmentGeometry: List[SegmentGeometry] = cast(List[SegmentGeometry], None)    # None until the next hit test;  See Inside
+
+        self._cachedSegments: List[Tuple[float, float]] = []        # valid while _segmentsValid;  See GetSegments
+        self._segmentsValid:  bool                      = False
+        self._arrowKey:       Tuple                     = cast(Tuple, None)   # the segment and size the arrow was computed for
+        self._arrowGeometry:  ArrowGeometry             = cast(ArrowGeometry, None)
         if srcAnchor:
             srcAnchor.AddLine(self)
         if dstAnchor:
@@ -49,6 +74,7 @@ class LineShape(Shape):
     @sourceAnchor.setter
     def sourceAnchor(self, theNewValue: AnchorPoint):
         self._srcAnchor = theNewValue
+        self._InvalidateGeometry()
 
     @property
     def destinationAnchor(self) -> AnchorPoint:
@@ -57,6 +83,7 @@ class LineShape(Shape):
     @destinationAnchor.setter
     def destinationAnchor(self, theNewValue: AnchorPoint):
         self._dstAnchor = theNewValue
+        self._InvalidateGeometry()
 
     def SetSpline(self, state):
         """
@@ -119,6 +146,7 @@ class LineShape(Shape):
         else:
             self._controls.append(control)
         control.AddLine(self)
+        self._InvalidateGeometry()
         # add the point to the diagram so that it can be selected
         if self._diagram is not None:
             self._diagram.AddShape(control)
@@ -140,6 +168,7 @@ class LineShape(Shape):
         """
         self._dstAnchor = anchor
         anchor.AddLine(self)
+        self._InvalidateGeometry()
 
     def SetDrawArrow(self, draw: bool):
         """
@@ -190,18 +219,42 @@ class LineShape(Shape):
         """
         self._srcAnchor = anchor
         anchor.AddLine(self)
+        self._InvalidateGeometry()
 
     def GetSegments(self):
         """
         Return a list of tuples which are the coordinates of the control points.
 
+        While the line is on a diagram the list is cached;  The diagram tells the line when
+        one of its points, or a shape they hang off, moves.  Do not modify the list
+
         Returns:  A list of float tuples
 
         """
+        if self._segmentsValid is True and self._diagram is not None:
+            return self._cachedSegments
+
         sp = self._srcAnchor.GetPosition()
         dp = self._dstAnchor.GetPosition()
         # LineShape.clsLogger.debug(f'GetSegments --  sp: {sp} dp: {dp}')
-        return [sp] + list(map(lambda x: x.GetPosition(), self._controls)) + [dp]
+        segments = [sp] + list(map(lambda x: x.GetPosition(), self._controls)) + [dp]
+
+        self._cachedSegments = segments
+        self._segmentsValid  = self._diagram is not None    # off a diagram nobody tells us about moves
+
+        return segments
+
+    def GetBoundingBox(self) -> Tuple[float, float, float, float]:
+        """
+        Override Shape.GetBoundingBox;  Spans every segment of the line
+
+        Returns:  (left, top, right, bottom)
+        """
+        left, top, right, bottom = Shape.GetBoundingBox(self)
+        for x, y in self.GetSegments():
+            left, top, right, bottom = min(left, x), min(top, y), max(right, x), max(bottom, y)
+
+        return left, top, right, bottom
 
     def GetControlPoints(self):
         """
@@ -223,6 +276,9 @@ class LineShape(Shape):
         """
         if self._visible:
 
+            if self.GetLevelOfDetail() != LevelOfDetail.FULL:
+                self.DrawOutline(dc)
+                return
             super().Draw(dc=dc, withChildren=withChildren)
             line = self.GetSegments()
             if self._selected:
@@ -244,6 +300,21 @@ class LineShape(Shape):
                 LineShape.clsLogger.debug(f'Draw Children')
                 self.DrawChildren(dc)
 
+    def DrawOutline(self, dc: DC):
+        """
+        Draw the line as a bare polyline;  No arrow, control points or labels.  Used when
+        the diagram is zoomed out too far for the details to be legible
+
+        Args:
+            dc:
+        """
+        if self._selected:
+            dc.SetPen(RED_PEN)
+        else:
+            dc.SetPen(self._pen)
+        dc.DrawLines(self.GetSegments())
+        dc.SetPen(BLACK_PEN)
+
     def DrawBorder(self, dc):
         """
         Draw the border of the shape, for fast rendering.
@@ -258,9 +329,66 @@ class LineShape(Shape):
         @param  u: points of the segment
         @param  v: points of the segment
         """
-        from math import pi, atan, cos, sin
+        alpha, points = self._getArrowGeometry(u, v)
+        if isinstance(dc, GCDC):
+            x2, y2 = v
+            cache: GraphicsPathCache = GraphicsPathCache()
+            cache.drawPath(dc, cache.getArrowHead(self._arrowSize), x2, y2, alpha)
+        else:
+            dc.DrawPolygon(points)
+
+    def IsBatchable(self) -> bool:
+        """
+        The frame may draw this line together with others of the same style;  Only for lines
+        that draw nothing but their polyline and arrowhead, so not for selected, moving, spline
+        or hidden lines, lines with children or subclasses that draw more
+
+        Returns:  `True` if `AddToBatch` draws the line exactly like `Draw`
+        """
+        return type(self).Draw is LineShape.Draw and self._visible is True and self._selected is False and self._moving is False \
+            and self._spline is False and len(self._children) == 0 and len(self._privateChildren) == 0 and len(self._anchors) == 0
+
+    def AddToBatch(self, batch: LineBatch):
+        """
+        Hand the polyline and arrowhead to the frame's batch instead of drawing them
+
+        Args:
+            batch:  The lines being collected for the current redraw
+        """
+        line = self.GetSegments()
+        batch.addPolyline(self._pen, line)
+        if self._drawArrow and self.GetLevelOfDetail() == LevelOfDetail.FULL:
+            batch.addPolygon(BLACK_PEN, self._brush, self._getArrowGeometry(line[-2], line[-1])[1])
+
+    @staticmethod
+    def computeArrowPoints(u: Tuple[float, float], v: Tuple[float, float], size: float) -> List[Tuple[float, float]]:
+        """
+        Args:
+            u:      The other end of the segment
+            v:      The end the arrowhead points at
+            size:   The length of the arrowhead sides
+
+        Returns:  The arrowhead polygon
+        """
+        alpha: float = LineShape.computeArrowAngle(u, v)
+        x2, y2 = v
         pi_6 = pi/6
-        points = []
+        alpha1 = alpha + pi_6
+        alpha2 = alpha - pi_6
+
+        return [(x2 + size * cos(alpha1), y2 + size * sin(alpha1)), (x2, y2), (x2 + size * cos(alpha2), y2 + size * sin(alpha2))]
+
+    @staticmethod
+    def computeArrowAngle(u: Tuple[float, float], v: Tuple[float, float]) -> float:
+        """
+        The direction of an arrowhead drawn at `v`
+
+        Args:
+            u:  The other end of the segment
+            v:  The end the arrowhead points at
+
+        Returns:  The angle in radians from `v` back along the segment towards `u`
+        """
         x1, y1 = u
         x2, y2 = v
         a = x2 - x1
@@ -271,19 +399,31 @@ class LineShape(Shape):
             else:
                 alpha = pi/2
         else:
-            if a == 0:
-                alpha = pi/2  # TODO ?
-            else:
-                alpha = atan(b/a)
+            alpha = atan(b/a)
         if a > 0:
             alpha += pi
-        alpha1 = alpha + pi_6
-        alpha2 = alpha - pi_6
-        size = self._arrowSize
-        points.append((x2 + size * cos(alpha1), y2 + size * sin(alpha1)))
-        points.append((x2, y2))
-        points.append((x2 + size * cos(alpha2), y2 + size * sin(alpha2)))
-        dc.DrawPolygon(points)
+
+        return alpha
+
+    def _getArrowGeometry(self, u: Tuple[float, float], v: Tuple[float, float]) -> ArrowGeometry:
+        """
+        The arrowhead for the segment uv;  Only computed again when the segment or the arrow size changed
+
+        Returns:  The arrow angle and polygon
+        """
+        key: Tuple = (u, v, self._arrowSize)
+        if key != self._arrowKey:
+            self._arrowGeometry = (LineShape.computeArrowAngle(u, v), LineShape.computeArrowPoints(u, v, self._arrowSize))
+            self._arrowKey      = key
+
+        return self._arrowGeometry
+
+    def _InvalidateGeometry(self):
+        """
+        Override Shape._InvalidateGeometry;  Forget the cached segments and their hit test geometry
+        """
+        self._segmentsValid   = False
+        self._segmentGeometry = cast(List[SegmentGeometry], None)
 
     def Detach(self):
         """
@@ -306,6 +446,7 @@ class LineShape(Shape):
         """
         if control in self._controls:
             self._controls.remove(control)
+            self._InvalidateGeometry()
 
     # noinspection PyUnusedLocal
     def _RemoveAnchor(self, anchor):
@@ -340,52 +481,18 @@ class LineShape(Shape):
         True if (x, y) is inside the line.
         A tolerance of 4 pixels is used.
 
+        The segment geometry is cached;  It is recomputed only after one of the
+        line points moved, see _InvalidateGeometry
+
         @param  x
         @param  y
 
         @return bool
         """
-        def InsideBoundingBox(x, y, a, b):
-            # check if the point (x, y) is inside a box of origin (0, 0) and
-            # diagonal (a, b) with a tolerance of 4
-            ma, mb = a / 2, b / 2
-            if a > 0:
-                w = max(4, a - 8)
-            else:
-                w = min(-4, a + 8)
-            if b > 0:
-                h = max(4, b - 8)
-            else:
-                h = min(-4, b + 8)
-            topLeftX = ma - w / 2
-            topLeftY = mb - h / 2
-            i = x > topLeftX
-            j = x > topLeftX + w
-            k = y > topLeftY
-            ll = y > topLeftY + h
-
-            return (i + j) == 1 and (k + ll) == 1
-
-        from math import sqrt
-
-        def InsideSegment(x, y, a, b):
-            den = sqrt(a*a + b*b)
-            if den != 0.0:
-                d = (x*b - y*a) / den
-            else:
-                return False
-            return abs(d) < 4.0
-
-        # go through each segment of the line
-        points = [self._srcAnchor] + self._controls + [self._dstAnchor]
-        while len(points) > 1:
-            x1, y1 = points[0].GetPosition()
-            x2, y2 = points[1].GetPosition()
-            a, b, xx, yy = x2 - x1, y2 - y1, x - x1, y - y1
-            points = points[1:]
-            if InsideBoundingBox(xx, yy, a, b) and InsideSegment(xx, yy, a, b):
-                return True
-        return False
+        if self._segmentGeometry is None:
+            self._segmentGeometry = computeSegmentGeometry(self.GetSegments(), LineShape.HIT_TOLERANCE)
+
+        return segmentsContainPoint(self._segmentGeometry, x, y, LineShape.HIT_TOLERANCE)
 
     def SetSelected(self, state: bool = True):
         """
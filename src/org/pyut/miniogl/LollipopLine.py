@@ -1,15 +1,19 @@
+from typing import Optional
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
 from wx import DC
+from wx import GCDC
 from wx import Pen
 from wx import RED_PEN
 
 from org.pyut.miniogl.Common import CommonLine
 from org.pyut.miniogl.Common import CommonPoint
 
+from org.pyut.miniogl.GraphicsPathCache import GraphicsPathCache
 from org.pyut.miniogl.SelectAnchorPoint import SelectAnchorPoint
 from org.pyut.miniogl.Shape import Shape
 
@@ -49,6 +53,25 @@ class LollipopLine(Shape):
 
         return CommonLine(CommonPoint(xSrc, ySrc), CommonPoint(xDest, yDest))
 
+    def GetBoundingBox(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Override Shape.GetBoundingBox;  The lollipop hangs off its destination anchor
+
+        Returns:  (left, top, right, bottom) or `None` if not attached yet
+        """
+        if self._destinationAnchor is None:
+            return None
+
+        line:   CommonLine = self.lineCoordinates()
+        radius: int        = LollipopLine.LOLLIPOP_CIRCLE_RADIUS
+
+        left:   float = min(line.start.x, line.end.x) - radius
+        top:    float = min(line.start.y, line.end.y) - radius
+        right:  float = max(line.start.x, line.end.x) + radius
+        bottom: float = max(line.start.y, line.end.y) + radius
+
+        return left, top, right, bottom
+
     def Draw(self, dc: DC, withChildren: bool = True):
 
         currentPen: Pen = RED_PEN
@@ -61,7 +84,11 @@ class LollipopLine(Shape):
         circleX, circleY, xSrc, ySrc = self._calculateWhereToDrawLollipop(attachmentPoint, xDest, yDest)
 
         dc.DrawLine(xSrc, ySrc, xDest, yDest)
-        dc.DrawCircle(circleX, circleY, LollipopLine.LOLLIPOP_CIRCLE_RADIUS)
+        if isinstance(dc, GCDC):
+            cache: GraphicsPathCache = GraphicsPathCache()
+            cache.drawPath(dc, cache.getCircle(LollipopLine.LOLLIPOP_CIRCLE_RADIUS), circleX, circleY)
+        else:
+            dc.DrawCircle(circleX, circleY, LollipopLine.LOLLIPOP_CIRCLE_RADIUS)
 
     def _calculateWhereToDrawLollipop(self, attachmentPoint, xDest, yDest):
         """
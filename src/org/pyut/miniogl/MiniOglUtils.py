@@ -1,3 +1,12 @@
+from typing import List
+from typing import Tuple
+
+from math import sqrt
+
+#
+# (boxLeft, boxRight, boxTop, boxBottom, x1, y1, unitB, unitA);  See computeSegmentGeometry
+#
+SegmentGeometry = Tuple[float, float, float, float, float, float, float, float]
 
 
 def sign(x):
@@ -12,3 +21,123 @@ def sign(x):
         return -1
     else:
         return 1
+
+
+def segmentIntersectsRectangle(x1: float, y1: float, x2: float, y2: float, left: float, top: float, right: float, bottom: float) -> bool:
+    """
+    Liang-Barsky clipping of the segment against the rectangle
+
+    Args:
+        x1:     segment start abscissa
+        y1:     segment start ordinate
+        x2:     segment end abscissa
+        y2:     segment end ordinate
+        left:   rectangle left
+        top:    rectangle top
+        right:  rectangle right
+        bottom: rectangle bottom
+
+    Returns:  `True` if any part of the segment is inside the rectangle
+    """
+    dx: float = x2 - x1
+    dy: float = y2 - y1
+    tMin: float = 0.0
+    tMax: float = 1.0
+    for p, q in ((-dx, x1 - left), (dx, right - x1), (-dy, y1 - top), (dy, bottom - y1)):
+        if p == 0:
+            if q < 0:
+                return False    # parallel to, and outside of, this edge
+        else:
+            t: float = q / p
+            if p < 0:
+                tMin = max(tMin, t)
+            else:
+                tMax = min(tMax, t)
+            if tMin > tMax:
+                return False
+    return True
+
+
+def mergeRectangles(rectangles: List[Tuple[float, float, float, float]]) -> List[Tuple[float, float, float, float]]:
+    """
+    Replace every group of overlapping rectangles by their union
+
+    Args:
+        rectangles:  (left, top, right, bottom) rectangles
+
+    Returns:  Rectangles that do not overlap each other and cover all the input
+    """
+    merged: List[Tuple[float, float, float, float]] = []
+    for rectangle in rectangles:
+        left, top, right, bottom = rectangle
+        overlapping: bool = True
+        while overlapping:
+            overlapping = False
+            for other in merged:
+                oLeft, oTop, oRight, oBottom = other
+                if left <= oRight and oLeft <= right and top <= oBottom and oTop <= bottom:
+                    merged.remove(other)
+                    left, top, right, bottom = min(left, oLeft), min(top, oTop), max(right, oRight), max(bottom, oBottom)
+                    overlapping = True
+                    break
+        merged.append((left, top, right, bottom))
+
+    return merged
+
+
+def computeSegmentGeometry(points: List[Tuple[float, float]], tolerance: float) -> List[SegmentGeometry]:
+    """
+    Precompute what `segmentsContainPoint` needs for every segment of a polyline.  For each
+    segment we keep the tolerance box around it and its normalized direction so that the
+    hit test is just a few comparisons and multiplications.  Zero length segments are
+    dropped;  They can never be hit
+
+    The box is the segment's bounding box shrunk by `tolerance` at each end, but never
+    thinner than `tolerance`, so that the point must be near the segment and not beyond
+    its ends.  For an axis aligned segment the box is the tighter test:  The point must be
+    within `tolerance / 2` of it
+
+    Args:
+        points:     The polyline points
+        tolerance:  How far from the segment a point still hits it
+
+    Returns:  One geometry tuple per segment
+    """
+    geometry: List[SegmentGeometry] = []
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        a: float = x2 - x1
+        b: float = y2 - y1
+        length: float = sqrt(a * a + b * b)
+        if length == 0.0:
+            continue
+
+        if a > 0:
+            w: float = max(tolerance, a - 2 * tolerance)
+        else:
+            w = min(-tolerance, a + 2 * tolerance)
+        if b > 0:
+            h: float = max(tolerance, b - 2 * tolerance)
+        else:
+            h = min(-tolerance, b + 2 * tolerance)
+        boxX: float = x1 + a / 2 - w / 2
+        boxY: float = y1 + b / 2 - h / 2
+
+        geometry.append((min(boxX, boxX + w), max(boxX, boxX + w), min(boxY, boxY + h), max(boxY, boxY + h), x1, y1, b / length, a / length))
+
+    return geometry
+
+
+def segmentsContainPoint(geometry: List[SegmentGeometry], x: float, y: float, tolerance: float) -> bool:
+    """
+    Args:
+        geometry:   From `computeSegmentGeometry`
+        x:          point abscissa
+        y:          point ordinate
+        tolerance:  The tolerance the geometry was computed with
+
+    Returns:  `True` if the point is within `tolerance` of any segment
+    """
+    for boxLeft, boxRight, boxTop, boxBottom, x1, y1, unitB, unitA in geometry:
+        if boxLeft < x <= boxRight and boxTop < y <= boxBottom and abs((x - x1) * unitB - (y - y1) * unitA) < tolerance:
+            return True
+    return False
@@ -1,7 +1,9 @@
 from typing import Tuple
 
 from wx import DC
+from wx import GCDC
 
+from org.pyut.miniogl.GraphicsPathCache import GraphicsPathCache
 from org.pyut.miniogl.Shape import Shape
 from org.pyut.miniogl.MiniOglUtils import sign
 from org.pyut.miniogl.SizerShape import SizerShape
@@ -85,6 +87,7 @@ class RectangleShape(Shape):
         if height < 0:
             y -= height
         self._x, self._y = x, y
+        self._IndexChanged()
 
     def Draw(self, dc: DC, withChildren: bool = False):
         """
@@ -104,7 +107,11 @@ class RectangleShape(Shape):
                 sx, sy = sx - self._ox, sy - self._oy
                 width, height = self.GetSize()
 
-                dc.DrawRectangle(sx, sy, width, height)
+                if isinstance(dc, GCDC):
+                    cache: GraphicsPathCache = GraphicsPathCache()
+                    cache.drawPath(dc, cache.getRectangle(width, height), sx, sy)
+                else:
+                    dc.DrawRectangle(sx, sy, width, height)
             if withChildren:
                 self.DrawChildren(dc)
             if self._topLeftSizer is not None:
@@ -210,6 +217,15 @@ class RectangleShape(Shape):
             self._botRightSizer.Detach()
             self._botRightSizer = None
 
+    def _GetIndexDependents(self):
+        """
+        Override Shape._GetIndexDependents;  The sizers are positioned relative to the rectangle
+        """
+        dependents = Shape._GetIndexDependents(self)
+        if self._topLeftSizer is not None:
+            dependents = dependents + [self._topLeftSizer, self._topRightSizer, self._botLeftSizer, self._botRightSizer]
+        return dependents
+
     def SetSize(self, width, height):
         """
         Set the size of the rectangle.
@@ -218,6 +234,7 @@ class RectangleShape(Shape):
         @param height
         """
         self._width, self._height = width, height
+        self._IndexChanged()
 
         if self.HasDiagramFrame():
             self.UpdateModel()
@@ -280,21 +297,16 @@ class RectangleShape(Shape):
         """
         Added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (12.11.2005)
 
-        Updates the shape position and size from the model in the light of a
-        change of state of the diagram frame (here it's only for the zoom)
+        Updates the shape position and size from the model;  The zoom does not
+        change them, it is applied by the dc user scale
         """
 
         #  change the position of the shape from the model
         Shape.UpdateFromModel(self)
 
-        #  get the model size
-        width, height = self.GetModel().GetSize()
-
-        #  get the diagram frame ratio between the shape and the model
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        # set the new size to the shape.
-        self._width, self._height = width * ratio, height * ratio
+        # set the model size to the shape.
+        self._width, self._height = self.GetModel().GetSize()
+        self._IndexChanged()
 
     def UpdateModel(self):
         """
@@ -305,12 +317,6 @@ class RectangleShape(Shape):
         #  change the coordinates of model
         Shape.UpdateModel(self)
 
-        #  get the size of the shape (view)
+        #  set the size of the shape (view) to the model.
         width, height = self.GetSize()
-
-        # get the ratio between the model and the shape (view) from
-        # the diagram frame where the shape is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        # set the new size to the model.
-        self.GetModel().SetSize(width/ratio, height/ratio)
+        self.GetModel().SetSize(width, height)
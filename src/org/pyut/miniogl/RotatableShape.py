@@ -69,6 +69,7 @@ class RotatableShape(RectangleShape):
         self._scale = scale
         self._ox, self._oy = self._sox * scale, self._soy * scale
         self._width, self._height = self._sw * scale, self._sh * scale
+        self._IndexChanged()
 
     def GetScale(self):
         """
@@ -131,6 +132,7 @@ class RotatableShape(RectangleShape):
                 child.SetDraggable(False)
         self._width, self._height = VShape().Convert(1, self._width, self._height)
         self._ox, self._oy = VShape().Convert(1, self._ox, self._oy)
+        self._IndexChanged()
 
     def Draw(self, dc, withChildren=True):
         """
@@ -1,8 +1,11 @@
 
+from typing import List
+from typing import Optional
 from typing import Tuple
 
 from logging import Logger
 from logging import getLogger
+from logging import DEBUG
 
 from wx import BLACK_PEN
 from wx import Brush
@@ -13,6 +16,7 @@ from wx import RED
 from wx import RED_PEN
 from wx import WHITE_BRUSH
 
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
 from org.pyut.miniogl.ShapeModel import ShapeModel
 from org.pyut.preferences.PyutPreferences import PyutPreferences
 
@@ -122,6 +126,7 @@ class Shape:
         @param  y new origin
         """
         self._ox, self._oy = x, y
+        self._IndexChanged()
 
     def GetOrigin(self):
         """
@@ -280,6 +285,7 @@ class Shape:
         @param  diagram
         """
         self._diagram = diagram
+        self._IndexChanged()
         # add the anchors and the children
         map(lambda x: diagram.AddShape(x), self._anchors + self._children
             + self._privateChildren)
@@ -345,8 +351,10 @@ class Shape:
             dc:
         """
         if self._visible:
+            debug: bool = Shape.clsLogger.isEnabledFor(DEBUG)
             for child in self._children + self._anchors + self._privateChildren:
-                Shape.clsLogger.debug(f'Draw {child=}')
+                if debug is True:
+                    Shape.clsLogger.debug(f'Draw {child=}')
                 child.Draw(dc)
 
     def DrawBorder(self, dc):
@@ -505,6 +513,8 @@ class Shape:
         @param state
         """
         self._selected = state
+        if self._diagram is not None:
+            self._diagram.ShapeStateChanged(self)
 
     def IsMoving(self):
         """
@@ -521,6 +531,8 @@ class Shape:
         @param state
         """
         self._moving = state
+        if self._diagram is not None:
+            self._diagram.ShapeStateChanged(self)
         for shape in self._children:
             shape.SetMoving(state)
         for anchor in self._anchors:
@@ -546,10 +558,13 @@ class Shape:
             if self._parent is None:
                 self._x = x
                 self._y = y
-                Shape.clsLogger.debug(f'{self._id=} Position: ({self._x},{self._y})')
+                if Shape.clsLogger.isEnabledFor(DEBUG):
+                    Shape.clsLogger.debug(f'{self._id=} Position: ({self._x},{self._y})')
             else:
-                Shape.clsLogger.debug(f'_parent: {self._parent}')
+                if Shape.clsLogger.isEnabledFor(DEBUG):
+                    Shape.clsLogger.debug(f'_parent: {self._parent}')
                 self._x, self._y = self.ConvertCoordToRelative(x, y)
+            self._IndexChanged()
             #  if the shape is attached to a diagramFrame, it means that
             #  the model will be initialized correctly.
             # (Avoid a null pointer error).
@@ -567,6 +582,7 @@ class Shape:
         if self._draggable:
             self._x = x
             self._y = y
+            self._IndexChanged()
 
     def SetProtected(self, newValue: bool):
         """
@@ -601,27 +617,66 @@ class Shape:
         """
         return self._diagram
 
+    def GetLevelOfDetail(self) -> LevelOfDetail:
+        """
+        Returns:  How much the shape should draw;  Full detail when not on a diagram frame
+        """
+        if self._diagram is None or self._diagram.GetPanel() is None:
+            return LevelOfDetail.FULL
+        return self._diagram.GetPanel().levelOfDetail
+
+    def GetBoundingBox(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        The area the diagram's spatial index files the shape under.  Subclasses whose
+        geometry is not described by their top left corner and size extend this.
+
+        Returns:  (left, top, right, bottom) in diagram coordinates or `None` if the
+        shape's extent cannot be derived from the shape itself
+        """
+        x, y = self.GetTopLeft()
+        w, h = self.GetSize()
+
+        return min(x, x + w), min(y, y + h), max(x, x + w), max(y, y + h)
+
+    def MarkDirty(self):
+        """
+        Ask for this shape to be repainted by the next DiagramFrame.RefreshDirtyRegions;
+        Use after an edit that changes what the shape draws but not where it is.
+        Moves and resizes mark the shape dirty themselves.
+        """
+        self._IndexChanged()
+
+    def _GetIndexDependents(self) -> List['Shape']:
+        """
+        Returns:  The shapes that move when this shape moves
+        """
+        return self._anchors + self._children + self._privateChildren
+
+    def _InvalidateGeometry(self):
+        """
+        This shape or one it depends on moved;  Shapes that cache geometry derived from
+        positions forget it here.  Called by the diagram for the shape and its index dependents
+        """
+        pass
+
+    def _IndexChanged(self):
+        """
+        Tell the diagram that this shape's extent changed so that the spatial index
+        re-files it, and its dependents, before the next query.
+        """
+        if self._diagram is not None:
+            self._diagram.InvalidateShape(self)
+
     def UpdateFromModel(self):
         """
         Added by P. Dabrowski <przemek.dabrowski@destroy-display.com> (12.11.2005)
 
-        Updates the shape position from the model in the light of a
-        change of state of the diagram frame (here it's only for the zoom)
+        Updates the shape position from the model.  The zoom is applied by the
+        dc user scale, so the view and the model share the same coordinates
         """
 
         # Get the coordinates of the model (ShapeModel)
-        mx, my = self.GetModel().GetPosition()
-
-        # Get the offsets and the ratio between the shape (view) and the
-        # shape model (ShapeModel) given by the frame where the shape
-        # is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-        dx = self.GetDiagram().GetPanel().GetXOffset()
-        dy = self.GetDiagram().GetPanel().GetYOffset()
-
-        # calculation of the shape (view) coordinates in the light of the offsets and ratio
-        x = (ratio * mx) + dx
-        y = (ratio * my) + dy
+        x, y = self.GetModel().GetPosition()
 
         # assign the new coordinates to the shape (view). DON'T USE SetPosition(),
         # because there is a call to UpdateModel() in that method.
@@ -630,6 +685,7 @@ class Shape:
         else:
             self._x = x
             self._y = y
+        self._IndexChanged()
 
     def UpdateModel(self):
         """
@@ -641,30 +697,16 @@ class Shape:
         #  get the associated model (ShapeModel)
         model = self.GetModel()
 
-        # Get the offsets and the ratio between the shape (view) and the
-        # shape model (ShapeModel) given by the frame where the shape
-        # is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-        dx = self.GetDiagram().GetPanel().GetXOffset()
-        dy = self.GetDiagram().GetPanel().GetYOffset()
-
-        #  get the coordinates of this shape
+        #  the view and the model share the same coordinates
         x, y = self.GetPosition()
-
-        # calculation of the model coordinates in the light of the
-        # offsets and ratio and assignment.
-        mx = (x - dx)/ratio
-        my = (y - dy)/ratio
-        model.SetPosition(mx, my)
+        model.SetPosition(x, y)
 
         # change also the position of the model of the children,
         # because when we move the parent children set position is not called
         # and so their update model is not called
         for child in self._anchors:
             cx, cy = child.GetPosition()
-            cmx = (cx - dx) / ratio
-            cmy = (cy - dy) / ratio
-            child.GetModel().SetPosition(cmx, cmy)
+            child.GetModel().SetPosition(cx, cy)
 
     def GetModel(self):
         """
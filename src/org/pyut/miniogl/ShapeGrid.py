@@ -0,0 +1,99 @@
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from math import floor
+
+BoundingBox = Tuple[float, float, float, float]
+Cell        = Tuple[int, int]
+
+
+class ShapeGrid:
+    """
+    A uniform grid spatial index.  Each key is filed in every cell that its bounding box
+    overlaps;  A point or rectangle query then only looks at the few cells it touches instead
+    of at every shape on the diagram.
+
+    The grid only answers "which keys might be here";  The caller still does the exact
+    hit test on the candidates.  Bounding boxes are (left, top, right, bottom) in diagram
+    coordinates.
+    """
+    DEFAULT_CELL_SIZE: int = 128
+
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+
+        self._cellSize: int                        = cellSize
+        self._cells:    Dict[Cell, Set[Hashable]]  = {}
+        self._keyCells: Dict[Hashable, List[Cell]] = {}
+
+    def insert(self, key: Hashable, boundingBox: BoundingBox):
+        """
+        File a key under its bounding box.  A key already in the grid is moved
+
+        Args:
+            key:            The key to file
+            boundingBox:    (left, top, right, bottom)
+        """
+        self.remove(key)
+
+        cells: List[Cell] = self._cellsFor(boundingBox)
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+        self._keyCells[key] = cells
+
+    def remove(self, key: Hashable):
+        """
+        Args:
+            key:  The key to forget;  Unknown keys are ignored
+        """
+        for cell in self._keyCells.pop(key, []):
+            keys: Set[Hashable] = self._cells[cell]
+            keys.discard(key)
+            if len(keys) == 0:
+                del self._cells[cell]
+
+    def clear(self):
+        self._cells.clear()
+        self._keyCells.clear()
+
+    def queryPoint(self, x: float, y: float) -> Set[Hashable]:
+        """
+        Args:
+            x: abscissa
+            y: ordinate
+
+        Returns:  The keys whose cells contain the point
+        """
+        return set(self._cells.get(self._cellAt(x, y), ()))
+
+    def queryRectangle(self, boundingBox: BoundingBox) -> Set[Hashable]:
+        """
+        Args:
+            boundingBox:  (left, top, right, bottom)
+
+        Returns:  The keys filed in any of the cells the rectangle overlaps
+        """
+        found: Set[Hashable] = set()
+        for cell in self._cellsFor(boundingBox):
+            found.update(self._cells.get(cell, ()))
+        return found
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keyCells
+
+    def __len__(self) -> int:
+        return len(self._keyCells)
+
+    def _cellAt(self, x: float, y: float) -> Cell:
+        return floor(x / self._cellSize), floor(y / self._cellSize)
+
+    def _cellsFor(self, boundingBox: BoundingBox) -> List[Cell]:
+
+        left, top, right, bottom = boundingBox
+
+        firstColumn, firstRow = self._cellAt(min(left, right), min(top, bottom))
+        lastColumn,  lastRow  = self._cellAt(max(left, right), max(top, bottom))
+
+        return [(column, row) for column in range(firstColumn, lastColumn + 1) for row in range(firstRow, lastRow + 1)]
@@ -0,0 +1,93 @@
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from wx import DC
+from wx import Font
+from wx import MemoryDC
+
+from org.pyut.general.Singleton import Singleton
+
+TextExtent = Tuple[int, int]
+CacheKey   = Tuple[str, str]
+
+
+class TextMetricsCache(Singleton):
+    """
+    Remembers text extents so that shapes do not re-measure unchanged strings on every
+    Draw or autoResize.  Entries are keyed by the font description and the text, so a
+    font change naturally misses.  Extents are in diagram coordinates;  The zoom does not
+    change them.  The least recently used entries are evicted past `MAXIMUM_ENTRIES`.
+
+    Usage:
+
+        width, height = TextMetricsCache().getTextExtent(text, font=self._defaultFont, dc=dc)
+    """
+    MAXIMUM_ENTRIES: int = 8192
+
+    def init(self):
+        """
+        The singleton initialization method
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._extents: OrderedDict = OrderedDict()
+        self._hits:    int         = 0
+        self._misses:  int         = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def getTextExtent(self, text: str, font: Font = None, dc: DC = None) -> TextExtent:
+        """
+        Args:
+            text:   The text to measure
+            font:   The font the text is drawn with;  If `None` the font currently selected in `dc`
+            dc:     The device context to measure with on a cache miss;  Its current font must be
+                    `font`.  If `None` a memory dc is used
+
+        Returns:  A (width, height) tuple
+        """
+        if font is None and dc is not None:
+            font = dc.GetFont()
+        key: CacheKey = (self._fontKey(font), text)
+
+        extent: TextExtent = self._extents.get(key)
+        if extent is not None:
+            self._hits += 1
+            self._extents.move_to_end(key)
+            return extent
+
+        self._misses += 1
+        if dc is None:
+            dc = MemoryDC()
+            if font is not None:
+                dc.SetFont(font)
+        width, height = dc.GetTextExtent(text)
+        extent = (width, height)
+
+        self._extents[key] = extent
+        if len(self._extents) > TextMetricsCache.MAXIMUM_ENTRIES:
+            self._extents.popitem(last=False)
+
+        return extent
+
+    def invalidate(self):
+        """
+        Forget every measurement;  Used when the fonts in use change wholesale
+        """
+        self._extents.clear()
+
+    def _fontKey(self, font: Font) -> str:
+
+        if font is None:
+            return ''
+        return font.GetNativeFontInfoDesc()
@@ -10,10 +10,11 @@ from wx import Font
 from wx import Colour
 
 from wx import DC
-from wx import MemoryDC
 
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
 from org.pyut.miniogl.Shape import Shape
 from org.pyut.miniogl.RectangleShape import RectangleShape
+from org.pyut.miniogl.TextMetricsCache import TextMetricsCache
 from org.pyut.miniogl.TextShapeModel import TextShapeModel
 
 
@@ -75,7 +76,8 @@ class TextShape(RectangleShape):
               text
         """
         self._text = text
-        self._width, self._height = MemoryDC().GetTextExtent(text)
+        self._width, self._height = TextMetricsCache().getTextExtent(text)
+        self._IndexChanged()
 
     def SetTextBackground(self, color: Colour):
         """
@@ -104,6 +106,8 @@ class TextShape(RectangleShape):
             withChildren
         """
         if self._visible:
+            if self._parent is not None and self.GetLevelOfDetail() != LevelOfDetail.FULL:
+                return      # labels on links and shapes are unreadable when zoomed out
             RectangleShape.Draw(self, dc, False)
             dc.SetTextForeground(self._color)
             dc.SetBackgroundMode(PENSTYLE_SOLID)
@@ -152,18 +156,15 @@ class TextShape(RectangleShape):
 
     def UpdateFromModel(self):
         """
-        Updates the shape position and size from the model in light of a
-        change of state of the diagram frame.  Here it is only for the zoom
+        Updates the shape position, size and font size from the model.  The zoom
+        scales the font through the dc user scale
         """
 
         # change the position and size of the shape from the model
         # RectangleShape.UpdateFromModel(self)
         super().UpdateFromModel()
-        # get the diagram frame ratio between the shape and the model
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
 
-        fontSize = self.GetModel().GetFontSize() * ratio
-        TextShape.clsLogger.debug(f'UpdateFromModel - ratio: {ratio}')
+        fontSize = self.GetModel().GetFontSize()
 
         # set the new font size
         if self._font is not None:
@@ -177,13 +178,8 @@ class TextShape(RectangleShape):
         # RectangleShape.UpdateModel(self)
         super().UpdateModel()
 
-        # get the ratio between the model and the shape (view) from
-        # the diagram frame where the shape is displayed.
-        ratio = self.GetDiagram().GetPanel().GetCurrentZoom()
-
-        # TextShape.clsLogger.debug(f'UpdateModel - ratio: {ratio}')
         if self.GetFont() is not None:
-            fontSize = self.GetFont().GetPointSize() / ratio
+            fontSize = self.GetFont().GetPointSize()
             self.GetModel().SetFontSize(fontSize)
 
     def GetFont(self) -> Font:
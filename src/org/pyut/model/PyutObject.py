@@ -1,3 +1,4 @@
+from org.pyut.general.IDRegistry import IDRegistry
 
 
 class PyutObject:
@@ -5,49 +6,16 @@ class PyutObject:
     """
     Pyut model  base object
     """
-    nextId: int = 0
-
     def __init__(self, name: str = ""):
         """
         Args:
             name:   The initial object name
         """
         # Setting an arbitrary ID, for identity purposes
-        self.computeNextSafeID()
-
         self._fileName: str = ""
-        self._id:       int = PyutObject.nextId
+        self._id:       int = IDRegistry().allocate()
         self._name:     str = name
 
-        PyutObject.nextId += 1
-
-    def computeNextSafeID(self):
-        """
-        Compute the next safe id
-        Verify that next id is not in use
-        """
-        while self.isIDUsed(PyutObject.nextId):
-            PyutObject.nextId += 1
-
-    def isIDUsed(self, idToCheck) -> bool:
-        """
-        Determine if an ID is in use
-
-        Args:
-            idToCheck:
-
-        Returns:
-            `True` if `idToCheck` is in use, else `False`
-        """
-        from org.pyut.general import Mediator
-        ctrl = Mediator.getMediator()
-        #
-        # TODO:  This seems compute heavy;  I wonder if we should have a lookup map
-        for obj in [el for el in ctrl.getUmlObjects() if isinstance(el, PyutObject)]:
-            if obj.getId() == idToCheck:
-                return True
-        return False
-
     def getName(self) -> str:
         """
 
@@ -71,10 +39,14 @@ class PyutObject:
 
     def setId(self, theId: int):
         """
+        The old ID is returned to the registry and the new one is reserved
 
         Args:
             theId:  the id (doh!)
         """
+        registry: IDRegistry = IDRegistry()
+        registry.release(self._id)
+        registry.reserve(theId)
         self._id = theId
 
     def getId(self) -> int:
@@ -1,5 +1,6 @@
 
 from typing import Tuple
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
@@ -7,7 +8,6 @@ from logging import INFO
 from logging import DEBUG
 
 from math import pi
-from math import atan
 from math import cos
 from math import sin
 
@@ -17,19 +17,28 @@ from wx import DC
 from wx import FONTFAMILY_DEFAULT
 from wx import FONTSTYLE_NORMAL
 from wx import FONTWEIGHT_NORMAL
+from wx import GCDC
 from wx import WHITE_BRUSH
 
 from wx import Font
 
+from org.pyut.miniogl.GraphicsPathCache import GraphicsPathCache
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+from org.pyut.miniogl.LineShape import ArrowGeometry
+from org.pyut.miniogl.LineShape import LineShape
+
 from org.pyut.ogl.OglAssociationLabel import OglAssociationLabel
 
 from org.pyut.ogl.OglLink import OglLink
 from org.pyut.ogl.OglPosition import OglPosition
 
+LabelPositions = Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]     # source, center, destination
+
 
 class OglAssociation(OglLink):
 
     TEXT_SHAPE_FONT_SIZE: int = 12
+    DIAMOND_SIZE:         int = 8
 
     clsLogger: Logger = getLogger(__name__)
     """
@@ -53,6 +62,11 @@ class OglAssociation(OglLink):
 
         self._defaultFont: Font = Font(OglAssociation.TEXT_SHAPE_FONT_SIZE, FONTFAMILY_DEFAULT, FONTSTYLE_NORMAL, FONTWEIGHT_NORMAL)
 
+        self._labelPositionsKey: Tuple          = cast(Tuple, None)    # the link ends the positions were computed for
+        self._labelPositions:    LabelPositions = cast(LabelPositions, None)
+        self._diamondKey:        Tuple          = cast(Tuple, None)
+        self._diamondGeometry:   ArrowGeometry  = cast(ArrowGeometry, None)
+
         self.SetDrawArrow(False)
 
         # self.__hackCenterLabelPosition(cenLblX, cenLblY)
@@ -91,15 +105,15 @@ class OglAssociation(OglLink):
             withChildren:   draw the children or not
         """
         OglLink.Draw(self, dc, withChildren)
-        sp: Tuple[float, float] = self._srcAnchor.GetPosition()
-        dp: Tuple[float, float] = self._dstAnchor.GetPosition()
+        line = self.GetSegments()
+        sourcePosition, centerPosition, destinationPosition = self._getLabelPositions(line[0], line[-1])
 
-        oglSp: OglPosition = OglPosition(x=sp[0], y=sp[1])
-        oglDp: OglPosition = OglPosition(x=dp[0], y=dp[1])
+        # Zoomed out the labels are unreadable;  Their positions are still kept current for persistence
+        drawText: bool = self.GetLevelOfDetail() == LevelOfDetail.FULL
 
-        self._drawSourceCardinality(dc=dc, sp=oglSp, dp=oglDp)
-        self._drawCenterLabel(dc=dc, sp=oglSp, dp=oglDp)
-        self._drawDestinationCardinality(dc=dc, sp=oglSp, dp=oglDp)
+        self._sourceCardinality = self._drawLabel(dc, self._sourceCardinality, sourcePosition, self._link.sourceCardinality, drawText)
+        self._centerLabel = self._drawLabel(dc, self._centerLabel, centerPosition, self._link.getName(), drawText)
+        self._destinationCardinality = self._drawLabel(dc, self._destinationCardinality, destinationPosition, self._link.destinationCardinality, drawText)
 
     def drawLosange(self, dc: DC, filled: bool = False):
         """
@@ -111,56 +125,84 @@ class OglAssociation(OglLink):
 
         Note:  Losange is French for 'diamond'
         """
-        pi_6 = pi/6
-        points = []
+        if self.GetLevelOfDetail() != LevelOfDetail.FULL:
+            return
         line = self.GetSegments()
-        x1, y1 = line[1]
         x2, y2 = line[0]
-        a = x2 - x1
-        b = y2 - y1
-        if abs(a) < 0.01:  # vertical segment
-            if b > 0:
-                alpha = -pi/2
-            else:
-                alpha = pi/2
-        else:
-            if a == 0:
-                if b > 0:
-                    alpha = pi/2
-                else:
-                    alpha = 3 * pi / 2
-            else:
-                alpha = atan(b/a)
-        if a > 0:
-            alpha += pi
-        alpha1 = alpha + pi_6
-        alpha2 = alpha - pi_6
-        size = 8
-        points.append((x2 + size * cos(alpha1), y2 + size * sin(alpha1)))
-        points.append((x2, y2))
-        points.append((x2 + size * cos(alpha2), y2 + size * sin(alpha2)))
-        points.append((x2 + 2*size * cos(alpha),  y2 + 2*size * sin(alpha)))
+        alpha, points = self._getDiamondGeometry(line[1], line[0])
         dc.SetPen(BLACK_PEN)
         if filled:
             dc.SetBrush(BLACK_BRUSH)
         else:
             dc.SetBrush(WHITE_BRUSH)
-        dc.DrawPolygon(points)
+        if isinstance(dc, GCDC):
+            cache: GraphicsPathCache = GraphicsPathCache()
+            cache.drawPath(dc, cache.getDiamond(OglAssociation.DIAMOND_SIZE), x2, y2, alpha)
+        else:
+            dc.DrawPolygon(points)
         dc.SetBrush(WHITE_BRUSH)
 
-    def _drawCenterLabel(self, dc: DC, sp: OglPosition, dp: OglPosition):
+    def _getDiamondGeometry(self, u: Tuple[float, float], v: Tuple[float, float]) -> ArrowGeometry:
+        """
+        The diamond at `v` for the segment uv;  Only computed again when the segment changed
 
-        centerX, centerY = self._computeMidPoint(srcPosition=sp, destPosition=dp)
+        Returns:  The diamond angle and polygon
+        """
+        key: Tuple[Tuple[float, float], Tuple[float, float]] = (u, v)
+        if key != self._diamondKey:
+            size = OglAssociation.DIAMOND_SIZE
+            x2, y2 = v
+            alpha: float = LineShape.computeArrowAngle(u, v)
+            pi_6 = pi/6
+            points = []
+            alpha1 = alpha + pi_6
+            alpha2 = alpha - pi_6
+            points.append((x2 + size * cos(alpha1), y2 + size * sin(alpha1)))
+            points.append((x2, y2))
+            points.append((x2 + size * cos(alpha2), y2 + size * sin(alpha2)))
+            points.append((x2 + 2*size * cos(alpha),  y2 + 2*size * sin(alpha)))
+            self._diamondGeometry = (alpha, points)
+            self._diamondKey      = key
+
+        return self._diamondGeometry
+
+    def _getLabelPositions(self, sp: Tuple[float, float], dp: Tuple[float, float]) -> LabelPositions:
+        """
+        Where the source cardinality, the name and the destination cardinality go;  Only
+        computed again when an end of the link moved
 
-        saveFont: Font = dc.GetFont()
-        dc.SetFont(self._defaultFont)
+        Args:
+            sp: The source anchor position
+            dp: The destination anchor position
+
+        Returns:  The source, center and destination label positions
+        """
+        key: Tuple[Tuple[float, float], Tuple[float, float]] = (sp, dp)
+        if key != self._labelPositionsKey:
+            oglSp: OglPosition = OglPosition(x=sp[0], y=sp[1])
+            oglDp: OglPosition = OglPosition(x=dp[0], y=dp[1])
+
+            self._labelPositions = (
+                self._computeSourceCardinalityPosition(sp=oglSp, dp=oglDp),
+                self._computeMidPoint(srcPosition=oglSp, destPosition=oglDp),
+                self._computeDestinationCardinalityPosition(sp=oglSp, dp=oglDp)
+            )
+            self._labelPositionsKey = key
 
-        centerText: str = self._link.getName()
-        dc.DrawText(centerText, centerX, centerY)
-        dc.SetFont(saveFont)
-        self._centerLabel = self.__updateAssociationLabel(self._centerLabel, x=centerX, y=centerY, text=centerText)
+        return self._labelPositions
 
-    def _drawSourceCardinality(self, dc: DC, sp: OglPosition, dp: OglPosition):
+    def _drawLabel(self, dc: DC, associationLabel: OglAssociationLabel, position: Tuple[float, float], text: str, drawText: bool) -> OglAssociationLabel:
+
+        x, y = position
+        if drawText is True:
+            saveFont: Font = dc.GetFont()
+            dc.SetFont(self._defaultFont)
+            dc.DrawText(text, x, y)
+            dc.SetFont(saveFont)
+
+        return self.__updateAssociationLabel(associationLabel, x=x, y=y, text=text)
+
+    def _computeSourceCardinalityPosition(self, sp: OglPosition, dp: OglPosition) -> Tuple[float, float]:
 
         dx, dy            = self._computeDxDy(srcPosition=sp, destPosition=dp)
 
@@ -180,15 +222,10 @@ class OglAssociation(OglLink):
                 f'srcLblY={srcLblY:.2f}'
             )
             OglAssociation.clsLogger.info(info)
-        saveFont: Font = dc.GetFont()
-        dc.SetFont(self._defaultFont)
 
-        sourceCardinalityText: str = self._link.sourceCardinality
-        dc.DrawText(sourceCardinalityText, srcLblX, srcLblY)
-        dc.SetFont(saveFont)
-        self._sourceCardinality = self.__updateAssociationLabel(self._sourceCardinality, x=srcLblX, y=srcLblY, text=sourceCardinalityText)
+        return srcLblX, srcLblY
 
-    def _drawDestinationCardinality(self, dc: DC, sp: OglPosition, dp: OglPosition):
+    def _computeDestinationCardinalityPosition(self, sp: OglPosition, dp: OglPosition) -> Tuple[float, float]:
 
         dx, dy            = self._computeDxDy(srcPosition=sp, destPosition=dp)
 
@@ -197,13 +234,7 @@ class OglAssociation(OglLink):
         dstLblX = (-20 * dx / linkLength + dy * 5 / linkLength) + dp.x
         dstLblY = (-20 * dy / linkLength - dy * 5 / linkLength) + dp.y
 
-        saveFont: Font = dc.GetFont()
-        dc.SetFont(self._defaultFont)
-
-        destinationCardinalityText: str = self._link.destinationCardinality
-        dc.DrawText(destinationCardinalityText, dstLblX, dstLblY)
-        self._destinationCardinality = self.__updateAssociationLabel(self._destinationCardinality, x=dstLblX, y=dstLblY, text=destinationCardinalityText)
-        dc.SetFont(saveFont)
+        return dstLblX, dstLblY
 
     def __updateAssociationLabel(self, associationLabel: OglAssociationLabel, x: float, y: float, text: str) -> OglAssociationLabel:
 
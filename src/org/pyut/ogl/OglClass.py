@@ -1,28 +1,46 @@
 
+from typing import List
 from typing import Tuple
 from typing import cast
 
 from logging import Logger
 from logging import getLogger
+from logging import DEBUG
+
+from math import ceil
+
+from time import perf_counter
 
 from wx import BLACK
 from wx import DC
+from wx import NullBitmap
 from wx import EVT_MENU
 from wx import FONTFAMILY_SWISS
 from wx import FONTSTYLE_NORMAL
 from wx import FONTWEIGHT_BOLD
 
+from wx import Bitmap
 from wx import Font
 from wx import ClientDC
+from wx import GCDC
+from wx import GraphicsContext
+from wx import GraphicsPath
 from wx import Menu
 from wx import CommandEvent
 from wx import MenuItem
+from wx import MemoryDC
 
 from org.pyut.model.PyutDisplayParameters import PyutDisplayParameters
 from org.pyut.model.PyutMethod import PyutMethod
 from org.pyut.model.PyutObject import PyutObject
 from org.pyut.model.PyutClass import PyutClass
 
+from org.pyut.miniogl.DrawingRecorder import DrawingRecorder
+from org.pyut.miniogl.DrawingRecorder import RecordedText
+from org.pyut.miniogl.GraphicsPathCache import GraphicsPathCache
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+from org.pyut.miniogl.TextMetricsCache import TextMetricsCache
+
 from org.pyut.ogl.OglObject import OglObject
 from org.pyut.ogl.OglObject import DEFAULT_FONT_SIZE
 
@@ -30,7 +48,10 @@ from org.pyut.PyutConstants import PyutConstants
 
 from org.pyut.PyutUtils import PyutUtils
 
+from org.pyut.preferences.PyutPreferences import PyutPreferences
+
 from org.pyut.general.Globals import _
+from org.pyut.general.Tracer import Tracer
 
 
 # Menu IDs
@@ -81,12 +102,19 @@ class OglClass(OglObject):
         self._nameFont: Font   = Font(DEFAULT_FONT_SIZE, FONTFAMILY_SWISS, FONTSTYLE_NORMAL, FONTWEIGHT_BOLD)
         self.logger:    Logger = getLogger(__name__)
 
+        self._renderCache:          Bitmap = cast(Bitmap, None)
+        self._renderCacheSignature: Tuple  = cast(Tuple, None)
+
+        self._separatorPath:   GraphicsPath       = cast(GraphicsPath, None)   # graphics context backend only
+        self._textLayout:      List[RecordedText] = []
+        self._layoutSignature: Tuple              = cast(Tuple, None)
+
     def GetTextWidth(self, dc, text):
-        width = dc.GetTextExtent(text)[0]
+        width = TextMetricsCache().getTextExtent(text, dc=dc)[0]
         return width
 
     def GetTextHeight(self, dc, text):
-        height = dc.GetTextExtent(text)[1]
+        height = TextMetricsCache().getTextExtent(text, dc=dc)[1]
         return height
 
     def calculateClassHeader(self, dc, draw=False, initialX=None, initialY=None, calcWidth=False):
@@ -112,7 +140,8 @@ class OglClass(OglObject):
             w = 0
 
         # define space between text and line
-        lth = dc.GetTextExtent("*")[1] / 2.0
+        metrics: TextMetricsCache = TextMetricsCache()
+        lth = metrics.getTextExtent("*", font=self._defaultFont, dc=dc)[1] / 2.0
 
         # from where begin the text
         h += lth
@@ -120,13 +149,13 @@ class OglClass(OglObject):
         # draw a pyutClass name
         name = self.pyutObject.name
         dc.SetFont(self._nameFont)
-        nameWidth = self.GetTextWidth(dc, name)
+        nameWidth = metrics.getTextExtent(name, font=self._nameFont, dc=dc)[0]
         if draw:
             dc.DrawText(name, x + (w - nameWidth) / 2.0, y + h)
         if calcWidth:
             w = max(nameWidth, w)
         dc.SetFont(self._defaultFont)
-        h += self.GetTextHeight(dc, str(name))
+        h += metrics.getTextExtent(str(name), font=self._defaultFont, dc=dc)[1]
         h += lth
 
         # draw the stereotype if there's one
@@ -135,12 +164,12 @@ class OglClass(OglObject):
         stereo = pyutClass.getStereotype()
         if stereo is not None and pyutClass.getShowStereotype() is True:
             name = str(stereo)
-            nameWidth = self.GetTextWidth(dc, name)
+            nameWidth, nameHeight = metrics.getTextExtent(name, font=self._defaultFont, dc=dc)
             if draw:
                 dc.DrawText(name, x + (w - nameWidth) / 2.0, y + h)
             if calcWidth:
                 w = max(nameWidth, w)
-            h += self.GetTextHeight(dc, str(name))
+            h += nameHeight
             h += lth
 
         # Return sizes
@@ -169,7 +198,8 @@ class OglClass(OglObject):
             w = 0
 
         # define space between text and line
-        lth = dc.GetTextExtent("*")[1] / 2.0
+        metrics: TextMetricsCache = TextMetricsCache()
+        lth = metrics.getTextExtent("*", font=self._defaultFont, dc=dc)[1] / 2.0
 
         # Add space
         pyutClass: PyutClass = cast(PyutClass, self.pyutObject)
@@ -179,12 +209,14 @@ class OglClass(OglObject):
         # draw pyutClass fields
         if pyutClass.showFields is True:
             for field in pyutClass.fields:
+                fieldText: str = str(field)
                 if draw:
-                    dc.DrawText(str(field), x + MARGIN, y + h)
+                    dc.DrawText(fieldText, x + MARGIN, y + h)
+                fieldWidth, fieldHeight = metrics.getTextExtent(fieldText, font=self._defaultFont, dc=dc)
                 if calcWidth:
-                    w = max(w, self.GetTextWidth(dc, str(field)))
+                    w = max(w, fieldWidth)
 
-                h += self.GetTextHeight(dc, str(field))
+                h += fieldHeight
 
         # Add space
         if len(pyutClass.fields) > 0:
@@ -222,7 +254,8 @@ class OglClass(OglObject):
             w = 0
 
         # define space between text and line
-        lth = dc.GetTextExtent("*")[1] / 2.0
+        metrics: TextMetricsCache = TextMetricsCache()
+        lth = metrics.getTextExtent("*", font=self._defaultFont, dc=dc)[1] / 2.0
 
         # Add space
         pyutClass: PyutClass = cast(PyutClass, self.pyutObject)
@@ -230,16 +263,19 @@ class OglClass(OglObject):
             h += lth
 
         # draw pyutClass methods
-        self.logger.debug(f"showMethods => {pyutClass.showMethods}")
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(f"showMethods => {pyutClass.showMethods}")
         if pyutClass.showMethods is True:
             for method in pyutClass.methods:
+                methodText: str = str(method)
                 if draw is True:
-                    self.__drawMethodSignature(dc, method, pyutClass, x, y, h)
+                    self.__drawMethodSignature(dc, method, methodText, pyutClass, x, y, h)
 
+                methodWidth, methodHeight = metrics.getTextExtent(methodText, font=self._defaultFont, dc=dc)
                 if calcWidth:
-                    w = max(w, self.GetTextWidth(dc, str(method)))
+                    w = max(w, methodWidth)
 
-                h += self.GetTextHeight(dc, str(method))
+                h += methodHeight
 
         # Add space
         if len(pyutClass.methods) > 0:
@@ -258,39 +294,57 @@ class OglClass(OglObject):
             dc: device context to draw to
             withChildren:
         """
-
-        pyutObject: PyutClass = cast(PyutClass, self.pyutObject)
-
+        if Tracer.ogl is True:
+            Tracer().count('ogl.classDraw')
         # Draw rectangle shape
         OglObject.Draw(self, dc)
 
         # drawing is restricted in the specified region of the device
         w, h = self._width, self._height
         x, y = self.GetPosition()           # Get position
-        dc.SetClippingRegion(x, y, w, h)
 
-        # Draw header
-        (headerX, headerY, headerW, headerH) = self.calculateClassHeader(dc, True)
-        y = headerY + headerH
+        levelOfDetail: LevelOfDetail = self.GetLevelOfDetail()
+        if levelOfDetail == LevelOfDetail.OUTLINE:
+            return
+        if levelOfDetail == LevelOfDetail.TITLE:
+            dc.SetClippingRegion(x, y, w, h)
+            self.calculateClassHeader(dc, True)
+            dc.DestroyClippingRegion()
+            return
+
+        if isinstance(dc, GCDC):
+            self._drawFromLayoutCache(dc, x, y, w, h)
+        elif PyutPreferences().classRenderCache is True:
+            self._drawFromRenderCache(dc, x, y, w, h)
+        else:
+            self._renderCache = cast(Bitmap, None)
+            dc.SetClippingRegion(x, y, w, h)
+            self._drawCompartments(dc, x, y, w)
+            dc.DestroyClippingRegion()
 
-        if pyutObject.showFields is True:
-            # Draw line
-            dc.DrawLine(x, y, x + w, y)
+    def invalidateRenderCache(self):
+        """
+        Forget the cached drawing;  The next Draw renders the class again.  Called whenever
+        what the class shows changes, since the per draw signature only covers the size, the
+        zoom and the colours
+        """
+        self._renderCache          = cast(Bitmap, None)
+        self._renderCacheSignature = cast(Tuple, None)
+        self._layoutSignature      = cast(Tuple, None)
 
-            # Draw fields
-            (fieldsX, fieldsY, fieldsW, fieldsH) = self.calculateClassFields(dc, True, initialY=y)
-            y = fieldsY + fieldsH
-        # Draw line
-        dc.DrawLine(x, y, x + w, y)
-        #
-        # Method needs to be called even though returned values not used  -- TODO look at refactoring
-        #
-        if pyutObject.showMethods is True:
-            (methodsX, methodsY, methodsW, methodsH) = self.calculateClassMethods(dc, True, initialY=y, calcWidth=True)
-            # noinspection PyUnusedLocal
-            y = methodsY + methodsH
+    def SetSize(self, width: float, height: float):
+        """
+        Override;  The cached drawing is for the old size
+        """
+        super().SetSize(width, height)
+        self.invalidateRenderCache()
 
-        dc.DestroyClippingRegion()
+    def SetSelected(self, state: bool = True):
+        """
+        Override;  The cached drawing is framed with the old selection colour
+        """
+        super().SetSelected(state)
+        self.invalidateRenderCache()
 
     def autoResize(self):
         """
@@ -299,6 +353,8 @@ class OglClass(OglObject):
         @author C.Dutoit
         WARNING : Every changes here must be reported in DRAW pyutMethod
         """
+        if Tracer.ogl is True:
+            startTime: float = perf_counter()
         # Init
         pyutObject: PyutClass = cast(PyutClass, self.pyutObject)
         dc = ClientDC(self.GetDiagram().GetPanel())
@@ -325,12 +381,16 @@ class OglClass(OglObject):
         h = y - headerY
         w += 2.0 * MARGIN
         self.SetSize(w, h)
+        self.invalidateRenderCache()
 
         # to automatically replace the sizers at a correct place
         if self.IsSelected():
             self.SetSelected(False)
             self.SetSelected(True)
 
+        if Tracer.ogl is True:
+            Tracer().record('ogl.classLayout', startTime)
+
     def OnRightDown(self, event):
         """
         Callback for right clicks
@@ -433,6 +493,7 @@ class OglClass(OglObject):
             pyutClass.displayParameters = PyutDisplayParameters.UNSPECIFIED
         else:
             assert False, 'Unknown display type'
+        self.invalidateRenderCache()
 
     def __repr__(self):
         selfName:   str = self.getPyutObject().getName()
@@ -482,7 +543,137 @@ class OglClass(OglObject):
         else:
             assert False, 'Unknown display type'
 
-    def __drawMethodSignature(self, dc: DC, pyutMethod: PyutMethod, pyutClass: PyutClass, x: float, y: float, h: float):
+    def _drawCompartments(self, dc: DC, x: float, y: float, w: float):
+        """
+        Draw the header, the fields and the methods with their separator lines
+
+        Args:
+            dc: device context to draw to
+            x:  The class abscissa
+            y:  The class ordinate
+            w:  The class width
+        """
+        pyutObject: PyutClass = cast(PyutClass, self.pyutObject)
+
+        # Draw header
+        (headerX, headerY, headerW, headerH) = self.calculateClassHeader(dc, True)
+        y = headerY + headerH
+
+        if pyutObject.showFields is True:
+            # Draw line
+            dc.DrawLine(x, y, x + w, y)
+
+            # Draw fields
+            (fieldsX, fieldsY, fieldsW, fieldsH) = self.calculateClassFields(dc, True, initialY=y)
+            y = fieldsY + fieldsH
+        # Draw line
+        dc.DrawLine(x, y, x + w, y)
+        #
+        # Method needs to be called even though returned values not used  -- TODO look at refactoring
+        #
+        if pyutObject.showMethods is True:
+            (methodsX, methodsY, methodsW, methodsH) = self.calculateClassMethods(dc, True, initialY=y, calcWidth=True)
+            # noinspection PyUnusedLocal
+            y = methodsY + methodsH
+
+    def _drawFromRenderCache(self, dc: DC, x: float, y: float, w: float, h: float):
+        """
+        Blit the cached drawing of the class interior, rendering it first if it was
+        invalidated or the size, zoom or colours changed.  The frame is drawn live so the bitmap sits one
+        unit inside it.  The bitmap is rendered at the zoom of `dc` and drawn unscaled
+        so that it stays sharp
+
+        Args:
+            dc: device context to draw to
+            x:  The class abscissa
+            y:  The class ordinate
+            w:  The class width
+            h:  The class height
+        """
+        zoom:      float = dc.GetUserScale()[0]
+        signature: Tuple = self._computeRenderSignature(dc, w, h) + (zoom, )
+        if self._renderCache is None or signature != self._renderCacheSignature:
+            self._renderCache          = self._renderToBitmap(dc, x, y, w, h, zoom)
+            self._renderCacheSignature = signature
+            self.logger.debug(f'{self} rendered to the cache')
+
+        deviceX: int = dc.LogicalToDeviceX(round(x) + 1)
+        deviceY: int = dc.LogicalToDeviceY(round(y) + 1)
+        scaleX, scaleY = dc.GetUserScale()
+        dc.SetUserScale(1.0, 1.0)
+        dc.DrawBitmap(self._renderCache, dc.DeviceToLogicalX(deviceX), dc.DeviceToLogicalY(deviceY))
+        dc.SetUserScale(scaleX, scaleY)
+
+    def _drawFromLayoutCache(self, dc: GCDC, x: float, y: float, w: float, h: float):
+        """
+        Draw the class interior on a graphics context from the cached separator path and
+        text layout, laying the class out first if it was invalidated or the size or colours changed.
+        Nothing is measured on the frames in between
+
+        Args:
+            dc: A dc over a graphics context
+            x:  The class abscissa
+            y:  The class ordinate
+            w:  The class width
+            h:  The class height
+        """
+        signature: Tuple = self._computeRenderSignature(dc, w, h)
+        if self._separatorPath is None or signature != self._layoutSignature:
+            recorder: DrawingRecorder = DrawingRecorder(dc, x, y)
+            self._drawCompartments(recorder, x, y, w)
+            self._separatorPath   = GraphicsPathCache.createLinesPath(recorder.lines)
+            self._textLayout      = recorder.texts
+            self._layoutSignature = signature
+            self.logger.debug(f'{self} laid out for the graphics context')
+
+        gc: GraphicsContext = dc.GetGraphicsContext()
+        gc.PushState()
+        gc.Clip(x, y, w, h)
+        gc.Translate(x, y)
+        gc.SetPen(dc.GetPen())
+        gc.StrokePath(self._separatorPath)
+        for text, font, colour, textX, textY in self._textLayout:
+            gc.SetFont(font, colour)
+            gc.DrawText(text, textX, textY)
+        gc.PopState()
+
+    def _renderToBitmap(self, dc: DC, x: float, y: float, w: float, h: float, zoom: float) -> Bitmap:
+
+        bitmap:   Bitmap   = Bitmap(max(1, ceil((round(w) - 2) * zoom)), max(1, ceil((round(h) - 2) * zoom)))
+        memoryDC: MemoryDC = MemoryDC(bitmap)
+
+        memoryDC.SetUserScale(zoom, zoom)
+        memoryDC.SetDeviceOrigin(-round((round(x) + 1) * zoom), -round((round(y) + 1) * zoom))
+        memoryDC.SetBackground(dc.GetBrush())
+        memoryDC.Clear()
+        memoryDC.SetPen(dc.GetPen())
+        memoryDC.SetBrush(dc.GetBrush())
+
+        self._drawCompartments(memoryDC, x, y, w)
+
+        memoryDC.SelectObject(NullBitmap)
+
+        return bitmap
+
+    def _computeRenderSignature(self, dc: DC, w: float, h: float) -> Tuple:
+        """
+        The cheap part of what the cached drawing depends on, checked on every Draw;  The
+        class content is not in it, its edits call `invalidateRenderCache()` instead
+
+        Args:
+            dc: The device context whose pen and brush the class was framed with
+            w:  The class width
+            h:  The class height
+
+        Returns:  A tuple that only compares equal if the size and colours are the same
+        """
+        return (
+            round(w), round(h),
+            dc.GetPen().GetColour().GetRGB(), dc.GetBrush().GetColour().GetRGB(),
+            self._defaultFont.GetPointSize()
+        )
+
+    def __drawMethodSignature(self, dc: DC, pyutMethod: PyutMethod, methodText: str, pyutClass: PyutClass, x: float, y: float, h: float):
         """
         If preference is not set at individual class level defer to global; Otherwise,
         respect the class level preference
@@ -490,13 +681,14 @@ class OglClass(OglObject):
         Args:
             dc:
             pyutMethod:
+            methodText:     The already formatted `str(pyutMethod)`
             pyutClass:
             x:
             y:
             h:
         """
         if pyutClass.displayParameters == PyutDisplayParameters.UNSPECIFIED:
-            dc.DrawText(str(pyutMethod), x + MARGIN, y + h)
+            dc.DrawText(methodText, x + MARGIN, y + h)
         elif pyutClass.displayParameters == PyutDisplayParameters.DISPLAY:
             dc.DrawText(pyutMethod.methodWithParameters(), x + MARGIN, y + h)
         elif pyutClass.displayParameters == PyutDisplayParameters.DO_NOT_DISPLAY:
@@ -11,6 +11,8 @@ from wx import RED_PEN
 from wx import BLACK_PEN
 from wx import WHITE_BRUSH
 
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+
 from org.pyut.model.PyutLink import PyutLink
 
 from org.pyut.ogl.OglLink import OglLink
@@ -95,6 +97,9 @@ class OglInterface(OglLink):
         """
         self.updateLabels()
         if self._visible:
+            if self.GetLevelOfDetail() != LevelOfDetail.FULL:
+                self.DrawOutline(dc)
+                return
             line = self.GetSegments()
             if self._selected:
                 dc.SetPen(RED_PEN)
@@ -6,7 +6,6 @@ from os import getcwd
 from os import chdir
 
 import zlib
-from xml.dom.minidom import Document
 from xml.dom.minidom import parseString
 
 from org.pyut.PyutUtils import PyutUtils
@@ -20,6 +19,8 @@ from org.pyut.general.Mediator import getMediator
 
 from org.pyut.general.Globals import _
 
+from org.pyut.persistence.PyutXmlStreamV10 import PyutXmlStream
+
 
 class IoFile:
     """
@@ -38,26 +39,15 @@ class IoFile:
 
     def save(self, project):
         """
-        To save diagram in XML file.  Always, uses the latest version
+        To save diagram in XML file.  Always, uses the latest version;  It is streamed
+        element by element into the compressed file
         """
-        lastVersion: str = PyutXmlFinder.getLatestXmlVersion()
-
-        myXml = PyutXmlFinder.getPyutXmlClass(theVersion=lastVersion)
-        doc:  Document = myXml.save(project)
-        text: str      = doc.toprettyxml()
-
-        updatedText: str = PyutXmlFinder.setAsISOLatin(xmlTextToUpdate=text)
-        self.logger.info(f'Document Save: \n{updatedText}')
-        byteText   = updatedText.encode()
-        compressed = zlib.compress(byteText)
-
-        file = open(project.getFilename(), "wb")
-        file.write(compressed)
-        file.close()
+        PyutXmlStream().save(project)
 
     def open(self, filename, project):
         """
-        To open a compressed file and create diagram.
+        To open a compressed file and create diagram.  Version 10 .put files are streamed;  Older
+        versions and plain .xml files are parsed into a minidom document.
 
         Args:
             filename: The file name
@@ -70,6 +60,9 @@ class IoFile:
         Lang.importLanguage()
         xmlString = ""
         if filename[-4:] == ".put":
+            if PyutXmlStream().open(filename=filename, project=project) is True:
+                chdir(oldPath)
+                return
             try:
                 with open(filename, "rb") as dataFile:
                     compressedData: bytes = dataFile.read()
@@ -0,0 +1,511 @@
+from typing import Generator
+from typing import Iterator
+from typing import List
+from typing import Dict
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from codecs import getincrementaldecoder
+
+from os import path as osPath
+from os import remove as osRemove
+from os import replace as osReplace
+
+from time import perf_counter
+
+from zlib import compressobj
+from zlib import decompressobj
+
+from xml.dom.minidom import Document
+from xml.dom.minidom import Element as MiniDomElement
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import XMLPullParser
+
+from xml.sax.saxutils import XMLGenerator
+
+from wx import Dialog
+from wx import Gauge
+from wx import Point
+from wx import Size
+from wx import Yield as wxYield
+
+from wx import ICON_INFORMATION
+from wx import RESIZE_BORDER
+from wx import STAY_ON_TOP
+from wx import ID_ANY
+
+from org.pyut.enums.DiagramType import DiagramType
+
+from org.pyut.ogl.OglActor import OglActor
+from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglInterface2 import OglInterface2
+from org.pyut.ogl.OglLink import OglLink
+from org.pyut.ogl.OglNote import OglNote
+from org.pyut.ogl.OglObject import OglObject
+from org.pyut.ogl.OglUseCase import OglUseCase
+
+from org.pyut.ogl.sd.OglSDInstance import OglSDInstance
+from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
+
+from org.pyut.PyutConstants import PyutConstants
+from org.pyut.PyutUtils import PyutUtils
+
+from org.pyut.persistence.converters.ElementTreeToOglV10 import ElementTreeToOgl
+from org.pyut.persistence.converters.MiniDomToOglV10 import OglObjects
+from org.pyut.persistence.converters.MiniDomToOglV10 import OglSDInstances
+from org.pyut.persistence.converters.OglToMiniDomV10 import OglToMiniDom as OglToMiniDomV10
+
+from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
+
+from org.pyut.ui.PyutDocument import PyutDocument
+from org.pyut.ui.PyutProject import PyutProject
+from org.pyut.ui.UmlDiagramsFrame import UmlDiagramsFrame
+
+from org.pyut.general.Mediator import getMediator
+from org.pyut.general.Tracer import Tracer
+from org.pyut.general.Globals import _
+
+ParseEvent = Tuple[str, Element]
+
+
+class CompressedFileWriter:
+    """
+    A write-only, file-like object that compresses everything written to it;  Lets
+    `XMLGenerator` stream straight to disk without an intermediate string
+    """
+    def __init__(self, filename: str):
+
+        self._file       = open(filename, 'wb')
+        self._compressor = compressobj()
+
+    def write(self, data: bytes) -> int:
+
+        self._file.write(self._compressor.compress(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+
+        self._file.write(self._compressor.flush())
+        self._file.close()
+
+
+class PyutXmlStream:
+    """
+    Loads and saves compressed version 10 Pyut project files without ever building the whole document.
+
+    The file is read in chunks through a zlib decompression object and fed to an `ElementTree`
+    pull parser.  Each `Graphic`xxx element is converted to its OGL object as soon as the parser
+    reports its end tag and is then dropped from the tree;  Peak memory is bounded by the largest
+    single graphic element rather than by the size of the project.
+
+    Links and sequence diagram messages may refer to shapes that appear later in the file.  Only
+    those elements are held until the end of their `PyutDocument`.
+
+    `open()` returns `False` without touching the project when the file is not version 10 so that
+    the caller can fall back to the minidom based loaders.
+
+    `save()` converts one OGL object at a time with the existing minidom converter and immediately
+    writes the resulting element through an `XMLGenerator` into a zlib compressor;  The converted
+    element is then discarded.
+    """
+    VERSION:         int = 10
+    READ_CHUNK_SIZE: int = 64 * 1024
+    INDENT:          str = '\t'
+
+    PROJECT_DEPTH:  int = 1
+    DOCUMENT_DEPTH: int = 2
+    GRAPHIC_DEPTH:  int = 3
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._toOgl:     ElementTreeToOgl = ElementTreeToOgl()
+        self._dlgGauge:  Dialog           = cast(Dialog, None)
+        self._gauge:     Gauge            = cast(Gauge, None)
+        self._fileSize:  int              = 0
+        self._bytesRead: int              = 0
+
+        self._umlFrame:        UmlDiagramsFrame = cast(UmlDiagramsFrame, None)
+        self._oglObjects:      OglObjects       = cast(OglObjects, {})
+        self._oglSDInstances:  OglSDInstances   = cast(OglSDInstances, {})
+        self._pendingLinks:    List[Element]    = []
+        self._pendingMessages: List[Element]    = []
+
+    def open(self, filename: str, project: PyutProject) -> bool:
+        """
+        Stream the file into the project
+
+        Args:
+            filename:   A compressed .put file
+            project:    The UI Project to fill out
+
+        Returns:
+            `True` if the file was handled here, `False` if the caller should use another loader
+        """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
+        self._fileSize  = osPath.getsize(filename)
+        self._bytesRead = 0
+
+        events: Generator[ParseEvent, None, None] = self._parseEvents(filename)
+        try:
+            streamable: bool = self.__isStreamable(events=events, project=project)
+        except (ValueError, Exception) as e:
+            self.logger.warning(f'Cannot stream {filename}: {e}')
+            streamable = False
+        if streamable is False:
+            events.close()
+            return False
+
+        self.__setupProgressDialog()
+        try:
+            self.__loadDocuments(events=events, project=project)
+        except (ValueError, Exception) as e:
+            self.logger.error(f'Streaming load of {filename} failed: {e}')
+            self._dlgGauge.Destroy()
+            PyutUtils.displayError(_(f"Can not load file {e}"))
+            if self._umlFrame is not None:
+                self._umlFrame.Refresh()
+            return True
+
+        self.__cleanupProgressDialog()
+        if Tracer.persistence is True:
+            Tracer().record('persistence.streamOpen', startTime)
+        return True
+
+    def save(self, project: PyutProject):
+        """
+        Stream the project to its file.  The file is written next to the original and only
+        replaces it once it is complete
+
+        Args:
+            project:  The project to write
+        """
+        assert project is not None, 'Oops someone sent me a bad project'
+
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
+        filename:     str = project.getFilename()
+        tempFilename: str = f'{filename}.tmp'
+
+        outFile: CompressedFileWriter = CompressedFileWriter(tempFilename)
+        self.__setupProgressDialog(title='Saving...')
+        try:
+            generator: XMLGenerator = XMLGenerator(outFile, encoding='utf-8', short_empty_elements=True)
+            self._writeProject(generator=generator, project=project)
+        except (ValueError, Exception) as e:
+            self.logger.error(f'Streaming save of {filename} failed: {e}')
+            outFile.close()
+            osRemove(tempFilename)
+            raise e
+        finally:
+            self._dlgGauge.Destroy()
+
+        outFile.close()
+        osReplace(tempFilename, filename)
+        if Tracer.persistence is True:
+            Tracer().record('persistence.streamSave', startTime)
+
+    def _writeProject(self, generator: XMLGenerator, project: PyutProject):
+
+        codePath: str = project.getCodePath()
+        if codePath is None:
+            codePath = ''
+        generator.startDocument()
+        generator.startElement(PyutXmlConstants.TOP_LEVEL_ELEMENT, {
+            PyutXmlConstants.ATTR_VERSION:   str(PyutXmlStream.VERSION),
+            PyutXmlConstants.ATTR_CODE_PATH: codePath
+        })
+
+        toMiniDom:  OglToMiniDomV10 = OglToMiniDomV10()
+        scratchDoc: Document        = Document()
+        for document in project.getDocuments():
+
+            document: PyutDocument = cast(PyutDocument, document)
+            self.__writeIndent(generator, 1)
+            generator.startElement(PyutXmlConstants.ELEMENT_DOCUMENT, self.__documentAttributes(document))
+
+            oglObjects: List[OglObject] = document.getFrame().getUmlObjects()
+            for i, oglObject in enumerate(oglObjects):
+                element: MiniDomElement = self.__oglObjectToXml(toMiniDom=toMiniDom, oglObject=oglObject, scratchDoc=scratchDoc)
+                if element is not None:
+                    self._writeElement(generator=generator, element=element, depth=2)
+                self.__updateSaveProgress(i, len(oglObjects))
+
+            self.__writeIndent(generator, 1)
+            generator.endElement(PyutXmlConstants.ELEMENT_DOCUMENT)
+
+        self.__writeIndent(generator, 0)
+        generator.endElement(PyutXmlConstants.TOP_LEVEL_ELEMENT)
+        generator.ignorableWhitespace('\n')
+        generator.endDocument()
+
+    def _writeElement(self, generator: XMLGenerator, element: MiniDomElement, depth: int):
+        """
+        Writes a minidom element and its children through the generator
+
+        Args:
+            generator:  Where to write
+            element:    The minidom element;  It belongs to a scratch document
+            depth:      Indentation level
+        """
+        self.__writeIndent(generator, depth)
+        generator.startElement(element.tagName, dict(element.attributes.items()))
+        children = [child for child in element.childNodes if child.nodeType == child.ELEMENT_NODE]
+        for child in children:
+            self._writeElement(generator=generator, element=child, depth=depth + 1)
+        if len(children) > 0:
+            self.__writeIndent(generator, depth)
+        generator.endElement(element.tagName)
+
+    def _parseEvents(self, filename: str) -> Generator[ParseEvent, None, None]:
+        """
+        The file is saved as UTF-8 even though the prolog claims iso-8859-1;  Feeding the parser
+        decoded text makes it ignore the declared encoding just like `parseString()` does.
+
+        Args:
+            filename:  The compressed file
+
+        Returns:
+            An iterator over the ('start' | 'end', element) parser events
+        """
+        decompressor = decompressobj()
+        decoder      = getincrementaldecoder('utf-8')()
+        parser: XMLPullParser = XMLPullParser(events=('start', 'end'))
+
+        with open(filename, 'rb') as dataFile:
+            while True:
+                chunk: bytes = dataFile.read(PyutXmlStream.READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._bytesRead += len(chunk)
+                parser.feed(decoder.decode(decompressor.decompress(chunk)))
+                for event in parser.read_events():
+                    yield event
+
+        parser.feed(decoder.decode(decompressor.flush(), final=True))
+        parser.close()
+        for event in parser.read_events():
+            yield event
+
+    def __isStreamable(self, events: Iterator[ParseEvent], project: PyutProject) -> bool:
+        """
+        Consume events up to and including the root start tag
+
+        Returns:
+            `True` if the root is a version 10 `PyutProject`
+        """
+        eventType, root = next(events)
+        if root.tag != PyutXmlConstants.TOP_LEVEL_ELEMENT:
+            return False
+        version: str = root.get(PyutXmlConstants.ATTR_VERSION, '1')
+        if version != str(PyutXmlStream.VERSION):
+            self.logger.info(f'Version {version} files are not streamed')
+            return False
+
+        project.setCodePath(root.get(PyutXmlConstants.ATTR_CODE_PATH, ''))
+
+        return True
+
+    def __loadDocuments(self, events: Iterator[ParseEvent], project: PyutProject):
+
+        depth:        int         = PyutXmlStream.PROJECT_DEPTH
+        documentNode: Element     = cast(Element, None)
+        docType:      DiagramType = cast(DiagramType, None)
+
+        for eventType, element in events:
+            if eventType == 'start':
+                depth += 1
+                if depth == PyutXmlStream.DOCUMENT_DEPTH and element.tag == PyutXmlConstants.ELEMENT_DOCUMENT:
+                    documentNode = element
+                    docType      = self.__startDocument(documentNode=documentNode, project=project)
+                continue
+
+            if depth == PyutXmlStream.GRAPHIC_DEPTH and documentNode is not None:
+                self.__handleGraphicElement(element=element, docType=docType)
+                documentNode.remove(element)
+                self.__updateProgressDialog()
+            elif depth == PyutXmlStream.DOCUMENT_DEPTH and element is documentNode:
+                self.__endDocument()
+                documentNode.clear()
+                documentNode = cast(Element, None)
+            depth -= 1
+
+    def __startDocument(self, documentNode: Element, project: PyutProject) -> DiagramType:
+
+        docTypeStr: str         = documentNode.get(PyutXmlConstants.ATTR_TYPE, '')
+        docType:    DiagramType = PyutConstants.diagramTypeFromString(docTypeStr)
+
+        document: PyutDocument = project.newDocument(docType)
+        docTitle: str          = documentNode.get(PyutXmlConstants.ATTR_TITLE, '')
+        if docTitle == '':
+            document.title = docTypeStr
+        else:
+            document.title = docTitle
+
+        self._umlFrame = document.getFrame()
+        getMediator().getFileHandling().showFrame(self._umlFrame)
+        self.__positionAndSetupDiagramFrame(documentNode=documentNode)
+
+        self._oglObjects      = cast(OglObjects, {})
+        self._oglSDInstances  = cast(OglSDInstances, {})
+        self._pendingLinks    = []
+        self._pendingMessages = []
+
+        return docType
+
+    def __endDocument(self):
+        """
+        Resolve whatever referred forward to shapes later in the document
+        """
+        for xmlLink in self._pendingLinks:
+            self.__displayLink(self._toOgl.getOglLink(xmlLink, self._oglObjects))
+        for xmlMessage in self._pendingMessages:
+            self.__displaySDMessage(self._toOgl.getOglSDMessage(xmlMessage, self._oglSDInstances))
+
+        self._pendingLinks    = []
+        self._pendingMessages = []
+
+    def __handleGraphicElement(self, element: Element, docType: DiagramType):
+
+        tag: str = element.tag
+        if tag == PyutXmlConstants.ELEMENT_GRAPHIC_CLASS and docType == DiagramType.CLASS_DIAGRAM:
+            self.__displayOglObject(self._toOgl.getOglClass(element))
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_NOTE and docType != DiagramType.SEQUENCE_DIAGRAM:
+            self.__displayOglObject(self._toOgl.getOglNote(element))
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_ACTOR and docType == DiagramType.USECASE_DIAGRAM:
+            self.__displayOglObject(self._toOgl.getOglActor(element))
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_USE_CASE and docType == DiagramType.USECASE_DIAGRAM:
+            self.__displayOglObject(self._toOgl.getOglUseCase(element))
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_LOLLIPOP and docType == DiagramType.CLASS_DIAGRAM:
+            oglInterface = self._toOgl.getOglInterface(element)
+            x, y = oglInterface.destinationAnchor.GetPosition()
+            self._umlFrame.addShape(oglInterface, x, y, withModelUpdate=True)
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_LINK and docType != DiagramType.SEQUENCE_DIAGRAM:
+            srcId, dstId = self._toOgl.getLinkEndPointIds(element)
+            if srcId in self._oglObjects and dstId in self._oglObjects:
+                self.__displayLink(self._toOgl.getOglLink(element, self._oglObjects))
+            else:
+                self._pendingLinks.append(element)
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_SD_INSTANCE and docType == DiagramType.SEQUENCE_DIAGRAM:
+            oglSDInstance = self._toOgl.getOglSDInstance(element, self._umlFrame)
+            self._oglSDInstances[oglSDInstance.getPyutObject().getId()] = oglSDInstance
+        elif tag == PyutXmlConstants.ELEMENT_GRAPHIC_SD_MESSAGE and docType == DiagramType.SEQUENCE_DIAGRAM:
+            srcId, dstId = self._toOgl.getSDMessageEndPointIds(element)
+            if srcId in self._oglSDInstances and dstId in self._oglSDInstances:
+                self.__displaySDMessage(self._toOgl.getOglSDMessage(element, self._oglSDInstances))
+            else:
+                self._pendingMessages.append(element)
+
+    def __displayOglObject(self, oglObject: OglObject):
+
+        self._oglObjects[oglObject.getPyutObject().getId()] = oglObject
+        x, y = oglObject.GetPosition()
+        self._umlFrame.addShape(oglObject, x, y)
+
+    def __displayLink(self, oglLink: OglLink):
+
+        if oglLink is None:
+            return
+        umlDiagram = self._umlFrame.GetDiagram()
+        umlDiagram.AddShape(oglLink, withModelUpdate=True)
+        for controlPoint in oglLink.GetControlPoints():
+            umlDiagram.AddShape(controlPoint)
+
+    def __displaySDMessage(self, oglSDMessage: OglSDMessage):
+        self._umlFrame.getDiagram().AddShape(oglSDMessage)
+
+    def __positionAndSetupDiagramFrame(self, documentNode: Element):
+
+        scrollPosX: int = PyutUtils.secureInteger(documentNode.get(PyutXmlConstants.ATTR_SCROLL_POSITION_X))
+        scrollPosY: int = PyutUtils.secureInteger(documentNode.get(PyutXmlConstants.ATTR_SCROLL_POSITION_Y))
+
+        self._umlFrame.Scroll(scrollPosX, scrollPosY)
+
+        pixelsPerUnitX: int = PyutUtils.secureInteger(documentNode.get(PyutXmlConstants.ATTR_PIXELS_PER_UNIT_X))
+        pixelsPerUnitY: int = PyutUtils.secureInteger(documentNode.get(PyutXmlConstants.ATTR_PIXELS_PER_UNIT_Y))
+        if pixelsPerUnitX != 0 and pixelsPerUnitY != 0:
+            self._umlFrame.SetScrollRate(xstep=pixelsPerUnitX, ystep=pixelsPerUnitY)
+
+    def __oglObjectToXml(self, toMiniDom: OglToMiniDomV10, oglObject: OglObject, scratchDoc: Document) -> MiniDomElement:
+
+        if isinstance(oglObject, OglClass):
+            return toMiniDom.oglClassToXml(oglObject, scratchDoc)
+        elif isinstance(oglObject, OglInterface2):
+            return toMiniDom.oglInterface2ToXml(oglObject, scratchDoc)
+        elif isinstance(oglObject, OglNote):
+            return toMiniDom.oglNoteToXml(oglObject, scratchDoc)
+        elif isinstance(oglObject, OglActor):
+            return toMiniDom.oglActorToXml(oglObject, scratchDoc)
+        elif isinstance(oglObject, OglUseCase):
+            return toMiniDom.oglUseCaseToXml(oglObject, scratchDoc)
+        elif isinstance(oglObject, OglSDInstance):
+            return toMiniDom.oglSDInstanceToXml(oglObject, scratchDoc)
+        elif isinstance(oglObject, OglSDMessage):
+            return toMiniDom.oglSDMessageToXml(oglObject, scratchDoc)
+        # OglLink comes last because OglSDMessage is a subclass of OglLink
+        elif isinstance(oglObject, OglLink):
+            return toMiniDom.oglLinkToXml(oglObject, scratchDoc)
+        else:
+            self.logger.warning(f'Unhandled OGL Object: {oglObject}')
+            return cast(MiniDomElement, None)
+
+    def __documentAttributes(self, pyutDocument: PyutDocument) -> Dict[str, str]:
+
+        docFrame: UmlDiagramsFrame = pyutDocument.getFrame()
+        scrollPosX, scrollPosY = docFrame.GetViewStart()
+        xUnit, yUnit           = docFrame.GetScrollPixelsPerUnit()
+
+        return {
+            PyutXmlConstants.ATTR_TYPE:              pyutDocument.getType().__str__(),
+            PyutXmlConstants.ATTR_TITLE:             pyutDocument.title,
+            PyutXmlConstants.ATTR_SCROLL_POSITION_X: str(scrollPosX),
+            PyutXmlConstants.ATTR_SCROLL_POSITION_Y: str(scrollPosY),
+            PyutXmlConstants.ATTR_PIXELS_PER_UNIT_X: str(xUnit),
+            PyutXmlConstants.ATTR_PIXELS_PER_UNIT_Y: str(yUnit),
+        }
+
+    def __writeIndent(self, generator: XMLGenerator, depth: int):
+        generator.ignorableWhitespace(f'\n{PyutXmlStream.INDENT * depth}')
+
+    def __updateSaveProgress(self, current: int, total: int):
+
+        percent: int = (current * 100) // total
+        if percent != self._gauge.GetValue():
+            self._gauge.SetValue(percent)
+            wxYield()
+
+    def __setupProgressDialog(self, title: str = 'Loading...'):
+
+        self._dlgGauge = Dialog(None, ID_ANY, title, style=STAY_ON_TOP | ICON_INFORMATION | RESIZE_BORDER, size=Size(250, 70))
+        self._gauge    = Gauge(self._dlgGauge, ID_ANY, 100, pos=Point(2, 5), size=Size(200, 30))
+        self._dlgGauge.Show(True)
+        wxYield()
+
+    def __updateProgressDialog(self):
+        """
+        The gauge tracks how much of the compressed file we have consumed;  Only yield
+        when the percentage actually changes
+        """
+        if self._fileSize == 0:
+            return
+        percent: int = min(100, (self._bytesRead * 100) // self._fileSize)
+        if percent != self._gauge.GetValue():
+            self._gauge.SetValue(percent)
+            wxYield()
+
+    def __cleanupProgressDialog(self):
+
+        if self._umlFrame is not None:
+            self._umlFrame.Refresh()
+        self._gauge.SetValue(100)
+        wxYield()
+        self._dlgGauge.Destroy()
@@ -88,7 +88,8 @@ class PyutXml:
 
     def save(self, project: PyutProject) -> Document:
         """
-        Save diagram in XML file.
+        Save diagram in XML file.  Project files are streamed by `PyutXmlStream`;  This builds
+        the whole document in memory and is kept for the XML export plugin, which pretty prints it
 
         Args:
             project:  The project to write as XML
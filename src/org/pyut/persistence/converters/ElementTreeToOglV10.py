@@ -0,0 +1,483 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from xml.etree.ElementTree import Element
+
+from org.pyut.miniogl.ControlPoint import ControlPoint
+from org.pyut.miniogl.SelectAnchorPoint import SelectAnchorPoint
+
+from org.pyut.enums.AttachmentPoint import AttachmentPoint
+
+from org.pyut.model.PyutActor import PyutActor
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutDisplayParameters import PyutDisplayParameters
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutInterface import PyutInterface
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutNote import PyutNote
+from org.pyut.model.PyutParam import PyutParam
+from org.pyut.model.PyutSDInstance import PyutSDInstance
+from org.pyut.model.PyutSDMessage import PyutSDMessage
+from org.pyut.model.PyutStereotype import getPyutStereotype
+from org.pyut.model.PyutUseCase import PyutUseCase
+
+from org.pyut.ogl.OglActor import OglActor
+from org.pyut.ogl.OglAssociation import OglAssociation
+from org.pyut.ogl.OglAssociationLabel import OglAssociationLabel
+from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglInterface2 import OglInterface2
+from org.pyut.ogl.OglLink import OglLink
+from org.pyut.ogl.OglNote import OglNote
+from org.pyut.ogl.OglUseCase import OglUseCase
+
+from org.pyut.ogl.sd.OglSDInstance import OglSDInstance
+from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
+
+from org.pyut.persistence.converters.MiniDomToOglV10 import ControlPoints
+from org.pyut.persistence.converters.MiniDomToOglV10 import OglObjects
+from org.pyut.persistence.converters.MiniDomToOglV10 import OglSDInstances
+from org.pyut.persistence.converters.MiniDomToOglV10 import PyutFields
+from org.pyut.persistence.converters.MiniDomToOglV10 import PyutMethods
+from org.pyut.persistence.converters.OglBuilderV10 import OglBuilder
+
+from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
+
+from org.pyut.general.Tracer import Tracer
+
+from org.pyut.PyutUtils import PyutUtils
+
+from org.pyut.ui.UmlFrame import UmlFrame
+
+
+class ElementTreeToOgl:
+    """
+    The streaming counterpart of `MiniDomToOgl`.  Instead of walking a complete minidom tree
+    each method converts a single, already completed, `ElementTree` element.  The streaming
+    loader hands us each `Graphic`xxx element as soon as the parser finishes it and then
+    discards it;  So, we never hold more than one of those elements in memory.
+
+    Like `MiniDomToOgl` this class does NO UI related actions;  It is up to the
+    caller to actually place the visual OGL object on the diagram frame
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._builder: OglBuilder = OglBuilder()
+
+    def getOglClass(self, xmlOglClass: Element) -> OglClass:
+        """
+        Args:
+            xmlOglClass:   XML 'GraphicClass' element
+
+        Returns:
+            The fully built OglClass positioned per the XML
+        """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
+        pyutClass: PyutClass = PyutClass()
+
+        height: float = float(xmlOglClass.get(PyutXmlConstants.ATTR_HEIGHT))
+        width:  float = float(xmlOglClass.get(PyutXmlConstants.ATTR_WIDTH))
+
+        oglClass: OglClass = OglClass(pyutClass, width, height)
+
+        xmlClass: Element = self._findFirst(xmlOglClass, PyutXmlConstants.ELEMENT_MODEL_CLASS)
+
+        pyutClass.setId(int(xmlClass.get(PyutXmlConstants.ATTR_ID)))
+        pyutClass.setName(xmlClass.get(PyutXmlConstants.ATTR_NAME, ''))
+        pyutClass.description = xmlClass.get(PyutXmlConstants.ATTR_DESCRIPTION, '')
+        if PyutXmlConstants.ATTR_STEREOTYPE in xmlClass.attrib:
+            pyutClass.setStereotype(getPyutStereotype(xmlClass.get(PyutXmlConstants.ATTR_STEREOTYPE)))
+
+        pyutClass.setShowStereotype(PyutUtils.secureBoolean(xmlClass.get(PyutXmlConstants.ATTR_SHOW_STEREOTYPE, '')))
+        pyutClass.showMethods = PyutUtils.secureBoolean(xmlClass.get(PyutXmlConstants.ATTR_SHOW_METHODS, ''))
+        pyutClass.showFields  = PyutUtils.secureBoolean(xmlClass.get(PyutXmlConstants.ATTR_SHOW_FIELDS, ''))
+
+        displayParametersStr: str = xmlClass.get(PyutXmlConstants.ATTR_DISPLAY_PARAMETERS, '')
+        if displayParametersStr == '':
+            pyutClass.displayParameters = PyutDisplayParameters.UNSPECIFIED
+        else:
+            pyutClass.displayParameters = PyutDisplayParameters(displayParametersStr)
+
+        pyutClass.setFilename(xmlClass.get(PyutXmlConstants.ATTR_FILENAME, ''))
+
+        pyutClass.methods = self._getMethods(xmlClass)
+        pyutClass.fields  = self._getFields(xmlClass)
+
+        x: float = float(xmlOglClass.get(PyutXmlConstants.ATTR_X))
+        y: float = float(xmlOglClass.get(PyutXmlConstants.ATTR_Y))
+        oglClass.SetPosition(x, y)
+
+        if Tracer.persistence is True:
+            Tracer().record('persistence.toOglClass', startTime)
+        return oglClass
+
+    def getOglInterface(self, xmlOglInterface: Element) -> OglInterface2:
+        """
+        Args:
+            xmlOglInterface:  XML 'GraphicLollipop' element
+
+        Returns:
+            The lollipop interface attached to its anchor point
+        """
+        anchorPoint:  SelectAnchorPoint = self.__getAttachmentPoint(xmlOglInterface)
+        xmlInterface: Element           = self._findFirst(xmlOglInterface, PyutXmlConstants.ELEMENT_MODEL_INTERFACE)
+
+        pyutInterface: PyutInterface = PyutInterface()
+        pyutInterface.name         = xmlInterface.get(PyutXmlConstants.ATTR_NAME, '')
+        pyutInterface.description  = xmlOglInterface.get(PyutXmlConstants.ATTR_DESCRIPTION, '')
+        pyutInterface.methods      = self._getMethods(xmlInterface)
+        pyutInterface.implementors = self._getImplementors(xmlInterface)
+
+        return OglInterface2(pyutInterface=pyutInterface, destinationAnchor=anchorPoint)
+
+    def getLinkEndPointIds(self, xmlLink: Element):
+        """
+        Lets the streaming loader decide whether it has already seen both ends of a link
+
+        Args:
+            xmlLink:  XML 'GraphicLink' element
+
+        Returns:
+            A tuple of the source ID and destination ID
+        """
+        link: Element = self._findFirst(xmlLink, PyutXmlConstants.ELEMENT_MODEL_LINK)
+
+        return int(link.get(PyutXmlConstants.ATTR_SOURCE_ID)), int(link.get(PyutXmlConstants.ATTR_DESTINATION_ID))
+
+    def getOglLink(self, xmlLink: Element, oglObjects: OglObjects) -> OglLink:
+        """
+        Args:
+            xmlLink:     XML 'GraphicLink' element
+            oglObjects:  The OGL objects built so far;  Must contain both ends of the link
+
+        Returns:
+            The built OglLink or `None` if either end is unknown
+        """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
+        sx: float = PyutUtils.secureFloat(xmlLink.get(PyutXmlConstants.ATTR_LINK_SOURCE_ANCHOR_X))
+        sy: float = PyutUtils.secureFloat(xmlLink.get(PyutXmlConstants.ATTR_LINK_SOURCE_ANCHOR_Y))
+        dx: float = PyutUtils.secureFloat(xmlLink.get(PyutXmlConstants.ATTR_LINK_DESTINATION_ANCHOR_X))
+        dy: float = PyutUtils.secureFloat(xmlLink.get(PyutXmlConstants.ATTR_LINK_DESTINATION_ANCHOR_Y))
+
+        spline: bool = PyutUtils.secureBoolean(xmlLink.get(PyutXmlConstants.ATTR_SPLINE, ''))
+
+        srcId, dstId, assocPyutLink = self._getPyutLink(xmlLink)
+        try:
+            src: OglClass = oglObjects[srcId]
+            dst: OglClass = oglObjects[dstId]
+        except KeyError as ke:
+            self.logger.error(f'Developer Error -- srcId: {srcId} - dstId: {dstId}  error: {ke}')
+            if Tracer.persistence is True:
+                Tracer().record('persistence.toOglLink', startTime)
+            return cast(OglLink, None)
+
+        oglLink: OglLink = self._builder.getOglLink(src=src, dst=dst, assocPyutLink=assocPyutLink, spline=spline,
+                                                    srcPosition=(sx, sy), dstPosition=(dx, dy),
+                                                    controlPoints=self._generateControlPoints(xmlLink))
+        if isinstance(oglLink, OglAssociation):
+            self.__furtherCustomizeAssociationLink(xmlLink, oglLink)
+
+        if Tracer.persistence is True:
+            Tracer().record('persistence.toOglLink', startTime)
+        return oglLink
+
+    def getOglNote(self, xmlOglNote: Element) -> OglNote:
+        """
+        Args:
+            xmlOglNote:  XML 'GraphicNote' element
+
+        Returns:
+            The built OglNote
+        """
+        pyutNote: PyutNote = PyutNote()
+
+        height: float = float(xmlOglNote.get(PyutXmlConstants.ATTR_HEIGHT))
+        width:  float = float(xmlOglNote.get(PyutXmlConstants.ATTR_WIDTH))
+        oglNote: OglNote = OglNote(pyutNote, width, height)
+
+        xmlNote: Element = self._findFirst(xmlOglNote, PyutXmlConstants.ELEMENT_MODEL_NOTE)
+
+        pyutNote.setId(int(xmlNote.get(PyutXmlConstants.ATTR_ID)))
+
+        content: str = xmlNote.get(PyutXmlConstants.ATTR_CONTENT, '')
+        pyutNote.content = content.replace("\\\\\\\\", "\n")
+
+        pyutNote.setFilename(xmlNote.get(PyutXmlConstants.ATTR_FILENAME, ''))
+
+        x: float = float(xmlOglNote.get(PyutXmlConstants.ATTR_X))
+        y: float = float(xmlOglNote.get(PyutXmlConstants.ATTR_Y))
+        oglNote.SetPosition(x, y)
+
+        return oglNote
+
+    def getOglActor(self, xmlOglActor: Element) -> OglActor:
+        """
+        Args:
+            xmlOglActor:  XML 'GraphicActor' element
+
+        Returns:
+            The built OglActor
+        """
+        pyutActor: PyutActor = PyutActor()
+
+        height: float = float(xmlOglActor.get(PyutXmlConstants.ATTR_HEIGHT))
+        width:  float = float(xmlOglActor.get(PyutXmlConstants.ATTR_WIDTH))
+        oglActor: OglActor = OglActor(pyutActor, width, height)
+
+        xmlActor: Element = self._findFirst(xmlOglActor, PyutXmlConstants.ELEMENT_MODEL_ACTOR)
+
+        pyutActor.setId(int(xmlActor.get(PyutXmlConstants.ATTR_ID)))
+        pyutActor.setName(xmlActor.get(PyutXmlConstants.ATTR_NAME, ''))
+        pyutActor.setFilename(xmlActor.get(PyutXmlConstants.ATTR_FILENAME, ''))
+
+        x: float = float(xmlOglActor.get(PyutXmlConstants.ATTR_X))
+        y: float = float(xmlOglActor.get(PyutXmlConstants.ATTR_Y))
+        oglActor.SetPosition(x, y)
+
+        return oglActor
+
+    def getOglUseCase(self, xmlOglUseCase: Element) -> OglUseCase:
+        """
+        Args:
+            xmlOglUseCase:  XML 'GraphicUseCase' element
+
+        Returns:
+            The built OglUseCase
+        """
+        pyutUseCase: PyutUseCase = PyutUseCase()
+
+        height: float = float(xmlOglUseCase.get(PyutXmlConstants.ATTR_HEIGHT))
+        width:  float = float(xmlOglUseCase.get(PyutXmlConstants.ATTR_WIDTH))
+        oglUseCase: OglUseCase = OglUseCase(pyutUseCase, width, height)
+
+        xmlUseCase: Element = self._findFirst(xmlOglUseCase, PyutXmlConstants.ELEMENT_MODEL_USE_CASE)
+
+        pyutUseCase.setId(int(xmlUseCase.get(PyutXmlConstants.ATTR_ID)))
+        pyutUseCase.setName(xmlUseCase.get(PyutXmlConstants.ATTR_NAME, ''))
+        pyutUseCase.setFilename(xmlUseCase.get(PyutXmlConstants.ATTR_FILENAME, ''))
+
+        x: float = float(xmlOglUseCase.get(PyutXmlConstants.ATTR_X))
+        y: float = float(xmlOglUseCase.get(PyutXmlConstants.ATTR_Y))
+        oglUseCase.SetPosition(x, y)
+
+        return oglUseCase
+
+    def getOglSDInstance(self, xmlOglSDInstance: Element, umlFrame: UmlFrame) -> OglSDInstance:
+        """
+        Args:
+            xmlOglSDInstance:   XML 'GraphicSDInstance' element
+            umlFrame:           SD Instances add themselves to the frame when constructed
+
+        Returns:
+            The built OglSDInstance
+        """
+        pyutSDInstance: PyutSDInstance = PyutSDInstance()
+        oglSDInstance:  OglSDInstance  = OglSDInstance(pyutSDInstance, umlFrame)
+
+        xmlSDInstance: Element = self._findFirst(xmlOglSDInstance, PyutXmlConstants.ELEMENT_MODEL_SD_INSTANCE)
+
+        pyutSDInstance.setId(int(xmlSDInstance.get(PyutXmlConstants.ATTR_ID)))
+        pyutSDInstance.setInstanceName(xmlSDInstance.get(PyutXmlConstants.ATTR_INSTANCE_NAME, ''))
+
+        lifeLineLength: int = PyutUtils.secureInteger(xmlSDInstance.get(PyutXmlConstants.ATTR_LIFE_LINE_LENGTH, ''))
+        pyutSDInstance.setInstanceLifeLineLength(lifeLineLength)
+
+        x: float = float(xmlOglSDInstance.get(PyutXmlConstants.ATTR_X))
+        y: float = float(xmlOglSDInstance.get(PyutXmlConstants.ATTR_Y))
+        w: float = float(xmlOglSDInstance.get(PyutXmlConstants.ATTR_WIDTH))
+        h: float = float(xmlOglSDInstance.get(PyutXmlConstants.ATTR_HEIGHT))
+        oglSDInstance.SetSize(w, h)
+        oglSDInstance.SetPosition(x, y)
+
+        return oglSDInstance
+
+    def getOglSDMessage(self, xmlOglSDMessage: Element, oglSDInstances: OglSDInstances) -> OglSDMessage:
+        """
+        Args:
+            xmlOglSDMessage:    XML 'GraphicSDMessage' element
+            oglSDInstances:     The SD instances built so far;  Must contain both ends of the message
+
+        Returns:
+            The built OglSDMessage
+        """
+        xmlPyutSDMessage: Element = self._findFirst(xmlOglSDMessage, PyutXmlConstants.ELEMENT_MODEL_SD_MESSAGE)
+
+        pyutSDMessage: PyutSDMessage = PyutSDMessage()
+
+        srcID:   int = int(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_SD_MESSAGE_SOURCE_ID))
+        dstID:   int = int(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_SD_MESSAGE_DESTINATION_ID))
+        srcTime: int = int(float(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_SOURCE_TIME_LINE)))
+        dstTime: int = int(float(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_DESTINATION_TIME_LINE)))
+        srcOgl = oglSDInstances[srcID]
+        dstOgl = oglSDInstances[dstID]
+
+        oglSDMessage: OglSDMessage = OglSDMessage(srcOgl, pyutSDMessage, dstOgl)
+        pyutSDMessage.setOglObject(oglSDMessage)
+        pyutSDMessage.setSource(srcOgl.getPyutObject(), srcTime)
+        pyutSDMessage.setDestination(dstOgl.getPyutObject(), dstTime)
+
+        pyutSDMessage.setId(int(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_ID)))
+        pyutSDMessage.setMessage(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_MESSAGE, ''))
+
+        srcOgl.addLink(oglSDMessage)
+        dstOgl.addLink(oglSDMessage)
+
+        return oglSDMessage
+
+    def getSDMessageEndPointIds(self, xmlOglSDMessage: Element):
+        """
+        Args:
+            xmlOglSDMessage:  XML 'GraphicSDMessage' element
+
+        Returns:
+            A tuple of the source ID and destination ID
+        """
+        xmlPyutSDMessage: Element = self._findFirst(xmlOglSDMessage, PyutXmlConstants.ELEMENT_MODEL_SD_MESSAGE)
+
+        srcID: int = int(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_SD_MESSAGE_SOURCE_ID))
+        dstID: int = int(xmlPyutSDMessage.get(PyutXmlConstants.ATTR_SD_MESSAGE_DESTINATION_ID))
+
+        return srcID, dstID
+
+    def _findFirst(self, element: Element, tagName: str) -> Element:
+        """
+        The equivalent of minidom's `getElementsByTagName(tagName)[0]`
+
+        Args:
+            element:  The element to search
+            tagName:  The descendant tag we want
+
+        Returns:
+            The first descendant with the given tag name
+        """
+        return next(element.iter(tagName))
+
+    def _getMethods(self, xmlClass: Element) -> PyutMethods:
+        """
+        Args:
+            xmlClass:  An element that is a UML Class or Interface
+
+        Returns:
+            A list of `PyutMethod`s associated with the class
+        """
+        allMethods: PyutMethods = cast(PyutMethods, [])
+        for xmlMethod in xmlClass.iter(PyutXmlConstants.ELEMENT_MODEL_METHOD):
+
+            returnElt: Element = self._findFirst(xmlMethod, PyutXmlConstants.ELEMENT_MODEL_RETURN)
+
+            pyutMethod: PyutMethod = self._builder.getPyutMethod(
+                name=xmlMethod.get(PyutXmlConstants.ATTR_NAME, ''),
+                visibility=xmlMethod.get(PyutXmlConstants.ATTR_VISIBILITY, ''),
+                returnType=returnElt.get(PyutXmlConstants.ATTR_TYPE, ''),
+                modifierNames=[xmlModifier.get(PyutXmlConstants.ATTR_NAME, '') for xmlModifier in xmlMethod.iter(PyutXmlConstants.ELEMENT_MODEL_MODIFIER)],
+                params=[self._getParam(xmlParam) for xmlParam in xmlMethod.iter(PyutXmlConstants.ELEMENT_MODEL_PARAM)])
+
+            allMethods.append(pyutMethod)
+
+        return allMethods
+
+    def _getImplementors(self, xmlClass: Element) -> PyutInterface.Implementors:
+
+        implementors: PyutInterface.Implementors = []
+        for xmlImplementor in xmlClass.iter(PyutXmlConstants.ELEMENT_IMPLEMENTOR):
+            className: PyutInterface.ClassName = xmlImplementor.get(PyutXmlConstants.ATTR_IMPLEMENTING_CLASS_NAME, '')
+            implementors.append(className)
+
+        return implementors
+
+    def _getParam(self, xmlParam: Element) -> PyutParam:
+        """
+        Args:
+            xmlParam:  The xml element that is a parameter
+
+        Returns:
+            A parameter model object
+        """
+        return self._builder.getPyutParam(name=xmlParam.get(PyutXmlConstants.ATTR_NAME, ''),
+                                          paramType=xmlParam.get(PyutXmlConstants.ATTR_TYPE, ''),
+                                          defaultValue=xmlParam.get(PyutXmlConstants.ATTR_DEFAULT_VALUE))
+
+    def _getFields(self, xmlClass: Element) -> PyutFields:
+        """
+        Args:
+            xmlClass:   An element that is a UML class
+
+        Returns:
+            PyutFields
+        """
+        pyutFields: PyutFields = cast(PyutFields, [])
+
+        for xmlField in xmlClass.iter(PyutXmlConstants.ELEMENT_MODEL_FIELD):
+
+            xmlParam:  Element   = self._findFirst(xmlField, PyutXmlConstants.ELEMENT_MODEL_PARAM)
+            pyutField: PyutField = self._builder.getPyutField(name=xmlParam.get(PyutXmlConstants.ATTR_NAME, ''),
+                                                              visibility=xmlField.get(PyutXmlConstants.ATTR_VISIBILITY, ''),
+                                                              fieldType=xmlParam.get(PyutXmlConstants.ATTR_TYPE, ''),
+                                                              defaultValue=xmlParam.get(PyutXmlConstants.ATTR_DEFAULT_VALUE))
+            pyutFields.append(pyutField)
+
+        return pyutFields
+
+    def _generateControlPoints(self, xmlLink: Element) -> ControlPoints:
+
+        controlPoints: ControlPoints = cast(ControlPoints, [])
+
+        for controlPoint in xmlLink.iter(PyutXmlConstants.ELEMENT_MODEL_CONTROL_POINT):
+            x: float = PyutUtils.secureFloat(controlPoint.get(PyutXmlConstants.ATTR_X))
+            y: float = PyutUtils.secureFloat(controlPoint.get(PyutXmlConstants.ATTR_Y))
+            controlPoints.append(ControlPoint(x, y))
+
+        return controlPoints
+
+    def _getPyutLink(self, xmlLink: Element):
+        """
+        Args:
+            xmlLink:  The GraphicLink element
+
+        Returns:
+            A tuple of a source ID, destination ID, and a PyutLink object
+        """
+        link: Element = self._findFirst(xmlLink, PyutXmlConstants.ELEMENT_MODEL_LINK)
+
+        pyutLink: PyutLink = self._builder.getPyutLink(name=link.get(PyutXmlConstants.ATTR_NAME, ''),
+                                                       linkType=link.get(PyutXmlConstants.ATTR_TYPE, ''),
+                                                       bidirectional=link.get(PyutXmlConstants.ATTR_BIDIRECTIONAL, ''),
+                                                       sourceCardinality=link.get(PyutXmlConstants.ATTR_CARDINALITY_SOURCE, ''),
+                                                       destinationCardinality=link.get(PyutXmlConstants.ATTR_CARDINALITY_DESTINATION, ''))
+
+        sourceId: int = int(link.get(PyutXmlConstants.ATTR_SOURCE_ID))
+        destId:   int = int(link.get(PyutXmlConstants.ATTR_DESTINATION_ID))
+
+        return sourceId, destId, pyutLink
+
+    def __furtherCustomizeAssociationLink(self, xmlLink: Element, oglLink: OglAssociation):
+
+        self.__setAssociationLabelPosition(xmlLink, PyutXmlConstants.ELEMENT_ASSOC_CENTER_LABEL,      oglLink.centerLabel)
+        self.__setAssociationLabelPosition(xmlLink, PyutXmlConstants.ELEMENT_ASSOC_SOURCE_LABEL,      oglLink.sourceCardinality)
+        self.__setAssociationLabelPosition(xmlLink, PyutXmlConstants.ELEMENT_ASSOC_DESTINATION_LABEL, oglLink.destinationCardinality)
+
+    def __setAssociationLabelPosition(self, xmlLink: Element, tagName: str, associationLabel: OglAssociationLabel):
+
+        label: Element = self._findFirst(xmlLink, tagName)
+
+        associationLabel.x = float(label.get(PyutXmlConstants.ATTR_X))
+        associationLabel.y = float(label.get(PyutXmlConstants.ATTR_Y))
+
+    def __getAttachmentPoint(self, xmlOglInterface: Element) -> SelectAnchorPoint:
+
+        attachmentPointStr: str = xmlOglInterface.get(PyutXmlConstants.ATTR_LOLLIPOP_ATTACHMENT_POINT, '')
+
+        x: float = PyutUtils.secureFloat(xmlOglInterface.get(PyutXmlConstants.ATTR_X))
+        y: float = PyutUtils.secureFloat(xmlOglInterface.get(PyutXmlConstants.ATTR_Y))
+
+        attachmentPoint: AttachmentPoint = AttachmentPoint.toEnum(attachmentPointStr)
+
+        return SelectAnchorPoint(x=x, y=y, attachmentPoint=attachmentPoint)
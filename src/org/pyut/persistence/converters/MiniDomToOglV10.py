@@ -9,6 +9,8 @@ from logging import Logger
 from logging import getLogger
 from logging import INFO
 
+from time import perf_counter
+
 from xml.dom.minidom import Element
 from xml.dom.minidom import NodeList
 
@@ -28,13 +30,8 @@ from org.pyut.model.PyutNote import PyutNote
 from org.pyut.model.PyutParam import PyutParam
 from org.pyut.model.PyutSDInstance import PyutSDInstance
 from org.pyut.model.PyutSDMessage import PyutSDMessage
-from org.pyut.model.PyutType import PyutType
 from org.pyut.model.PyutUseCase import PyutUseCase
 from org.pyut.model.PyutStereotype import getPyutStereotype
-from org.pyut.model.PyutModifier import PyutModifier
-from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
-
-from org.pyut.enums.LinkType import LinkType
 
 from org.pyut.ogl.OglActor import OglActor
 from org.pyut.ogl.OglAssociationLabel import OglAssociationLabel
@@ -46,15 +43,17 @@ from org.pyut.ogl.OglNote import OglNote
 from org.pyut.ogl.OglObject import OglObject
 from org.pyut.ogl.OglUseCase import OglUseCase
 from org.pyut.ogl.OglAssociation import OglAssociation
-from org.pyut.ogl.OglLinkFactory import getOglLinkFactory
 
 from org.pyut.ogl.sd.OglSDInstance import OglSDInstance
 from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 
+from org.pyut.persistence.converters.OglBuilderV10 import OglBuilder
 from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
 
 from org.pyut.PyutUtils import PyutUtils
 
+from org.pyut.general.Tracer import Tracer
+
 from org.pyut.ui.UmlFrame import UmlFrame
 
 OglObjects     = NewType('OglObjects',     Dict[int, OglObject])
@@ -84,6 +83,8 @@ class MiniDomToOgl:
 
         self.logger: Logger = getLogger(__name__)
 
+        self._builder: OglBuilder = OglBuilder()
+
     def getOglClasses(self, xmlOglClasses: NodeList) -> OglClasses:
         """
         Loads to OGL objects
@@ -95,6 +96,8 @@ class MiniDomToOgl:
         Returns:
                 The built dictionary uses an ID for the key and an OglClass for the value
         """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
         oglObjects: OglClasses = cast(OglClasses, {})
 
         for xmlOglClass in xmlOglClasses:
@@ -145,6 +148,8 @@ class MiniDomToOgl:
 
             oglObjects[pyutClass.getId()] = oglClass
 
+        if Tracer.persistence is True:
+            Tracer().record('persistence.toOglClasses', startTime)
         return oglObjects
 
     def getOglInterfaces(self, xmlOglInterfaces: NodeList) -> OglInterfaces:
@@ -180,6 +185,8 @@ class MiniDomToOgl:
         Returns:
             The OglLinks list
         """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
         oglLinks: OglLinks = cast(OglLinks, [])
 
         for xmlLink in xmlOglLinks:
@@ -203,45 +210,16 @@ class MiniDomToOgl:
                 self.logger.error(f'Developer Error -- srcId: {srcId} - dstId: {dstId}  error: {ke}')
                 continue
 
-            linkType: LinkType = assocPyutLink.getType()
-            pyutLink: PyutLink = PyutLink(name=assocPyutLink.getName(),
-                                          linkType=linkType,
-                                          cardSrc=assocPyutLink.sourceCardinality,
-                                          cardDest=assocPyutLink.destinationCardinality,
-                                          source=src.getPyutObject(), destination=dst.getPyutObject())
-
-            oglLinkFactory = getOglLinkFactory()
-            oglLink = oglLinkFactory.getOglLink(src, pyutLink, dst, linkType)
-            src.addLink(oglLink)
-            dst.addLink(oglLink)
-
-            oglLinks.append(oglLink)
-
-            oglLink.SetSpline(spline)
-
-            # put the anchors at the right position
-            srcAnchor = oglLink.GetSource()
-            dstAnchor = oglLink.GetDestination()
-            srcAnchor.SetPosition(sx, sy)
-            dstAnchor.SetPosition(dx, dy)
-
-            # add the control points to the line
-            line   = srcAnchor.GetLines()[0]  # only 1 line per anchor in pyut
-            parent = line.GetSource().GetParent()
-            selfLink = parent is line.GetDestination().GetParent()
-
-            controlPoints: ControlPoints = self._generateControlPoints(xmlLink)
-            for controlPoint in controlPoints:
-                line.AddControl(controlPoint)
-                if selfLink:
-                    x, y = controlPoint.GetPosition()
-                    controlPoint.SetParent(parent)
-                    controlPoint.SetPosition(x, y)
-
+            oglLink: OglLink = self._builder.getOglLink(src=src, dst=dst, assocPyutLink=assocPyutLink, spline=spline,
+                                                        srcPosition=(sx, sy), dstPosition=(dx, dy),
+                                                        controlPoints=self._generateControlPoints(xmlLink))
             if isinstance(oglLink, OglAssociation):
                 self.__furtherCustomizeAssociationLink(xmlLink, oglLink)
-            self._reconstituteLinkDataModel(oglLink)
 
+            oglLinks.append(oglLink)
+
+        if Tracer.persistence is True:
+            Tracer().record('persistence.toOglLinks', startTime)
         return oglLinks
 
     def getOglNotes(self, xmlOglNotes: NodeList) -> OglNotes:
@@ -454,33 +432,15 @@ class MiniDomToOgl:
         allMethods: PyutMethods = cast(PyutMethods, [])
         for xmlMethod in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_METHOD):
 
-            pyutMethod: PyutMethod = PyutMethod(xmlMethod.getAttribute(PyutXmlConstants.ATTR_NAME))
-
-            strVis: str = xmlMethod.getAttribute(PyutXmlConstants.ATTR_VISIBILITY)
-            vis: PyutVisibilityEnum = PyutVisibilityEnum.toEnum(strVis)
-            pyutMethod.setVisibility(visibility=vis)
-
-            returnElt:  Element  = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_RETURN)[0]
-            retTypeStr: str      = returnElt.getAttribute(PyutXmlConstants.ATTR_TYPE)
-            retType:    PyutType = PyutType(retTypeStr)
-            pyutMethod.setReturns(retType)
-
-            #
-            #  Code supports multiple modifiers, but the dialog allows input of only one
-            #
+            returnElt: Element  = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_RETURN)[0]
             modifiers: NodeList = xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_MODIFIER)
-            for xmlModifier in modifiers:
-                xmlModifier: Element = cast(Element, xmlModifier)
-                modName:  str        = xmlModifier.getAttribute(PyutXmlConstants.ATTR_NAME)
-
-                pyutModifier: PyutModifier = PyutModifier(modName)
-                pyutMethod.addModifier(pyutModifier)
 
-            methodParameters = []
-            for xmlParam in xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM):
-                methodParameters.append(self._getParam(xmlParam))
-
-            pyutMethod.setParams(methodParameters)
+            pyutMethod: PyutMethod = self._builder.getPyutMethod(
+                name=xmlMethod.getAttribute(PyutXmlConstants.ATTR_NAME),
+                visibility=xmlMethod.getAttribute(PyutXmlConstants.ATTR_VISIBILITY),
+                returnType=returnElt.getAttribute(PyutXmlConstants.ATTR_TYPE),
+                modifierNames=[xmlModifier.getAttribute(PyutXmlConstants.ATTR_NAME) for xmlModifier in modifiers],
+                params=[self._getParam(xmlParam) for xmlParam in xmlMethod.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM)])
 
             allMethods.append(pyutMethod)
 
@@ -504,15 +464,13 @@ class MiniDomToOgl:
         Returns:
             A parameter model object
         """
-        paramTypeStr: str = domElement.getAttribute(PyutXmlConstants.ATTR_TYPE)
-        paramType:    PyutType = PyutType(paramTypeStr)
-        pyutParam: PyutParam = PyutParam(name=domElement.getAttribute(PyutXmlConstants.ATTR_NAME),
-                                         theParameterType=paramType)
-
+        defaultValue: str = None
         if domElement.hasAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE):
-            pyutParam.setDefaultValue(domElement.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE))
+            defaultValue = domElement.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE)
 
-        return pyutParam
+        return self._builder.getPyutParam(name=domElement.getAttribute(PyutXmlConstants.ATTR_NAME),
+                                          paramType=domElement.getAttribute(PyutXmlConstants.ATTR_TYPE),
+                                          defaultValue=defaultValue)
 
     def _getFields(self, xmlClass: Element) -> PyutFields:
         """
@@ -529,22 +487,17 @@ class MiniDomToOgl:
 
         for xmlField in xmlClass.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_FIELD):
 
-            xmlField:   Element  = cast(Element, xmlField)
-            pyutField: PyutField = PyutField()
-
-            strVis: str                = xmlField.getAttribute(PyutXmlConstants.ATTR_VISIBILITY)
-            vis:    PyutVisibilityEnum = PyutVisibilityEnum.toEnum(strVis)
-
-            pyutField.setVisibility(vis)
+            xmlField: Element = cast(Element, xmlField)
             xmlParam: Element = xmlField.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_PARAM)[0]
 
+            defaultValue: str = None
             if xmlParam.hasAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE):
-                pyutField.setDefaultValue(xmlParam.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE))
-            pyutField.setName(xmlParam.getAttribute(PyutXmlConstants.ATTR_NAME))
-
-            pyutType: PyutType = PyutType(xmlParam.getAttribute(PyutXmlConstants.ATTR_TYPE))
-            pyutField.setType(pyutType)
+                defaultValue = xmlParam.getAttribute(PyutXmlConstants.ATTR_DEFAULT_VALUE)
 
+            pyutField: PyutField = self._builder.getPyutField(name=xmlParam.getAttribute(PyutXmlConstants.ATTR_NAME),
+                                                              visibility=xmlField.getAttribute(PyutXmlConstants.ATTR_VISIBILITY),
+                                                              fieldType=xmlParam.getAttribute(PyutXmlConstants.ATTR_TYPE),
+                                                              defaultValue=defaultValue)
             pyutFields.append(pyutField)
 
         return pyutFields
@@ -560,30 +513,6 @@ class MiniDomToOgl:
 
         return controlPoints
 
-    def _reconstituteLinkDataModel(self, oglLink: OglLink):
-        """
-        Updates one the following lists in a PyutLinkedObject:
-
-        ._parents   for Inheritance links
-        ._links     for all other link types
-
-        Args:
-            oglLink:       An OglLink
-        """
-        srcShape:  OglClass = oglLink.getSourceShape()
-        destShape: OglClass = oglLink.getDestinationShape()
-        self.logger.debug(f'source ID: {srcShape.GetID()} - destination ID: {destShape.GetID()}')
-
-        pyutLink:        PyutLink = oglLink.getPyutObject()
-
-        if pyutLink.getType() == LinkType.INHERITANCE:
-            childPyutClass:  PyutClass = cast(PyutClass, srcShape.getPyutObject())
-            parentPyutClass: PyutClass = cast(PyutClass, destShape.getPyutObject())
-            childPyutClass.addParent(parentPyutClass)
-        else:
-            srcPyutClass:  PyutClass = cast(PyutClass, srcShape.getPyutObject())
-            srcPyutClass.addLink(pyutLink)
-
     def _getPyutLink(self, obj: Element):
         """
 
@@ -595,18 +524,11 @@ class MiniDomToOgl:
         """
         link: Element = obj.getElementsByTagName(PyutXmlConstants.ELEMENT_MODEL_LINK)[0]
 
-        pyutLink: PyutLink = PyutLink()
-
-        pyutLink.setBidir(bool(link.getAttribute(PyutXmlConstants.ATTR_BIDIRECTIONAL)))
-
-        pyutLink.destinationCardinality = link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_DESTINATION)
-        pyutLink.sourceCardinality      = link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_SOURCE)
-
-        pyutLink.setName(link.getAttribute(PyutXmlConstants.ATTR_NAME))
-
-        strLinkType: str         = link.getAttribute(PyutXmlConstants.ATTR_TYPE)
-        linkType:    LinkType    = LinkType.toEnum(strValue=strLinkType)
-        pyutLink.setType(linkType)
+        pyutLink: PyutLink = self._builder.getPyutLink(name=link.getAttribute(PyutXmlConstants.ATTR_NAME),
+                                                       linkType=link.getAttribute(PyutXmlConstants.ATTR_TYPE),
+                                                       bidirectional=link.getAttribute(PyutXmlConstants.ATTR_BIDIRECTIONAL),
+                                                       sourceCardinality=link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_SOURCE),
+                                                       destinationCardinality=link.getAttribute(PyutXmlConstants.ATTR_CARDINALITY_DESTINATION))
 
         # source and destination will be reconstructed by _getOglLinks
         sourceId = int(link.getAttribute(PyutXmlConstants.ATTR_SOURCE_ID))
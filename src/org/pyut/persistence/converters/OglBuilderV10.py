@@ -0,0 +1,202 @@
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.miniogl.ControlPoint import ControlPoint
+
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutClass import PyutClass
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutModifier import PyutModifier
+from org.pyut.model.PyutParam import PyutParam
+from org.pyut.model.PyutType import PyutType
+from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
+
+from org.pyut.ogl.OglClass import OglClass
+from org.pyut.ogl.OglLink import OglLink
+from org.pyut.ogl.OglLinkFactory import getOglLinkFactory
+
+AnchorPosition = Tuple[float, float]     # x, y
+
+
+class OglBuilder:
+    """
+    The model and OGL construction shared by the version 10 loaders, `MiniDomToOgl` and
+    `ElementTreeToOgl`.  The loaders only differ in how they read the XML;  They extract the
+    attribute values and hand them here, so that both build exactly the same objects.
+
+    Attributes that are absent from the XML are passed as `None` where the model
+    distinguishes absent from empty (default values);  Otherwise as an empty string
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+    def getPyutParam(self, name: str, paramType: str, defaultValue: str = None) -> PyutParam:
+        """
+        Args:
+            name:           The parameter name
+            paramType:      The parameter type name
+            defaultValue:   The default value;  `None` if the parameter has none
+
+        Returns:
+            A parameter model object
+        """
+        pyutParam: PyutParam = PyutParam(name=name, theParameterType=PyutType(paramType))
+        if defaultValue is not None:
+            pyutParam.setDefaultValue(defaultValue)
+
+        return pyutParam
+
+    def getPyutMethod(self, name: str, visibility: str, returnType: str, modifierNames: List[str], params: List[PyutParam]) -> PyutMethod:
+        """
+        Args:
+            name:           The method name
+            visibility:     The visibility as written in the file
+            returnType:     The return type name
+            modifierNames:  The modifiers in file order
+            params:         The parameters already built by `getPyutParam`
+
+        Returns:
+            A method model object
+        """
+        pyutMethod: PyutMethod = PyutMethod(name)
+
+        pyutMethod.setVisibility(visibility=PyutVisibilityEnum.toEnum(visibility))
+        pyutMethod.setReturns(PyutType(returnType))
+        #
+        #  Code supports multiple modifiers, but the dialog allows input of only one
+        #
+        for modifierName in modifierNames:
+            pyutMethod.addModifier(PyutModifier(modifierName))
+        pyutMethod.setParams(params)
+
+        return pyutMethod
+
+    def getPyutField(self, name: str, visibility: str, fieldType: str, defaultValue: str = None) -> PyutField:
+        """
+        Args:
+            name:           The field name
+            visibility:     The visibility as written in the file
+            fieldType:      The field type name
+            defaultValue:   The default value;  `None` if the field has none
+
+        Returns:
+            A field model object
+        """
+        pyutField: PyutField = PyutField()
+
+        pyutField.setVisibility(PyutVisibilityEnum.toEnum(visibility))
+        if defaultValue is not None:
+            pyutField.setDefaultValue(defaultValue)
+        pyutField.setName(name)
+        pyutField.setType(PyutType(fieldType))
+
+        return pyutField
+
+    def getPyutLink(self, name: str, linkType: str, bidirectional: str, sourceCardinality: str, destinationCardinality: str) -> PyutLink:
+        """
+        The link as read from the file;  Its source and destination are only known once
+        `getOglLink` connects the shapes
+
+        Args:
+            name:                   The link name
+            linkType:               The link type as written in the file
+            bidirectional:          The bidirectional flag as written in the file
+            sourceCardinality:      The source cardinality
+            destinationCardinality: The destination cardinality
+
+        Returns:
+            A link model object
+        """
+        pyutLink: PyutLink = PyutLink()
+
+        pyutLink.setBidir(bool(bidirectional))
+
+        pyutLink.destinationCardinality = destinationCardinality
+        pyutLink.sourceCardinality      = sourceCardinality
+
+        pyutLink.setName(name)
+        pyutLink.setType(LinkType.toEnum(strValue=linkType))
+
+        return pyutLink
+
+    def getOglLink(self, src: OglClass, dst: OglClass, assocPyutLink: PyutLink, spline: bool,
+                   srcPosition: AnchorPosition, dstPosition: AnchorPosition, controlPoints: List[ControlPoint]) -> OglLink:
+        """
+        Connect two shapes, place the link anchors and control points and update the data model
+
+        Args:
+            src:            The source shape
+            dst:            The destination shape
+            assocPyutLink:  The link built by `getPyutLink`
+            spline:         `True` if the line is drawn as a spline
+            srcPosition:    Where the source anchor is
+            dstPosition:    Where the destination anchor is
+            controlPoints:  The line control points in file order
+
+        Returns:
+            The connected OglLink;  Association labels are left to the caller
+        """
+        linkType: LinkType = assocPyutLink.getType()
+        pyutLink: PyutLink = PyutLink(name=assocPyutLink.getName(),
+                                      linkType=linkType,
+                                      cardSrc=assocPyutLink.sourceCardinality,
+                                      cardDest=assocPyutLink.destinationCardinality,
+                                      source=src.getPyutObject(), destination=dst.getPyutObject())
+
+        oglLink = getOglLinkFactory().getOglLink(src, pyutLink, dst, linkType)
+        src.addLink(oglLink)
+        dst.addLink(oglLink)
+
+        oglLink.SetSpline(spline)
+
+        # put the anchors at the right position
+        srcAnchor = oglLink.GetSource()
+        dstAnchor = oglLink.GetDestination()
+        srcAnchor.SetPosition(*srcPosition)
+        dstAnchor.SetPosition(*dstPosition)
+
+        # add the control points to the line
+        line     = srcAnchor.GetLines()[0]  # only 1 line per anchor in pyut
+        parent   = line.GetSource().GetParent()
+        selfLink = parent is line.GetDestination().GetParent()
+
+        for controlPoint in controlPoints:
+            line.AddControl(controlPoint)
+            if selfLink:
+                x, y = controlPoint.GetPosition()
+                controlPoint.SetParent(parent)
+                controlPoint.SetPosition(x, y)
+
+        self._reconstituteLinkDataModel(oglLink)
+
+        return oglLink
+
+    def _reconstituteLinkDataModel(self, oglLink: OglLink):
+        """
+        Updates one the following lists in a PyutLinkedObject:
+
+        ._parents   for Inheritance links
+        ._links     for all other link types
+
+        Args:
+            oglLink:       An OglLink
+        """
+        srcShape:  OglClass = oglLink.getSourceShape()
+        destShape: OglClass = oglLink.getDestinationShape()
+        pyutLink:  PyutLink = oglLink.getPyutObject()
+
+        if pyutLink.getType() == LinkType.INHERITANCE:
+            childPyutClass:  PyutClass = cast(PyutClass, srcShape.getPyutObject())
+            parentPyutClass: PyutClass = cast(PyutClass, destShape.getPyutObject())
+            childPyutClass.addParent(parentPyutClass)
+        else:
+            srcPyutClass: PyutClass = cast(PyutClass, srcShape.getPyutObject())
+            srcPyutClass.addLink(pyutLink)
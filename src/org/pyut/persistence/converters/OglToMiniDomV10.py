@@ -5,6 +5,8 @@ from logging import Logger
 from logging import getLogger
 from typing import Union
 
+from time import perf_counter
+
 from xml.dom.minidom import Document
 from xml.dom.minidom import Element
 
@@ -40,6 +42,8 @@ from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 from org.pyut.persistence.converters.PyutXmlConstants import PyutXmlConstants
 from org.pyut.persistence.converters.IDFactory import IDFactory
 
+from org.pyut.general.Tracer import Tracer
+
 
 class OglToMiniDom:
     """
@@ -69,6 +73,8 @@ class OglToMiniDom:
         Returns:
             The newly created `GraphicClass` element
         """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
         root: Element = xmlDoc.createElement(PyutXmlConstants.ELEMENT_GRAPHIC_CLASS)
 
         root = self.__appendOglBase(oglClass, root)
@@ -76,6 +82,8 @@ class OglToMiniDom:
         # adding the data layer object
         root.appendChild(self._pyutClassToXml(oglClass.getPyutObject(), xmlDoc))
 
+        if Tracer.persistence is True:
+            Tracer().record('persistence.classToXml', startTime)
         return root
 
     def oglInterface2ToXml(self, oglInterface: OglInterface2, xmlDoc: Document) -> Element:
@@ -174,6 +182,8 @@ class OglToMiniDom:
         Returns:
             A new minidom element
         """
+        if Tracer.persistence is True:
+            startTime: float = perf_counter()
         root = xmlDoc.createElement(PyutXmlConstants.ELEMENT_GRAPHIC_LINK)
 
         # save source and destination anchor points
@@ -216,6 +226,8 @@ class OglToMiniDom:
 
         root.appendChild(self._pyutLinkToXml(oglLink.getPyutObject(), xmlDoc))
 
+        if Tracer.persistence is True:
+            Tracer().record('persistence.linkToXml', startTime)
         return root
 
     def oglSDInstanceToXml(self, oglSDInstance: OglSDInstance, xmlDoc: Document) -> Element:
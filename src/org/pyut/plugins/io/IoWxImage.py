@@ -10,18 +10,14 @@ from wx._core import BitmapType
 
 from wx import OK
 
-from wx import Bitmap
-from wx import ClientDC
 from wx import Image
-from wx import MemoryDC
-from wx import NullBitmap
-from wx import ScrolledWindow
 
 from org.pyut.general.Mediator import Mediator
 
 from org.pyut.ogl.OglClass import OglClass
 
 from org.pyut.plugins.io.nativeimagesupport.DlgWxImageOptions import DlgWxImageOptions
+from org.pyut.plugins.io.nativeimagesupport.OffscreenRenderer import OffscreenRenderer
 from org.pyut.plugins.io.nativeimagesupport.WxImageFormat import WxImageFormat
 
 from org.pyut.plugins.base.PyutIoPlugin import PyutIoPlugin
@@ -106,6 +102,7 @@ class IoWxImage(PyutIoPlugin):
                 self.logger.warning(f'{dlg.imageFormat=} {dlg.outputFileName=}')
                 self._imageFormat:    WxImageFormat = dlg.imageFormat
                 self._outputFileName: str           = dlg.outputFileName
+                self._scale:          float         = dlg.scale
 
             else:
                 self.logger.warning(f'Cancelled')
@@ -125,7 +122,8 @@ class IoWxImage(PyutIoPlugin):
 
     def write(self, oglObjects: List[OglClass]):
         """
-        Write data
+        Write the whole diagram, rendered off screen at the chosen scale.  PNG images are
+        streamed to the file a band at a time;  The other formats are rendered into one image
 
         Args:
             oglObjects:     list of exported objects
@@ -134,23 +132,18 @@ class IoWxImage(PyutIoPlugin):
         mediator: Mediator = self._ctrl
         mediator.deselectAllShapes()
 
-        imageType: BitmapType     = WxImageFormat.toWxBitMapType(self._imageFormat)
-
-        window:    ScrolledWindow = self._umlFrame
-        context:   ClientDC       = ClientDC(window)
-        memory:    MemoryDC       = MemoryDC()
-
-        x, y = window.GetSize()
-        emptyBitmap: Bitmap = Bitmap(x, y, -1)
-
-        memory.SelectObject(emptyBitmap)
-        memory.Blit(source=context, xsrc=0, height=y, xdest=0, ydest=0, ysrc=0, width=x)
-        memory.SelectObject(NullBitmap)
-
-        img:       Image = emptyBitmap.ConvertToImage()
-        extension: str   = self._imageFormat.__str__()
-
-        filename: str   = f'{self._outputFileName}.{extension}'
-        status:   bool  = img.SaveFile(filename, imageType)
-        if status is False:
-            self.logger.error(f'Error on image write to {filename}')
+        imageType: BitmapType        = WxImageFormat.toWxBitMapType(self._imageFormat)
+        renderer:  OffscreenRenderer = OffscreenRenderer(self._umlFrame, scale=self._scale)
+
+        extension: str = self._imageFormat.__str__()
+        filename:  str = f'{self._outputFileName}.{extension}'
+
+        width, height = renderer.imageSize
+        self.logger.info(f'Exporting a {width}x{height} image to {filename}')
+        if self._imageFormat == WxImageFormat.PNG:
+            renderer.writePng(filename)
+        else:
+            img:    Image = renderer.renderImage()
+            status: bool  = img.SaveFile(filename, imageType)
+            if status is False:
+                self.logger.error(f'Error on image write to {filename}')
@@ -10,6 +10,7 @@ from wx import EVT_BUTTON
 from wx import EVT_CHOICE
 from wx import EVT_CLOSE
 from wx import EVT_MOTION
+from wx import EVT_SPINCTRLDOUBLE
 
 from wx import EXPAND
 from wx import FD_CHANGE_DIR
@@ -29,6 +30,8 @@ from wx import CommandEvent
 from wx import FileDialog
 from wx import BoxSizer
 from wx import Sizer
+from wx import SpinCtrlDouble
+from wx import SpinDoubleEvent
 
 from wx import StaticBox
 from wx import StaticBoxSizer
@@ -56,28 +59,37 @@ class DlgWxImageOptions(BaseDlgEdit):
 
     DEFAULT_IMAGE_FILENAME: str = 'ImageDump'   # TODO make this a preference
 
+    MIN_SCALE:       float = 0.1
+    MAX_SCALE:       float = 20.0
+    SCALE_INCREMENT: float = 0.5
+    SCREEN_DPI:      int   = 96     # a scale of 1 is one pixel per diagram unit
+
     def __init__(self, parent):
 
         [self.__selectedFileId,
          self.__imageWidthId,    self.__imageHeightId,
          self.__horizontalGapId, self.__verticalGapId,
-         self.__fileSelectBtn,   self.__imageFormatChoiceId
-         ] = PyutUtils.assignID(7)
+         self.__fileSelectBtn,   self.__imageFormatChoiceId,
+         self.__scaleId
+         ] = PyutUtils.assignID(8)
 
         super().__init__(parent, theTitle='Native Image Generation Options')
 
         self.logger:          Logger        = getLogger(__name__)
         self._outputFileName: str           = DlgWxImageOptions.DEFAULT_IMAGE_FILENAME
         self._imageFormat:    WxImageFormat = WxImageFormat.PNG
+        self._scale:          float         = 1.0
 
         fs:   StaticBoxSizer = self.__layoutFileSelection()
         imgF: StaticBoxSizer = self.__layoutImageFormatChoice()
+        scl:  StaticBoxSizer = self.__layoutScale()
 
         hs:   Sizer      = self._createDialogButtonsContainer(buttons=OK | CANCEL)
 
         mainSizer: BoxSizer = BoxSizer(orient=VERTICAL)
         mainSizer.Add(fs,   0, ALL | EXPAND, 5)
         mainSizer.Add(imgF, 0, ALL, 5)
+        mainSizer.Add(scl,  0, ALL, 5)
         mainSizer.Add(hs,   0, ALIGN_RIGHT)
 
         self.SetSizerAndFit(mainSizer)
@@ -103,12 +115,25 @@ class DlgWxImageOptions(BaseDlgEdit):
     def outputFileName(self, newName: str):
         self._outputFileName = newName
 
+    @property
+    def scale(self) -> float:
+        """
+        Returns:  Image pixels per diagram unit;  Independent of the current zoom
+        """
+        return self._scale
+
+    @scale.setter
+    def scale(self, newScale: float):
+        self._scale = newScale
+
     def _bindEventHandlers(self):
 
         self.Bind(EVT_BUTTON, self._onFileSelectClick,     id=self.__fileSelectBtn)
 
         self.Bind(EVT_CHOICE, self._onImageFormatChoice, id=self.__imageFormatChoiceId)
 
+        self.Bind(EVT_SPINCTRLDOUBLE, self._onScaleChanged, id=self.__scaleId)
+
         self._selectedFile.Bind(EVT_MOTION, self._fileSelectionMotion, id=self.__selectedFileId)
 
     def _fileSelectionMotion(self, event: MouseEvent):
@@ -153,6 +178,11 @@ class DlgWxImageOptions(BaseDlgEdit):
 
         self._imageFormat = newFormat
 
+    def _onScaleChanged(self, event: SpinDoubleEvent):
+
+        self._scale = event.GetValue()
+        self._scaleDpi.SetValue(self.__dpiText())
+
     def __layoutFileSelection(self) -> StaticBoxSizer:
 
         box:                StaticBox      = StaticBox(self, ID_ANY, label="Output Filename")
@@ -181,3 +211,21 @@ class DlgWxImageOptions(BaseDlgEdit):
         szrImageFormat.Add(self._imageFormatChoice, 0, ALL)
 
         return szrImageFormat
+
+    def __layoutScale(self) -> StaticBoxSizer:
+
+        self._scaleControl: SpinCtrlDouble = SpinCtrlDouble(self, self.__scaleId, min=DlgWxImageOptions.MIN_SCALE, max=DlgWxImageOptions.MAX_SCALE,
+                                                            initial=self._scale, inc=DlgWxImageOptions.SCALE_INCREMENT)
+        self._scaleControl.SetDigits(1)
+        self._scaleDpi: TextCtrl = TextCtrl(self, value=self.__dpiText(), style=TE_READONLY)
+
+        box:      StaticBox      = StaticBox(self, ID_ANY, "Scale")
+        szrScale: StaticBoxSizer = StaticBoxSizer(box, HORIZONTAL)
+
+        szrScale.Add(self._scaleControl, 0, ALL, DlgWxImageOptions.HORIZONTAL_GAP)
+        szrScale.Add(self._scaleDpi,     0, ALL, DlgWxImageOptions.HORIZONTAL_GAP)
+
+        return szrScale
+
+    def __dpiText(self) -> str:
+        return f'{round(self._scale * DlgWxImageOptions.SCREEN_DPI)} dpi'
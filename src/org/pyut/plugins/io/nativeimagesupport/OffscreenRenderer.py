@@ -0,0 +1,147 @@
+
+from typing import Callable
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from math import ceil
+
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Image
+from wx import MemoryDC
+from wx import NullBitmap
+
+from org.pyut.plugins.io.nativeimagesupport.PngStreamWriter import PngStreamWriter
+
+from org.pyut.ui.UmlFrame import UmlFrame
+
+DiagramBounds = Tuple[float, float, float, float]       # left, top, right, bottom in diagram coordinates
+
+BandCallback = Callable[[Image, int], None]             # a band of the image and its top row
+
+
+class OffscreenRenderer:
+    """
+    Renders a whole diagram, independently of what is on screen, at any scale.  The image
+    is rendered in tiles into a small `MemoryDC`;  A row of tiles makes a band that is either
+    streamed to a PNG file or pasted into a single image.  Only the band being rendered is
+    in memory while streaming, so very large exports are possible.
+
+    Usage:
+
+        renderer: OffscreenRenderer = OffscreenRenderer(umlFrame, scale=4.0)
+        renderer.writePng('poster.png')
+    """
+    DEFAULT_TILE_SIZE: int   = 1024
+    DEFAULT_MARGIN:    float = 10.0     # diagram units left blank around the shapes
+
+    def __init__(self, umlFrame: UmlFrame, scale: float = 1.0, tileSize: int = DEFAULT_TILE_SIZE, margin: float = DEFAULT_MARGIN):
+        """
+
+        Args:
+            umlFrame:   The frame whose diagram to render
+            scale:      Output pixels per diagram unit
+            tileSize:   Width and height in pixels of the tiles rendered at once
+            margin:     Blank space around the shapes in diagram units
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._umlFrame: UmlFrame = umlFrame
+        self._scale:    float    = scale
+        self._tileSize: int      = tileSize
+
+        left, top, right, bottom = umlFrame.getObjectsBoundaries()
+        if left > right or top > bottom:
+            left, top, right, bottom = 0, 0, 0, 0       # an empty diagram
+        self._bounds: DiagramBounds = (left - margin, top - margin, right + margin, bottom + margin)
+
+    @property
+    def imageSize(self) -> Tuple[int, int]:
+        """
+        Returns:  The (width, height) of the rendered image in pixels
+        """
+        left, top, right, bottom = self._bounds
+        return max(1, ceil((right - left) * self._scale)), max(1, ceil((bottom - top) * self._scale))
+
+    def writePng(self, fileName: str):
+        """
+        Stream the diagram to a PNG file one band at a time
+
+        Args:
+            fileName:   The file to write
+        """
+        width, height = self.imageSize
+        with PngStreamWriter(fileName, width, height) as writer:
+
+            def writeBand(band: Image, bandTop: int):
+                writer.writeRows(bytes(band.GetData()), band.GetHeight())
+
+            self._renderBands(writeBand)
+
+    def renderImage(self) -> Image:
+        """
+        Render the diagram into a single image;  For the formats that cannot be streamed
+
+        Returns:  The image of the whole diagram
+        """
+        width, height = self.imageSize
+        image: Image = Image(width, height)
+
+        def pasteBand(band: Image, bandTop: int):
+            image.Paste(band, 0, bandTop)
+
+        self._renderBands(pasteBand)
+
+        return image
+
+    def _renderBands(self, bandCallback: BandCallback):
+        """
+        Render the image a band of tiles at a time, top to bottom
+
+        Args:
+            bandCallback:   Receives each band and the image row it starts at
+        """
+        width, height = self.imageSize
+        tileSize: int = self._tileSize
+
+        tileBitmap: Bitmap   = Bitmap(tileSize, tileSize)
+        tileDC:     MemoryDC = MemoryDC(tileBitmap)
+        tileDC.SetBackground(WHITE_BRUSH)
+        tileDC.SetUserScale(self._scale, self._scale)
+
+        for bandTop in range(0, height, tileSize):
+            bandHeight: int   = min(tileSize, height - bandTop)
+            band:       Image = Image(width, bandHeight)
+            for tileLeft in range(0, width, tileSize):
+                tileWidth: int = min(tileSize, width - tileLeft)
+                self._renderTile(tileDC, tileLeft, bandTop)
+                tile: Image = tileBitmap.ConvertToImage()
+                band.Paste(tile.GetSubImage((0, 0, tileWidth, bandHeight)), tileLeft, 0)
+
+            bandCallback(band, bandTop)
+
+        tileDC.SelectObject(NullBitmap)
+
+    def _renderTile(self, tileDC: MemoryDC, tileLeft: int, tileTop: int):
+        """
+        Draw the part of the diagram under one tile
+
+        Args:
+            tileDC:     The tile dc;  Scaled to the output
+            tileLeft:   The image column of the tile's left edge
+            tileTop:    The image row of the tile's top edge
+        """
+        scale:    float = self._scale
+        tileSize: int   = self._tileSize
+        left, top, right, bottom = self._bounds
+
+        # image pixel (px, py) shows the diagram point (left + px / scale, top + py / scale)
+        tileDC.SetDeviceOrigin(-round(left * scale) - tileLeft, -round(top * scale) - tileTop)
+        tileDC.Clear()
+
+        self._umlFrame.DrawShapesInRectangle(tileDC,
+                                             left + tileLeft / scale, top + tileTop / scale,
+                                             left + (tileLeft + tileSize) / scale, top + (tileTop + tileSize) / scale)
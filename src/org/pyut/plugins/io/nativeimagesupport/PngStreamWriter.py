@@ -0,0 +1,101 @@
+
+from typing import BinaryIO
+
+from logging import Logger
+from logging import getLogger
+
+from struct import pack
+
+from zlib import Z_DEFAULT_COMPRESSION
+from zlib import compressobj
+from zlib import crc32
+
+
+class PngStreamWriter:
+    """
+    Writes an 8 bit RGB PNG a band of rows at a time, so that an image far larger than
+    what fits in memory can be saved.  Only the rows handed to `writeRows` and the zlib
+    window are held in memory.
+
+    Usage:
+
+        with PngStreamWriter('poster.png', width, height) as writer:
+            for band in bands:
+                writer.writeRows(band.GetData(), band.GetHeight())
+    """
+    PNG_SIGNATURE:   bytes = b'\x89PNG\r\n\x1a\n'
+    BYTES_PER_PIXEL: int   = 3
+
+    BIT_DEPTH:       int = 8
+    COLOR_TYPE_RGB:  int = 2
+    FILTER_NONE:     bytes = b'\x00'
+
+    def __init__(self, fileName: str, width: int, height: int, compressionLevel: int = Z_DEFAULT_COMPRESSION):
+        """
+
+        Args:
+            fileName:           The file to write
+            width:              Image width in pixels
+            height:             Image height in pixels
+            compressionLevel:   zlib level
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._width:       int = width
+        self._height:      int = height
+        self._rowsWritten: int = 0
+
+        self._compressor = compressobj(compressionLevel)
+        self._file: BinaryIO = open(fileName, 'wb')
+
+        self._file.write(PngStreamWriter.PNG_SIGNATURE)
+        header: bytes = pack('>IIBBBBB', width, height, PngStreamWriter.BIT_DEPTH, PngStreamWriter.COLOR_TYPE_RGB, 0, 0, 0)
+        self._writeChunk(b'IHDR', header)
+
+    @property
+    def rowsWritten(self) -> int:
+        return self._rowsWritten
+
+    def writeRows(self, rgbData: bytes, rowCount: int):
+        """
+        Append rows to the image
+
+        Args:
+            rgbData:    `rowCount` rows of `width` RGB pixels, top to bottom, e.g. from `wx.Image.GetData()`
+            rowCount:   The number of rows in `rgbData`
+        """
+        stride: int = self._width * PngStreamWriter.BYTES_PER_PIXEL
+        assert len(rgbData) == stride * rowCount, 'The data does not match the image width'
+        assert self._rowsWritten + rowCount <= self._height, 'More rows than the image height'
+
+        rows: bytes = b''.join(PngStreamWriter.FILTER_NONE + rgbData[offset:offset + stride] for offset in range(0, len(rgbData), stride))
+
+        compressed: bytes = self._compressor.compress(rows)
+        if len(compressed) > 0:
+            self._writeChunk(b'IDAT', compressed)
+        self._rowsWritten += rowCount
+
+    def close(self):
+        """
+        Finish the image;  Every row must have been written
+        """
+        if self._file.closed:
+            return
+        if self._rowsWritten != self._height:
+            self.logger.error(f'Only {self._rowsWritten} of {self._height} rows were written')
+        self._writeChunk(b'IDAT', self._compressor.flush())
+        self._writeChunk(b'IEND', b'')
+        self._file.close()
+
+    def __enter__(self) -> 'PngStreamWriter':
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def _writeChunk(self, chunkType: bytes, data: bytes):
+
+        self._file.write(pack('>I', len(data)))
+        self._file.write(chunkType)
+        self._file.write(data)
+        self._file.write(pack('>I', crc32(chunkType + data) & 0xFFFFFFFF))
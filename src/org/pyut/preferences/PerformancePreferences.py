@@ -0,0 +1,133 @@
+from logging import Logger
+from logging import getLogger
+
+from org.pyut.preferences.BaseSubPreference import BaseSubPreference
+
+from org.pyut.preferences.PreferencesCommon import PREFS_NAME_VALUES
+from org.pyut.preferences.PreferencesCommon import PreferencesCommon
+
+
+class PerformancePreferences(BaseSubPreference):
+    """
+    Preferences that trade memory or fidelity against drawing speed
+    """
+    PERFORMANCE_SECTION: str = 'Performance'
+
+    CLASS_RENDER_CACHE:    str = 'class_render_cache'       # If `True` each OglClass keeps a bitmap of its content
+    LOD_TITLE_ZOOM:        str = 'lod_title_zoom'           # Below this zoom classes only show their name and links are bare lines
+    LOD_OUTLINE_ZOOM:      str = 'lod_outline_zoom'         # Below this zoom classes are empty rectangles
+    DRAG_FRAME_RATE:       str = 'drag_frame_rate'          # Dragged shapes are moved and repainted at most this often per second;  0 is every mouse move
+    GRAPHICS_CONTEXT:      str = 'graphics_context'         # If `True` shapes are drawn anti-aliased through a wx.GraphicsContext
+    HISTORY_WRITE_BEHIND:  str = 'history_write_behind'     # If `True` the undo journal is written in batches until the diagram is first saved
+    HISTORY_MAXIMUM_GROUPS:    str = 'history_maximum_groups'       # The oldest undo steps are dropped beyond this many;  0 is no limit
+    HISTORY_MAXIMUM_KILOBYTES: str = 'history_maximum_kilobytes'    # The oldest undo steps are dropped when they take more memory than this;  0 is no limit
+
+    PERFORMANCE_PREFERENCES: PREFS_NAME_VALUES = {
+        CLASS_RENDER_CACHE:    'False',
+        LOD_TITLE_ZOOM:        '0.5',
+        LOD_OUTLINE_ZOOM:      '0.3',
+        DRAG_FRAME_RATE:       '60',
+        GRAPHICS_CONTEXT:      'False',
+        HISTORY_WRITE_BEHIND:  'True',
+        HISTORY_MAXIMUM_GROUPS:    '1000',
+        HISTORY_MAXIMUM_KILOBYTES: '8192',
+    }
+
+    def init(self, *args, **kwds):
+
+        self.logger:  Logger       = getLogger(__name__)
+
+        BaseSubPreference.init(self, *args, **kwds)
+
+        self._preferencesCommon: PreferencesCommon = PreferencesCommon(self._config)
+
+    def addAnyMissingPerformancePreferences(self):
+
+        try:
+            if self._config.has_section(PerformancePreferences.PERFORMANCE_SECTION) is False:
+                self._config.add_section(PerformancePreferences.PERFORMANCE_SECTION)
+
+            for prefName in PerformancePreferences.PERFORMANCE_PREFERENCES.keys():
+                if self._config.has_option(PerformancePreferences.PERFORMANCE_SECTION, prefName) is False:
+                    self.__addMissingPerformancePreference(prefName, PerformancePreferences.PERFORMANCE_PREFERENCES[prefName])
+
+        except (ValueError, Exception) as e:
+            self.logger.error(f"Error: {e}")
+
+    @property
+    def classRenderCache(self) -> bool:
+        ans: bool = self._config.getboolean(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.CLASS_RENDER_CACHE)
+        return ans
+
+    @classRenderCache.setter
+    def classRenderCache(self, theNewValue: bool):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.CLASS_RENDER_CACHE, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def levelOfDetailTitleZoom(self) -> float:
+        return self._config.getfloat(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.LOD_TITLE_ZOOM)
+
+    @levelOfDetailTitleZoom.setter
+    def levelOfDetailTitleZoom(self, theNewValue: float):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.LOD_TITLE_ZOOM, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def levelOfDetailOutlineZoom(self) -> float:
+        return self._config.getfloat(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.LOD_OUTLINE_ZOOM)
+
+    @levelOfDetailOutlineZoom.setter
+    def levelOfDetailOutlineZoom(self, theNewValue: float):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.LOD_OUTLINE_ZOOM, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def dragFrameRate(self) -> int:
+        return self._config.getint(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.DRAG_FRAME_RATE)
+
+    @dragFrameRate.setter
+    def dragFrameRate(self, theNewValue: int):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.DRAG_FRAME_RATE, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def graphicsContextRendering(self) -> bool:
+        ans: bool = self._config.getboolean(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.GRAPHICS_CONTEXT)
+        return ans
+
+    @graphicsContextRendering.setter
+    def graphicsContextRendering(self, theNewValue: bool):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.GRAPHICS_CONTEXT, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def historyWriteBehind(self) -> bool:
+        ans: bool = self._config.getboolean(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.HISTORY_WRITE_BEHIND)
+        return ans
+
+    @historyWriteBehind.setter
+    def historyWriteBehind(self, theNewValue: bool):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.HISTORY_WRITE_BEHIND, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def historyMaximumGroups(self) -> int:
+        return self._config.getint(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.HISTORY_MAXIMUM_GROUPS)
+
+    @historyMaximumGroups.setter
+    def historyMaximumGroups(self, theNewValue: int):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.HISTORY_MAXIMUM_GROUPS, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    @property
+    def historyMaximumKilobytes(self) -> int:
+        return self._config.getint(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.HISTORY_MAXIMUM_KILOBYTES)
+
+    @historyMaximumKilobytes.setter
+    def historyMaximumKilobytes(self, theNewValue: int):
+        self._config.set(PerformancePreferences.PERFORMANCE_SECTION, PerformancePreferences.HISTORY_MAXIMUM_KILOBYTES, str(theNewValue))
+        self._preferencesCommon.saveConfig()
+
+    def __addMissingPerformancePreference(self, preferenceName, value):
+        self._preferencesCommon.addMissingPreference(PerformancePreferences.PERFORMANCE_SECTION, preferenceName, value)
@@ -14,6 +14,7 @@ from org.pyut.miniogl.PyutPenStyle import PyutPenStyle
 from org.pyut.preferences.DebugPreferences import DebugPreferences
 from org.pyut.preferences.DiagramPreferences import BackgroundPreferences
 from org.pyut.preferences.MainPreferences import MainPreferences
+from org.pyut.preferences.PerformancePreferences import PerformancePreferences
 from org.pyut.preferences.PreferencesCommon import PreferencesCommon
 
 
@@ -64,10 +65,11 @@ class PyutPreferences(Singleton):
         self._overrideOnProgramExit: bool         = True
         self._config:                ConfigParser = cast(ConfigParser, None)
 
-        self._preferencesCommon: PreferencesCommon     = PreferencesCommon(config=self._config)
-        self._mainPrefs:         MainPreferences       = MainPreferences(config=self._config)
-        self._diagramPrefs:      BackgroundPreferences = BackgroundPreferences(config=self._config)
-        self._debugPrefs:        DebugPreferences      = DebugPreferences(config=self._config)
+        self._preferencesCommon: PreferencesCommon      = PreferencesCommon(config=self._config)
+        self._mainPrefs:         MainPreferences        = MainPreferences(config=self._config)
+        self._diagramPrefs:      BackgroundPreferences  = BackgroundPreferences(config=self._config)
+        self._debugPrefs:        DebugPreferences       = DebugPreferences(config=self._config)
+        self._performancePrefs:  PerformancePreferences = PerformancePreferences(config=self._config)
 
         self._createEmptyPreferences()
 
@@ -358,6 +360,70 @@ class PyutPreferences(Singleton):
     def gridLineStyle(self, theNewValue: PyutPenStyle):
         self._diagramPrefs.gridLineStyle = theNewValue
 
+    @property
+    def classRenderCache(self) -> bool:
+        return self._performancePrefs.classRenderCache
+
+    @classRenderCache.setter
+    def classRenderCache(self, theNewValue: bool):
+        self._performancePrefs.classRenderCache = theNewValue
+
+    @property
+    def levelOfDetailTitleZoom(self) -> float:
+        return self._performancePrefs.levelOfDetailTitleZoom
+
+    @levelOfDetailTitleZoom.setter
+    def levelOfDetailTitleZoom(self, theNewValue: float):
+        self._performancePrefs.levelOfDetailTitleZoom = theNewValue
+
+    @property
+    def levelOfDetailOutlineZoom(self) -> float:
+        return self._performancePrefs.levelOfDetailOutlineZoom
+
+    @levelOfDetailOutlineZoom.setter
+    def levelOfDetailOutlineZoom(self, theNewValue: float):
+        self._performancePrefs.levelOfDetailOutlineZoom = theNewValue
+
+    @property
+    def dragFrameRate(self) -> int:
+        return self._performancePrefs.dragFrameRate
+
+    @dragFrameRate.setter
+    def dragFrameRate(self, theNewValue: int):
+        self._performancePrefs.dragFrameRate = theNewValue
+
+    @property
+    def graphicsContextRendering(self) -> bool:
+        return self._performancePrefs.graphicsContextRendering
+
+    @graphicsContextRendering.setter
+    def graphicsContextRendering(self, theNewValue: bool):
+        self._performancePrefs.graphicsContextRendering = theNewValue
+
+    @property
+    def historyWriteBehind(self) -> bool:
+        return self._performancePrefs.historyWriteBehind
+
+    @historyWriteBehind.setter
+    def historyWriteBehind(self, theNewValue: bool):
+        self._performancePrefs.historyWriteBehind = theNewValue
+
+    @property
+    def historyMaximumGroups(self) -> int:
+        return self._performancePrefs.historyMaximumGroups
+
+    @historyMaximumGroups.setter
+    def historyMaximumGroups(self, theNewValue: int):
+        self._performancePrefs.historyMaximumGroups = theNewValue
+
+    @property
+    def historyMaximumKilobytes(self) -> int:
+        return self._performancePrefs.historyMaximumKilobytes
+
+    @historyMaximumKilobytes.setter
+    def historyMaximumKilobytes(self, theNewValue: int):
+        self._performancePrefs.historyMaximumKilobytes = theNewValue
+
     def __loadConfig(self):
         """
         Load preferences from configuration file
@@ -389,6 +455,7 @@ class PyutPreferences(Singleton):
         self._mainPrefs.addAnyMissingMainPreferences()
         self._diagramPrefs.addMissingDiagramPreferences()
         self._debugPrefs.addAnyMissingDebugPreferences()
+        self._performancePrefs.addAnyMissingPerformancePreferences()
 
     def __addOpenedFilesSection(self):
 
@@ -408,3 +475,4 @@ class PyutPreferences(Singleton):
         self._mainPrefs.configParser         = self._config
         self._diagramPrefs.configParser      = self._config
         self._debugPrefs.configParser        = self._config
+        self._performancePrefs.configParser  = self._config
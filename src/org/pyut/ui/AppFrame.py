@@ -225,6 +225,14 @@ class AppFrame(Frame):
         """
         self._loadFile(filename)
 
+    def recoverHistories(self):
+        """
+        Offer to recover the changes a Pyut session that did not close properly left unsaved;
+        Called by PyutApp at startup
+        """
+        if self._mainFileHandlingUI.recoverHistories() is True:
+            self.removeEmptyProject()
+
     def removeEmptyProject(self):
 
         self.logger.info(f'Remove the default project')
@@ -0,0 +1,233 @@
+
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from math import ceil
+from math import floor
+
+from wx import EVT_LEFT_DOWN
+from wx import EVT_MOTION
+from wx import EVT_PAINT
+from wx import EVT_SIZE
+from wx import EVT_TIMER
+from wx import ID_ANY
+from wx import PENSTYLE_SOLID
+from wx import RED
+from wx import TRANSPARENT_BRUSH
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import BufferedPaintDC
+from wx import MemoryDC
+from wx import MouseEvent
+from wx import NullBitmap
+from wx import PaintEvent
+from wx import Pen
+from wx import SizeEvent
+from wx import Timer
+from wx import TimerEvent
+from wx import Window
+
+from org.pyut.miniogl.DiagramFrame import DiagramFrame
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+from org.pyut.miniogl.MiniOglUtils import mergeRectangles
+from org.pyut.miniogl.ShapeGrid import BoundingBox
+
+from org.pyut.preferences.PyutPreferences import PyutPreferences
+
+FrameProvider = Callable[[], Optional[DiagramFrame]]
+
+
+class DiagramMinimap(Window):
+    """
+    An overview of the whole diagram in the current frame with the visible part outlined.
+    Clicking or dragging on it scrolls the frame there.
+
+    The overview is a cached thumbnail.  It is rendered once when the frame or the diagram's
+    extent changes;  After that only the regions the diagram reports as damaged are drawn
+    again.  The viewport rectangle is drawn over the thumbnail and costs nothing to move.
+
+    The minimap follows whatever frame `frameProvider` returns;  It checks on a short timer
+    so that the many places that switch frames do not have to tell it
+    """
+    POLL_INTERVAL:   int = 250      # milliseconds between checks of the current frame and its viewport
+    VIEWPORT_WIDTH:  int = 2
+
+    def __init__(self, parent: Window, frameProvider: FrameProvider):
+        """
+
+        Args:
+            parent:         The parent window
+            frameProvider:  Returns the frame to show or `None`
+        """
+        super().__init__(parent, ID_ANY)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._frameProvider: FrameProvider   = frameProvider
+        self._frame:         DiagramFrame    = cast(DiagramFrame, None)
+        self._prefs:         PyutPreferences = PyutPreferences()
+
+        self._thumbnail:          Bitmap                      = cast(Bitmap, None)
+        self._thumbnailSignature: Tuple                       = cast(Tuple, None)   # what the thumbnail was rendered for
+        self._scale:              float                       = 1.0                 # thumbnail pixels per diagram unit
+        self._pendingRegions:     Optional[List[BoundingBox]] = []                  # damage not yet redrawn;  None is everything
+        self._viewportSignature:  Tuple                       = cast(Tuple, None)
+
+        self._pollTimer: Timer = Timer(self)
+
+        self.Bind(EVT_PAINT,     self._onPaint)
+        self.Bind(EVT_SIZE,      self._onSize)
+        self.Bind(EVT_LEFT_DOWN, self._onMouse)
+        self.Bind(EVT_MOTION,    self._onMouse)
+        self.Bind(EVT_TIMER,     self._onPollTimer, self._pollTimer)
+
+        self._pollTimer.Start(DiagramMinimap.POLL_INTERVAL)
+
+    @property
+    def frame(self) -> DiagramFrame:
+        return self._frame
+
+    @frame.setter
+    def frame(self, newFrame: DiagramFrame):
+        """
+        Show another frame;  Its thumbnail is rendered on the next paint
+
+        Args:
+            newFrame:   The frame or `None` to show nothing
+        """
+        if self._frame:
+            self._frame.GetDiagram().RemoveDamageListener(self._onDamage)
+        self._frame = newFrame
+        if newFrame is not None:
+            newFrame.GetDiagram().AddDamageListener(self._onDamage)
+
+        self._thumbnailSignature = cast(Tuple, None)
+        self._pendingRegions     = None
+        self.Refresh(False)
+
+    def _onDamage(self, regions: Optional[List[BoundingBox]]):
+        """
+        The frame took these regions to repaint;  Remember them for the next minimap paint
+
+        Args:
+            regions:    The damaged regions in diagram coordinates or `None` for everything
+        """
+        if regions is None or self._pendingRegions is None:
+            self._pendingRegions = None
+        else:
+            self._pendingRegions.extend(regions)
+            if len(self._pendingRegions) > 0:
+                self._pendingRegions = mergeRectangles(self._pendingRegions)
+        self.Refresh(False)
+
+    # noinspection PyUnusedLocal
+    def _onPollTimer(self, event: TimerEvent):
+
+        frame: DiagramFrame = self._frameProvider()
+        if not frame:
+            frame = cast(DiagramFrame, None)         # a destroyed window is falsy
+        if frame is not self._frame:
+            self.frame = frame
+        elif frame is not None and self._computeViewportSignature() != self._viewportSignature:
+            self.Refresh(False)
+
+    # noinspection PyUnusedLocal
+    def _onSize(self, event: SizeEvent):
+        self._thumbnailSignature = cast(Tuple, None)
+        self.Refresh(False)
+
+    # noinspection PyUnusedLocal
+    def _onPaint(self, event: PaintEvent):
+
+        dc: BufferedPaintDC = BufferedPaintDC(self)
+        dc.SetBackground(WHITE_BRUSH)
+        dc.Clear()
+        if self._frame is None:
+            return
+
+        self._updateThumbnail()
+        dc.DrawBitmap(self._thumbnail, 0, 0)
+
+        left, top, right, bottom = self._frame.GetVisibleRectangle()
+        scale: float = self._scale
+        dc.SetPen(Pen(RED, DiagramMinimap.VIEWPORT_WIDTH, PENSTYLE_SOLID))
+        dc.SetBrush(TRANSPARENT_BRUSH)
+        dc.DrawRectangle(round(left * scale), round(top * scale), max(1, round((right - left) * scale)), max(1, round((bottom - top) * scale)))
+
+        self._viewportSignature = self._computeViewportSignature()
+
+    def _onMouse(self, event: MouseEvent):
+        """
+        Scroll the frame so that the clicked point is in the middle of it
+
+        Args:
+            event:
+        """
+        if self._frame is None or not event.LeftIsDown():
+            event.Skip()
+            return
+        self._frame.CenterOn(event.GetX() / self._scale, event.GetY() / self._scale)
+        self._frame.Refresh()
+        self.Refresh(False)
+
+    def _updateThumbnail(self):
+        """
+        Render the whole thumbnail if the panel, the frame or the diagram's extent changed;
+        Otherwise only redraw the pending damaged regions
+        """
+        width, height = self.GetClientSize()
+        diagramWidth, diagramHeight = self._getDiagramExtent()
+        signature: Tuple = (id(self._frame), width, height, diagramWidth, diagramHeight)
+
+        if self._thumbnail is None or signature != self._thumbnailSignature:
+            self._scale = min(width / diagramWidth, height / diagramHeight)
+            self._thumbnail = Bitmap(max(1, width), max(1, height))
+            self._thumbnailSignature = signature
+            self._pendingRegions = None
+
+        if self._pendingRegions is None:
+            regions: List[BoundingBox] = [(0, 0, diagramWidth, diagramHeight)]
+        else:
+            regions = self._pendingRegions
+        self._pendingRegions = []
+        if len(regions) == 0:
+            return
+
+        scale: float = self._scale
+        levelOfDetail: LevelOfDetail = LevelOfDetail.forZoom(scale,
+                                                             titleZoom=self._prefs.levelOfDetailTitleZoom,
+                                                             outlineZoom=self._prefs.levelOfDetailOutlineZoom)
+        memoryDC: MemoryDC = MemoryDC(self._thumbnail)
+        memoryDC.SetBackground(WHITE_BRUSH)
+        for left, top, right, bottom in regions:
+            pixelLeft, pixelTop = floor(left * scale), floor(top * scale)
+            pixelWidth  = ceil(right * scale) - pixelLeft
+            pixelHeight = ceil(bottom * scale) - pixelTop
+            if pixelWidth <= 0 or pixelHeight <= 0:
+                continue
+            memoryDC.SetUserScale(1.0, 1.0)
+            memoryDC.SetClippingRegion(pixelLeft, pixelTop, pixelWidth, pixelHeight)
+            memoryDC.Clear()
+            memoryDC.SetUserScale(scale, scale)
+            self._frame.DrawShapesInRectangle(memoryDC, left, top, right, bottom, levelOfDetail=levelOfDetail)
+            memoryDC.DestroyClippingRegion()
+        memoryDC.SelectObject(NullBitmap)
+
+    def _getDiagramExtent(self) -> Tuple[float, float]:
+        """
+        Returns:  The (width, height) of the scrollable diagram area in diagram coordinates
+        """
+        zoom: float = self._frame.GetCurrentZoom()
+        virtualWidth, virtualHeight = self._frame.GetVirtualSize()
+
+        return max(1.0, virtualWidth / zoom), max(1.0, virtualHeight / zoom)
+
+    def _computeViewportSignature(self) -> Tuple:
+        return self._frame.GetViewStart(), self._frame.GetClientSize(), self._frame.GetCurrentZoom()
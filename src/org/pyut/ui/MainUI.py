@@ -1,4 +1,5 @@
 
+from typing import Dict
 from typing import List
 from typing import TypeVar
 from typing import cast
@@ -37,9 +38,12 @@ from wx import Notebook
 from wx import MessageDialog
 from wx import Menu
 
+from wx import BeginBusyCursor
+from wx import EndBusyCursor
 from wx import Yield as wxYield
 
 
+from org.pyut.ui.DiagramMinimap import DiagramMinimap
 from org.pyut.ui.PyutDocument import PyutDocument
 from org.pyut.ui.PyutProject import PyutProject
 from org.pyut.ui.UmlDiagramsFrame import UmlDiagramsFrame
@@ -51,6 +55,9 @@ from org.pyut.enums.DiagramType import DiagramType
 
 from org.pyut.dialogs.DlgEditDocument import DlgEditDocument
 
+from org.pyut.history.HistoryRecovery import HistoryRecovery
+from org.pyut.history.HistoryRecovery import OrphanedJournal
+
 from org.pyut.general.Globals import _
 
 TreeDataType = TypeVar('TreeDataType', PyutProject, UmlDiagramsFrame)
@@ -92,6 +99,8 @@ class MainUI:
         if not self._mediator.isInScriptMode():
 
             self.__splitter:          SplitterWindow = cast(SplitterWindow, None)
+            self.__leftSplitter:      SplitterWindow = cast(SplitterWindow, None)
+            self.__minimap:           DiagramMinimap = cast(DiagramMinimap, None)
             self.__projectTree:       TreeCtrl       = cast(TreeCtrl, None)
             self.__projectTreeRoot:   TreeItemId     = cast(TreeItemId, None)
             self.__notebook:          Notebook       = cast(Notebook, None)
@@ -123,6 +132,7 @@ class MainUI:
         """
         self._currentFrame = frame
         self._currentProject = self.getProjectFromFrame(frame)
+        self.__selectCurrentIdScope()
 
     def showFrame(self, frame):
         self._frame = frame
@@ -359,6 +369,75 @@ class MainUI:
         dlg.Destroy()
         return True
 
+    def recoverHistories(self) -> bool:
+        """
+        Offer to replay the history journals left behind by a Pyut session that did not close
+        properly onto the projects they were last saved to;  One question per project.  The
+        journals are removed whatever the answer.
+
+        Returns:
+            `True` if a project was recovered
+        """
+        recovery: HistoryRecovery = HistoryRecovery()
+
+        journalsByProject: Dict[str, List[OrphanedJournal]] = {}
+        for journal in recovery.findOrphanedJournals():
+            journalsByProject.setdefault(journal.projectFileName, []).append(journal)
+
+        recovered: bool = False
+        for projectFileName, journals in journalsByProject.items():
+            if osPath.isfile(projectFileName) is False:
+                self.logger.warning(f'Cannot recover the changes to a missing project: {projectFileName}')
+            elif not self._mediator.isInScriptMode():
+                dlg = MessageDialog(self.__parent,
+                                    _(f"Pyut did not close properly. Would you like to recover the unsaved changes to {projectFileName} ?"),
+                                    _("Recover changes ?"), YES_NO | ICON_QUESTION)
+                if dlg.ShowModal() == ID_YES:
+                    recovered = self.__replayJournals(projectFileName, journals) or recovered
+                dlg.Destroy()
+
+            for journal in journals:
+                recovery.discard(journal)
+
+        return recovered
+
+    def __replayJournals(self, projectFileName: str, journals: List[OrphanedJournal]) -> bool:
+        """
+        Open a project and replay the recovered changes onto its documents
+
+        Args:
+            projectFileName:    The project the journals were saved to
+            journals:           The journals of its documents
+
+        Returns:
+            `True` if the changes were replayed
+        """
+        project: PyutProject = self.getProject(projectFileName)
+        if project is None:
+            if self.openFile(projectFileName) is False:
+                return False
+            project = self.getProject(projectFileName)
+
+        documents: List[PyutDocument] = project.getDocuments()
+        BeginBusyCursor()
+        try:
+            for journal in journals:
+                if journal.documentIndex >= len(documents):
+                    self.logger.warning(f'{projectFileName} has no document {journal.documentIndex};  Its changes are lost')
+                    continue
+                frame: UmlDiagramsFrame = documents[journal.documentIndex].getFrame()
+                frame.getHistory().replay(journal.recovery.groupsToUndo, journal.recovery.groupsToRedo)
+        except (ValueError, Exception) as e:
+            EndBusyCursor()
+            PyutUtils.displayError(_(f"An error occurred while recovering the project {e}"))
+            return False
+        EndBusyCursor()
+
+        self._currentProject = project
+        self.setModified(True)
+
+        return True
+
     def newProject(self):
         """
         Begin a new project
@@ -462,10 +541,18 @@ class MainUI:
                             return False
                     dlg.Destroy()
 
+        # a clean close;  Nothing to recover
+        for project in self._projects:
+            for frame in project.getFrames():
+                frame.getHistory().destroy()
+
         # dereference all
         self.__parent = None
         self._mediator = None
         self.__splitter = None
+        self.__leftSplitter = None
+        self.__minimap.frame = None
+        self.__minimap = None
         self.__projectTree = None
         self.__notebook.DeleteAllPages()
         self.__notebook = None
@@ -515,6 +602,9 @@ class MainUI:
                 if self.saveFile() is False:
                     return False
 
+        for frame in self._currentProject.getFrames():
+            frame.getHistory().destroy()
+
         # Remove the frame in the notebook
         if not self._mediator.isInScriptMode():
             pages = list(range(self.__notebook.GetPageCount()))
@@ -525,6 +615,7 @@ class MainUI:
                     self.__notebook.DeletePage(i)
 
         self._currentProject.removeFromTree()
+        self._currentProject.removeIdScope()
         self._projects.remove(self._currentProject)
 
         self._currentProject = None
@@ -567,9 +658,8 @@ class MainUI:
         for project in self._projects:
             for frame in project.getFrames():
                 diagram = frame.getDiagram()
-                shapes = diagram.GetShapes()
                 for obj in oglObjects:
-                    if obj in shapes:
+                    if diagram.HasShape(obj):
                         self.logger.info(f'obj: {obj} is part of project: {project}')
                         return project
 
@@ -581,7 +671,8 @@ class MainUI:
         Instantiate all the UI elements
         """
         self.__splitter        = SplitterWindow(self.__parent, ID_ANY)
-        self.__projectTree     = TreeCtrl(self.__splitter, ID_ANY, style=TR_HIDE_ROOT + TR_HAS_BUTTONS)
+        self.__leftSplitter    = SplitterWindow(self.__splitter, ID_ANY)
+        self.__projectTree     = TreeCtrl(self.__leftSplitter, ID_ANY, style=TR_HIDE_ROOT + TR_HAS_BUTTONS)
         self.__projectTreeRoot = self.__projectTree.AddRoot(_("Root"))
 
         #  self.__projectTree.SetPyData(self.__projectTreeRoot, None)
@@ -592,9 +683,14 @@ class MainUI:
         # diagram container
         self.__notebook = Notebook(self.__splitter, ID_ANY, style=CLIP_CHILDREN)
 
-        # Set splitter
+        # diagram overview under the project tree
+        self.__minimap = DiagramMinimap(self.__leftSplitter, frameProvider=lambda: self._currentFrame)
+
+        # Set splitters
+        self.__leftSplitter.SetMinimumPaneSize(20)
+        self.__leftSplitter.SplitHorizontally(self.__projectTree, self.__minimap, -160)
         self.__splitter.SetMinimumPaneSize(20)
-        self.__splitter.SplitVertically(self.__projectTree, self.__notebook, 160)
+        self.__splitter.SplitVertically(self.__leftSplitter, self.__notebook, 160)
 
         self.__notebookCurrentPage = -1
 
@@ -621,6 +717,7 @@ class MainUI:
 
         # Register the current project
         self._currentProject = self.getProjectFromFrame(self._currentFrame)
+        self.__selectCurrentIdScope()
 
     def __onProjectTreeSelChanged(self, event: TreeEvent):
         """
@@ -637,6 +734,7 @@ class MainUI:
             frame: UmlDiagramsFrame = pyutData
             self._currentFrame = frame
             self._currentProject = self.getProjectFromFrame(frame)
+            self.__selectCurrentIdScope()
 
             # Select the frame in the notebook
             for i in range(self.__notebook.GetPageCount()):
@@ -646,6 +744,14 @@ class MainUI:
                     return
         elif isinstance(pyutData, PyutProject):
             self._currentProject = pyutData
+            self.__selectCurrentIdScope()
+
+    def __selectCurrentIdScope(self):
+        """
+        New model objects get their IDs from the current project's scope
+        """
+        if self._currentProject is not None:
+            self._currentProject.selectIdScope()
 
     def _getCurrentFrameFromNotebook(self):
         """
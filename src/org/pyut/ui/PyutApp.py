@@ -106,6 +106,8 @@ class PyutApp(wxApp):
             if self._showMainFrame is True:
                 self._frame.Show(True)
 
+            self._frame.recoverHistories()
+
             # Show full screen ?
             if prefs.fullScreen is True:
                 dc = ScreenDC()
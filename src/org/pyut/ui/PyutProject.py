@@ -21,6 +21,7 @@ from wx import Yield as wxYield
 from org.pyut.PyutUtils import PyutUtils
 
 from org.pyut.enums.DiagramType import DiagramType
+from org.pyut.general.IDRegistry import IDRegistry
 from org.pyut.general.Mediator import Mediator
 
 from org.pyut.general.Mediator import getMediator
@@ -62,11 +63,24 @@ class PyutProject:
         self._treeRootParent: TreeItemId = treeRoot                 # Parent of the project root entry
         self._treeRoot:       TreeItemId = cast(TreeItemId, None)   # Root of the project entry in the tree
         self._tree:           TreeCtrl   = tree                     # Tree I belong to
+        self._idScope:        int        = IDRegistry().newScope()  # Model IDs are unique per project
         self.addToTree()
 
     def selectSelf(self):
         self._tree.SelectItem(self._treeRoot)
 
+    def selectIdScope(self):
+        """
+        Make this project's ID scope the one new model objects draw their IDs from
+        """
+        IDRegistry().scope = self._idScope
+
+    def removeIdScope(self):
+        """
+        The project is going away;  Forget its IDs
+        """
+        IDRegistry().removeScope(self._idScope)
+
     def setFilename(self, filename):
         """
         Get the project's filename
@@ -167,9 +181,11 @@ class PyutProject:
         wxYield()       # to treat the uml frame refresh in newDiagram before loading
         # Load the file
         self._filename = filename
+        self.selectIdScope()
         try:
             io.open(filename, self)
             self._modified = False
+            self.__markHistoriesSaved()
         except (ValueError, Exception) as e:
             EndBusyCursor()
             PyutUtils.displayError(_(f"Error loading file: {e}"))
@@ -213,6 +229,7 @@ class PyutProject:
         BeginBusyCursor()
         io = IoFile.IoFile()
 
+        self.selectIdScope()
         try:
             io.open(filename, self)
             self._modified = False
@@ -243,6 +260,7 @@ class PyutProject:
         Returns:
             the newly created PyutDocument
         """
+        self.selectIdScope()
         document = PyutDocument(self._parentFrame, self, documentType)
         self._documents.append(document)
         document.addToTree(self._tree, self._treeRoot)
@@ -270,6 +288,7 @@ class PyutProject:
         try:
             io.save(self)
             self._modified = False
+            self.__markHistoriesSaved()
             self.updateTreeText()
         except (ValueError, Exception) as e:
             PyutUtils.displayError(_(f"An error occurred while saving project {e}"))
@@ -309,6 +328,8 @@ class PyutProject:
                 return
             dlg.Destroy()
 
+        frame.getHistory().destroy()
+
         # Remove references
         from org.pyut.general import Mediator
         ctrl = Mediator.getMediator()
@@ -325,6 +346,14 @@ class PyutProject:
         # Remove document from documents list
         self._documents.remove(document)
 
+    def __markHistoriesSaved(self):
+        """
+        Let the document histories know that the project file holds their current state;  Their
+        journals can then be replayed onto it if Pyut does not close properly
+        """
+        for documentIndex, document in enumerate(self._documents):
+            document.getFrame().getHistory().markSaved(self._filename, documentIndex)
+
     def __repr__(self):
         projectName: str = PyutUtils.extractFileName(self._filename)
         return f'[Project: {projectName} modified: {self._modified}]'
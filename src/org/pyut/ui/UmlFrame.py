@@ -1,4 +1,10 @@
 
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import cast
+
 from logging import Logger
 from logging import getLogger
 
@@ -12,12 +18,14 @@ from wx import Window
 
 from org.pyut.ogl.OglInterface2 import OglInterface2
 from org.pyut.ogl.OglObject import OglObject
+from org.pyut.ogl.OglClass import OglClass
 
 from org.pyut.ogl.OglLink import OglLink
 from org.pyut.ogl.sd.OglSDMessage import OglSDMessage
 
 from org.pyut.miniogl.Constants import SKIP_EVENT
 from org.pyut.miniogl.DiagramFrame import DiagramFrame
+from org.pyut.miniogl.SizerShape import SizerShape
 
 from org.pyut.general.Mediator import ACTION_ZOOM_IN
 from org.pyut.general.Mediator import getMediator
@@ -26,9 +34,16 @@ from org.pyut.PyutUtils import PyutUtils
 
 from org.pyut.history.HistoryManager import HistoryManager
 
+from org.pyut.commands.Command import Command
+from org.pyut.commands.CommandGroup import CommandGroup
+from org.pyut.commands.MoveOglObjectsCommand import MoveOglObjectsCommand
+from org.pyut.commands.ResizeOglObjectCommand import ResizeOglObjectCommand
+from org.pyut.commands.ResizeOglObjectCommand import ShapeGeometry
+
 from org.pyut.experimental.GraphicalHandler import GraphicalHandler
 
 from org.pyut.general.Globals import _
+from org.pyut.general.IDRegistry import IDRegistry
 
 from org.pyut.ui.UmlFrameShapeHandler import UmlFrameShapeHandler
 
@@ -37,6 +52,8 @@ from org.pyut.ui.UmlFrameShapeHandler import UmlFrameShapeHandler
 DEFAULT_WIDTH = 3000
 A4_FACTOR:    float = 1.41
 
+DragStart = Tuple[OglObject, bool, ShapeGeometry]     # shape, resized, geometry before the drag
+
 
 class UmlFrame(UmlFrameShapeHandler):
     """
@@ -72,6 +89,12 @@ class UmlFrame(UmlFrameShapeHandler):
         self._frame = frame
         self._history = HistoryManager(self)
 
+        self._umlObjectIndex: Dict[int, Union[OglObject, OglLink]] = {}
+        self._dragStarts:     Dict[int, DragStart]                 = {}
+
+        self._indexedShapes:       Tuple = cast(Tuple, None)   # the GetShapes() result the index was built from
+        self._indexedReleaseCount: int   = -1
+
         # Close event
         self.Bind(EVT_CLOSE, self.evtClose)
         self.Bind(EVT_PAINT, self.OnPaint)
@@ -137,7 +160,7 @@ class UmlFrame(UmlFrameShapeHandler):
         """
 
         if self._ctrl.actionWaiting():
-            x, y = self.CalcUnscrolledPosition(event.GetX(), event.GetY())
+            x, y = self.CalcDiagramPosition(event.GetX(), event.GetY())
             skip = self._ctrl.doAction(x, y)
 
             if self._ctrl.getCurrentAction() == ACTION_ZOOM_IN:
@@ -166,6 +189,62 @@ class UmlFrame(UmlFrameShapeHandler):
 
             DiagramFrame.OnLeftUp(self, event)
 
+    def _BeginDrag(self):
+        """
+        Override DiagramFrame._BeginDrag;  Remember where the dragged UML objects are so
+        that the drag can be undone
+        """
+        super()._BeginDrag()
+
+        self._dragStarts = {}
+        for shape in self._dragShapes:
+            resized: bool = isinstance(shape, SizerShape)
+            if resized is True:
+                shape = shape.GetParent()
+            if isinstance(shape, OglObject):
+                x, y = shape.GetPosition()
+                w, h = shape.GetSize()
+                self._dragStarts[id(shape)] = (shape, resized, [x, y, w, h])
+
+    def _EndDrag(self):
+        """
+        Override DiagramFrame._EndDrag;  Add the moves and resizes of the drag to the history
+        """
+        super()._EndDrag()
+
+        if len(self._dragStarts) > 0:
+            self._recordDrag()
+            self._dragStarts = {}
+
+    def _recordDrag(self):
+        """
+        The moved shapes all moved by the same amount and become a single command
+        """
+        movedIds: List[int]     = []
+        commands: List[Command] = []
+        deltaX:   float         = 0.0
+        deltaY:   float         = 0.0
+        for shape, resized, startGeometry in self._dragStarts.values():
+            x, y = shape.GetPosition()
+            w, h = shape.GetSize()
+            shapeId: int = shape.getPyutObject().getId()
+            if resized is True:
+                if [x, y, w, h] != startGeometry:
+                    commands.append(ResizeOglObjectCommand(shapeId, startGeometry, [x, y, w, h]))
+            elif [x, y] != startGeometry[:2]:
+                movedIds.append(shapeId)
+                deltaX, deltaY = x - startGeometry[0], y - startGeometry[1]
+
+        if len(movedIds) > 0:
+            commands.insert(0, MoveOglObjectsCommand(movedIds, deltaX, deltaY))
+
+        if len(commands) > 0:
+            # the shapes have already moved;  The group is not executed
+            group: CommandGroup = CommandGroup("Move UML object(s)" if len(movedIds) > 0 else "Resize UML object(s)")
+            for command in commands:
+                group.addCommand(command)
+            self._history.addCommandGroup(group)
+
     def OnLeftDClick(self, event: MouseEvent):
         """
         Manage a left double click mouse event.
@@ -174,10 +253,19 @@ class UmlFrame(UmlFrameShapeHandler):
         @since 1.22
         @author L. Burgbacher <lb@alawa.ch>
         """
-        x, y = self.CalcUnscrolledPosition(event.GetX(), event.GetY())
+        x, y = self.CalcDiagramPosition(event.GetX(), event.GetY())
         self._ctrl.editObject(x, y)
         DiagramFrame.OnLeftDClick(self, event)
 
+    def _applyZoom(self, zoomFactor: float, centerX: float, centerY: float):
+        """
+        Override;  The cached class drawings are for the previous zoom
+        """
+        for umlObject in self.getUmlObjects():
+            if isinstance(umlObject, OglClass):
+                umlObject.invalidateRenderCache()
+        super()._applyZoom(zoomFactor, centerX, centerY)
+
     def newDiagram(self):
         """
         Remove all shapes, get a brand new empty diagram.
@@ -289,13 +377,31 @@ class UmlFrame(UmlFrameShapeHandler):
 
         @return the uml object that has the specified id. If there is no
         matching object, None is returned.
+
+        The lookup is served from an ID index.  The index is rebuilt only when a shape was
+        added or removed, or a model object changed its ID, since it was last built;  So a
+        miss on an unchanged diagram costs nothing
+        """
+        shapes: Tuple = self.GetDiagram().GetShapes()
+        if shapes is not self._indexedShapes or IDRegistry().releaseCount != self._indexedReleaseCount:
+            self._rebuildUmlObjectIndex(shapes)
+
+        return self._umlObjectIndex.get(objectId)
+
+    def _rebuildUmlObjectIndex(self, shapes: Tuple):
         """
+        Index every UML object in the diagram by its model ID;  The first shape wins on duplicates
 
-        for shape in self.GetDiagram().GetShapes():
+        Args:
+            shapes: The current diagram shapes
+        """
+        self._umlObjectIndex = {}
+        for shape in shapes:
             if isinstance(shape, (OglObject, OglLink)):
-                if shape.getPyutObject().getId() == objectId:
-                    return shape
-        return None
+                self._umlObjectIndex.setdefault(shape.getPyutObject().getId(), shape)
+
+        self._indexedShapes       = shapes
+        self._indexedReleaseCount = IDRegistry().releaseCount
 
     def getHistory(self):
         """
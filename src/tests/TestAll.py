@@ -108,6 +108,7 @@ class TestAll:
         dtdModules:             List[str] = glob('tests/org/pyut/plugins/dtd/Test*.py')
         gmlModules:             List[str] = glob('tests/org/pyut/plugins/gml/Test*.py')
         iopythonSupportModules: List[str] = glob('tests/org/pyut/plugins/iopythonsupport/Test*.py')
+        nativeImageModules:     List[str] = glob('tests/org/pyut/plugins/io/nativeimagesupport/Test*.py')
         xsdModules:             List[str] = glob('tests/org/pyut/plugins/xsd/Test*.py')
 
         preferencesModules: List[str] = glob('tests/org/pyut/preferences/Test*.py')
@@ -116,7 +117,7 @@ class TestAll:
 
         allModules: List[str] = fModules + \
             pyutModules + commandsModules + \
-            dtdModules + errorControllerModules + generalModules + gmlModules + historyModules + iopythonSupportModules + xsdModules + \
+            dtdModules + errorControllerModules + generalModules + gmlModules + historyModules + iopythonSupportModules + nativeImageModules + xsdModules + \
             miniOglModules + modelModules + oglModules + persistenceModules + converterModules + pluginModules + \
             preferencesModules
 
@@ -0,0 +1,92 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+from unittest.mock import MagicMock
+
+from tests.TestBase import TestBase
+
+from org.pyut.commands.CommandGroup import CommandGroup
+from org.pyut.commands.MoveOglObjectsCommand import MoveOglObjectsCommand
+
+from org.pyut.history.HistoryUtils import CommandRecord
+
+
+class TestMoveOglObjectsCommand(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestMoveOglObjectsCommand.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestMoveOglObjectsCommand.clsLogger
+
+    def testSerializeRoundTrip(self):
+
+        command: MoveOglObjectsCommand = MoveOglObjectsCommand([1, 2, 3], 10.0, -5.0)
+        record:  CommandRecord         = command.serialize()
+
+        restored: MoveOglObjectsCommand = MoveOglObjectsCommand()
+        restored.deserialize(record)
+
+        self.assertEqual([1, 2, 3], restored.shapeIds, 'IDs mismatch')
+        self.assertEqual((10.0, -5.0), restored.delta, 'Delta mismatch')
+
+    def testCoalesceSameShapes(self):
+
+        command: MoveOglObjectsCommand = MoveOglObjectsCommand([1, 2], 10.0, 0.0)
+
+        self.assertTrue(command.coalesce(MoveOglObjectsCommand([2, 1], 5.0, 5.0)), 'Should coalesce')
+        self.assertEqual((15.0, 5.0), command.delta, 'Deltas should add up')
+
+    def testNoCoalesceOtherShapes(self):
+
+        command: MoveOglObjectsCommand = MoveOglObjectsCommand([1, 2], 10.0, 0.0)
+
+        self.assertFalse(command.coalesce(MoveOglObjectsCommand([1], 5.0, 5.0)), 'Should not coalesce')
+        self.assertEqual((10.0, 0.0), command.delta, 'Delta should not change')
+
+    def testNoCoalesceLaterMove(self):
+
+        command:   MoveOglObjectsCommand = MoveOglObjectsCommand([1], 10.0, 0.0)
+        laterMove: MoveOglObjectsCommand = MoveOglObjectsCommand([1], 5.0, 5.0)
+        laterMove._timeStamp = command._timeStamp + MoveOglObjectsCommand.COALESCE_SECONDS + 1
+
+        self.assertFalse(command.coalesce(laterMove), 'Moves too far apart should not coalesce')
+
+    def testUndoMovesBack(self):
+
+        shape: MagicMock = MagicMock()
+        shape.GetPosition = MagicMock(return_value=(110.0, 95.0))
+
+        umlFrame: MagicMock = MagicMock()
+        umlFrame.getUmlObjectById = MagicMock(return_value=shape)
+
+        group: CommandGroup = CommandGroup('Move')
+        group.setHistory(MagicMock(getFrame=MagicMock(return_value=umlFrame)))
+
+        command: MoveOglObjectsCommand = MoveOglObjectsCommand([1], 10.0, -5.0)
+        group.addCommand(command)
+        command.undo()
+
+        shape.SetPosition.assert_called_once_with(100.0, 100.0)
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestMoveOglObjectsCommand))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
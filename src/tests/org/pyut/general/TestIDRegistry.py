@@ -0,0 +1,95 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.general.IDRegistry import IDRegistry
+
+
+class TestIDRegistry(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestIDRegistry.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger     = TestIDRegistry.clsLogger
+        self._registry: IDRegistry = IDRegistry()
+        self._registry.scope = self._registry.newScope()
+
+    def tearDown(self):
+        self._registry.removeScope(self._registry.scope)
+
+    def testIsSingleton(self):
+        self.assertIs(self._registry, IDRegistry(), 'Should be the same instance')
+
+    def testAllocateIncrements(self):
+
+        firstId:  int = self._registry.allocate()
+        secondId: int = self._registry.allocate()
+
+        self.assertEqual(firstId + 1, secondId, 'IDs should be handed out in order')
+
+    def testAllocateSkipsReserved(self):
+
+        self._registry.reserve(0)
+        self._registry.reserve(1)
+
+        self.assertEqual(2, self._registry.allocate(), 'Reserved IDs must be skipped')
+
+    def testRelease(self):
+
+        theId: int = self._registry.allocate()
+        self._registry.release(theId)
+
+        self.assertFalse(self._registry.isUsed(theId), 'Should no longer be in use')
+
+    def testReleaseCounted(self):
+
+        releaseCount: int = self._registry.releaseCount
+        self._registry.release(self._registry.allocate())
+
+        self.assertEqual(releaseCount + 1, self._registry.releaseCount, 'The release should be counted')
+
+    def testScopesAreIndependent(self):
+
+        firstScope:  int = self._registry.scope
+        secondScope: int = self._registry.newScope()
+
+        self._registry.reserve(42)
+        self._registry.scope = secondScope
+        self.assertFalse(self._registry.isUsed(42), 'The ID belongs to the other scope')
+
+        self._registry.removeScope(secondScope)
+        self._registry.scope = firstScope
+        self.assertTrue(self._registry.isUsed(42), 'The ID should still be in its own scope')
+
+    def testRemoveCurrentScopeRevertsToDefault(self):
+
+        scope: int = self._registry.newScope()
+        self._registry.scope = scope
+        self._registry.removeScope(scope)
+
+        self.assertEqual(IDRegistry.DEFAULT_SCOPE, self._registry.scope, 'Should revert to the default scope')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestIDRegistry))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,81 @@
+from logging import Logger
+from logging import getLogger
+
+from time import perf_counter
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.general.Tracer import TraceSubsystem
+from org.pyut.general.Tracer import Tracer
+
+
+class TestTracer(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestTracer.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:  Logger = TestTracer.clsLogger
+        self._tracer: Tracer = Tracer()
+        self._tracer.reset()
+
+    def tearDown(self):
+        for subsystem in TraceSubsystem:
+            self._tracer.setEnabled(subsystem, False)
+        self._tracer.reset()
+
+    def testDisabledByDefault(self):
+        for subsystem in TraceSubsystem:
+            self.assertFalse(self._tracer.isEnabled(subsystem), f'{subsystem} should start disabled')
+
+    def testEnableSetsClassFlag(self):
+
+        self._tracer.setEnabled(TraceSubsystem.OGL, True)
+
+        self.assertTrue(Tracer.ogl, 'The hot paths test the class attribute')
+        self.assertFalse(Tracer.miniogl, 'Other subsystems are unchanged')
+
+    def testCount(self):
+
+        self._tracer.count('ogl.classDraw')
+        self._tracer.count('ogl.classDraw')
+
+        self.assertEqual([('ogl.classDraw', 2, 0.0)], self._tracer.statistics(), 'Untimed trace points report no time')
+
+    def testRecord(self):
+
+        self._tracer.record('miniogl.draw', perf_counter())
+
+        name, count, seconds = self._tracer.statistics()[0]
+        self.assertEqual(1, count, 'Should be counted')
+        self.assertGreaterEqual(seconds, 0.0, 'Should be timed')
+
+    def testReset(self):
+
+        self._tracer.count('miniogl.hitTest')
+        self._tracer.reset()
+
+        self.assertEqual([], self._tracer.statistics(), 'Everything should be zeroed')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestTracer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
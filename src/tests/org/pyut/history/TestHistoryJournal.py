@@ -0,0 +1,228 @@
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+
+from tempfile import gettempdir
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.history.HistoryJournal import HistoryJournal
+from org.pyut.history.HistoryJournal import JournalRecovery
+
+
+class TestHistoryJournal(TestBase):
+    """
+    """
+    JOURNAL_FILE_NAME: str = osPath.join(gettempdir(), 'pyutTestHistoryJournal')
+
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestHistoryJournal.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:   Logger         = TestHistoryJournal.clsLogger
+        self._journal: HistoryJournal = HistoryJournal(TestHistoryJournal.JOURNAL_FILE_NAME, writeBehind=True)
+
+    def tearDown(self):
+        self._journal.close(remove=True)
+
+    def testReadGroupByPosition(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.appendGroup(2, 'group2')
+
+        self.assertEqual('group1', self._journal.readGroup(1), 'Wrong group read back')
+        self.assertEqual(3, self._journal.groupCount, 'Group count mismatch')
+
+    def testAppendAfterUndoDropsRedoGroups(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.appendGroup(2, 'group2')
+        self._journal.appendUndo()
+        self._journal.appendUndo()
+        self._journal.appendGroup(1, 'group3')
+
+        self.assertEqual(2, self._journal.groupCount, 'Undone groups should be dropped from the index')
+        self.assertEqual('group3', self._journal.readGroup(1), 'Wrong group read back')
+
+    def testReplaceLastGroup(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.replaceLastGroup('group1and2')
+
+        self.assertEqual(2, self._journal.groupCount, 'Replacing should not add a group')
+        self.assertEqual('group1and2', self._journal.readGroup(1), 'Wrong group read back')
+
+    def testWriteBehindBuffers(self):
+
+        self._journal.appendGroup(0, 'group0')
+
+        self.assertEqual(0, osPath.getsize(TestHistoryJournal.JOURNAL_FILE_NAME), 'Record should still be pending')
+        self._journal.flush()
+        self.assertEqual(self._journal.size, osPath.getsize(TestHistoryJournal.JOURNAL_FILE_NAME), 'Flush should write pending records')
+
+    def testWriteThrough(self):
+
+        self._journal.close(remove=True)
+        self._journal = HistoryJournal(TestHistoryJournal.JOURNAL_FILE_NAME, writeBehind=False)
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendUndo()
+
+        self.assertEqual(len(b'Ggroup0\nU\n'), osPath.getsize(TestHistoryJournal.JOURNAL_FILE_NAME), 'Records should be written immediately')
+
+    def testEvictGroups(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.appendGroup(2, 'group2')
+        self._journal.evictGroups(2)
+
+        self.assertEqual(1, self._journal.groupCount, 'Evicted groups should be dropped from the index')
+        self.assertEqual('group2', self._journal.readGroup(0), 'Wrong group read back')
+
+    def testCompactKeepsLiveGroups(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.appendGroup(2, 'group2')
+        self._journal.evictGroups(1)
+        self._journal.appendUndo()
+        self._journal.compact()
+
+        with open(TestHistoryJournal.JOURNAL_FILE_NAME, 'rb') as journalFile:
+            self.assertEqual(b'Ggroup1\nGgroup2\nU\n', journalFile.read(), 'Compacted journal mismatch')
+        self.assertEqual('group2', self._journal.readGroup(1), 'Wrong group read back')
+
+    def testCompactWhenWasteful(self):
+
+        for replacement in range(200):
+            self._journal.appendGroup(0, f'{replacement:04}' * 250)
+
+        self.assertGreater(self._journal.compactionCount, 0, 'Journal should have compacted itself')
+        self.assertLessEqual(self._journal.size, HistoryJournal.COMPACT_RATIO * self._journal.liveSize + HistoryJournal.COMPACT_MINIMUM_BYTES,
+                             'Journal is bigger than its bound')
+        self.assertEqual('0199' * 250, self._journal.readGroup(0), 'Wrong group read back')
+
+    def testRecoverSinceSave(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.markSaved('saved')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.appendGroup(2, 'group2')
+        self._journal.flush()
+
+        recovery: JournalRecovery = HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME)
+
+        self.assertEqual('saved', recovery.savePoint, 'Save point mismatch')
+        self.assertEqual([], recovery.groupsToUndo, 'Nothing saved was undone')
+        self.assertEqual(['group1', 'group2'], recovery.groupsToRedo, 'Wrong groups to redo')
+
+    def testRecoverUndoneSavedGroups(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.markSaved('saved')
+        self._journal.appendUndo()
+        self._journal.appendUndo()
+        self._journal.appendGroup(0, 'group2')
+        self._journal.flush()
+
+        recovery: JournalRecovery = HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME)
+
+        self.assertEqual(['group1', 'group0'], recovery.groupsToUndo, 'Wrong groups to undo')
+        self.assertEqual(['group2'], recovery.groupsToRedo, 'Wrong groups to redo')
+
+    def testRecoverJournalNeverClosed(self):
+
+        self._journal.markSaved('saved')
+        for groupNumber in range(20):
+            self._journal.appendGroup(groupNumber, f'group{groupNumber}')
+
+        recovery: JournalRecovery = HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME)
+
+        self.assertEqual([f'group{groupNumber}' for groupNumber in range(20)], recovery.groupsToRedo, 'The edits since the save should be on disk')
+
+    def testRecoverWithoutSavePoint(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.flush()
+
+        self.assertIsNone(HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME), 'A journal never saved cannot be recovered')
+
+    def testCompactKeepsSavePoint(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.markSaved('saved')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.appendGroup(2, 'group2')
+        self._journal.evictGroups(1)
+        self._journal.compact()
+
+        with open(TestHistoryJournal.JOURNAL_FILE_NAME, 'rb') as journalFile:
+            self.assertEqual(b'Ssaved\nGgroup1\nGgroup2\n', journalFile.read(), 'Compacted journal mismatch')
+
+        recovery: JournalRecovery = HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME)
+        self.assertEqual(['group1', 'group2'], recovery.groupsToRedo, 'Wrong groups to redo')
+
+    def testCompactKeepsUndoneSavedGroups(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.markSaved('saved')
+        self._journal.appendUndo()
+        self._journal.appendUndo()
+        self._journal.appendGroup(0, 'group2')
+        self._journal.compact()
+
+        recovery: JournalRecovery = HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME)
+        self.assertEqual('saved', recovery.savePoint, 'Save point should survive compaction')
+        self.assertEqual(['group1', 'group0'], recovery.groupsToUndo, 'Wrong groups to undo')
+        self.assertEqual(['group2'], recovery.groupsToRedo, 'Wrong groups to redo')
+        self.assertEqual('group2', self._journal.readGroup(0), 'Wrong group read back')
+
+    def testCompactKeepsReplacedSavedGroup(self):
+
+        self._journal.appendGroup(0, 'group0')
+        self._journal.markSaved('saved')
+        self._journal.replaceLastGroup('group0and1')
+        self._journal.compact()
+
+        recovery: JournalRecovery = HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME)
+        self.assertEqual(['group0'], recovery.groupsToUndo, 'Wrong groups to undo')
+        self.assertEqual(['group0and1'], recovery.groupsToRedo, 'Wrong groups to redo')
+
+    def testCompactDropsUnsavedEvictions(self):
+
+        self._journal.markSaved('saved')
+        self._journal.appendGroup(0, 'group0')
+        self._journal.appendGroup(1, 'group1')
+        self._journal.evictGroups(1)
+        self._journal.compact()
+
+        self.assertIsNone(HistoryJournal.recover(TestHistoryJournal.JOURNAL_FILE_NAME), 'The evicted group cannot be recovered')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestHistoryJournal))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -1,9 +1,13 @@
+from typing import List
 from typing import cast
 
 from sys import path as sysPath
 
 from unittest import main as unitTestMain
 from unittest import TestSuite
+from unittest.mock import MagicMock
+from unittest.mock import PropertyMock
+from unittest.mock import patch
 
 from logging import Logger
 from logging import getLogger
@@ -14,8 +18,12 @@ from org.pyut.PyutUtils import PyutUtils
 
 from org.pyut.history.HistoryManager import HistoryManager
 
+from org.pyut.preferences.PyutPreferences import PyutPreferences
+
 from org.pyut.commands.CommandGroup import CommandGroup
 
+from org.pyut.commands.MoveOglObjectsCommand import MoveOglObjectsCommand
+
 from tests.testclass.PrintCommand import PrintCommand
 
 
@@ -122,6 +130,131 @@ class TestHistory(TestBase):
 
         self.logger.info(f'Nothing left to undo: {self.historyManager.groupUndoIndex}')
 
+    def testRedoAfterUndo(self):
+
+        for comment in [TestHistory.COMMAND_GROUP0_STR, TestHistory.COMMAND_GROUP1_STR]:
+            printCommand: PrintCommand = PrintCommand()
+            printCommand.setMessage(comment)
+            commandGroup: CommandGroup = CommandGroup(comment)
+            commandGroup.addCommand(printCommand)
+            self.historyManager.addCommandGroup(commandGroup)
+
+        self.historyManager.undo()
+        self.assertTrue(self.historyManager.isRedoPossible(), 'Should be able to redo')
+        self.assertEqual(TestHistory.COMMAND_GROUP1_STR, self.historyManager.getCommandGroupToRedo().getComment(), 'Wrong group to redo')
+        self.assertEqual(TestHistory.COMMAND_GROUP0_STR, self.historyManager.getCommandGroupToUndo().getComment(), 'Wrong group to undo')
+
+        self.historyManager.redo()
+        self._checkUndoIndex(expectedGroupUndoIndex=1)
+        self.assertFalse(self.historyManager.isRedoPossible(), 'Nothing left to redo')
+
+    def testCoalesceMoves(self):
+
+        for deltaX in [10.0, 20.0]:
+            moveGroup: CommandGroup = CommandGroup('move')
+            moveGroup.addCommand(MoveOglObjectsCommand([1, 2], deltaX, 0.0))
+            self.historyManager.addCommandGroup(moveGroup)
+
+        self.assertEqual(1, self.historyManager.groupCount, 'Moves should coalesce')
+        moveCommand: MoveOglObjectsCommand = self.historyManager.getCommandGroupToUndo()._commands[0]
+        self.assertEqual((30.0, 0.0), moveCommand.delta, 'Coalesced delta mismatch')
+
+    def testNoCoalesceAfterUndo(self):
+
+        shape: MagicMock = MagicMock()
+        shape.GetPosition = MagicMock(return_value=(0.0, 0.0))
+        umlFrame: MagicMock = MagicMock()
+        umlFrame.getUmlObjectById = MagicMock(return_value=shape)
+
+        self.historyManager = HistoryManager(umlFrame)
+        for deltaX in [10.0, 20.0]:
+            moveGroup: CommandGroup = CommandGroup('move')
+            moveGroup.addCommand(MoveOglObjectsCommand([1, 2], deltaX, 0.0))
+            self.historyManager.addCommandGroup(moveGroup)
+            if deltaX == 10.0:
+                self.historyManager.undo()
+
+        self.assertEqual(1, self.historyManager.groupCount, 'The undone move should be replaced')
+        moveCommand: MoveOglObjectsCommand = self.historyManager.getCommandGroupToUndo()._commands[0]
+        self.assertEqual((20.0, 0.0), moveCommand.delta, 'An undone move must not coalesce')
+
+    def testNoCoalesceAfterSave(self):
+
+        for deltaX in [10.0, 20.0]:
+            moveGroup: CommandGroup = CommandGroup('move')
+            moveGroup.addCommand(MoveOglObjectsCommand([1, 2], deltaX, 0.0))
+            self.historyManager.addCommandGroup(moveGroup)
+            if deltaX == 10.0:
+                self.historyManager.markSaved('project.put', 0)
+
+        self.assertEqual(2, self.historyManager.groupCount, 'A saved move must not coalesce')
+
+    def testCompressOlderGroups(self):
+
+        groupCount: int = HistoryManager.UNCOMPRESSED_GROUPS + 2
+        for groupNumber in range(groupCount):
+            self._addPrintGroup(f'group{groupNumber}', 'a compressible message ' * 20)
+
+        self.assertEqual(2, self.historyManager.compressedCount, 'Only the older groups should be compressed')
+        for _ in range(groupCount - 1):
+            self.historyManager.undo()
+        self.assertEqual('group0', self.historyManager.getCommandGroupToUndo().getComment(), 'Compressed group not read back')
+
+    def testEvictOverGroupBudget(self):
+
+        with patch.object(PyutPreferences, 'historyMaximumGroups', new_callable=PropertyMock, return_value=3), \
+                patch.object(PyutPreferences, 'historyMaximumKilobytes', new_callable=PropertyMock, return_value=0):
+            for groupNumber in range(5):
+                self._addPrintGroup(f'group{groupNumber}', f'message{groupNumber}')
+
+        self.assertEqual(3, self.historyManager.groupCount, 'Oldest groups should be evicted')
+        self.assertEqual(2, self.historyManager.evictedCount, 'Evicted count mismatch')
+        self.assertEqual(3, self.historyManager.journal.groupCount, 'Journal index out of step')
+        self._checkUndoIndex(expectedGroupUndoIndex=2)
+
+        self.historyManager.undo()
+        self.historyManager.undo()
+        self.assertEqual('group2', self.historyManager.getCommandGroupToUndo().getComment(), 'Wrong oldest group')
+
+    def testEvictOverByteBudget(self):
+
+        with patch.object(PyutPreferences, 'historyMaximumGroups', new_callable=PropertyMock, return_value=0), \
+                patch.object(PyutPreferences, 'historyMaximumKilobytes', new_callable=PropertyMock, return_value=1):
+            for groupNumber in range(5):
+                self._addPrintGroup(f'group{groupNumber}', f'{groupNumber}' * 400)
+
+        self.assertLessEqual(self.historyManager.byteCount, 1024, 'History is over its byte budget')
+        self.assertGreater(self.historyManager.evictedCount, 0, 'Oldest groups should be evicted')
+        self.assertEqual('group4', self.historyManager.getCommandGroupToUndo().getComment(), 'Last group must be kept')
+
+    def testReplayRefreshesOnce(self):
+
+        umlFrame: MagicMock = MagicMock()
+        self.historyManager = HistoryManager(umlFrame)
+
+        serialGroups: List[str] = []
+        for comment in [TestHistory.COMMAND_GROUP0_STR, TestHistory.COMMAND_GROUP1_STR]:
+            printCommand: PrintCommand = PrintCommand()
+            printCommand.setMessage(comment)
+            commandGroup: CommandGroup = CommandGroup(comment)
+            commandGroup.addCommand(printCommand)
+            serialGroups.append(commandGroup.serialize())
+
+        self.historyManager.replay([], serialGroups)
+
+        umlFrame.SuspendRefresh.assert_called_once()
+        umlFrame.ResumeRefresh.assert_called_once()
+        self.assertEqual(2, self.historyManager.groupCount, 'Replayed groups should be in the history')
+        self.assertEqual(TestHistory.COMMAND_GROUP1_STR, self.historyManager.getCommandGroupToUndo().getComment(), 'Wrong group to undo')
+
+    def _addPrintGroup(self, comment: str, message: str):
+
+        printCommand: PrintCommand = PrintCommand()
+        printCommand.setMessage(message)
+        commandGroup: CommandGroup = CommandGroup(comment)
+        commandGroup.addCommand(printCommand)
+        self.historyManager.addCommandGroup(commandGroup)
+
     def _checkUndoIndex(self, expectedGroupUndoIndex: int):
 
         actualGroupUndoIndex: int = self.historyManager.groupUndoIndex
@@ -0,0 +1,116 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from os import getpid
+from os import listdir
+from os import path as osPath
+
+from subprocess import Popen
+
+from sys import executable
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.history.HistoryJournal import HistoryJournal
+from org.pyut.history.HistoryRecovery import HistoryRecovery
+from org.pyut.history.HistoryRecovery import OrphanedJournal
+
+from org.pyut.history.HistoryUtils import HISTORY_FILE_ID_SEPARATOR
+from org.pyut.history.HistoryUtils import HISTORY_FILE_NAME
+from org.pyut.history.HistoryUtils import encodeSavePoint
+
+
+class TestHistoryRecovery(TestBase):
+    """
+    """
+    PROJECT_FILE_NAME: str = 'project.put'
+
+    clsLogger: Logger = None
+    deadProcessId: int = 0
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestHistoryRecovery.clsLogger = getLogger(__name__)
+
+        process: Popen = Popen([executable, '-c', 'pass'])
+        process.wait()
+        TestHistoryRecovery.deadProcessId = process.pid
+
+    def setUp(self):
+        self.logger:     Logger             = TestHistoryRecovery.clsLogger
+        self._directory: TemporaryDirectory = TemporaryDirectory()
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def testFindOrphanedJournal(self):
+
+        self._writeJournal(TestHistoryRecovery.deadProcessId, saved=True)
+
+        orphans: List[OrphanedJournal] = HistoryRecovery(self._directory.name).findOrphanedJournals()
+
+        self.assertEqual(1, len(orphans), 'The journal should be orphaned')
+        self.assertEqual(TestHistoryRecovery.PROJECT_FILE_NAME, orphans[0].projectFileName, 'Project mismatch')
+        self.assertEqual(1, orphans[0].documentIndex, 'Document mismatch')
+        self.assertEqual(['group1'], orphans[0].recovery.groupsToRedo, 'Wrong groups to redo')
+
+    def testIgnoreOwnJournals(self):
+
+        self._writeJournal(getpid(), saved=True)
+
+        self.assertEqual([], HistoryRecovery(self._directory.name).findOrphanedJournals(), 'The journal of this process is not orphaned')
+
+    def testIsRunning(self):
+
+        self.assertTrue(HistoryRecovery._isRunning(getpid()), 'This process is running')
+        self.assertFalse(HistoryRecovery._isRunning(TestHistoryRecovery.deadProcessId), 'The process has exited')
+
+    def testRemoveJournalNeverSaved(self):
+
+        self._writeJournal(TestHistoryRecovery.deadProcessId, saved=False)
+
+        self.assertEqual([], HistoryRecovery(self._directory.name).findOrphanedJournals(), 'Nothing to recover')
+        self.assertEqual([], listdir(self._directory.name), 'The journal should be removed')
+
+    def testDiscard(self):
+
+        self._writeJournal(TestHistoryRecovery.deadProcessId, saved=True)
+        recovery: HistoryRecovery = HistoryRecovery(self._directory.name)
+
+        recovery.discard(recovery.findOrphanedJournals()[0])
+
+        self.assertEqual([], listdir(self._directory.name), 'The journal should be removed')
+
+    def _writeJournal(self, processId: int, saved: bool):
+
+        name:    str            = f'{HISTORY_FILE_NAME}{processId}{HISTORY_FILE_ID_SEPARATOR}0'
+        journal: HistoryJournal = HistoryJournal(osPath.join(self._directory.name, name))
+
+        journal.appendGroup(0, 'group0')
+        if saved is True:
+            journal.markSaved(encodeSavePoint(TestHistoryRecovery.PROJECT_FILE_NAME, 1))
+        journal.appendGroup(1, 'group1')
+        journal.close(remove=False)
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestHistoryRecovery))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
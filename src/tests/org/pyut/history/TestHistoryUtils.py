@@ -0,0 +1,73 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.history.HistoryUtils import CommandRecord
+from org.pyut.history.HistoryUtils import decodeGroup
+from org.pyut.history.HistoryUtils import encodeGroup
+
+
+class TestHistoryUtils(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestHistoryUtils.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestHistoryUtils.clsLogger
+
+    def testRoundTrip(self):
+
+        records: List[CommandRecord] = [
+            {'module': 'tests.testclass.PrintCommand', 'class': 'PrintCommand', 'message': 'pc0a'},
+            {'module': 'tests.testclass.PrintCommand', 'class': 'PrintCommand', 'position': [39.0, 31.0], 'shapeId': 2}
+        ]
+        comment, decodedRecords = decodeGroup(encodeGroup('cg0', records))
+
+        self.assertEqual('cg0', comment, 'Comment mismatch')
+        self.assertEqual(records, decodedRecords, 'Records mismatch')
+
+    def testSingleLine(self):
+
+        records: List[CommandRecord] = [{'classDescription': 'First line\nSecond line'}]
+        serializedGroup: str = encodeGroup('multi\nline', records)
+
+        self.assertNotIn('\n', serializedGroup, 'A group must fit on one journal line')
+
+        comment, decodedRecords = decodeGroup(serializedGroup)
+        self.assertEqual('multi\nline', comment, 'Comment mismatch')
+        self.assertEqual('First line\nSecond line', decodedRecords[0]['classDescription'], 'Line breaks lost')
+
+    def testFormerControlSequencesAreNotSpecial(self):
+
+        message: str = '<BEGIN_COMMAND><message=\\>'
+        records: List[CommandRecord] = [{'message': message}]
+
+        comment, decodedRecords = decodeGroup(encodeGroup('', records))
+
+        self.assertEqual(message, decodedRecords[0]['message'], 'Value should come back verbatim')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestHistoryUtils))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
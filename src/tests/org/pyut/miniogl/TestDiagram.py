@@ -0,0 +1,131 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import MagicMock
+
+from wx import App
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.Diagram import Diagram
+from org.pyut.miniogl.Shape import Shape
+
+
+class TestDiagram(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagram.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:  Logger      = TestDiagram.clsLogger
+        self.app:     App         = App()
+        self.diagram: Diagram     = Diagram(MagicMock())
+        self.shapes:  List[Shape] = [Shape(x=10 * i, y=10 * i) for i in range(3)]
+
+        for shape in self.shapes:
+            self.diagram.AddShape(shape, withModelUpdate=False)
+
+    def tearDown(self):
+        del self.app
+
+    def testGetShapesInDisplayOrder(self):
+        self.assertEqual(tuple(self.shapes), self.diagram.GetShapes(), 'Should be in the order added')
+
+    def testGetShapesIsShared(self):
+        self.assertIs(self.diagram.GetShapes(), self.diagram.GetShapes(), 'Should not copy when nothing changed')
+
+    def testAddShapeTwice(self):
+
+        self.diagram.AddShape(self.shapes[0], withModelUpdate=False)
+        self.assertEqual(len(self.shapes), self.diagram.GetShapeCount(), 'A shape is only added once')
+
+    def testRemoveShape(self):
+
+        before = self.diagram.GetShapes()
+        self.diagram.RemoveShape(self.shapes[1])
+
+        self.assertFalse(self.diagram.HasShape(self.shapes[1]), 'Should be gone')
+        self.assertEqual((self.shapes[0], self.shapes[2]), self.diagram.GetShapes(), 'Wrong shapes left')
+        self.assertEqual(tuple(self.shapes), before, 'An earlier result must not change')
+
+    def testMoveToFront(self):
+
+        self.diagram.MoveToFront(self.shapes[0])
+        self.assertEqual((self.shapes[1], self.shapes[2], self.shapes[0]), self.diagram.GetShapes(), 'Should be drawn last')
+
+    def testMoveToBack(self):
+
+        self.diagram.MoveToBack(self.shapes[2])
+        self.assertEqual((self.shapes[2], self.shapes[0], self.shapes[1]), self.diagram.GetShapes(), 'Should be drawn first')
+
+    def testSelectionTracked(self):
+
+        self.shapes[1].SetSelected(True)
+        self.assertEqual([self.shapes[1]], self.diagram.GetActiveShapes(), 'Selected shape not tracked')
+
+        self.shapes[1].SetSelected(False)
+        self.assertEqual([], self.diagram.GetActiveShapes(), 'Deselected shape still tracked')
+
+    def testMovingTracked(self):
+
+        self.shapes[2].SetMoving(True)
+        self.assertEqual([self.shapes[2]], self.diagram.GetActiveShapes(), 'Moving shape not tracked')
+
+    def testRemovedShapeNotActive(self):
+
+        self.shapes[0].SetSelected(True)
+        self.diagram.RemoveShape(self.shapes[0])
+        self.assertEqual([], self.diagram.GetActiveShapes(), 'A removed shape is not active')
+
+    def testInvalidateShapeTellsDependents(self):
+
+        child: Shape = Shape()
+        child._InvalidateGeometry = MagicMock()
+        self.shapes[0].AppendChild(child)
+
+        self.diagram.InvalidateShape(self.shapes[0])
+        self.diagram.InvalidateShape(self.shapes[0])
+        self.assertEqual(2, child._InvalidateGeometry.call_count, 'Dependents must forget cached geometry on every move')
+
+    def testDamageListenerGetsTakenRegions(self):
+
+        listener: MagicMock = MagicMock()
+        self.diagram.AddDamageListener(listener)
+
+        regions = self.diagram.TakeDamagedRegions()
+        listener.assert_called_once_with(regions)
+
+    def testRemovedDamageListenerNotCalled(self):
+
+        listener: MagicMock = MagicMock()
+        self.diagram.AddDamageListener(listener)
+        self.diagram.RemoveDamageListener(listener)
+        self.diagram.RemoveDamageListener(listener)     # unknown listeners are ignored
+
+        self.diagram.TakeDamagedRegions()
+        listener.assert_not_called()
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagram))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,74 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.DrawingRecorder import DrawingRecorder
+
+
+class TestDrawingRecorder(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDrawingRecorder.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger = TestDrawingRecorder.clsLogger
+        self._mockedDC: Mock   = Mock()
+        self._mockedDC.GetFont = Mock(return_value='defaultFont')
+        self._mockedDC.GetTextForeground = Mock(return_value='black')
+
+        self._recorder: DrawingRecorder = DrawingRecorder(self._mockedDC, 100, 200)
+
+    def testTextRecordedRelativeToOrigin(self):
+
+        self._recorder.DrawText('Name', 110, 205)
+
+        self.assertEqual([('Name', 'defaultFont', 'black', 10, 5)], self._recorder.texts, 'Wrong text layout')
+        self._mockedDC.DrawText.assert_not_called()
+
+    def testLineRecordedRelativeToOrigin(self):
+
+        self._recorder.DrawLine(100, 230, 250, 230)
+
+        self.assertEqual([(0, 30, 150, 30)], self._recorder.lines, 'Wrong separator')
+        self._mockedDC.DrawLine.assert_not_called()
+
+    def testFontFollowsSetFont(self):
+
+        self._recorder.SetFont('nameFont')
+        self._recorder.SetTextForeground('red')
+        self._recorder.DrawText('Name', 100, 200)
+
+        self.assertEqual(('Name', 'nameFont', 'red', 0, 0), self._recorder.texts[0], 'Should record the current font and colour')
+        self._mockedDC.SetFont.assert_called_once_with('nameFont')
+
+    def testMeasuringDelegated(self):
+
+        self._mockedDC.GetTextExtent = Mock(return_value=(40, 12))
+
+        self.assertEqual((40, 12), self._recorder.GetTextExtent('Name'), 'Should measure with the real dc')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDrawingRecorder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,61 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.LevelOfDetail import LevelOfDetail
+
+
+class TestLevelOfDetail(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    TITLE_ZOOM:   float = 0.5
+    OUTLINE_ZOOM: float = 0.3
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestLevelOfDetail.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestLevelOfDetail.clsLogger
+
+    def testFullAtNormalZoom(self):
+        self.assertEqual(LevelOfDetail.FULL, self._forZoom(1.0), 'Nothing is dropped at 100%')
+
+    def testFullAtTitleThreshold(self):
+        self.assertEqual(LevelOfDetail.FULL, self._forZoom(TestLevelOfDetail.TITLE_ZOOM), 'The thresholds are exclusive')
+
+    def testTitleBetweenThresholds(self):
+        self.assertEqual(LevelOfDetail.TITLE, self._forZoom(0.4), 'Should only draw titles')
+
+    def testOutlineBelowOutlineThreshold(self):
+        self.assertEqual(LevelOfDetail.OUTLINE, self._forZoom(0.2), 'Should only draw outlines')
+
+    def testZeroThresholdsDisable(self):
+
+        levelOfDetail: LevelOfDetail = LevelOfDetail.forZoom(zoom=0.2, titleZoom=0.0, outlineZoom=0.0)
+        self.assertEqual(LevelOfDetail.FULL, levelOfDetail, 'Zero thresholds should always draw everything')
+
+    def _forZoom(self, zoom: float) -> LevelOfDetail:
+        return LevelOfDetail.forZoom(zoom=zoom, titleZoom=TestLevelOfDetail.TITLE_ZOOM, outlineZoom=TestLevelOfDetail.OUTLINE_ZOOM)
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestLevelOfDetail))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
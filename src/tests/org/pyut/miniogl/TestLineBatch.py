@@ -0,0 +1,104 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.LineBatch import LineBatch
+
+
+class TestLineBatch(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestLineBatch.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:    Logger    = TestLineBatch.clsLogger
+        self._batch:    LineBatch = LineBatch()
+        self._mockedDC: Mock      = Mock()
+
+    def testPolylineSplitIntoSegments(self):
+
+        pen: Mock = self._createStyle(rgb=0)
+        self._batch.addPolyline(pen, [(0.0, 0.0), (10.4, 0.0), (10.4, 20.6)])
+
+        self._batch.draw(self._mockedDC)
+        self._mockedDC.DrawLineList.assert_called_once_with([(0, 0, 10, 0), (10, 0, 10, 21)], pen)
+
+    def testOneCallPerPen(self):
+
+        black: Mock = self._createStyle(rgb=0)
+        blue:  Mock = self._createStyle(rgb=255)
+        for x in range(10):
+            self._batch.addPolyline(black, [(x, 0), (x, 10)])
+            self._batch.addPolyline(blue,  [(x, 20), (x, 30)])
+
+        self._batch.draw(self._mockedDC)
+        self.assertEqual(2, self._mockedDC.DrawLineList.call_count, 'Lines with the same pen are drawn together')
+        self.assertEqual(20, self._batch.segmentCount, 'Wrong segment count')
+
+    def testEqualPensShareACall(self):
+
+        self._batch.addPolyline(self._createStyle(rgb=0), [(0, 0), (10, 10)])
+        self._batch.addPolyline(self._createStyle(rgb=0), [(20, 0), (30, 10)])
+
+        self._batch.draw(self._mockedDC)
+        self.assertEqual(1, self._mockedDC.DrawLineList.call_count, 'Pens are grouped by style, not identity')
+
+    def testPolygonsGroupedByPenAndBrush(self):
+
+        pen:   Mock = self._createStyle(rgb=0)
+        white: Mock = self._createStyle(rgb=0xFFFFFF)
+        black: Mock = self._createStyle(rgb=0)
+        arrow = [(0, 0), (5, 5), (0, 10)]
+        self._batch.addPolygon(pen, white, arrow)
+        self._batch.addPolygon(pen, white, arrow)
+        self._batch.addPolygon(pen, black, arrow)
+
+        self._batch.draw(self._mockedDC)
+        self.assertEqual(2, self._mockedDC.DrawPolygonList.call_count, 'One call per pen and brush')
+        self.assertEqual(3, self._batch.polygonCount, 'Wrong polygon count')
+
+    def testClear(self):
+
+        self._batch.addPolyline(self._createStyle(rgb=0), [(0, 0), (10, 10)])
+        self.assertFalse(self._batch.isEmpty, 'The batch holds a line')
+
+        self._batch.clear()
+        self.assertTrue(self._batch.isEmpty, 'The batch should be empty')
+        self._batch.draw(self._mockedDC)
+        self._mockedDC.DrawLineList.assert_not_called()
+
+    def _createStyle(self, rgb: int) -> Mock:
+        """
+        Returns:  A mocked pen or brush;  Both are keyed by colour, style and, for a pen, width
+        """
+        style: Mock = Mock()
+        style.GetColour.return_value.GetRGB.return_value = rgb
+        style.GetWidth.return_value = 1
+        style.GetStyle.return_value = 100
+        return style
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestLineBatch))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,92 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.MiniOglUtils import computeSegmentGeometry
+from org.pyut.miniogl.MiniOglUtils import mergeRectangles
+from org.pyut.miniogl.MiniOglUtils import segmentsContainPoint
+from org.pyut.miniogl.MiniOglUtils import segmentIntersectsRectangle
+
+
+class TestMiniOglUtils(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    RECTANGLE = (0, 0, 100, 100)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestMiniOglUtils.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestMiniOglUtils.clsLogger
+
+    def testSegmentInside(self):
+        self.assertTrue(segmentIntersectsRectangle(10, 10, 20, 20, *TestMiniOglUtils.RECTANGLE), 'Fully inside')
+
+    def testSegmentCrossesWithoutEndpointsInside(self):
+        self.assertTrue(segmentIntersectsRectangle(-50, 50, 150, 50, *TestMiniOglUtils.RECTANGLE), 'Passes straight through')
+
+    def testSegmentMissesCorner(self):
+        self.assertFalse(segmentIntersectsRectangle(-50, 40, 40, -50, *TestMiniOglUtils.RECTANGLE), 'Diagonal outside the top left corner')
+
+    def testSegmentOutsideParallel(self):
+        self.assertFalse(segmentIntersectsRectangle(-10, 200, 110, 200, *TestMiniOglUtils.RECTANGLE), 'Horizontal below the rectangle')
+
+    def testDegenerateSegment(self):
+        self.assertTrue(segmentIntersectsRectangle(50, 50, 50, 50, *TestMiniOglUtils.RECTANGLE),   'A point inside')
+        self.assertFalse(segmentIntersectsRectangle(500, 50, 500, 50, *TestMiniOglUtils.RECTANGLE), 'A point outside')
+
+    def testMergeChainedRectangles(self):
+
+        merged = mergeRectangles([(0, 0, 10, 10), (20, 20, 30, 30), (5, 5, 25, 25)])
+
+        self.assertEqual([(0, 0, 30, 30)], merged, 'The third rectangle links the first two')
+
+    def testMergeKeepsDisjointRectangles(self):
+
+        merged = mergeRectangles([(0, 0, 10, 10), (100, 100, 110, 110)])
+
+        self.assertEqual(2, len(merged), 'Nothing to merge')
+
+    def testPointNearSegment(self):
+
+        geometry = computeSegmentGeometry([(0, 0), (100, 0), (100, 100)], 4.0)
+
+        self.assertTrue(segmentsContainPoint(geometry, 50, 1.5, 4.0), 'Within the band of the first segment')
+        self.assertTrue(segmentsContainPoint(geometry, 99, 50, 4.0),  'Within the band of the second segment')
+        self.assertFalse(segmentsContainPoint(geometry, 50, 3, 4.0),  'An axis aligned band is only tolerance thick')
+        self.assertFalse(segmentsContainPoint(geometry, 50, 10, 4.0), 'Too far from the line')
+
+    def testPointBeyondSegmentEnd(self):
+
+        geometry = computeSegmentGeometry([(0, 0), (100, 0)], 4.0)
+
+        self.assertFalse(segmentsContainPoint(geometry, 120, 0, 4.0), 'On the line through the segment, but past its end')
+
+    def testZeroLengthSegmentsDropped(self):
+
+        geometry = computeSegmentGeometry([(10, 10), (10, 10), (50, 10)], 4.0)
+
+        self.assertEqual(1, len(geometry), 'A zero length segment can never be hit')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestMiniOglUtils))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,92 @@
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.ShapeGrid import ShapeGrid
+
+
+class TestShapeGrid(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    CELL_SIZE: int = 100
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestShapeGrid.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger    = TestShapeGrid.clsLogger
+        self._grid:  ShapeGrid = ShapeGrid(cellSize=TestShapeGrid.CELL_SIZE)
+
+    def testQueryPoint(self):
+
+        self._grid.insert('near', (10, 10, 50, 50))
+        self._grid.insert('far',  (1000, 1000, 1050, 1050))
+
+        found: Set[str] = self._grid.queryPoint(20, 20)
+
+        self.assertEqual({'near'}, found, 'Only the shape in the same cell')
+
+    def testSpansCells(self):
+
+        self._grid.insert('wide', (50, 50, 250, 60))
+
+        self.assertIn('wide', self._grid.queryPoint(220, 55), 'Should be filed in every overlapped cell')
+
+    def testNegativeCoordinates(self):
+
+        self._grid.insert('negative', (-150, -150, -120, -120))
+
+        self.assertIn('negative', self._grid.queryPoint(-130, -130), 'Negative coordinates use floor')
+        self.assertNotIn('negative', self._grid.queryPoint(10, 10), 'Must not leak into cell (0, 0)')
+
+    def testInsertMovesKey(self):
+
+        self._grid.insert('moving', (10, 10, 20, 20))
+        self._grid.insert('moving', (510, 510, 520, 520))
+
+        self.assertEqual(set(), self._grid.queryPoint(15, 15), 'Old cells should be emptied')
+        self.assertEqual({'moving'}, self._grid.queryPoint(515, 515), 'Should be in the new cell')
+        self.assertEqual(1, len(self._grid), 'Still a single key')
+
+    def testRemove(self):
+
+        self._grid.insert('gone', (10, 10, 20, 20))
+        self._grid.remove('gone')
+        self._grid.remove('unknown')
+
+        self.assertNotIn('gone', self._grid, 'Should be removed')
+        self.assertEqual(set(), self._grid.queryPoint(15, 15), 'Cell should be empty')
+
+    def testQueryRectangle(self):
+
+        self._grid.insert('inside',  (120, 120, 130, 130))
+        self._grid.insert('outside', (820, 820, 830, 830))
+
+        found: Set[str] = self._grid.queryRectangle((300, 300, 100, 100))
+
+        self.assertEqual({'inside'}, found, 'Reversed corners should be normalized')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestShapeGrid))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
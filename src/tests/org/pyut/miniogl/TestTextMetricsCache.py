@@ -0,0 +1,96 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import Mock
+
+from tests.TestBase import TestBase
+
+from org.pyut.miniogl.TextMetricsCache import TextMetricsCache
+
+
+class TestTextMetricsCache(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestTextMetricsCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:  Logger           = TestTextMetricsCache.clsLogger
+        self._cache:  TextMetricsCache = TextMetricsCache()
+        self._cache.invalidate()
+
+        self._mockedDC: Mock = Mock()
+        self._mockedDC.GetTextExtent = Mock(side_effect=lambda text: (len(text) * 5, 10))
+
+    def testMeasuredOnce(self):
+
+        font: Mock = self._createFont('Sans 10')
+        for x in range(3):
+            self._cache.getTextExtent('+ method()', font=font, dc=self._mockedDC)
+
+        self.assertEqual(1, self._mockedDC.GetTextExtent.call_count, 'Unchanged strings must not be re-measured')
+
+    def testFontsAreSeparate(self):
+
+        small: Mock = self._createFont('Sans 10')
+        large: Mock = self._createFont('Sans 20')
+        self._cache.getTextExtent('text', font=small, dc=self._mockedDC)
+        self._cache.getTextExtent('text', font=large, dc=self._mockedDC)
+
+        self.assertEqual(2, self._mockedDC.GetTextExtent.call_count, 'A different font is a different measurement')
+
+    def testInvalidate(self):
+
+        font: Mock = self._createFont('Sans 10')
+        self._cache.getTextExtent('text', font=font, dc=self._mockedDC)
+        self._cache.invalidate()
+        self._cache.getTextExtent('text', font=font, dc=self._mockedDC)
+
+        self.assertEqual(2, self._mockedDC.GetTextExtent.call_count, 'Should measure again after invalidation')
+
+    def testLeastRecentlyUsedEvicted(self):
+
+        saveMaximum: int = TextMetricsCache.MAXIMUM_ENTRIES
+        TextMetricsCache.MAXIMUM_ENTRIES = 2
+        try:
+            font: Mock = self._createFont('Sans 10')
+            self._cache.getTextExtent('first',  font=font, dc=self._mockedDC)
+            self._cache.getTextExtent('second', font=font, dc=self._mockedDC)
+            self._cache.getTextExtent('first',  font=font, dc=self._mockedDC)     # now most recently used
+            self._cache.getTextExtent('third',  font=font, dc=self._mockedDC)     # evicts 'second'
+            self._cache.getTextExtent('first',  font=font, dc=self._mockedDC)
+            self.assertEqual(3, self._mockedDC.GetTextExtent.call_count, "'first' should have survived")
+
+            self._cache.getTextExtent('second', font=font, dc=self._mockedDC)
+            self.assertEqual(4, self._mockedDC.GetTextExtent.call_count, "'second' should have been evicted")
+        finally:
+            TextMetricsCache.MAXIMUM_ENTRIES = saveMaximum
+
+    def _createFont(self, description: str) -> Mock:
+
+        font: Mock = Mock()
+        font.GetNativeFontInfoDesc = Mock(return_value=description)
+
+        return font
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestTextMetricsCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -7,6 +7,8 @@ from unittest import main as unitTestMain
 
 from tests.TestBase import TestBase
 
+from org.pyut.general.IDRegistry import IDRegistry
+
 from org.pyut.model.PyutObject import PyutObject
 
 
@@ -22,11 +24,12 @@ class TestPyutObject(TestBase):
         TestPyutObject.clsLogger = getLogger(__name__)
 
     def setUp(self):
-        self.logger: Logger = TestPyutObject.clsLogger
-        PyutObject.nextId = 0
+        self.logger:    Logger     = TestPyutObject.clsLogger
+        self._registry: IDRegistry = IDRegistry()
+        self._registry.scope = self._registry.newScope()
 
     def tearDown(self):
-        pass
+        self._registry.removeScope(self._registry.scope)
 
     def testNoName(self):
         pyutObject: PyutObject = PyutObject()
@@ -62,18 +65,27 @@ class TestPyutObject(TestBase):
         self.assertEqual(expectedLength, actualLength, 'Our name appears to have NOT been used')
 
     def testInitialId(self):
-        self.assertEqual(0, PyutObject.nextId, 'Not correctly initialized')
+        pyutObject: PyutObject = PyutObject()
+        self.assertEqual(0, pyutObject.getId(), 'Not correctly initialized')
 
     def testHowIdsIncrement(self):
 
         pyutObject1: PyutObject = PyutObject(name='pyutObject1')
-        self.assertEqual(1, PyutObject.nextId, f'Not correctly incremented {pyutObject1.name}')
+        self.assertEqual(0, pyutObject1.getId(), f'Not correctly incremented {pyutObject1.name}')
 
         pyutObject2: PyutObject = PyutObject(name='pyutObject2')
-        self.assertEqual(2, PyutObject.nextId, f'Not correctly incremented {pyutObject2.name}')
+        self.assertEqual(1, pyutObject2.getId(), f'Not correctly incremented {pyutObject2.name}')
 
         pyutObject3: PyutObject = PyutObject(name='pyutObject3')
-        self.assertEqual(3, PyutObject.nextId, f'Not correctly incremented {pyutObject3.name}')
+        self.assertEqual(2, pyutObject3.getId(), f'Not correctly incremented {pyutObject3.name}')
+
+    def testSetIdSkippedOnAllocation(self):
+
+        pyutObject1: PyutObject = PyutObject(name='pyutObject1')
+        pyutObject1.setId(1)
+
+        pyutObject2: PyutObject = PyutObject(name='pyutObject2')
+        self.assertEqual(2, pyutObject2.getId(), 'A reserved ID must not be handed out')
 
 
 def suite() -> TestSuite:
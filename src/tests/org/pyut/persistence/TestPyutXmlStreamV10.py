@@ -0,0 +1,132 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from os import remove as osRemove
+
+from tempfile import NamedTemporaryFile
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from unittest.mock import MagicMock
+
+from zlib import compress
+from zlib import decompress
+
+from xml.dom.minidom import Document
+from xml.dom.minidom import Element
+
+from xml.sax.saxutils import XMLGenerator
+
+from tests.TestBase import TestBase
+
+from org.pyut.persistence.PyutXmlStreamV10 import CompressedFileWriter
+from org.pyut.persistence.PyutXmlStreamV10 import PyutXmlStream
+
+
+class TestPyutXmlStreamV10(TestBase):
+    """
+    Only exercises the streaming plumbing;  The OGL builders need a live UI
+    """
+    clsLogger: Logger = None
+
+    V10_XML: str = (
+        '<?xml version="1.0" encoding="iso-8859-1"?>\n'
+        '<PyutProject version="10" CodePath="">\n'
+        '    <PyutDocument type="CLASS_DIAGRAM" title="Ünïcode" />\n'
+        '</PyutProject>\n'
+    )
+    V8_XML: str = (
+        '<?xml version="1.0" encoding="iso-8859-1"?>\n'
+        '<PyutProject version="8" CodePath="">\n'
+        '</PyutProject>\n'
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPyutXmlStreamV10.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:        Logger        = TestPyutXmlStreamV10.clsLogger
+        self.pyutXmlStream: PyutXmlStream = PyutXmlStream()
+        self._fileNames:    List[str]     = []
+
+    def tearDown(self):
+        for fileName in self._fileNames:
+            osRemove(fileName)
+
+    def testParseEventsDecodesUtf8(self):
+
+        fileName: str = self._createCompressedFile(TestPyutXmlStreamV10.V10_XML)
+
+        titles: List[str] = [element.get('title') for eventType, element in self.pyutXmlStream._parseEvents(fileName)
+                             if eventType == 'start' and element.tag == 'PyutDocument']
+
+        self.assertEqual(['Ünïcode'], titles, 'File content is UTF-8 regardless of the prolog')
+
+    def testParseEventsBalanced(self):
+
+        fileName: str = self._createCompressedFile(TestPyutXmlStreamV10.V10_XML)
+
+        eventTypes: List[str] = [eventType for eventType, element in self.pyutXmlStream._parseEvents(fileName)]
+
+        self.assertEqual(eventTypes.count('start'), eventTypes.count('end'), 'Every start should have an end')
+
+    def testOlderVersionNotStreamed(self):
+
+        fileName: str       = self._createCompressedFile(TestPyutXmlStreamV10.V8_XML)
+        project:  MagicMock = MagicMock()
+
+        handled: bool = self.pyutXmlStream.open(filename=fileName, project=project)
+
+        self.assertFalse(handled, 'Older versions go to the minidom loaders')
+        project.newDocument.assert_not_called()
+
+    def testWriteElementRoundTrip(self):
+
+        scratchDoc: Document = Document()
+        graphic:    Element  = scratchDoc.createElement('GraphicNote')
+        note:       Element  = scratchDoc.createElement('Note')
+        graphic.setAttribute('x', '10.00')
+        note.setAttribute('content', 'Ünïcode & <friends>')
+        graphic.appendChild(note)
+
+        fileName:  str                  = self._createCompressedFile('')
+        outFile:   CompressedFileWriter = CompressedFileWriter(fileName)
+        generator: XMLGenerator         = XMLGenerator(outFile, encoding='utf-8', short_empty_elements=True)
+        generator.startDocument()
+        self.pyutXmlStream._writeElement(generator=generator, element=graphic, depth=0)
+        generator.endDocument()
+        outFile.close()
+
+        with open(fileName, 'rb') as inFile:
+            xmlText: str = decompress(inFile.read()).decode()
+
+        self.assertIn('<Note content="Ünïcode &amp; &lt;friends&gt;"/>', xmlText, 'Attributes must be escaped')
+        self.assertIn('<GraphicNote x="10.00">', xmlText, 'Parent element missing')
+
+    def _createCompressedFile(self, xmlText: str) -> str:
+
+        with NamedTemporaryFile(suffix='.put', delete=False) as tempFile:
+            tempFile.write(compress(xmlText.encode()))
+            self._fileNames.append(tempFile.name)
+
+        return tempFile.name
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPyutXmlStreamV10))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,86 @@
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from org.pyut.enums.LinkType import LinkType
+
+from org.pyut.model.PyutField import PyutField
+from org.pyut.model.PyutLink import PyutLink
+from org.pyut.model.PyutMethod import PyutMethod
+from org.pyut.model.PyutParam import PyutParam
+from org.pyut.model.PyutVisibilityEnum import PyutVisibilityEnum
+
+from org.pyut.persistence.converters.OglBuilderV10 import OglBuilder
+
+from tests.TestBase import TestBase
+
+
+class TestOglBuilderV10(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestOglBuilderV10.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger:   Logger     = TestOglBuilderV10.clsLogger
+        self._builder: OglBuilder = OglBuilder()
+
+    def testFieldWithoutDefaultValue(self):
+
+        pyutField: PyutField = self._builder.getPyutField(name='count', visibility='-', fieldType='int', defaultValue=None)
+
+        self.assertEqual('count', pyutField.getName(), 'Name mismatch')
+        self.assertEqual(PyutVisibilityEnum.PRIVATE, pyutField.getVisibility(), 'Visibility mismatch')
+        self.assertEqual('int', pyutField.getType().value, 'Type mismatch')
+        self.assertIsNone(pyutField.getDefaultValue(), 'An absent default value should stay absent')
+
+    def testFieldWithEmptyDefaultValue(self):
+
+        pyutField: PyutField = self._builder.getPyutField(name='label', visibility='+', fieldType='str', defaultValue='')
+
+        self.assertEqual('', pyutField.getDefaultValue(), 'An empty default value is not an absent one')
+
+    def testMethod(self):
+
+        pyutParam:  PyutParam  = self._builder.getPyutParam(name='amount', paramType='float', defaultValue='1.0')
+        pyutMethod: PyutMethod = self._builder.getPyutMethod(name='deposit', visibility='+', returnType='bool',
+                                                             modifierNames=['static'], params=[pyutParam])
+
+        self.assertEqual('deposit', pyutMethod.getName(), 'Name mismatch')
+        self.assertEqual(PyutVisibilityEnum.PUBLIC, pyutMethod.getVisibility(), 'Visibility mismatch')
+        self.assertEqual('bool', pyutMethod.getReturns().value, 'Return type mismatch')
+        self.assertEqual(['static'], [modifier.getName() for modifier in pyutMethod.getModifiers()], 'Modifiers mismatch')
+        self.assertEqual([pyutParam], pyutMethod.getParams(), 'Parameters mismatch')
+        self.assertEqual('1.0', pyutParam.getDefaultValue(), 'Default value mismatch')
+
+    def testLink(self):
+
+        pyutLink: PyutLink = self._builder.getPyutLink(name='owns', linkType='COMPOSITION', bidirectional='',
+                                                       sourceCardinality='1', destinationCardinality='0..*')
+
+        self.assertEqual('owns', pyutLink.getName(), 'Name mismatch')
+        self.assertEqual(LinkType.COMPOSITION, pyutLink.getType(), 'Type mismatch')
+        self.assertFalse(pyutLink.getBidir(), 'An empty flag is not bidirectional')
+        self.assertEqual('1', pyutLink.sourceCardinality, 'Source cardinality mismatch')
+        self.assertEqual('0..*', pyutLink.destinationCardinality, 'Destination cardinality mismatch')
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestOglBuilderV10))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
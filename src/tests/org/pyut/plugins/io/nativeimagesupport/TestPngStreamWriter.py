@@ -0,0 +1,110 @@
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from os import remove
+
+from struct import unpack
+
+from tempfile import NamedTemporaryFile
+
+from zlib import decompress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.TestBase import TestBase
+
+from org.pyut.plugins.io.nativeimagesupport.PngStreamWriter import PngStreamWriter
+
+
+class TestPngStreamWriter(TestBase):
+    """
+    """
+    clsLogger: Logger = None
+
+    WIDTH:  int = 3
+    HEIGHT: int = 4
+
+    RED:  bytes = bytes([255, 0, 0])
+    BLUE: bytes = bytes([0, 0, 255])
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPngStreamWriter.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPngStreamWriter.clsLogger
+
+        with NamedTemporaryFile(suffix='.png', delete=False) as tempFile:
+            self._fileName: str = tempFile.name
+
+    def tearDown(self):
+        remove(self._fileName)
+
+    def testSignatureAndHeader(self):
+
+        self._writeTwoBands()
+
+        with open(self._fileName, 'rb') as pngFile:
+            data: bytes = pngFile.read()
+
+        self.assertEqual(PngStreamWriter.PNG_SIGNATURE, data[:8], 'Not a PNG file')
+        width, height = unpack('>II', data[16:24])
+        self.assertEqual((TestPngStreamWriter.WIDTH, TestPngStreamWriter.HEIGHT), (width, height), 'Wrong image size')
+
+    def testRowsRoundTrip(self):
+
+        self._writeTwoBands()
+
+        rows:   bytes = decompress(b''.join(self._readChunks(b'IDAT')))
+        stride: int   = 1 + TestPngStreamWriter.WIDTH * 3
+
+        self.assertEqual(stride * TestPngStreamWriter.HEIGHT, len(rows), 'Every row should be written')
+        self.assertEqual(b'\x00' + TestPngStreamWriter.RED * TestPngStreamWriter.WIDTH,  rows[:stride],  'First band is red')
+        self.assertEqual(b'\x00' + TestPngStreamWriter.BLUE * TestPngStreamWriter.WIDTH, rows[-stride:], 'Last band is blue')
+
+    def testEndsWithIEND(self):
+
+        self._writeTwoBands()
+
+        self.assertEqual(1, len(self._readChunks(b'IEND')), 'The image must be terminated')
+
+    def _writeTwoBands(self):
+
+        width: int = TestPngStreamWriter.WIDTH
+        with PngStreamWriter(self._fileName, width, TestPngStreamWriter.HEIGHT) as writer:
+            writer.writeRows(TestPngStreamWriter.RED * width * 2, 2)
+            writer.writeRows(TestPngStreamWriter.BLUE * width * 2, 2)
+
+    def _readChunks(self, chunkType: bytes) -> List[bytes]:
+
+        with open(self._fileName, 'rb') as pngFile:
+            data: bytes = pngFile.read()
+
+        chunks: List[bytes] = []
+        offset: int = len(PngStreamWriter.PNG_SIGNATURE)
+        while offset < len(data):
+            length: int = unpack('>I', data[offset:offset + 4])[0]
+            if data[offset + 4:offset + 8] == chunkType:
+                chunks.append(data[offset + 8:offset + 8 + length])
+            offset += 12 + length
+
+        return chunks
+
+
+def suite() -> TestSuite:
+
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPngStreamWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -102,6 +102,61 @@ class TestPyutPreferences(TestBase):
         self.prefs.debugBasicShape = False
         self.assertFalse(self.prefs.debugBasicShape, 'Syntactic sugar not working')
 
+    def testClassRenderCacheTrue(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.classRenderCache = True
+        self.assertTrue(self.prefs.classRenderCache, 'Syntactic sugar not working')
+
+    def testClassRenderCacheFalse(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.classRenderCache = False
+        self.assertFalse(self.prefs.classRenderCache, 'Syntactic sugar not working')
+
+    def testLevelOfDetailTitleZoom(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.levelOfDetailTitleZoom = 0.45
+        self.assertEqual(0.45, self.prefs.levelOfDetailTitleZoom, 'Syntactic sugar not working')
+
+    def testLevelOfDetailOutlineZoom(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.levelOfDetailOutlineZoom = 0.25
+        self.assertEqual(0.25, self.prefs.levelOfDetailOutlineZoom, 'Syntactic sugar not working')
+
+    def testDragFrameRate(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.dragFrameRate = 30
+        self.assertEqual(30, self.prefs.dragFrameRate, 'Syntactic sugar not working')
+
+    def testGraphicsContextRenderingTrue(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.graphicsContextRendering = True
+        self.assertTrue(self.prefs.graphicsContextRendering, 'Syntactic sugar not working')
+
+    def testGraphicsContextRenderingFalse(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.graphicsContextRendering = False
+        self.assertFalse(self.prefs.graphicsContextRendering, 'Syntactic sugar not working')
+
+    def testHistoryWriteBehindTrue(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.historyWriteBehind = True
+        self.assertTrue(self.prefs.historyWriteBehind, 'Syntactic sugar not working')
+
+    def testHistoryWriteBehindFalse(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.historyWriteBehind = False
+        self.assertFalse(self.prefs.historyWriteBehind, 'Syntactic sugar not working')
+
+    def testHistoryMaximumGroups(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.historyMaximumGroups = 250
+        self.assertEqual(250, self.prefs.historyMaximumGroups, 'Syntactic sugar not working')
+
+    def testHistoryMaximumKilobytes(self):
+        self.prefs.init()  # reload prefs
+        self.prefs.historyMaximumKilobytes = 1024
+        self.assertEqual(1024, self.prefs.historyMaximumKilobytes, 'Syntactic sugar not working')
+
     def testTwoColorValue(self):
 
         self._emptyPrefs()
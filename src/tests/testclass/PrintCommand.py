@@ -6,8 +6,7 @@ from logging import getLogger
 
 from org.pyut.commands.Command import Command
 
-from org.pyut.history.HistoryUtils import getTokenValue
-from org.pyut.history.HistoryUtils import makeValuatedToken
+from org.pyut.history.HistoryUtils import CommandRecord
 
 
 class PrintCommand(Command):
@@ -42,19 +41,21 @@ class PrintCommand(Command):
     def undo(self):
         self.logger.info(f'undo: `{self._message}`')
 
-    def serialize(self):
+    def serialize(self) -> CommandRecord:
         """
         serialize the message to display. DON't forget to call the serialize
         method of command.
         """
+        record: CommandRecord = Command.serialize(self)
+        record['message'] = self._message
 
-        return Command.serialize(self) + makeValuatedToken("message", self._message)
+        return record
 
-    def deserialize(self, serialCommand):
+    def deserialize(self, record: CommandRecord):
         """
         get from the serialized command the message to display
         and init the corresponding attribute.
-        @param serialCommand    :   serialized command
+        @param record    :   serialized command
         """
 
-        self._message = getTokenValue("message", serialCommand)
+        self._message = record['message']